@@ -10,12 +10,13 @@ import ssl
 from collections.abc import Callable
 from datetime import time as dt_time
 from datetime import timedelta
+from functools import partial
 from pathlib import Path
 from typing import Any
 
 import aiohttp
 import voluptuous as vol
-from boschshcpy import SHCSessionAsync, SHCUniversalSwitch
+from boschshcpy import SHCDevice, SHCSessionAsync, SHCUniversalSwitch
 from boschshcpy.api import JSONRPCError
 from boschshcpy.api_async import build_ssl_context
 from boschshcpy.exceptions import (
@@ -24,7 +25,11 @@ from boschshcpy.exceptions import (
     SHCException,
     SHCSessionError,
 )
-from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigEntryState,
+    OperationNotAllowed,
+)
 from homeassistant.const import (
     ATTR_COMMAND,
     ATTR_DEVICE_ID,
@@ -52,6 +57,7 @@ from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.device_registry import DeviceEntry
 from homeassistant.helpers.event import (
+    async_call_later,
     async_track_state_change_event,
     async_track_time_change,
     async_track_time_interval,
@@ -59,11 +65,24 @@ from homeassistant.helpers.event import (
 from homeassistant.util import dt as dt_util
 from homeassistant.util import slugify
 
+from .bulk_command import (
+    BULK_COMMAND_ITEM_SCHEMA,
+    CONTROLLER_MAX_CONCURRENCY,
+    DEFAULT_CONCURRENCY,
+    SHCCommandDispatcher,
+    async_fleet_apply,
+)
+from .capabilities import async_platforms_to_forward, platform_has_sources
 from .certificate import parse_certificate
 from .const import (
+    ATTR_COMMANDS,
+    ATTR_CONFIG_ENTRY_ID,
     ATTR_EVENT_SUBTYPE,
     ATTR_EVENT_TYPE,
+    ATTR_INCREMENTAL,
     ATTR_LAST_TIME_TRIGGERED,
+    ATTR_MAX_AGE,
+    ATTR_MAX_CONCURRENCY,
     ATTR_SERVICE_ID,
     ATTR_TITLE,
     CAMERA_TOOL_DOMAIN,
@@ -86,15 +105,37 @@ from .const import (
     OPT_SILENT_MODE_START,
     OPT_SSL_SKIP_VERIFY,
     OPT_SSL_VERIFY_HOSTNAME,
+    SERVICE_BULK_COMMAND,
     SERVICE_EXPORT_ZIGBEE_TOPOLOGY,
     SERVICE_REFRESH_ZIGBEE_ROUTING,
     SERVICE_TRIGGER_RAWSCAN,
     SERVICE_TRIGGER_SCENARIO,
     SUPPORTED_INPUTS_EVENTS_TYPES,
 )
-from .coordinator import SHCZigbeeRoutingCoordinator
-from .data import SHCData
+from .coordinator import (
+    SHCMessagesCache,
+    SHCPollScheduler,
+    SHCPollStats,
+    SHCZigbeeRoutingCoordinator,
+)
+from .data import SHCData, async_get_entry_registry
+from .entity import (
+    SHCDeviceIndex,
+    SHCDispatchIndex,
+    SHCScenarioIndex,
+    SHCStateWriteCoalescer,
+    async_batch_stale_entity_removal,
+)
 from .keypad_bridge import async_sync_keypad_bridge
+from .migration import UNIQUE_ID_MINOR_VERSION, async_migrate_unique_ids
+from .options import async_apply_options
+from .snapshot import (
+    SHCSnapshotStore,
+    async_fetch,
+    async_init_from_snapshot,
+    async_init_recording,
+    async_reconcile,
+)
 from .zigbee_topology import (
     build_topology_graph,
     topology_to_html,
@@ -118,16 +159,22 @@ PLATFORMS = [
 if hasattr(Platform, "VALVE"):
     PLATFORMS.append(Platform.VALVE)
 
+# Quiet period after the last presence change before child lock / silent mode
+# are re-evaluated, so a burst of person/tracker updates costs one fleet write.
+PRESENCE_DEBOUNCE_SECONDS = 2.0
+
 SCENARIO_TRIGGER_SCHEMA = vol.Schema(
     {
         vol.Optional(ATTR_TITLE, default=""): cv.string,
-        vol.Required(ATTR_NAME): cv.string,
+        vol.Optional(ATTR_CONFIG_ENTRY_ID, default=""): cv.string,
+        vol.Required(ATTR_NAME): vol.All(cv.ensure_list, [cv.string]),
     }
 )
 
 RAWSCAN_TRIGGER_SCHEMA = vol.Schema(
     {
         vol.Optional(ATTR_TITLE, default=""): cv.string,
+        vol.Optional(ATTR_CONFIG_ENTRY_ID, default=""): cv.string,
         vol.Required(ATTR_COMMAND): cv.string,
         vol.Optional(ATTR_DEVICE_ID, default=""): cv.string,
         vol.Optional(ATTR_SERVICE_ID, default=""): cv.string,
@@ -137,16 +184,52 @@ RAWSCAN_TRIGGER_SCHEMA = vol.Schema(
 EXPORT_ZIGBEE_TOPOLOGY_SCHEMA = vol.Schema(
     {
         vol.Optional(ATTR_TITLE, default=""): cv.string,
+        vol.Optional(ATTR_CONFIG_ENTRY_ID, default=""): cv.string,
     }
 )
 
 REFRESH_ZIGBEE_ROUTING_SCHEMA = vol.Schema(
     {
         vol.Optional(ATTR_TITLE, default=""): cv.string,
+        vol.Optional(ATTR_CONFIG_ENTRY_ID, default=""): cv.string,
+        vol.Optional(ATTR_INCREMENTAL, default=False): cv.boolean,
+        vol.Optional(ATTR_MAX_AGE): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    }
+)
+
+BULK_COMMAND_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_TITLE, default=""): cv.string,
+        vol.Optional(ATTR_CONFIG_ENTRY_ID, default=""): cv.string,
+        vol.Required(ATTR_COMMANDS): vol.All(
+            cv.ensure_list, [BULK_COMMAND_ITEM_SCHEMA], vol.Length(min=1)
+        ),
+        vol.Optional(ATTR_MAX_CONCURRENCY, default=DEFAULT_CONCURRENCY): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=CONTROLLER_MAX_CONCURRENCY)
+        ),
     }
 )
 
 
+def _service_targets(
+    hass: HomeAssistant, call: ServiceCall
+) -> list[tuple[str, SHCData]]:
+    """Return (entry id, runtime data) of the entries a domain service targets."""
+    return async_get_entry_registry(hass).resolve(
+        call.data[ATTR_TITLE], call.data.get(ATTR_CONFIG_ENTRY_ID, "")
+    )
+
+
+def _entry_not_found(call: ServiceCall, translation_key: str) -> ServiceValidationError:
+    """Build the error for a service call that matches no set-up entry."""
+    target = call.data.get(ATTR_CONFIG_ENTRY_ID, "") or call.data[ATTR_TITLE]
+    return ServiceValidationError(
+        f"No loaded Bosch SHC entry '{target}' found.",
+        translation_domain=DOMAIN,
+        translation_key=translation_key,
+    )
+
+
 async def async_setup(hass: HomeAssistant, config: dict[str, Any]) -> bool:
     """Set up the Bosch SHC component.
 
@@ -159,24 +242,29 @@ async def async_setup(hass: HomeAssistant, config: dict[str, Any]) -> bool:
     """
 
     async def scenario_service_call(call: ServiceCall) -> None:
-        """SHC Scenario service call."""
-        name = call.data[ATTR_NAME]
-        title = call.data[ATTR_TITLE]
-        for config_entry in hass.config_entries.async_entries(DOMAIN):
-            if not hasattr(config_entry, "runtime_data"):
-                continue
-            runtime: SHCData = config_entry.runtime_data
-            if title in ("", runtime.title):
-                for scenario in runtime.session.scenarios:
-                    if scenario.name == name:
-                        try:
-                            await scenario.async_trigger()
-                        except SHCException as err:
-                            raise ServiceValidationError(
-                                f"Failed to trigger scenario '{name}': {err}",
-                                translation_domain=DOMAIN,
-                                translation_key="scenario_not_found",
-                            ) from err
+        """SHC Scenario service call; every named scenario is triggered at once."""
+        names = cv.ensure_list(call.data[ATTR_NAME])
+        targets: list[tuple[str, Any]] = []
+        for _, runtime in _service_targets(hass, call):
+            if runtime.scenario_index is not None:
+                targets.extend(
+                    (name, scenario)
+                    for name in names
+                    for scenario in runtime.scenario_index.get(name)
+                )
+        results = await asyncio.gather(
+            *(scenario.async_trigger() for _, scenario in targets),
+            return_exceptions=True,
+        )
+        for (name, _), result in zip(targets, results, strict=True):
+            if isinstance(result, SHCException):
+                raise ServiceValidationError(
+                    f"Failed to trigger scenario '{name}': {result}",
+                    translation_domain=DOMAIN,
+                    translation_key="scenario_not_found",
+                ) from result
+            if isinstance(result, BaseException):
+                raise result
 
     hass.services.async_register(
         DOMAIN,
@@ -195,65 +283,56 @@ def _register_rawscan_service(hass: HomeAssistant) -> None:
 
     async def rawscan_service_call(call: ServiceCall) -> ServiceResponse:
         """SHC Rawscan service call."""
-        title = call.data[ATTR_TITLE]
         command = call.data[ATTR_COMMAND]
-        for config_entry in hass.config_entries.async_entries(DOMAIN):
-            if not hasattr(config_entry, "runtime_data"):
-                continue
-            if config_entry.state is not ConfigEntryState.LOADED:
-                continue
-            runtime: SHCData = config_entry.runtime_data
-            if title in ("", runtime.title):
-                api = runtime.session.api
-                device_id = call.data[ATTR_DEVICE_ID]
-                service_id = call.data[ATTR_SERVICE_ID]
-                # SHCSessionAsync has no rawscan(); dispatch directly over the
-                # async API (mirrors SHCSession.rawscan_commands).
-                commands = {
-                    "devices": api.get_devices,
-                    "device": lambda _api=api, _did=device_id: _api.get_device(_did),  # type: ignore[misc]
-                    "services": api.get_services,
-                    "device_services": lambda _api=api, _did=device_id: (  # type: ignore[misc]
-                        _api.get_device_services(_did)
-                    ),
-                    "device_service": lambda _api=api, _did=device_id, _sid=service_id: (  # type: ignore[misc]
-                        _api.get_device_service(_did, _sid)
-                    ),
-                    "rooms": api.get_rooms,
-                    "scenarios": api.get_scenarios,
-                    "messages": api.get_messages,
-                    "info": api.get_information,
-                    "information": api.get_information,
-                    "public_information": api.get_public_information,
-                    "intrusion_detection": api.get_domain_intrusion_detection,
-                }
-                if command not in commands:
-                    raise ServiceValidationError(
-                        f"Unknown rawscan command '{command}'. "
-                        f"Valid commands: {sorted(commands)}",
-                        translation_domain=DOMAIN,
-                        translation_key="rawscan_type_unknown",
-                    )
-                try:
-                    rawscan = await commands[command]()
-                except (
-                    JSONRPCError,
-                    SHCException,
-                    SHCConnectionError,
-                    aiohttp.ClientError,
-                    asyncio.TimeoutError,
-                ) as err:
-                    raise ServiceValidationError(
-                        f"Failed to execute rawscan command '{command}': {err}",
-                        translation_domain=DOMAIN,
-                        translation_key="rawscan_command_failed",
-                    ) from err
-                return {command: rawscan}
-        raise ServiceValidationError(
-            f"No loaded Bosch SHC entry with title '{title}' found.",
-            translation_domain=DOMAIN,
-            translation_key="rawscan_entry_not_found",
-        )
+        targets = _service_targets(hass, call)
+        if not targets:
+            raise _entry_not_found(call, "rawscan_entry_not_found")
+        _, runtime = targets[0]
+        api = runtime.session.api
+        device_id = call.data[ATTR_DEVICE_ID]
+        service_id = call.data[ATTR_SERVICE_ID]
+        # SHCSessionAsync has no rawscan(); dispatch directly over the
+        # async API (mirrors SHCSession.rawscan_commands).
+        commands = {
+            "devices": api.get_devices,
+            "device": lambda _api=api, _did=device_id: _api.get_device(_did),  # type: ignore[misc]
+            "services": api.get_services,
+            "device_services": lambda _api=api, _did=device_id: (  # type: ignore[misc]
+                _api.get_device_services(_did)
+            ),
+            "device_service": lambda _api=api, _did=device_id, _sid=service_id: (  # type: ignore[misc]
+                _api.get_device_service(_did, _sid)
+            ),
+            "rooms": api.get_rooms,
+            "scenarios": api.get_scenarios,
+            "messages": api.get_messages,
+            "info": api.get_information,
+            "information": api.get_information,
+            "public_information": api.get_public_information,
+            "intrusion_detection": api.get_domain_intrusion_detection,
+        }
+        if command not in commands:
+            raise ServiceValidationError(
+                f"Unknown rawscan command '{command}'. "
+                f"Valid commands: {sorted(commands)}",
+                translation_domain=DOMAIN,
+                translation_key="rawscan_type_unknown",
+            )
+        try:
+            rawscan = await commands[command]()
+        except (
+            JSONRPCError,
+            SHCException,
+            SHCConnectionError,
+            aiohttp.ClientError,
+            asyncio.TimeoutError,
+        ) as err:
+            raise ServiceValidationError(
+                f"Failed to execute rawscan command '{command}': {err}",
+                translation_domain=DOMAIN,
+                translation_key="rawscan_command_failed",
+            ) from err
+        return {command: rawscan}
 
     hass.services.async_register(
         DOMAIN,
@@ -275,13 +354,7 @@ def _register_export_zigbee_topology_service(hass: HomeAssistant) -> None:
 
     async def export_topology_service_call(call: ServiceCall) -> ServiceResponse:
         """Build a Zigbee mesh topology graph from the last routing poll."""
-        title = call.data[ATTR_TITLE]
-        for config_entry in hass.config_entries.async_entries(DOMAIN):
-            if not hasattr(config_entry, "runtime_data"):
-                continue
-            runtime: SHCData = config_entry.runtime_data
-            if title not in ("", runtime.title):
-                continue
+        for entry_id, runtime in _service_targets(hass, call):
             coordinator = runtime.zigbee_routing_coordinator
             if coordinator is None or not coordinator.data:
                 raise ServiceValidationError(
@@ -337,7 +410,7 @@ def _register_export_zigbee_topology_service(hass: HomeAssistant) -> None:
 
             try:
                 html_filename = await hass.async_add_executor_job(
-                    _write_files, runtime.title, config_entry.entry_id, graph, html
+                    _write_files, runtime.title, entry_id, graph, html
                 )
             except OSError as err:
                 raise ServiceValidationError(
@@ -351,11 +424,7 @@ def _register_export_zigbee_topology_service(hass: HomeAssistant) -> None:
                 "mermaid": mermaid,
                 "url": f"/local/bosch_shc/{html_filename}",
             }
-        raise ServiceValidationError(
-            f"No loaded Bosch SHC entry with title '{title}' found.",
-            translation_domain=DOMAIN,
-            translation_key="zigbee_topology_entry_not_found",
-        )
+        raise _entry_not_found(call, "zigbee_topology_entry_not_found")
 
     hass.services.async_register(
         DOMAIN,
@@ -373,29 +442,26 @@ def _register_refresh_zigbee_routing_service(hass: HomeAssistant) -> None:
     periodic polling — even a slow periodic interval is an unnecessary
     battery/stability cost). This is the explicit, user-requested way to
     get a fresh reading on demand, e.g. right before exporting the
-    topology map.
+    topology map. `incremental` re-polls only devices older than `max_age`
+    and skips routers already named in another device's route.
     """
     if hass.services.has_service(DOMAIN, SERVICE_REFRESH_ZIGBEE_ROUTING):
         return
 
     async def refresh_routing_service_call(call: ServiceCall) -> None:
         """Trigger an on-demand Zigbee routing-info refresh."""
-        title = call.data[ATTR_TITLE]
-        for config_entry in hass.config_entries.async_entries(DOMAIN):
-            if not hasattr(config_entry, "runtime_data"):
-                continue
-            runtime: SHCData = config_entry.runtime_data
-            if title not in ("", runtime.title):
-                continue
+        for _, runtime in _service_targets(hass, call):
             coordinator = runtime.zigbee_routing_coordinator
-            if coordinator is not None:
+            if coordinator is None:
+                return
+            if call.data.get(ATTR_INCREMENTAL, False):
+                await coordinator.async_request_incremental_refresh(
+                    call.data.get(ATTR_MAX_AGE)
+                )
+            else:
                 await coordinator.async_request_refresh()
             return
-        raise ServiceValidationError(
-            f"No loaded Bosch SHC entry with title '{title}' found.",
-            translation_domain=DOMAIN,
-            translation_key="zigbee_topology_entry_not_found",
-        )
+        raise _entry_not_found(call, "zigbee_topology_entry_not_found")
 
     hass.services.async_register(
         DOMAIN,
@@ -405,6 +471,44 @@ def _register_refresh_zigbee_routing_service(hass: HomeAssistant) -> None:
     )
 
 
+def _register_bulk_command_service(hass: HomeAssistant) -> None:
+    """Register the bulk_command service if not already registered.
+
+    Runs a list of (device, operation, value) commands against one controller
+    with bounded concurrency and returns a result per command; failures are
+    reported per item rather than aborting the rest of the batch.
+    """
+    if hass.services.has_service(DOMAIN, SERVICE_BULK_COMMAND):
+        return
+
+    async def bulk_command_service_call(call: ServiceCall) -> ServiceResponse:
+        """Run a batch of device commands through the entry's dispatcher."""
+        for _, runtime in _service_targets(hass, call):
+            if runtime.command_dispatcher is None:
+                continue
+            results = await runtime.command_dispatcher.async_run(
+                call.data[ATTR_COMMANDS], call.data[ATTR_MAX_CONCURRENCY]
+            )
+            failed = [result for result in results if not result["success"]]
+            if failed:
+                LOGGER.warning(
+                    "bulk_command: %d of %d commands failed: %s",
+                    len(failed),
+                    len(results),
+                    failed,
+                )
+            return {"results": results}
+        raise _entry_not_found(call, "bulk_command_entry_not_found")
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BULK_COMMAND,
+        bulk_command_service_call,
+        schema=BULK_COMMAND_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
 def _idempotent_unsub(unsub: Callable[[], None]) -> Callable[[], None]:
     """Wrap an unsub callable so it is safe to invoke more than once.
 
@@ -431,57 +535,55 @@ def _idempotent_unsub(unsub: Callable[[], None]) -> Callable[[], None]:
     return _wrapped
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:  # noqa: C901
-    """Set up Bosch SHC from a config entry."""
-    data = entry.data
+def _debounced(
+    hass: HomeAssistant, entry: ConfigEntry, action: Callable[[], None]
+) -> Callable[..., None]:
+    """Return a callback that runs `action` once presence has settled.
 
-    # Pre-flight certificate validity check for clearer user feedback
-    cert_path = data.get(CONF_SSL_CERTIFICATE, "")
-    try:
-        cert_info = (
-            await hass.async_add_executor_job(parse_certificate, cert_path)
-            if cert_path
-            else None
-        )
-    except Exception as err:  # noqa: BLE001  # parsing issues shouldn't block setup
-        LOGGER.warning("Unable to parse Bosch SHC certificate (%s): %s", cert_path, err)
-        cert_info = None
+    Every call restarts a PRESENCE_DEBOUNCE_SECONDS timer; `action` runs when
+    it expires. A timer still pending at unload is cancelled.
+    """
+    pending: list[Callable[[], None] | None] = [None]
 
-    if cert_info is not None:
-        if cert_info.days_remaining < 0:
-            expiry = cert_info.not_after.date()
-            LOGGER.error(
-                "Bosch SHC client certificate expired on %s. Reconfigure integration (put controller in pairing mode and re-authenticate).",
-                expiry,
-            )
-            raise ConfigEntryAuthFailed(
-                f"Client certificate expired on {expiry}. Reconfigure the integration."
-            )
-        if cert_info.days_remaining <= CERT_EXPIRY_WARNING_DAYS:
-            expiry = cert_info.not_after.date()
-            LOGGER.warning(
-                "Bosch SHC client certificate will expire in %d days (on %s). Put controller in pairing mode and reconfigure integration to renew.",
-                cert_info.days_remaining,
-                expiry,
-            )
-            ir.async_create_issue(
-                hass,
-                DOMAIN,
-                f"{ISSUE_CERT_EXPIRING}_{entry.entry_id}",
-                is_fixable=False,
-                severity=ir.IssueSeverity.WARNING,
-                translation_key=ISSUE_CERT_EXPIRING,
-                translation_placeholders={
-                    "title": entry.title,
-                    "days": str(cert_info.days_remaining),
-                    "expiry": str(expiry),
-                },
-            )
-        else:
-            ir.async_delete_issue(
-                hass, DOMAIN, f"{ISSUE_CERT_EXPIRING}_{entry.entry_id}"
-            )
+    @callback  # type: ignore[untyped-decorator]
+    def _fire(_now: Any) -> None:
+        pending[0] = None
+        action()
+
+    @callback  # type: ignore[untyped-decorator]
+    def _schedule(*_args: Any) -> None:
+        if pending[0] is not None:
+            pending[0]()
+        pending[0] = async_call_later(hass, PRESENCE_DEBOUNCE_SECONDS, _fire)
+
+    def _cancel() -> None:
+        if pending[0] is not None:
+            pending[0]()
+            pending[0] = None
+
+    entry.async_on_unload(_cancel)
+    return _schedule
+
+
+def _child_lock_state(device: Any) -> bool | None:
+    """Return a device's cached child lock (bool or ON/OFF enum), else None."""
+    value = getattr(device, "child_lock", None)
+    if isinstance(value, bool):
+        return value
+    return {"ON": True, "OFF": False}.get(getattr(value, "name", None))
+
+
+def _silent_mode_state(device: Any) -> bool | None:
+    """Return whether a device's cached silent mode is MODE_SILENT, else None."""
+    name = getattr(getattr(device, "silentmode", None), "name", None)
+    return {"MODE_SILENT": True, "MODE_NORMAL": False}.get(name)
 
+
+async def _async_create_session(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> SHCSessionAsync:
+    """Build the entry's (not yet initialized) session."""
+    data = entry.data
     # NumberSelector yields a float; the SHC long-poll RPC expects an integer
     # number of seconds, so coerce it.
     long_poll_timeout = int(entry.options.get(OPT_LONG_POLL_TIMEOUT, 10))
@@ -526,14 +628,113 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:  #
             ) from err
     if "external_session" in inspect.signature(SHCSessionAsync.__init__).parameters:
         _session_kwargs["external_session"] = websession
-    session = SHCSessionAsync(
+    return SHCSessionAsync(
         data[CONF_HOST],
         data[CONF_SSL_CERTIFICATE],
         data[CONF_SSL_KEY],
         **_session_kwargs,
     )
+
+
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate an older config entry.
+
+    1.2 re-keys the entities still carrying a serial-based unique id, which
+    needs the device model: from the warm-start snapshot when there is one,
+    else enumerated live. If the controller can't be reached, the entry stays
+    at 1.1 and async_setup_entry migrates with its own session instead.
+    """
+    if entry.version > 1:
+        return False
+    if entry.minor_version >= UNIQUE_ID_MINOR_VERSION:
+        return True
+    try:
+        session = await _async_create_session(hass, entry)
+    except ConfigEntryAuthFailed:
+        # async_setup_entry raises it again, starting the reauth flow.
+        return True
+    snapshot = await SHCSnapshotStore(
+        hass, entry.entry_id, entry.data[CONF_HOST]
+    ).async_load()
+    try:
+        if snapshot is not None:
+            await async_init_from_snapshot(session, snapshot)
+        else:
+            await session.async_init()
+    except Exception as err:  # noqa: BLE001 -- setup migrates instead
+        LOGGER.warning(
+            "Bosch SHC at %s is unavailable, unique id migration will run at setup: %s",
+            entry.data.get(CONF_HOST),
+            err,
+        )
+        return True
+    finally:
+        await session.api.close()
+    await async_migrate_unique_ids(hass, entry, session)
+    return True
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:  # noqa: C901
+    """Set up Bosch SHC from a config entry."""
+    data = entry.data
+
+    # Pre-flight certificate validity check for clearer user feedback
+    cert_path = data.get(CONF_SSL_CERTIFICATE, "")
+    try:
+        cert_info = (
+            await hass.async_add_executor_job(parse_certificate, cert_path)
+            if cert_path
+            else None
+        )
+    except Exception as err:  # noqa: BLE001  # parsing issues shouldn't block setup
+        LOGGER.warning("Unable to parse Bosch SHC certificate (%s): %s", cert_path, err)
+        cert_info = None
+
+    if cert_info is not None:
+        if cert_info.days_remaining < 0:
+            expiry = cert_info.not_after.date()
+            LOGGER.error(
+                "Bosch SHC client certificate expired on %s. Reconfigure integration (put controller in pairing mode and re-authenticate).",
+                expiry,
+            )
+            raise ConfigEntryAuthFailed(
+                f"Client certificate expired on {expiry}. Reconfigure the integration."
+            )
+        if cert_info.days_remaining <= CERT_EXPIRY_WARNING_DAYS:
+            expiry = cert_info.not_after.date()
+            LOGGER.warning(
+                "Bosch SHC client certificate will expire in %d days (on %s). Put controller in pairing mode and reconfigure integration to renew.",
+                cert_info.days_remaining,
+                expiry,
+            )
+            ir.async_create_issue(
+                hass,
+                DOMAIN,
+                f"{ISSUE_CERT_EXPIRING}_{entry.entry_id}",
+                is_fixable=False,
+                severity=ir.IssueSeverity.WARNING,
+                translation_key=ISSUE_CERT_EXPIRING,
+                translation_placeholders={
+                    "title": entry.title,
+                    "days": str(cert_info.days_remaining),
+                    "expiry": str(expiry),
+                },
+            )
+        else:
+            ir.async_delete_issue(
+                hass, DOMAIN, f"{ISSUE_CERT_EXPIRING}_{entry.entry_id}"
+            )
+
+    session = await _async_create_session(hass, entry)
+    # Warm start: build the model from the last run's snapshot (no round trip)
+    # and reconcile it with the controller once the platforms are up.
+    snapshot_store = SHCSnapshotStore(hass, entry.entry_id, data[CONF_HOST])
+    snapshot = await snapshot_store.async_load()
     try:
-        await session.async_init()
+        if snapshot is not None:
+            await async_init_from_snapshot(session, snapshot)
+        else:
+            snapshot_store.async_save_later(await async_init_recording(session))
     except SHCAuthenticationError as err:
         await session.api.close()
         raise ConfigEntryAuthFailed from err
@@ -553,6 +754,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:  #
             err,
         )
         await session.api.close()
+        if snapshot is not None:
+            await snapshot_store.async_remove()
         raise ConfigEntryNotReady from err
 
     shc_info = session.information
@@ -583,6 +786,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:  #
         shc_device=device_entry,
         title=entry.title,
         zigbee_routing_coordinator=zigbee_routing_coordinator,
+        poll_scheduler=SHCPollScheduler(hass, entry),
+        state_writer=SHCStateWriteCoalescer(hass),
+        dispatch_index=SHCDispatchIndex(),
+        command_dispatcher=SHCCommandDispatcher(session),
+        device_index=SHCDeviceIndex(session, device_registry, entry.options),
+        scenario_index=SHCScenarioIndex(session),
+        messages_cache=SHCMessagesCache(session),
+        poll_stats=SHCPollStats(),
+    )
+    # Before either start_polling() path, so the first subscribe is counted.
+    entry.async_on_unload(entry.runtime_data.poll_stats.async_instrument(session.api))
+    # Platforms create most of the registry devices the trigger index resolves.
+    entry.async_on_unload(
+        hass.bus.async_listen(
+            dr.EVENT_DEVICE_REGISTRY_UPDATED,
+            entry.runtime_data.device_index.async_device_registry_updated,
+        )
     )
 
     # #395: before platforms are set up, so a freshly-created UserDefinedState
@@ -594,7 +814,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:  #
     except SHCException as err:
         LOGGER.warning("Keypad bridge sync failed: %s", err)
 
-    # Backgrounded (sequential live per-device queries can take minutes) so
+    # Backgrounded (live per-device queries on a big mesh still take a while) so
     # setup isn't delayed; task kept so unload can cancel it before stop_polling().
     entry.runtime_data.zigbee_routing_refresh_task = entry.async_create_background_task(
         hass,
@@ -706,28 +926,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:  #
             return thermostats, bool_devices
 
         async def _set_child_lock_one(device: Any, lock_state: bool) -> None:
-            """Set child lock on a single device, logging on error."""
-            try:
-                await device.async_set_child_lock(lock_state)
-            except (
-                JSONRPCError,
-                SHCException,
-                AttributeError,
-                aiohttp.ClientError,
-                asyncio.TimeoutError,
-            ) as err:
-                LOGGER.warning(
-                    "Failed to set child_lock=%s on %s: %s",
-                    lock_state,
-                    device.id,
-                    err,
-                )
+            await device.async_set_child_lock(lock_state)
 
         async def _apply_child_lock(lock_state: bool) -> None:
-            """Set child lock on all SHC devices (async; on the event loop)."""
+            """Set child lock on all SHC devices not already in `lock_state`."""
             thermostats, bool_devices = _child_lock_devices(session)
-            for device in thermostats + bool_devices:
-                await _set_child_lock_one(device, lock_state)
+            await async_fleet_apply(
+                thermostats + bool_devices,
+                lock_state,
+                label="child_lock",
+                current=_child_lock_state,
+                write=_set_child_lock_one,
+            )
 
         @callback  # type: ignore[untyped-decorator]
         def _evaluate_child_lock(*_args: Any) -> None:
@@ -736,7 +946,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:  #
             Semantics: child lock ON when ANY tracked entity is present;
             OFF when ALL are away. "Present" is auto-inferred per domain.
             Redundant writes are suppressed via _last_lock_state.
-            Called both on presence state-change events and once at startup
+            Called (debounced) on presence state changes and once at startup
             (see below) so a person already present across a restart/reload
             still gets locked, instead of only on the next state transition.
             """
@@ -759,7 +969,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:  #
 
         entry.runtime_data.presence_unsub = _idempotent_unsub(
             async_track_state_change_event(
-                hass, presence_entities, _evaluate_child_lock
+                hass,
+                presence_entities,
+                _debounced(hass, entry, _evaluate_child_lock),
             )
         )
         # See cert_check_unsub above: guard against leaking this listener on
@@ -767,15 +979,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:  #
         entry.async_on_unload(entry.runtime_data.presence_unsub)
         # Apply the correct state once at startup/reload — otherwise a
         # presence entity already "home" across the restart would leave
-        # devices unlocked until its next state-change event. Trade-off:
-        # _last_lock_state is a fresh local (seeded to None) every time this
-        # runs, so this fires one API write on EVERY setup — including a
-        # lightweight config-entry reload (e.g. an unrelated options-flow
-        # change), not just a real restart — even if the device is already in
-        # the correct lock state. We don't read back the device's actual
-        # current child_lock (extra API round-trip) to dedupe that, since the
-        # write is idempotent and correctness (never leaving an already-home
-        # person unlocked) matters more here than avoiding a redundant write.
+        # devices unlocked until its next state-change event. _last_lock_state
+        # starts at None on every setup, so this always applies; devices whose
+        # cached child_lock already matches are skipped by async_fleet_apply.
         _evaluate_child_lock()
 
     # Presence + time-window driven silent mode: optional, default off.
@@ -829,25 +1035,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:  #
         _last_silent_state: list[bool | None] = [None]
 
         async def _set_silent_one(device: Any, silent_on: bool) -> None:
-            """Set silent mode on a single device, logging on error."""
-            try:
-                await device.async_set_silentmode(silent_on)
-            except (
-                JSONRPCError,
-                SHCException,
-                AttributeError,
-                aiohttp.ClientError,
-                asyncio.TimeoutError,
-            ) as err:
-                LOGGER.warning(
-                    "Failed to set silent_mode=%s on %s: %s",
-                    silent_on,
-                    device.id,
-                    err,
-                )
+            await device.async_set_silentmode(silent_on)
 
         async def _apply_silent(silent_on: bool) -> None:
-            """Set silent mode on all capable SHC devices (async; on the loop)."""
+            """Set silent mode on all capable SHC devices not already there."""
             dh = session.device_helper
             if dh is None:
                 return
@@ -856,8 +1047,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:  #
                 for d in (list(dh.thermostats) + list(dh.roomthermostats))
                 if getattr(d, "supports_silentmode", False)
             ]
-            for device in devices:
-                await _set_silent_one(device, silent_on)
+            await async_fleet_apply(
+                devices,
+                silent_on,
+                label="silent_mode",
+                current=_silent_mode_state,
+                write=_set_silent_one,
+            )
 
         @callback  # type: ignore[untyped-decorator]
         def _evaluate_silent(*_args: Any) -> None:
@@ -874,7 +1070,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:  #
         # Re-evaluate on presence change and at the two window boundaries.
         # Each is also registered via async_on_unload (see cert_check_unsub above).
         _silent_unsub_presence = _idempotent_unsub(
-            async_track_state_change_event(hass, presence_entities, _evaluate_silent)
+            async_track_state_change_event(
+                hass, presence_entities, _debounced(hass, entry, _evaluate_silent)
+            )
         )
         entry.runtime_data.silent_mode_unsubs.append(_silent_unsub_presence)
         entry.async_on_unload(_silent_unsub_presence)
@@ -910,40 +1108,53 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:  #
         )
         await session.stop_polling()
 
-    LOGGER.debug(
-        "Bosch SHC '%s': starting long-poll session (local_push).", entry.title
-    )
-    # Async long-poll: start_polling() creates an asyncio.Task on the loop
-    # (no thread, no executor). Callbacks fire on the event loop directly.
-    try:
-        await session.start_polling()
-    except (SHCConnectionError, SHCSessionError, JSONRPCError) as err:
-        # subscribe (RE/subscribe) is a network call -- a drop here used to
-        # crash setup uncaught and leak the session's aiohttp ClientSession.
-        LOGGER.warning(
-            "Bosch SHC at %s failed to start polling, will retry: %s",
-            data.get(CONF_HOST),
-            err,
+    @callback  # type: ignore[untyped-decorator]
+    def _polling_started() -> None:
+        LOGGER.info("Bosch SHC '%s' connected and polling.", entry.title)
+        entry.runtime_data.polling_handler = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, stop_polling
         )
-        await session.api.close()
-        raise ConfigEntryNotReady from err
-    except Exception as err:  # same rationale as async_init's
-        # fallback above: an unexpected/unwrapped error here must not skip
-        # closing the session.
-        LOGGER.warning(
-            "Bosch SHC at %s failed to start polling unexpectedly, will retry: %s",
-            data.get(CONF_HOST),
-            err,
+        # Warm start: platforms are forwarded by the time the reconcile gets
+        # the long poll going, so the polled resources can start with it.
+        if snapshot is not None and entry.runtime_data.poll_scheduler is not None:
+            entry.runtime_data.poll_scheduler.async_start()
+
+    if snapshot is None:
+        LOGGER.debug(
+            "Bosch SHC '%s': starting long-poll session (local_push).", entry.title
         )
-        await session.api.close()
-        raise ConfigEntryNotReady from err
-    LOGGER.info("Bosch SHC '%s' connected and polling.", entry.title)
-    entry.runtime_data.polling_handler = hass.bus.async_listen_once(
-        EVENT_HOMEASSISTANT_STOP, stop_polling
-    )
+        # Async long-poll: start_polling() creates an asyncio.Task on the loop
+        # (no thread, no executor). Callbacks fire on the event loop directly.
+        try:
+            await session.start_polling()
+        except (SHCConnectionError, SHCSessionError, JSONRPCError) as err:
+            # subscribe (RE/subscribe) is a network call -- a drop here used to
+            # crash setup uncaught and leak the session's aiohttp ClientSession.
+            LOGGER.warning(
+                "Bosch SHC at %s failed to start polling, will retry: %s",
+                data.get(CONF_HOST),
+                err,
+            )
+            await session.api.close()
+            raise ConfigEntryNotReady from err
+        except Exception as err:  # same rationale as async_init's
+            # fallback above: an unexpected/unwrapped error here must not skip
+            # closing the session.
+            LOGGER.warning(
+                "Bosch SHC at %s failed to start polling unexpectedly, will retry: %s",
+                data.get(CONF_HOST),
+                err,
+            )
+            await session.api.close()
+            raise ConfigEntryNotReady from err
+        _polling_started()
 
     @callback  # type: ignore[untyped-decorator]
     def _scenario_trigger(event_data: Any) -> None:
+        if (scenario_index := entry.runtime_data.scenario_index) is not None:
+            scenario_index.async_scenario_triggered(
+                event_data["id"], event_data["name"]
+            )
         # Fired from the async poll loop — already on the event loop, so fire
         # directly (no call_soon_threadsafe marshalling).
         hass.bus.async_fire(
@@ -970,12 +1181,36 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:  #
     # Register rawscan diagnostic service when the option is enabled (default: on).
     # The service is domain-scoped but opt-in: only register when at least one
     # entry enables it; unregister when the last enabling entry is unloaded.
+    entry_registry = async_get_entry_registry(hass)
+    entry_registry.async_add(entry.entry_id, entry.runtime_data)
+    entry.async_on_unload(partial(entry_registry.async_remove, entry.entry_id))
     if entry.options.get(OPT_ENABLE_RAWSCAN, True):
         _register_rawscan_service(hass)
     _register_export_zigbee_topology_service(hass)
     _register_refresh_zigbee_routing_service(hass)
-
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    _register_bulk_command_service(hass)
+
+    if entry.minor_version < UNIQUE_ID_MINOR_VERSION:
+        await async_migrate_unique_ids(hass, entry, session)
+    platforms = async_platforms_to_forward(hass, entry, session, PLATFORMS)
+    async with async_batch_stale_entity_removal(hass, entry):
+        await hass.config_entries.async_forward_entry_setups(entry, platforms)
+    entry.runtime_data.loaded_platforms.update(platforms)
+    _subscribe_platform_loader(hass, entry)
+    entry.runtime_data.applied_options = dict(entry.options)
+    entry.async_on_unload(entry.add_update_listener(_async_options_updated))
+    if snapshot is not None:
+        entry.runtime_data.warm_start_task = entry.async_create_background_task(
+            hass,
+            _async_warm_start_reconcile(
+                hass, entry, snapshot_store, snapshot, _polling_started
+            ),
+            f"{DOMAIN}_{entry.entry_id}_warm_start_reconcile",
+        )
+    # Long poll is subscribed and every platform has registered its polled
+    # resources: only now let their (staggered) first fetches go out.
+    if snapshot is None and entry.runtime_data.poll_scheduler is not None:
+        entry.runtime_data.poll_scheduler.async_start()
 
     # Surface a dismissible tip when cameras are present and the dedicated
     # Camera Tool is not already installed; remove it otherwise.
@@ -1004,9 +1239,121 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:  #
     return True
 
 
+async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply an options change on the live session (see options.py)."""
+    await async_apply_options(hass, entry, PLATFORMS)
+
+
+def _subscribe_platform_loader(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forward a skipped platform once a device added at runtime needs it.
+
+    The device is also added to the entry's device-trigger index.
+    """
+    session = entry.runtime_data.session
+    loaded = entry.runtime_data.loaded_platforms
+    device_index = entry.runtime_data.device_index
+
+    async def _async_load(platforms: list[Platform]) -> None:
+        try:
+            async with async_batch_stale_entity_removal(hass, entry):
+                await hass.config_entries.async_forward_entry_setups(entry, platforms)
+        except OperationNotAllowed:
+            # The entry is unloading; the next setup forwards them anyway.
+            loaded.difference_update(platforms)
+
+    @callback  # type: ignore[untyped-decorator]
+    def _new_device(device: SHCDevice) -> None:
+        if device_index is not None:
+            device_index.async_add_device(device)
+        missing = [
+            platform
+            for platform in PLATFORMS
+            if platform not in loaded
+            and platform_has_sources(platform, session, entry.options)
+        ]
+        if not missing:
+            return
+        LOGGER.debug(
+            "Bosch SHC '%s': new device %s, loading platforms %s",
+            entry.title,
+            device.id,
+            missing,
+        )
+        # Claimed before the forward completes, so a burst of new devices
+        # cannot forward the same platform twice.
+        loaded.update(missing)
+        hass.async_create_task(_async_load(missing))
+
+    # session.subscribe() returns None, so unsubscribe is built manually below.
+    subscriber = (SHCDevice, _new_device)
+    session.subscribe(subscriber)
+
+    def _unsubscribe() -> None:
+        with contextlib.suppress(ValueError):
+            session._subscribers.remove(subscriber)  # noqa: SLF001
+
+    entry.async_on_unload(_unsubscribe)
+
+
+async def _async_warm_start_reconcile(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    snapshot_store: SHCSnapshotStore,
+    snapshot: dict[str, Any],
+    polling_started: Callable[[], None],
+) -> None:
+    """Reconcile a warm-started session with the controller, then poll.
+
+    Reloads the entry when the controller's model changed since the snapshot
+    (with the fresh snapshot saved first), or when it cannot be reached (with
+    the snapshot dropped, so the reload enumerates live and retries as usual).
+    """
+    session = entry.runtime_data.session
+    try:
+        live = await async_fetch(session)
+        in_sync = await async_reconcile(session, snapshot, live)
+        if in_sync:
+            await session.start_polling()
+    except (
+        SHCException,
+        SHCAuthenticationError,
+        JSONRPCError,
+        aiohttp.ClientError,
+        asyncio.TimeoutError,
+    ) as err:
+        LOGGER.warning(
+            "Bosch SHC '%s' could not be reconciled with its snapshot, reloading: %s",
+            entry.title,
+            err,
+        )
+        await snapshot_store.async_remove()
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+        return
+    except Exception:  # noqa: BLE001 -- as on the cold path
+        # An unexpected payload (KeyError, JSONDecodeError) must not leave the
+        # entry on snapshot state without a long poll.
+        LOGGER.exception(
+            "Bosch SHC '%s' failed to reconcile with its snapshot, reloading",
+            entry.title,
+        )
+        await snapshot_store.async_remove()
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+        return
+    snapshot_store.async_save_later(live)
+    if not in_sync:
+        LOGGER.info(
+            "Bosch SHC '%s' devices changed since the last start, reloading.",
+            entry.title,
+        )
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+        return
+    polling_started()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     runtime: SHCData = entry.runtime_data
+    async_get_entry_registry(hass).async_remove(entry.entry_id)
     runtime.session.unsubscribe_scenario_callback("shc")
 
     if runtime.polling_handler is not None:
@@ -1025,13 +1372,30 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     runtime.switch_event_listeners.clear()
     # Cancel before stop_polling() closes the session, else an in-flight
     # refresh races the closed session and logs a spurious traceback.
-    if runtime.zigbee_routing_refresh_task is not None:
-        runtime.zigbee_routing_refresh_task.cancel()
-        with contextlib.suppress(asyncio.CancelledError):
-            await runtime.zigbee_routing_refresh_task
-    await runtime.session.stop_polling()
-
-    unload_ok = bool(await hass.config_entries.async_unload_platforms(entry, PLATFORMS))
+    for task in (runtime.zigbee_routing_refresh_task, runtime.warm_start_task):
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+    if runtime.poll_scheduler is not None:
+        await runtime.poll_scheduler.async_shutdown()
+    if runtime.state_writer is not None:
+        runtime.state_writer.async_cancel()
+    if runtime.messages_cache is not None:
+        runtime.messages_cache.async_cancel()
+    if runtime.dispatch_index is not None:
+        runtime.dispatch_index.async_clear()
+    try:
+        await runtime.session.stop_polling()
+    except SHCSessionError:
+        # Unloaded while a warm start was still reconciling: never polled.
+        await runtime.session.api.close()
+
+    unload_ok = bool(
+        await hass.config_entries.async_unload_platforms(
+            entry, runtime.loaded_platforms
+        )
+    )
     if unload_ok:
         # Issue ids are scoped per entry (see async_setup_entry) so a removed
         # controller's warnings don't linger in Repairs forever.
@@ -1050,7 +1414,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         if not remaining:
             hass.services.async_remove(DOMAIN, SERVICE_TRIGGER_RAWSCAN)
 
-    # Remove export/refresh zigbee services if no loaded entries remain at all
+    # Remove the zigbee and bulk_command services if no loaded entries remain
     # (always-on, unlike rawscan — no per-entry option gates them).
     remaining_any = [
         e
@@ -1062,10 +1426,17 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             hass.services.async_remove(DOMAIN, SERVICE_EXPORT_ZIGBEE_TOPOLOGY)
         if hass.services.has_service(DOMAIN, SERVICE_REFRESH_ZIGBEE_ROUTING):
             hass.services.async_remove(DOMAIN, SERVICE_REFRESH_ZIGBEE_ROUTING)
+        if hass.services.has_service(DOMAIN, SERVICE_BULK_COMMAND):
+            hass.services.async_remove(DOMAIN, SERVICE_BULK_COMMAND)
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the warm-start snapshot of a removed config entry."""
+    await SHCSnapshotStore(hass, entry.entry_id, entry.data[CONF_HOST]).async_remove()
+
+
 async def async_remove_config_entry_device(
     hass: HomeAssistant, entry: ConfigEntry, device_entry: DeviceEntry
 ) -> bool:
@@ -12,16 +12,12 @@ from homeassistant.components.alarm_control_panel.const import (
     AlarmControlPanelState,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import (
-    Platform,
-)
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
-from .entity import async_migrate_to_new_unique_id
 
 PARALLEL_UPDATES = 1
 
@@ -37,13 +33,6 @@ async def async_setup_entry(
     session: SHCSession = config_entry.runtime_data.session
 
     intrusion_system = session.intrusion_system
-    await async_migrate_to_new_unique_id(
-        hass,
-        Platform.ALARM_CONTROL_PANEL,
-        device=intrusion_system,  # type: ignore[arg-type]
-        attr_name=None,
-        old_unique_id=f"{config_entry.entry_id}_{intrusion_system.id}",
-    )
     alarm_control_panel = IntrusionSystemAlarmControlPanel(
         device=intrusion_system,
         entry_id=config_entry.entry_id,
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import contextlib
 import json
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any, Callable
@@ -63,10 +64,11 @@ from .const import (
     SERVICE_SMOKEDETECTOR_ALARMSTATE,
     SERVICE_SMOKEDETECTOR_CHECK,
 )
+from .coordinator import SHCMessagesCache
 from .entity import (
     SHCEntity,
     async_get_device_id,
-    async_migrate_to_new_unique_id,
+    async_on_platform_unload,
     device_excluded,
 )
 
@@ -99,9 +101,6 @@ async def async_setup_entry(  # noqa: C901
     ):
         if device_excluded(shutter_device, config_entry.options):
             continue
-        await async_migrate_to_new_unique_id(
-            hass, Platform.BINARY_SENSOR, device=shutter_device
-        )
         async_add_shuttercontact(device=shutter_device)
 
     # session.subscribe() returns None, so unsubscribe is built manually below.
@@ -112,14 +111,11 @@ async def async_setup_entry(  # noqa: C901
         with contextlib.suppress(ValueError):
             session._subscribers.remove(_shutter_subscriber)  # noqa: SLF001
 
-    config_entry.async_on_unload(_unsubscribe_shutter)
+    async_on_platform_unload(config_entry, Platform.BINARY_SENSOR, _unsubscribe_shutter)
 
     for motion_device in session.device_helper.motion_detectors:
         if device_excluded(motion_device, config_entry.options):
             continue
-        await async_migrate_to_new_unique_id(
-            hass, Platform.BINARY_SENSOR, device=motion_device
-        )
         entities.append(
             MotionDetectionSensor(
                 hass=hass,
@@ -131,9 +127,6 @@ async def async_setup_entry(  # noqa: C901
     for motion2_device in session.device_helper.motion_detectors2:
         if device_excluded(motion2_device, config_entry.options):
             continue
-        await async_migrate_to_new_unique_id(
-            hass, Platform.BINARY_SENSOR, device=motion2_device
-        )
         entities.append(
             MotionDetectionSensor(
                 hass=hass,
@@ -141,9 +134,6 @@ async def async_setup_entry(  # noqa: C901
                 entry_id=config_entry.entry_id,
             )
         )
-        await async_migrate_to_new_unique_id(
-            hass, Platform.BINARY_SENSOR, device=motion2_device, attr_name="Occupancy"
-        )
         entities.append(
             OccupancyDetectionSensor(
                 device=motion2_device,
@@ -160,9 +150,6 @@ async def async_setup_entry(  # noqa: C901
     for smoke_device in session.device_helper.smoke_detectors:
         if device_excluded(smoke_device, config_entry.options):
             continue
-        await async_migrate_to_new_unique_id(
-            hass, Platform.BINARY_SENSOR, device=smoke_device
-        )
         entities.append(
             SmokeDetectorSensor(
                 device=smoke_device,
@@ -198,20 +185,27 @@ async def async_setup_entry(  # noqa: C901
                 session=session,
                 smoke_detection_system=smoke_detection_system,
                 hass=hass,
+                messages_cache=getattr(
+                    config_entry.runtime_data, "messages_cache", None
+                ),
             )
-            # Initial refresh (async; awaits get_messages on the loop).
+            # Initial refresh (async; reads the entry's shared messages cache).
             await tracker.async_refresh()
 
             def _cleanup_tracker() -> None:
                 tracker.teardown()
 
-            config_entry.async_on_unload(_cleanup_tracker)
+            async_on_platform_unload(
+                config_entry, Platform.BINARY_SENSOR, _cleanup_tracker
+            )
             # async_listen_once returns an unsubscribe callable; register it so the
             # listener is removed on config-entry reload (prevents closure leak).
-            config_entry.async_on_unload(
+            async_on_platform_unload(
+                config_entry,
+                Platform.BINARY_SENSOR,
                 hass.bus.async_listen_once(
                     EVENT_HOMEASSISTANT_STOP, lambda _: tracker.teardown()
-                )
+                ),
             )
 
             for twinguard_device in twinguards:
@@ -228,9 +222,6 @@ async def async_setup_entry(  # noqa: C901
     for water_leak_device in session.device_helper.water_leakage_detectors:
         if device_excluded(water_leak_device, config_entry.options):
             continue
-        await async_migrate_to_new_unique_id(
-            hass, Platform.BINARY_SENSOR, device=water_leak_device
-        )
         entities.append(
             WaterLeakageDetectorSensor(
                 device=water_leak_device,
@@ -265,9 +256,6 @@ async def async_setup_entry(  # noqa: C901
     ):
         if device_excluded(battery_device, config_entry.options):
             continue
-        await async_migrate_to_new_unique_id(
-            hass, Platform.BINARY_SENSOR, device=battery_device, attr_name="Battery"
-        )
         if battery_device.supports_batterylevel:
             entities.append(
                 BatterySensor(
@@ -408,6 +396,8 @@ class SHCBinarySensorEntityDescription[_DeviceT: SHCDevice](
     is_on_fn: Callable[[_DeviceT], bool]
     attributes_fn: Callable[[_DeviceT], dict[str, Any]] | None = None
     unique_id_suffix: str | None = None
+    # Device services is_on_fn/attributes_fn read; None wakes on every service.
+    service_ids: tuple[str, ...] | None = None
 
 
 class SHCBinarySensor[_DeviceT: SHCDevice](SHCEntity, BinarySensorEntity):  # type: ignore[misc]
@@ -415,6 +405,8 @@ class SHCBinarySensor[_DeviceT: SHCDevice](SHCEntity, BinarySensorEntity):  # ty
 
     entity_description: SHCBinarySensorEntityDescription[_DeviceT]
     _device: _DeviceT
+    # e.g. a multi-service device's unrelated push must not rewrite this state.
+    _state_fingerprint_attrs = ("is_on", "extra_state_attributes")
 
     def __init__(
         self, device: _DeviceT, entry_id: str, device_name: str | None = None
@@ -689,10 +681,12 @@ class SHCShutterContactSensorEntityDescription(BinarySensorEntityDescription):
     """Describes a SHC shutter contact binary sensor."""
 
     is_on_fn: Callable[[SHCShutterContact], bool]
+    service_ids: tuple[str, ...] | None = None
 
 
 SHUTTER_CONTACT_DESCRIPTION = SHCShutterContactSensorEntityDescription(
     key="shutter_contact",
+    service_ids=("ShutterContact",),
     is_on_fn=lambda device: bool(device.state is ShutterContactService.State.OPEN),
 )
 
@@ -734,6 +728,7 @@ class ShutterContactSensor(SHCEntity, BinarySensorEntity):  # type: ignore[misc]
 
 _VIBRATION_DESCRIPTION = SHCBinarySensorEntityDescription[SHCShutterContact2Plus](
     key="vibration",
+    service_ids=("VibrationSensor",),
     is_on_fn=lambda device: bool(
         device.vibrationsensor is VibrationSensorService.State.VIBRATION_DETECTED
     ),
@@ -1044,6 +1039,7 @@ class SmokeDetectorSensor(SHCEntity, BinarySensorEntity):  # type: ignore[misc]
 
 _WATER_LEAKAGE_DESCRIPTION = SHCBinarySensorEntityDescription[SHCWaterLeakageSensor](
     key="water_leakage",
+    service_ids=("WaterLeakageSensor", "WaterLeakageSensorTilt"),
     is_on_fn=lambda device: bool(
         device.leakage_state is not WaterLeakageSensorService.State.NO_LEAKAGE
     ),
@@ -1187,9 +1183,10 @@ class TwinguardAlarmTracker:
     ``arguments.surveillanceEvents[].triggerId`` maps back to the individual
     Twinguard device id.
 
-    ``refresh()`` does blocking HTTP and MUST NOT be called from the event loop.
-    Callbacks fire from the async polling loop on the event loop; listeners are
-    called directly without call_soon_threadsafe marshalling.
+    Messages are read through the entry's SHCMessagesCache, shared with any
+    other reader. Callbacks fire from the async polling loop on the event
+    loop; listeners are called directly without call_soon_threadsafe
+    marshalling.
     """
 
     def __init__(
@@ -1197,9 +1194,11 @@ class TwinguardAlarmTracker:
         session: SHCSession,
         smoke_detection_system: SHCSmokeDetectionSystem,
         hass: HomeAssistant,
+        messages_cache: SHCMessagesCache | None = None,
     ) -> None:
         """Initialize the tracker (no I/O; call refresh() separately)."""
         self._session = session
+        self._messages_cache = messages_cache or SHCMessagesCache(session)
         self._smoke_detection_system = smoke_detection_system
         self._hass = hass
         self._service = None
@@ -1251,20 +1250,23 @@ class TwinguardAlarmTracker:
         """Return whether a smoke alarm is active for the given Twinguard device id."""
         return device_id in self._active_trigger_ids
 
-    async def async_refresh(self) -> None:
+    async def async_refresh(self, since: float | None = None) -> None:
         """Refresh active trigger ids from the SHC (async; on the event loop).
 
         Safe to call multiple times; skips notification if state did not change.
+        `since` (time.monotonic()) asks for messages fetched no earlier than
+        that; without it a recently cached list will do.
 
         Concurrency: _handle_alarm_update() fires a new task per
-        SurveillanceAlarm callback with no de-dup — a burst of updates (e.g.
-        multiple Twinguards, or an ON immediately followed by an OFF) can have
-        two async_refresh() calls in flight at once, awaiting get_messages()
-        with no ordering guarantee on which HTTP response lands first. Guard
-        with a monotonic generation counter so only the most-recently-STARTED
-        call's result is applied — an in-flight call whose result arrives
-        after a newer call has already started is a stale/superseded read and
-        is discarded rather than overwriting fresher state.
+        SurveillanceAlarm callback — a burst of updates (e.g. multiple
+        Twinguards, or an ON immediately followed by an OFF) shares the
+        cache's in-flight GET and at most one queued behind it, but several
+        async_refresh() calls can still be awaiting at once with no ordering
+        guarantee on which resumes first. Guard with a monotonic generation
+        counter so only the most-recently-STARTED call's result is applied —
+        an in-flight call whose result arrives after a newer call has already
+        started is a stale/superseded read and is discarded rather than
+        overwriting fresher state.
         """
         if self._torn_down:
             return
@@ -1274,11 +1276,11 @@ class TwinguardAlarmTracker:
         if alarm_state == SurveillanceAlarmService.State.ALARM_OFF.name:
             new_trigger_ids: set[str] = set()
         else:
-            new_trigger_ids = await self._extract_trigger_ids_from_messages()
+            new_trigger_ids = await self._extract_trigger_ids_from_messages(since)
 
         if my_generation != self._refresh_generation:
-            # A newer async_refresh() started while we were awaiting
-            # get_messages() above — this result is stale, discard it.
+            # A newer async_refresh() started while we were awaiting the
+            # messages above — this result is stale, discard it.
             return
 
         if (
@@ -1314,15 +1316,18 @@ class TwinguardAlarmTracker:
         """Handle a SurveillanceAlarm update (fired on the event loop).
 
         The async session fires this callback on the loop; schedule the async
-        refresh (it awaits get_messages) as a task so the poll loop isn't
-        blocked on the follow-up HTTP call.
+        refresh (it awaits the messages) as a task so the poll loop isn't
+        blocked on the follow-up HTTP call. The alarm changed now, so a list
+        cached or requested before this callback won't do.
         """
-        self._hass.async_create_task(self.async_refresh())
+        self._hass.async_create_task(self.async_refresh(time.monotonic()))
 
-    async def _extract_trigger_ids_from_messages(self) -> set[str]:
+    async def _extract_trigger_ids_from_messages(
+        self, since: float | None = None
+    ) -> set[str]:
         """Extract active Twinguard trigger ids from SMOKE_ALARM messages."""
         try:
-            messages = await self._session.api.get_messages()
+            messages = await self._messages_cache.async_get(since)
 
             trigger_ids: set[str] = set()
             for message in messages:
@@ -1479,6 +1484,7 @@ def _battery_sensor_is_on(device: SHCBatteryDevice) -> bool:
 
 _BATTERY_DESCRIPTION = SHCBinarySensorEntityDescription[SHCBatteryDevice](
     key="battery",
+    service_ids=("BatteryLevel",),
     is_on_fn=_battery_sensor_is_on,
     unique_id_suffix="battery",
 )
@@ -1494,6 +1500,7 @@ class BatterySensor(SHCBinarySensor[SHCBatteryDevice]):  # type: ignore[misc]
 
 _OCCUPANCY_DESCRIPTION = SHCBinarySensorEntityDescription[SHCMotionDetector2](
     key="occupancy",
+    service_ids=("OccupancyDetection",),
     is_on_fn=lambda device: bool(device.occupied),
     attributes_fn=lambda device: {
         "last_occupancy_change": device.last_occupancy_change_time,
@@ -1513,6 +1520,7 @@ class OccupancyDetectionSensor(SHCBinarySensor[SHCMotionDetector2]):  # type: ig
 
 _TAMPER_DESCRIPTION = SHCBinarySensorEntityDescription[SHCMotionDetector2](
     key="tamper",
+    service_ids=("LatestTamper",),
     is_on_fn=lambda device: bool(getattr(device, "was_tampered", False)),
     attributes_fn=lambda device: {
         "last_tamper_time": getattr(device, "last_tamper_time", None),
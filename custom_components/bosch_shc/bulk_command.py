@@ -0,0 +1,209 @@
+"""Bulk device commands for the bosch_shc.bulk_command action.
+
+HA scripts that move 20 shutters or switch 40 relays fan out to one entity
+service call per device, each serialized by the platform's PARALLEL_UPDATES
+and each a separate HTTPS request. bulk_command takes the whole list and runs
+it through a per-controller dispatcher with bounded concurrency, reusing the
+same boschshcpy ``async_set_*`` device methods cover.py, switch.py and
+light.py call, and reports a result per item.
+
+The dispatcher writes to the devices directly: entity-side bookkeeping (e.g.
+a cover's opening/closing flags) follows from the long-poll push, as it does
+for a command sent from the Bosch app.
+
+async_fleet_apply is the same idea for integration-driven writes (the
+presence child lock and silent mode): one target state for many devices,
+skipping those already there and retrying transient failures per device.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from typing import Any
+
+import aiohttp
+import voluptuous as vol
+from boschshcpy import SHCSessionAsync
+from boschshcpy.api import JSONRPCError
+from boschshcpy.exceptions import SHCConnectionError, SHCException
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.helpers import config_validation as cv
+
+from .const import ATTR_OPERATION, ATTR_VALUE, LOGGER
+
+# In-flight writes per controller, shared by every concurrent bulk_command.
+CONTROLLER_MAX_CONCURRENCY = 8
+DEFAULT_CONCURRENCY = 4
+
+# async_fleet_apply: in-flight writes, attempts per device, pause between them.
+FLEET_MAX_CONCURRENCY = 4
+FLEET_WRITE_ATTEMPTS = 2
+FLEET_RETRY_DELAY = 1.0
+
+# operation -> (device methods tried in order, value -> positional arguments).
+# turn_on/turn_off: PowerSwitch relays first, then SHCLight's BinarySwitch.
+_OPERATIONS: dict[str, tuple[tuple[str, ...], Callable[[Any], tuple[Any, ...]]]] = {
+    "turn_on": (
+        ("async_set_switchstate", "async_set_binarystate"),
+        lambda _value: (True,),
+    ),
+    "turn_off": (
+        ("async_set_switchstate", "async_set_binarystate"),
+        lambda _value: (False,),
+    ),
+    "open": (("async_set_level",), lambda _value: (1.0,)),
+    "close": (("async_set_level",), lambda _value: (0.0,)),
+    "set_position": (("async_set_level",), lambda value: (value / 100.0,)),
+    "stop": (("async_stop",), lambda _value: ()),
+    "set_brightness": (("async_set_brightness",), lambda value: (round(value),)),
+}
+OPERATIONS = tuple(_OPERATIONS)
+
+# Operations that take a value, with its valid (inclusive) range.
+_VALUE_RANGES = {"set_position": (0, 100), "set_brightness": (1, 100)}
+
+
+def _validate_value(command: dict[str, Any]) -> dict[str, Any]:
+    """Require an in-range value for the operations that take one."""
+    bounds = _VALUE_RANGES.get(command[ATTR_OPERATION])
+    if bounds is None:
+        return command
+    value = command.get(ATTR_VALUE)
+    if value is None or not bounds[0] <= value <= bounds[1]:
+        raise vol.Invalid(
+            f"{command[ATTR_OPERATION]} needs a value between "
+            f"{bounds[0]} and {bounds[1]}"
+        )
+    return command
+
+
+BULK_COMMAND_ITEM_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(ATTR_DEVICE_ID): cv.string,
+            vol.Required(ATTR_OPERATION): vol.In(OPERATIONS),
+            vol.Optional(ATTR_VALUE): vol.Coerce(float),
+        }
+    ),
+    _validate_value,
+)
+
+
+class SHCCommandDispatcher:
+    """Runs bulk device commands against one controller.
+
+    Two limits apply: the call's own ``max_concurrency`` and a controller-wide
+    ceiling, so two overlapping bulk calls cannot flood the SHC together.
+    """
+
+    def __init__(
+        self, session: SHCSessionAsync, limit: int = CONTROLLER_MAX_CONCURRENCY
+    ) -> None:
+        """Initialize the dispatcher."""
+        self._session = session
+        self._controller_slots = asyncio.Semaphore(limit)
+
+    async def async_run(
+        self, commands: Sequence[Mapping[str, Any]], max_concurrency: int
+    ) -> list[dict[str, Any]]:
+        """Run `commands`; return one result per command, in input order."""
+        call_slots = asyncio.Semaphore(max_concurrency)
+
+        async def run_one(command: Mapping[str, Any]) -> dict[str, Any]:
+            async with call_slots, self._controller_slots:
+                return await self._async_execute(command)
+
+        return list(await asyncio.gather(*(run_one(c) for c in commands)))
+
+    async def _async_execute(self, command: Mapping[str, Any]) -> dict[str, Any]:
+        device_id = command[ATTR_DEVICE_ID]
+        operation = command[ATTR_OPERATION]
+        result: dict[str, Any] = {
+            ATTR_DEVICE_ID: device_id,
+            ATTR_OPERATION: operation,
+            "success": False,
+        }
+        try:
+            device = self._session.device(device_id)
+        except KeyError:
+            result["error"] = "unknown_device"
+            return result
+        method_names, arguments = _OPERATIONS[operation]
+        method = next(
+            (getattr(device, name) for name in method_names if hasattr(device, name)),
+            None,
+        )
+        if method is None:
+            result["error"] = "unsupported_operation"
+            return result
+        try:
+            await method(*arguments(command.get(ATTR_VALUE)))
+        except (
+            SHCException,
+            SHCConnectionError,
+            aiohttp.ClientError,
+            asyncio.TimeoutError,
+        ) as err:
+            result["error"] = str(err) or type(err).__name__
+            return result
+        result["success"] = True
+        return result
+
+
+async def async_fleet_apply(
+    devices: Sequence[Any],
+    target: bool,
+    *,
+    label: str,
+    current: Callable[[Any], bool | None],
+    write: Callable[[Any, bool], Awaitable[None]],
+    max_concurrency: int = FLEET_MAX_CONCURRENCY,
+    attempts: int = FLEET_WRITE_ATTEMPTS,
+) -> dict[str, int]:
+    """Drive every device in `devices` to `target`; return the write counts.
+
+    `current` reads a device's state (None when unknown); devices already at
+    `target` are skipped. The rest are written with at most `max_concurrency`
+    in flight, each retried up to `attempts` times in total before a warning
+    is logged. A device lacking the setter (AttributeError) is not retried.
+    """
+    pending = [device for device in devices if current(device) != target]
+    slots = asyncio.Semaphore(max_concurrency)
+
+    async def apply_one(device: Any) -> bool:
+        for attempt in range(1, attempts + 1):
+            try:
+                async with slots:
+                    await write(device, target)
+            except AttributeError as err:
+                LOGGER.warning(
+                    "Failed to set %s=%s on %s: %s", label, target, device.id, err
+                )
+                return False
+            except (
+                JSONRPCError,
+                SHCException,
+                aiohttp.ClientError,
+                asyncio.TimeoutError,
+            ) as err:
+                if attempt == attempts:
+                    LOGGER.warning(
+                        "Failed to set %s=%s on %s: %s",
+                        label,
+                        target,
+                        device.id,
+                        err,
+                    )
+                    return False
+                await asyncio.sleep(FLEET_RETRY_DELAY)
+            else:
+                return True
+        return False
+
+    written = sum(await asyncio.gather(*(apply_one(d) for d in pending)))
+    return {
+        "written": written,
+        "skipped": len(devices) - len(pending),
+        "failed": len(pending) - written,
+    }
@@ -104,9 +104,11 @@ async def async_setup_entry(  # noqa: C901
                 )
             )
         else:
-            await async_remove_stale_entity(hass, Platform.BUTTON, walk_test_unique_id)
             await async_remove_stale_entity(
-                hass, Platform.BUTTON, walk_test_stop_unique_id
+                hass, config_entry, Platform.BUTTON, walk_test_unique_id
+            )
+            await async_remove_stale_entity(
+                hass, config_entry, Platform.BUTTON, walk_test_stop_unique_id
             )
 
     # DetectionTest start/stop + tamper reset for Motion Detector II — the
@@ -131,10 +133,10 @@ async def async_setup_entry(  # noqa: C901
             )
         else:
             await async_remove_stale_entity(
-                hass, Platform.BUTTON, detection_test_unique_id
+                hass, config_entry, Platform.BUTTON, detection_test_unique_id
             )
             await async_remove_stale_entity(
-                hass, Platform.BUTTON, detection_test_stop_unique_id
+                hass, config_entry, Platform.BUTTON, detection_test_stop_unique_id
             )
         # resetTamperedState — reset_tampered_state()/async_reset_tampered_state()
         # are defined unconditionally on the class, so a plain hasattr() check
@@ -149,7 +151,7 @@ async def async_setup_entry(  # noqa: C901
             )
         else:
             await async_remove_stale_entity(
-                hass, Platform.BUTTON, reset_tamper_unique_id
+                hass, config_entry, Platform.BUTTON, reset_tamper_unique_id
             )
 
     # entry_unique_id/entry_id computed unconditionally (not just when the
@@ -178,7 +180,7 @@ async def async_setup_entry(  # noqa: C901
             return None
 
     # Toggling OPT_SCENARIOS_AS_BUTTONS off, or narrowing OPT_SCENARIOS_FILTER,
-    # reloads the config entry (OptionsFlowWithReload) but HA never removes a
+    # re-runs this platform's setup (options.py) but HA never removes a
     # disabled/no-longer-applicable entity from the registry on its own —
     # without this, a previously-created scenario button is orphaned forever
     # (same bug class as #356's MD2 indicator light).
@@ -198,7 +200,10 @@ async def async_setup_entry(  # noqa: C901
                 entities.append(btn)
         elif scenario_id is not None:
             await async_remove_stale_entity(
-                hass, Platform.BUTTON, f"{scenario_prefix}_scenario_{scenario_id}"
+                hass,
+                config_entry,
+                Platform.BUTTON,
+                f"{scenario_prefix}_scenario_{scenario_id}",
             )
 
     # Same stale-entity cleanup for automation-rule trigger buttons: toggling
@@ -219,7 +224,10 @@ async def async_setup_entry(  # noqa: C901
             )
         elif rule_id is not None:
             await async_remove_stale_entity(
-                hass, Platform.BUTTON, f"{entry_id}_automation_rule_{rule_id}_trigger"
+                hass,
+                config_entry,
+                Platform.BUTTON,
+                f"{entry_id}_automation_rule_{rule_id}_trigger",
             )
 
     # async_mute() existed but was unreachable (no HA mute hook/service) --
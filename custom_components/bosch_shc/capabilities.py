@@ -0,0 +1,150 @@
+"""Which platforms a controller needs, derived once from its device model.
+
+Forwarding a platform imports its module, runs its async_setup_entry and
+walks the device_helper buckets it reads; a home without covers, climate or
+an alarm system pays that for platforms that end up with zero entities. The
+capability map below names, per platform, what its setup builds entities
+from, so async_setup_entry only forwards the platforms that have something to
+build. A platform that already has entities in the entity registry for the
+entry is always forwarded, so its stale-entity cleanup and unique-id
+migrations keep running when its last device goes away.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+from boschshcpy import SHCSessionAsync
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from .const import OPT_TEMPERATURE_DROP_ENTITIES
+
+# Always forwarded: the controller, scenarios, automation rules and
+# user-defined states give every home entities on these.
+_ALWAYS_FORWARDED = frozenset(
+    {
+        Platform.BINARY_SENSOR,
+        Platform.BUTTON,
+        Platform.SENSOR,
+        Platform.SWITCH,
+        Platform.UPDATE,
+    }
+)
+
+# Platform -> device_helper buckets its async_setup_entry builds entities from.
+_PLATFORM_BUCKETS: dict[Platform, tuple[str, ...]] = {
+    Platform.CLIMATE: ("climate_controls", "heating_circuits"),
+    Platform.COVER: (
+        "shutter_controls",
+        "micromodule_shutter_controls",
+        "micromodule_blinds",
+    ),
+    Platform.EVENT: (
+        "universal_switches",
+        "micromodule_light_controls",
+        "motion_detectors",
+        "motion_detectors2",
+        "smoke_detectors",
+    ),
+    Platform.LIGHT: (
+        "ledvance_lights",
+        "hue_lights",
+        "micromodule_dimmers",
+        "motion_detectors2",
+        "light_switches_bsm",
+        "micromodule_light_attached",
+    ),
+    Platform.NUMBER: (
+        "thermostats",
+        "roomthermostats",
+        "wallthermostats",
+        "micromodule_impulse_relays",
+        "heating_circuits",
+        "shutter_contacts2",
+        "smart_plugs",
+        "smart_plugs_compact",
+        "outdoor_sirens",
+        "micromodule_dimmers",
+    ),
+    Platform.SELECT: (
+        "thermostats",
+        "roomthermostats",
+        "wallthermostats",
+        "motion_detectors2",
+        "shutter_contacts2",
+        "smart_plugs",
+        "smart_plugs_compact",
+        "smoke_detectors",
+        "twinguards",
+        "micromodule_relays",
+        "micromodule_light_controls",
+        "outdoor_sirens",
+        "micromodule_dimmers",
+    ),
+    Platform.VALVE: ("thermostats",),
+}
+
+# Entity sources outside the device_helper buckets, per platform.
+_PLATFORM_EXTRAS: dict[
+    Platform, Callable[[SHCSessionAsync, Mapping[str, Any]], bool]
+] = {
+    Platform.ALARM_CONTROL_PANEL: lambda session, _options: (
+        session.intrusion_system is not None
+    ),
+    Platform.EVENT: lambda session, _options: bool(
+        session.scenarios
+        or getattr(session.device_helper, "smoke_detection_system", None)
+    ),
+    # Per-room temperature-drop numbers are opt-in.
+    Platform.NUMBER: lambda session, options: bool(
+        options.get(OPT_TEMPERATURE_DROP_ENTITIES, False)
+        and getattr(session.device_helper, "climate_controls", None)
+    ),
+}
+
+
+def platform_has_sources(
+    platform: Platform, session: SHCSessionAsync, options: Mapping[str, Any]
+) -> bool:
+    """Return True if `platform`'s setup would find something to build."""
+    if platform in _ALWAYS_FORWARDED:
+        return True
+    buckets = _PLATFORM_BUCKETS.get(platform)
+    extra = _PLATFORM_EXTRAS.get(platform)
+    if buckets is None and extra is None:
+        # Unmapped platform: forward rather than risk dropping its entities.
+        return True
+    device_helper = session.device_helper
+    if device_helper is not None and any(
+        getattr(device_helper, bucket, None) for bucket in buckets or ()
+    ):
+        return True
+    return extra is not None and extra(session, options)
+
+
+def _registered_platforms(hass: HomeAssistant, entry_id: str) -> set[str]:
+    """Return the platforms the entry already has registry entities on."""
+    return {
+        entity.domain
+        for entity in er.async_entries_for_config_entry(er.async_get(hass), entry_id)
+    }
+
+
+def async_platforms_to_forward(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    session: SHCSessionAsync,
+    platforms: Iterable[Platform],
+) -> list[Platform]:
+    """Return the subset of `platforms` worth forwarding for this entry."""
+    registered = _registered_platforms(hass, entry.entry_id)
+    return [
+        platform
+        for platform in platforms
+        if platform in registered
+        or platform_has_sources(platform, session, entry.options)
+    ]
@@ -240,6 +240,8 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore[call
     """Handle a config flow for Bosch SHC."""
 
     VERSION = 1
+    # 1.2: entities re-keyed from the device serial (migration.py).
+    MINOR_VERSION = 2
     info: dict[str, Any] | None = None
     host: str | None = None
     hostname: str | None = None
@@ -579,7 +581,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore[call
         )
 
 
-class OptionsFlowHandler(config_entries.OptionsFlowWithReload):  # type: ignore[misc]
+class OptionsFlowHandler(config_entries.OptionsFlow):  # type: ignore[misc]
     """Handle options flow for Bosch SHC."""
 
     async def async_step_init(
@@ -3,11 +3,18 @@
 import logging
 
 ATTR_NAME = "name"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
 ATTR_EVENT_TYPE = "event_type"
 ATTR_EVENT_SUBTYPE = "event_subtype"
 ATTR_LAST_TIME_TRIGGERED = "lastTimeTriggered"
 ATTR_SERVICE_ID = "service_id"
 ATTR_TITLE = "title"
+ATTR_INCREMENTAL = "incremental"
+ATTR_MAX_AGE = "max_age"
+ATTR_COMMANDS = "commands"
+ATTR_MAX_CONCURRENCY = "max_concurrency"
+ATTR_OPERATION = "operation"
+ATTR_VALUE = "value"
 
 CONF_HOSTNAME = "hostname"
 CONF_SHC_CERT = "bosch_shc-cert"
@@ -28,6 +35,7 @@ SERVICE_TRIGGER_SCENARIO = "trigger_scenario"
 SERVICE_TRIGGER_RAWSCAN = "trigger_rawscan"
 SERVICE_EXPORT_ZIGBEE_TOPOLOGY = "export_zigbee_topology"
 SERVICE_REFRESH_ZIGBEE_ROUTING = "refresh_zigbee_routing"
+SERVICE_BULK_COMMAND = "bulk_command"
 
 # Options flow keys
 OPT_SCENARIOS_AS_BUTTONS = "scenarios_as_buttons"
@@ -1,28 +1,138 @@
-"""DataUpdateCoordinator for Zigbee mesh routing-quality diagnostics.
+"""DataUpdateCoordinators for the data the long-poll stream doesn't deliver.
 
 Follows the documented pattern (developers.home-assistant.io/docs/
-integration_fetching_data/) for genuinely-polled data. This is the one piece
-of data in the integration that is NOT delivered by the long-poll stream
-(iot_class local_push) — SHCSessionAsync.get_zigbee_routing_info is an
-on-demand HTTPS GET per device, so it needs its own poll loop instead of the
-push-entity pattern every other platform in this integration uses.
+integration_fetching_data/) for genuinely-polled data. Everything else in
+this integration is push (iot_class local_push); the exceptions are Zigbee
+routing info (SHCSessionAsync.get_zigbee_routing_info, an on-demand HTTPS
+GET per device) and a handful of plain REST resources -- firmware state,
+room temperature-drop config, automation rules, ... -- that
+SHCPollScheduler polls once on behalf of every entity reading them.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import contextlib
+import time
+import zlib
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
 
-from boschshcpy.exceptions import SHCConnectionError, SHCException
+from boschshcpy.exceptions import JSONRPCError, SHCConnectionError, SHCException
+from boschshcpy.zigbee_routing import SHCZigbeeRoutingInfo
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+from homeassistant.util.async_ import create_eager_task
 
 from .const import DOMAIN, LOGGER
 
 if TYPE_CHECKING:
     from boschshcpy import SHCSessionAsync
-    from boschshcpy.zigbee_routing import SHCZigbeeRoutingInfo
+    from boschshcpy.zigbee_routing import ZigbeeRoutingHop
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
 
+# Small in-flight window: enough to overlap one sleepy end device's wait with
+# other queries, without flooding the mesh with concurrent route requests.
+DEFAULT_ZIGBEE_ROUTING_CONCURRENCY = 3
+# Per-device cap (seconds) so one unresponsive node can't stall the refresh.
+DEFAULT_ZIGBEE_ROUTING_DEVICE_TIMEOUT = 20.0
+# Incremental mode: a device answered more recently than this (seconds) is
+# carried over from the previous cycle instead of being re-queried.
+DEFAULT_ZIGBEE_ROUTING_MAX_AGE = 3600.0
+
+# Hop qualities from best to worst, for approximating an inferred aggregate.
+_QUALITY_RANK = {"GOOD": 0, "MEDIUM": 1, "BAD": 2}
+
+# Window (seconds) the first fetch of a resource with no setup-probe value is
+# spread over, so entities don't sit unknown for a whole (6h) interval.
+_FIRST_REFRESH_WINDOW = 120.0
+# A resource whose fetch keeps failing backs off to at most 2**3 intervals.
+_MAX_BACKOFF_EXPONENT = 3
+# Fast polling stretches towards this while the data stays unchanged.
+_FAST_POLL_MAX = timedelta(minutes=5)
+# How long (seconds) a fetched /messages list is served to readers that
+# accept any recent copy; alarm callbacks ask for a newer one explicitly.
+MESSAGES_CACHE_TTL = 5.0
+# Upper bounds of the long-poll health histograms: round trip (seconds), and
+# results per poll; each has one more, open-ended bucket past the last bound.
+POLL_ROUND_TRIP_BUCKETS = (0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0, 60.0)
+POLL_EVENTS_BUCKETS = (0, 1, 2, 5, 10, 25, 50)
+
+
+@dataclass
+class ZigbeeRoutingRefreshStats:
+    """Per-device timing of the last routing refresh, for tuning the window."""
+
+    concurrency: int
+    device_timeout: float
+    incremental: bool = False
+    duration: float = 0.0
+    latency: dict[str, float] = field(default_factory=dict)
+    timed_out: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+    reused: list[str] = field(default_factory=list)
+    inferred: list[str] = field(default_factory=list)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable view (device ids under a redactable key)."""
+        devices: list[dict[str, Any]] = [
+            {
+                "device_id": device_id,
+                "latency": round(latency, 3),
+                "result": "timeout"
+                if device_id in self.timed_out
+                else "error"
+                if device_id in self.failed
+                else "ok",
+            }
+            for device_id, latency in self.latency.items()
+        ]
+        devices.extend(
+            {"device_id": device_id, "latency": None, "result": result}
+            for result, device_ids in (
+                ("reused", self.reused),
+                ("inferred", self.inferred),
+            )
+            for device_id in device_ids
+        )
+        return {
+            "concurrency": self.concurrency,
+            "device_timeout": self.device_timeout,
+            "incremental": self.incremental,
+            "duration": round(self.duration, 3),
+            "queried": len(self.latency),
+            "devices": devices,
+        }
+
+
+def _inferred_routing_info(
+    device_id: str, route: list[ZigbeeRoutingHop]
+) -> SHCZigbeeRoutingInfo:
+    """Build a router's routing info from the tail of another device's route.
+
+    The tail starting at the router is exactly the router's own hop chain to
+    the controller. The SHC's aggregate isn't part of it, so it is
+    approximated as the worst hop on that chain.
+    """
+    worst = max(
+        route, key=lambda hop: _QUALITY_RANK.get(hop.quality.value, len(_QUALITY_RANK))
+    )
+    return SHCZigbeeRoutingInfo(
+        {
+            "device": device_id,
+            "aggregatedQuality": worst.quality.value,
+            "route": [
+                {"deviceId": hop.device_id, "quality": hop.quality.value}
+                for hop in route
+            ],
+        }
+    )
+
 
 class SHCZigbeeRoutingCoordinator(
     DataUpdateCoordinator["dict[str, SHCZigbeeRoutingInfo]"]
@@ -41,7 +151,15 @@ class SHCZigbeeRoutingCoordinator(
     """
 
     def __init__(
-        self, hass: HomeAssistant, config_entry: ConfigEntry, session: SHCSessionAsync
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        session: SHCSessionAsync,
+        *,
+        concurrency: int = DEFAULT_ZIGBEE_ROUTING_CONCURRENCY,
+        device_timeout: float = DEFAULT_ZIGBEE_ROUTING_DEVICE_TIMEOUT,
+        incremental: bool = False,
+        max_age: float = DEFAULT_ZIGBEE_ROUTING_MAX_AGE,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
@@ -52,46 +170,654 @@ class SHCZigbeeRoutingCoordinator(
             update_interval=None,
         )
         self._session = session
+        self.concurrency = max(1, concurrency)
+        self.device_timeout = device_timeout
+        self.incremental = incremental
+        self.max_age = max_age
+        self.last_refresh_stats: ZigbeeRoutingRefreshStats | None = None
+        self._fetched_at: dict[str, float] = {}
+        self._requested_max_age: float | None = None
+
+    async def async_request_incremental_refresh(
+        self, max_age: float | None = None
+    ) -> None:
+        """Request one incremental refresh, regardless of the default mode."""
+        self._requested_max_age = self.max_age if max_age is None else max_age
+        await self.async_request_refresh()
+
+    def _split_device_ids(self) -> tuple[list[str], list[str]]:
+        """Split every Zigbee device id into (routers, end devices).
+
+        Mains-powered devices route for the mesh; a device already seen as
+        an intermediate hop in the previous cycle is a router regardless.
+        """
+        known_routers = {
+            hop.device_id
+            for info in (self.data or {}).values()
+            for hop in (getattr(info, "route", None) or [])[1:]
+        }
+        routers: list[str] = []
+        end_devices: list[str] = []
+        for device in getattr(self._session, "devices", None) or []:
+            device_id = getattr(device, "id", None)
+            if not device_id or not device_id.startswith("hdm:ZigBee:"):
+                continue
+            if device_id in known_routers or not getattr(
+                device, "supports_batterylevel", False
+            ):
+                routers.append(device_id)
+            else:
+                end_devices.append(device_id)
+        return routers, end_devices
 
     async def _async_update_data(self) -> dict[str, SHCZigbeeRoutingInfo]:
-        """Fetch routing info for every Zigbee-attached device, one at a time.
-
-        Sequential, not concurrent: firing every device's on-demand routing
-        query at once spikes load on the SHC and the Zigbee mesh itself
-        (each query makes the SHC round-trip live to the physical device,
-        nothing is cached) — a real stability/battery concern. A few extra
-        seconds of wall-clock per
-        refresh is a fine trade for a refresh that only happens on request.
-
-        A single device's failure (offline mesh node, transient error) must
-        not fail the whole refresh for every other device: caught per
-        device, logged at debug (this fires routinely for an offline node),
-        and simply omitted from the result for this cycle.
+        """Fetch routing info for every Zigbee-attached device.
+
+        At most `concurrency` queries are in flight at once — firing every
+        device's on-demand routing query at once spikes load on the SHC and
+        the Zigbee mesh itself (each query makes the SHC round-trip live to
+        the physical device, nothing is cached), while strictly sequential
+        queries made a large mesh take minutes. Each query is capped at
+        `device_timeout` so total wall-clock stays bounded.
+
+        Routers are queried before end devices in a full refresh: they
+        answer quickly, and a sleepy battery end device's slow reply then
+        overlaps with nothing that other devices' routes depend on.
+
+        An incremental refresh (see `_plan_incremental`) instead reuses
+        recent answers and queries end devices first, so that routers
+        named in their routes can be skipped.
+
+        A single device's failure (offline mesh node, transient error,
+        timeout) must not fail the whole refresh for every other device:
+        caught per device, logged at debug (this fires routinely for an
+        offline node), and simply omitted from the result for this cycle.
         """
-        device_ids = [
-            device_id
-            for device in getattr(self._session, "devices", None) or []
-            if (device_id := getattr(device, "id", None))
-            and device_id.startswith("hdm:ZigBee:")
-        ]
+        max_age = self._requested_max_age
+        self._requested_max_age = None
+        if max_age is None and self.incremental:
+            max_age = self.max_age
+        stats = ZigbeeRoutingRefreshStats(
+            concurrency=self.concurrency,
+            device_timeout=self.device_timeout,
+            incremental=max_age is not None,
+        )
         result: dict[str, SHCZigbeeRoutingInfo] = {}
-        for device_id in device_ids:
-            info = await self._fetch_one(device_id)
-            if info is not None:
+        routers, end_devices = self._split_device_ids()
+        if max_age is None:
+            order = routers + end_devices
+        else:
+            order = self._plan_incremental(end_devices + routers, max_age, result)
+            stats.reused.extend(result)
+        pending = iter(order)
+        # Router id -> its own hop chain, as reported inside another device's
+        # route this cycle (incremental mode only).
+        reported: dict[str, list[ZigbeeRoutingHop]] = {}
+
+        async def _worker() -> None:
+            for device_id in pending:
+                if device_id in reported:
+                    result[device_id] = _inferred_routing_info(
+                        device_id, reported[device_id]
+                    )
+                    self._fetched_at[device_id] = time.monotonic()
+                    stats.inferred.append(device_id)
+                    continue
+                info = await self._fetch_one(device_id, stats)
+                if info is None:
+                    continue
                 result[device_id] = info
+                self._fetched_at[device_id] = time.monotonic()
+                if stats.incremental:
+                    route = list(getattr(info, "route", None) or [])
+                    for index in range(1, len(route)):
+                        reported.setdefault(route[index].device_id, route[index:])
+
+        started = time.monotonic()
+        await asyncio.gather(
+            *(create_eager_task(_worker()) for _ in range(self.concurrency))
+        )
+        stats.duration = time.monotonic() - started
+        self.last_refresh_stats = stats
         return result
 
-    async def _fetch_one(self, device_id: str) -> SHCZigbeeRoutingInfo | None:
+    def _plan_incremental(
+        self,
+        device_ids: list[str],
+        max_age: float,
+        result: dict[str, SHCZigbeeRoutingInfo],
+    ) -> list[str]:
+        """Carry over fresh answers into `result`; return the ids to re-poll."""
+        previous = self.data or {}
+        now = time.monotonic()
+        stale: list[str] = []
+        for device_id in device_ids:
+            fetched_at = self._fetched_at.get(device_id)
+            if (
+                device_id in previous
+                and fetched_at is not None
+                and now - fetched_at < max_age
+            ):
+                result[device_id] = previous[device_id]
+            else:
+                stale.append(device_id)
+        return stale
+
+    async def _fetch_one(
+        self, device_id: str, stats: ZigbeeRoutingRefreshStats
+    ) -> SHCZigbeeRoutingInfo | None:
         """Fetch one device's routing info, or None on a per-device error.
 
-        A separate method (not an inline try/except in the loop above) both
+        A separate method (not an inline try/except in the worker above) both
         avoids ruff's PERF203 and keeps the per-device isolation contract
         documented on _async_update_data easy to read at a glance.
         """
+        started = time.monotonic()
         try:
-            return await self._session.get_zigbee_routing_info(device_id)
+            async with asyncio.timeout(self.device_timeout):
+                return await self._session.get_zigbee_routing_info(device_id)
+        except TimeoutError:
+            LOGGER.debug(
+                "Timed out after %ss fetching Zigbee routing info for %s",
+                self.device_timeout,
+                device_id,
+            )
+            stats.timed_out.append(device_id)
+            return None
         except (SHCException, SHCConnectionError) as err:
             LOGGER.debug(
                 "Failed to fetch Zigbee routing info for %s: %s", device_id, err
             )
+            stats.failed.append(device_id)
             return None
+        finally:
+            stats.latency[device_id] = time.monotonic() - started
+
+
+def _spread_offset(key: str, window: float) -> float:
+    """Return a deterministic offset in [0, window) for a resource key.
+
+    Stable across restarts (crc32, not hash()), so a resource keeps its slot
+    in the interval instead of re-colliding with its neighbours every boot.
+    """
+    return window * zlib.crc32(key.encode()) / 0x1_0000_0000
+
+
+class SHCPolledResource(DataUpdateCoordinator[Any]):
+    """One REST resource, fetched once per interval for all of its readers.
+
+    For data that is not delivered by the long-poll stream (firmware state,
+    room temperature-drop config, automation rules, ...). Every entity that
+    reads the same resource shares one instance via SHCPollScheduler.
+
+    The interval adapts per fetch: `fast_interval` while `fast_poll_while`
+    holds for the data (doubling up to `_FAST_POLL_MAX` while nothing
+    changes, doubling back up to the idle interval once it stops holding),
+    exponential backoff while the fetch keeps failing (from the fast interval
+    while fast polling, capped at `_FAST_POLL_MAX`), and a one-off `phase`
+    delay after the first fetch so the next ones land in this resource's
+    own slot of the interval.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        update_interval: timedelta,
+        *,
+        fast_interval: timedelta | None = None,
+        fast_poll_while: Callable[[Any], bool] | None = None,
+    ) -> None:
+        """Initialize the polled resource."""
+        super().__init__(
+            hass,
+            LOGGER,
+            config_entry=config_entry,
+            name=f"{DOMAIN}_{key}",
+            update_interval=update_interval,
+        )
+        self.key = key
+        self._fetch = fetch
+        self.idle_interval = update_interval
+        self._fast_interval = fast_interval
+        self._fast_poll_while = fast_poll_while
+        self.phase: timedelta | None = None
+        self.consecutive_failures = 0
+        self._adaptive_step: timedelta | None = None
+
+    async def _async_update_data(self) -> Any:
+        """Fetch the resource, keeping the last-known value on failure.
+
+        Same contract as the per-entity polls this replaced: a transient
+        probe failure is logged at debug and must not make every reader
+        unavailable.
+        """
+        try:
+            data = await self._fetch()
+        except Exception as err:  # noqa: BLE001 -- never raise from a poll
+            self.consecutive_failures += 1
+            exponent = min(self.consecutive_failures, _MAX_BACKOFF_EXPONENT)
+            if self._fast_polling():
+                # The SHC (or the device) reboots mid-update; stay on the fast poll.
+                self.update_interval = min(
+                    self._fast_interval * 2**exponent, _FAST_POLL_MAX
+                )
+            else:
+                self.update_interval = self.idle_interval * 2**exponent
+            LOGGER.debug(
+                "Failed to poll %s (%d in a row), next try in %s: %s",
+                self.key,
+                self.consecutive_failures,
+                self.update_interval,
+                err,
+            )
+            return self.data
+        self.consecutive_failures = 0
+        self.update_interval = self._next_interval(self.data, data)
+        return data
+
+    def _fast_polling(self) -> bool:
+        """True while the resource is on, or winding down from, the fast poll."""
+        if self._fast_interval is None:
+            return False
+        if self._adaptive_step is not None:
+            return True
+        return (
+            self._fast_poll_while is not None
+            and self.data is not None
+            and self._fast_poll_while(self.data)
+        )
+
+    def _next_interval(self, previous: Any, data: Any) -> timedelta:
+        """Return the delay until the fetch after a successful one."""
+        if (
+            self._fast_interval is not None
+            and self._fast_poll_while is not None
+            and self._fast_poll_while(data)
+        ):
+            if self._adaptive_step is None or data != previous:
+                self._adaptive_step = self._fast_interval
+            else:
+                self._adaptive_step = min(self._adaptive_step * 2, _FAST_POLL_MAX)
+            return self._adaptive_step
+        if self._adaptive_step is not None:
+            self._adaptive_step *= 2
+            if self._adaptive_step < self.idle_interval:
+                return self._adaptive_step
+            self._adaptive_step = None
+        if self.phase is not None:
+            phase, self.phase = self.phase, None
+            return self.idle_interval + phase
+        return self.idle_interval
+
+
+def merge_temperature_drop_config(data: Any, field: str, value: Any) -> Any:
+    """Return a room temperature-drop body with one configuration field set.
+
+    Write-through for the shared temperature_drop_<room> resource: readers
+    see an accepted PUT at once instead of after the next poll.
+    """
+    if not data:
+        return data
+    return {**data, "configuration": {**data.get("configuration", {}), field: value}}
+
+
+class SHCPollScheduler:
+    """Per-entry family of SHCPolledResource coordinators, keyed by resource.
+
+    Replaces the per-entity should_poll loops, which fetched a shared
+    resource once per reader and all fired together after every restart.
+    First fetches are held until `async_start` (called once the long poll
+    is up and the platforms are set up), then offset by `_spread_offset`;
+    since the coordinator re-arms one interval after each fetch, that
+    offset also spreads every later cycle across the interval.
+    """
+
+    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._config_entry = config_entry
+        self.resources: dict[str, SHCPolledResource] = {}
+        self._unsub_first_refresh: list[CALLBACK_TYPE] = []
+        self._probe_locks: dict[str, asyncio.Lock] = {}
+        self._started = False
+        self._pending_first_refresh: list[tuple[SHCPolledResource, float]] = []
+
+    @callback  # type: ignore[untyped-decorator]
+    def async_get(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        update_interval: timedelta,
+        *,
+        data: Any = None,
+        fast_interval: timedelta | None = None,
+        fast_poll_while: Callable[[Any], bool] | None = None,
+    ) -> SHCPolledResource:
+        """Return the coordinator for `key`, creating and scheduling it once.
+
+        `data` seeds a resource whose value the platform already probed
+        during setup; its first fetch is then due anywhere in the interval.
+        An unseeded resource is probed within the startup window instead,
+        and its next fetch is pushed into its slot of the full interval.
+        """
+        if (resource := self.resources.get(key)) is not None:
+            return resource
+        resource = SHCPolledResource(
+            self._hass,
+            self._config_entry,
+            key,
+            fetch,
+            update_interval,
+            fast_interval=fast_interval,
+            fast_poll_while=fast_poll_while,
+        )
+        self.resources[key] = resource
+        window = update_interval.total_seconds()
+        if data is None:
+            resource.phase = timedelta(seconds=_spread_offset(key, window))
+            window = min(window, _FIRST_REFRESH_WINDOW)
+        else:
+            resource.data = data
+        if self._started:
+            self._schedule_first_refresh(resource, window)
+        else:
+            self._pending_first_refresh.append((resource, window))
+        return resource
+
+    @callback  # type: ignore[untyped-decorator]
+    def async_start(self) -> None:
+        """Release the first fetches held back during setup."""
+        self._started = True
+        for resource, window in self._pending_first_refresh:
+            self._schedule_first_refresh(resource, window)
+        self._pending_first_refresh.clear()
+
+    @callback  # type: ignore[untyped-decorator]
+    def _schedule_first_refresh(
+        self, resource: SHCPolledResource, window: float
+    ) -> None:
+        @callback  # type: ignore[untyped-decorator]
+        def _first_refresh(_now: datetime) -> None:
+            self._config_entry.async_create_background_task(
+                self._hass,
+                resource.async_refresh(),
+                f"{DOMAIN}_{self._config_entry.entry_id}_{resource.key}_first_refresh",
+            )
+
+        self._unsub_first_refresh.append(
+            async_call_later(
+                self._hass, _spread_offset(resource.key, window), _first_refresh
+            )
+        )
+
+    async def async_get_probed(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        update_interval: timedelta,
+    ) -> SHCPolledResource | None:
+        """Probe `key` once for every platform that reads it, then seed it.
+
+        Platforms set up concurrently; the lock makes the second reader wait
+        for the first one's probe instead of issuing its own GET. Returns
+        None when the probe yields no data; probe errors propagate.
+        """
+        lock = self._probe_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            if (resource := self.resources.get(key)) is not None:
+                return resource
+            if (data := await fetch()) is None:
+                return None
+            return self.async_get(key, fetch, update_interval, data=data)
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending first fetches and stop every resource's schedule."""
+        for unsub in self._unsub_first_refresh:
+            unsub()
+        self._unsub_first_refresh.clear()
+        self._pending_first_refresh.clear()
+        for resource in self.resources.values():
+            await resource.async_shutdown()
+
+
+class SHCMessagesCache:
+    """Per-entry, single-flight cache of the SHC's /messages list.
+
+    Concurrent readers share one in-flight GET, and a list younger than
+    `ttl` seconds is served without one. A reader passing `since` (a
+    time.monotonic() stamp, e.g. when an alarm callback fired) needs a list
+    fetched no earlier than that: if the in-flight GET started before it,
+    one follow-up GET is queued behind it and shared by every such reader,
+    so a burst of callbacks costs at most two downloads.
+    """
+
+    def __init__(
+        self, session: SHCSessionAsync, ttl: float = MESSAGES_CACHE_TTL
+    ) -> None:
+        """Initialize the cache (no I/O until the first read)."""
+        self._session = session
+        self._ttl = ttl
+        self._messages: list[dict[str, Any]] | None = None
+        # When the GET that produced _messages was started.
+        self._fetched_at = 0.0
+        self._inflight: asyncio.Task[list[dict[str, Any]]] | None = None
+        self._inflight_started = 0.0
+        self._queued: asyncio.Task[list[dict[str, Any]]] | None = None
+
+    async def async_get(self, since: float | None = None) -> list[dict[str, Any]]:
+        """Return the message list, fetched no earlier than `since`.
+
+        Without `since`, any list younger than the TTL will do. Fetch
+        errors propagate to every reader sharing the GET.
+        """
+        if since is None:
+            since = time.monotonic() - self._ttl
+        if self._messages is not None and self._fetched_at >= since:
+            return self._messages
+        if self._inflight is None:
+            task = self._start_fetch()
+        elif self._inflight_started >= since:
+            task = self._inflight
+        else:
+            if self._queued is None:
+                self._queued = asyncio.get_running_loop().create_task(
+                    self._async_fetch_after(self._inflight)
+                )
+            task = self._queued
+        # Shielded: one reader being cancelled must not cancel the shared GET.
+        return await asyncio.shield(task)
+
+    @callback  # type: ignore[untyped-decorator]
+    def async_cancel(self) -> None:
+        """Cancel the in-flight and queued GETs (on entry unload)."""
+        for task in (self._queued, self._inflight):
+            if task is not None:
+                task.cancel()
+        self._queued = self._inflight = None
+
+    def _start_fetch(self) -> asyncio.Task[list[dict[str, Any]]]:
+        started = time.monotonic()
+        task = asyncio.get_running_loop().create_task(self._async_fetch(started))
+        task.add_done_callback(self._fetch_done)
+        self._inflight = task
+        self._inflight_started = started
+        return task
+
+    async def _async_fetch(self, started: float) -> list[dict[str, Any]]:
+        messages: list[dict[str, Any]] = await self._session.api.get_messages()
+        if started >= self._fetched_at:
+            self._messages = messages
+            self._fetched_at = started
+        return messages
+
+    def _fetch_done(self, task: asyncio.Task[list[dict[str, Any]]]) -> None:
+        if self._inflight is task:
+            self._inflight = None
+        # Mark a failure retrieved even if every reader was cancelled meanwhile.
+        if not task.cancelled():
+            task.exception()
+
+    async def _async_fetch_after(
+        self, previous: asyncio.Task[list[dict[str, Any]]]
+    ) -> list[dict[str, Any]]:
+        # The earlier GET's outcome is its own readers' concern.
+        with contextlib.suppress(Exception):
+            await asyncio.shield(previous)
+        self._queued = None
+        return await self._start_fetch()
+
+
+def _histogram(bounds: tuple[float, ...], counts: list[int]) -> dict[str, int]:
+    labels = [f"<={bound:g}" for bound in bounds] + [f">{bounds[-1]:g}"]
+    return dict(zip(labels, counts, strict=True))
+
+
+def _bucket(bounds: tuple[float, ...], value: float) -> int:
+    return next(
+        (index for index, bound in enumerate(bounds) if value <= bound), len(bounds)
+    )
+
+
+class SHCPollStats:
+    """Per-entry health counters of the session's long-poll loop.
+
+    boschshcpy's poll loop has no hooks, so async_instrument wraps the API's
+    subscribe and poll calls: each poll's round trip and result count feed
+    the histograms, and every subscribe after the first is a resubscribe
+    (the loop only subscribes again after losing its poll id).
+    """
+
+    def __init__(self) -> None:
+        """Initialize the counters (nothing is measured until instrumented)."""
+        self.polls = 0
+        self.events = 0
+        self.subscribes = 0
+        self.rpc_errors = 0
+        self.connection_errors = 0
+        self.last_error: str | None = None
+        self.last_round_trip: float | None = None
+        self.max_round_trip = 0.0
+        self._round_trip_total = 0.0
+        self.last_event: datetime | None = None
+        self._round_trips = [0] * (len(POLL_ROUND_TRIP_BUCKETS) + 1)
+        self._events_per_poll = [0] * (len(POLL_EVENTS_BUCKETS) + 1)
+        self._listeners: list[CALLBACK_TYPE] = []
+
+    @property
+    def resubscribes(self) -> int:
+        """Return how often the loop subscribed again after its first poll id."""
+        return max(self.subscribes - 1, 0)
+
+    @property
+    def errors(self) -> int:
+        """Return the total failed subscribe and poll calls."""
+        return self.rpc_errors + self.connection_errors
+
+    @property
+    def average_round_trip(self) -> float | None:
+        """Return the mean poll round trip in seconds, if any poll completed."""
+        return self._round_trip_total / self.polls if self.polls else None
+
+    def round_trip_histogram(self) -> dict[str, int]:
+        """Return the poll round-trip counts by bucket."""
+        return _histogram(POLL_ROUND_TRIP_BUCKETS, self._round_trips)
+
+    def events_histogram(self) -> dict[str, int]:
+        """Return the results-per-poll counts by bucket."""
+        return _histogram(POLL_EVENTS_BUCKETS, self._events_per_poll)
+
+    @callback  # type: ignore[untyped-decorator]
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Call `update_callback` after each recorded call; returns the remover."""
+        self._listeners.append(update_callback)
+
+        @callback  # type: ignore[untyped-decorator]
+        def _remove() -> None:
+            if update_callback in self._listeners:
+                self._listeners.remove(update_callback)
+
+        return _remove
+
+    @callback  # type: ignore[untyped-decorator]
+    def async_instrument(self, api: Any) -> CALLBACK_TYPE:
+        """Wrap `api`'s long-poll calls; the returned callable unwraps them."""
+        subscribe = api.long_polling_subscribe
+        poll = api.long_polling_poll
+
+        async def _subscribe() -> str:
+            try:
+                poll_id: str = await subscribe()
+            except Exception as err:
+                self._record_error(err)
+                raise
+            self.subscribes += 1
+            self._notify()
+            return poll_id
+
+        async def _poll(poll_id: str, wait_seconds: int = 30) -> Any:
+            started = time.monotonic()
+            try:
+                results = await poll(poll_id, wait_seconds)
+            except Exception as err:
+                self._record_error(err)
+                raise
+            self._record_poll(time.monotonic() - started, len(results or ()))
+            return results
+
+        api.long_polling_subscribe = _subscribe
+        api.long_polling_poll = _poll
+
+        @callback  # type: ignore[untyped-decorator]
+        def _restore() -> None:
+            api.long_polling_subscribe = subscribe
+            api.long_polling_poll = poll
+
+        return _restore
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters and histograms, for diagnostics."""
+        average = self.average_round_trip
+        return {
+            "polls": self.polls,
+            "events": self.events,
+            "last_event": self.last_event.isoformat() if self.last_event else None,
+            "resubscribes": self.resubscribes,
+            "rpc_errors": self.rpc_errors,
+            "connection_errors": self.connection_errors,
+            "last_error": self.last_error,
+            "last_round_trip": None
+            if self.last_round_trip is None
+            else round(self.last_round_trip, 3),
+            "average_round_trip": None if average is None else round(average, 3),
+            "max_round_trip": round(self.max_round_trip, 3),
+            "round_trip_histogram": self.round_trip_histogram(),
+            "events_histogram": self.events_histogram(),
+        }
+
+    def _record_poll(self, round_trip: float, events: int) -> None:
+        self.polls += 1
+        self.events += events
+        self.last_round_trip = round_trip
+        self.max_round_trip = max(self.max_round_trip, round_trip)
+        self._round_trip_total += round_trip
+        self._round_trips[_bucket(POLL_ROUND_TRIP_BUCKETS, round_trip)] += 1
+        self._events_per_poll[_bucket(POLL_EVENTS_BUCKETS, events)] += 1
+        if events:
+            self.last_event = dt_util.utcnow()
+        self._notify()
+
+    def _record_error(self, err: Exception) -> None:
+        if isinstance(err, JSONRPCError):
+            self.rpc_errors += 1
+        else:
+            self.connection_errors += 1
+        # The type only: connection error messages carry the controller's URL.
+        self.last_error = type(err).__name__
+        self._notify()
+
+    def _notify(self) -> None:
+        for update_callback in list(self._listeners):
+            update_callback()
@@ -21,14 +21,13 @@ from homeassistant.components.cover import (
     CoverEntityFeature,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
 from homeassistant.core import CALLBACK_TYPE, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_call_later
 
 from .const import DOMAIN, LOGGER
-from .entity import SHCEntity, async_migrate_to_new_unique_id, device_excluded
+from .entity import SHCEntity, device_excluded
 
 PARALLEL_UPDATES = 1
 
@@ -51,7 +50,6 @@ async def async_setup_entry(
     ):
         if device_excluded(cover, config_entry.options):
             continue
-        await async_migrate_to_new_unique_id(hass, Platform.COVER, device=cover)
         entities.append(
             ShutterControlCover(
                 device=cover,
@@ -62,7 +60,6 @@ async def async_setup_entry(
     for blind in session.device_helper.micromodule_blinds:
         if device_excluded(blind, config_entry.options):
             continue
-        await async_migrate_to_new_unique_id(hass, Platform.COVER, device=blind)
         entities.append(
             BlindsControlCover(
                 device=blind,
@@ -7,10 +7,27 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Callable
 
 from boschshcpy import SHCSessionAsync
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceEntry
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
 
 if TYPE_CHECKING:
-    from .coordinator import SHCZigbeeRoutingCoordinator
+    from .bulk_command import SHCCommandDispatcher
+    from .coordinator import (
+        SHCMessagesCache,
+        SHCPollScheduler,
+        SHCPollStats,
+        SHCZigbeeRoutingCoordinator,
+    )
+    from .entity import (
+        SHCDeviceIndex,
+        SHCDispatchIndex,
+        SHCScenarioIndex,
+        SHCStateWriteCoalescer,
+    )
 
 
 @dataclass
@@ -27,3 +44,75 @@ class SHCData:
     switch_event_listeners: list[Any] = field(default_factory=list)
     zigbee_routing_coordinator: SHCZigbeeRoutingCoordinator | None = field(default=None)
     zigbee_routing_refresh_task: asyncio.Task[None] | None = field(default=None)
+    warm_start_task: asyncio.Task[None] | None = field(default=None)
+    poll_scheduler: SHCPollScheduler | None = field(default=None)
+    state_writer: SHCStateWriteCoalescer | None = field(default=None)
+    dispatch_index: SHCDispatchIndex | None = field(default=None)
+    command_dispatcher: SHCCommandDispatcher | None = field(default=None)
+    device_index: SHCDeviceIndex | None = field(default=None)
+    scenario_index: SHCScenarioIndex | None = field(default=None)
+    messages_cache: SHCMessagesCache | None = field(default=None)
+    poll_stats: SHCPollStats | None = field(default=None)
+    loaded_platforms: set[Platform] = field(default_factory=set)
+    applied_options: dict[str, Any] = field(default_factory=dict)
+    platform_unloads: dict[Platform, list[Callable[[], None]]] = field(
+        default_factory=dict
+    )
+    options_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    # Set during async_batch_stale_entity_removal (entity.py).
+    stale_entities: set[tuple[str, str]] | None = field(default=None)
+
+
+class SHCEntryRegistry:
+    """Set-up entries' runtime data, by entry id and by title.
+
+    The domain services resolve their target controller here instead of
+    scanning hass.config_entries; titles may repeat, so each maps to the
+    entries carrying it, in setup order.
+    """
+
+    def __init__(self) -> None:
+        """Start empty."""
+        self._by_entry_id: dict[str, SHCData] = {}
+        self._by_title: dict[str, dict[str, SHCData]] = {}
+
+    @callback  # type: ignore[untyped-decorator]
+    def async_add(self, entry_id: str, runtime: SHCData) -> None:
+        """Register an entry's runtime data."""
+        self.async_remove(entry_id)
+        self._by_entry_id[entry_id] = runtime
+        self._by_title.setdefault(runtime.title, {})[entry_id] = runtime
+
+    @callback  # type: ignore[untyped-decorator]
+    def async_remove(self, entry_id: str) -> None:
+        """Forget an entry; a no-op if it isn't registered."""
+        runtime = self._by_entry_id.pop(entry_id, None)
+        if runtime is None:
+            return
+        same_title = self._by_title[runtime.title]
+        del same_title[entry_id]
+        if not same_title:
+            del self._by_title[runtime.title]
+
+    def resolve(self, title: str = "", entry_id: str = "") -> list[tuple[str, SHCData]]:
+        """Return (entry id, runtime data) of the entries a service targets.
+
+        An entry id wins over the title; with neither, every entry matches.
+        """
+        if entry_id:
+            runtime = self._by_entry_id.get(entry_id)
+            return [] if runtime is None else [(entry_id, runtime)]
+        if title:
+            return list(self._by_title.get(title, {}).items())
+        return list(self._by_entry_id.items())
+
+
+DATA_ENTRY_REGISTRY: HassKey[SHCEntryRegistry] = HassKey(f"{DOMAIN}_entry_registry")
+
+
+@callback  # type: ignore[untyped-decorator]
+def async_get_entry_registry(hass: HomeAssistant) -> SHCEntryRegistry:
+    """Return the domain's SHCEntryRegistry, creating it on first use."""
+    if (registry := hass.data.get(DATA_ENTRY_REGISTRY)) is None:
+        registry = hass.data[DATA_ENTRY_REGISTRY] = SHCEntryRegistry()
+    return registry
@@ -6,7 +6,6 @@ from collections.abc import Iterable
 from typing import Any
 
 import voluptuous as vol
-from boschshcpy import SHCSession
 from homeassistant.components.device_automation import DEVICE_TRIGGER_BASE_SCHEMA
 from homeassistant.components.device_automation.exceptions import (
     InvalidDeviceAutomationConfig,
@@ -61,40 +60,12 @@ async def get_device_from_id(hass: HomeAssistant, device_id: str) -> tuple[Any,
     """Get the device for the given device id."""
     dev_registry = dr.async_get(hass)
     for entry in hass.config_entries.async_entries(DOMAIN):
-        if not hasattr(entry, "runtime_data"):
+        index = getattr(getattr(entry, "runtime_data", None), "device_index", None)
+        if index is None:
             continue
-        session: SHCSession = entry.runtime_data.session
-
-        for shc_device in session.devices:
-            device = dev_registry.async_get_device(
-                identifiers={(DOMAIN, shc_device.id)}, connections=set()
-            )
-            if device is None or device.id != device_id:
-                continue
-            return shc_device, shc_device.device_model
-
-        ids = session.intrusion_system
-        if ids:
-            device = dev_registry.async_get_device(
-                identifiers={(DOMAIN, ids.id)}, connections=set()
-            )
-            if device is not None and device.id == device_id:
-                return ids, "IDS"
-
-        device = dev_registry.async_get_device(
-            identifiers={
-                (
-                    DOMAIN,
-                    (session.information.unique_id or "")
-                    if session.information
-                    else "",
-                )
-            },
-            connections=set(),
-        )
-        if device is not None and device.id == device_id:
-            return session, "SHC"
-
+        found = index.async_get(dev_registry, device_id)
+        if found is not None:
+            return found
     return None, ""
 
 
@@ -125,4 +125,23 @@ async def async_get_config_entry_diagnostics(
     diag["devices"] = [
         async_redact_data(_device_dump(device), TO_REDACT) for device in devices
     ]
+
+    coordinator = getattr(entry.runtime_data, "zigbee_routing_coordinator", None)
+    stats = getattr(coordinator, "last_refresh_stats", None)
+    if stats is not None:
+        # Names survive redaction, so rows stay correlatable without the ids.
+        names = {device.id: device.name for device in devices}
+        refresh = stats.as_dict()
+        for row in refresh["devices"]:
+            row["name"] = names.get(row["device_id"])
+        diag["zigbee_routing_refresh"] = async_redact_data(refresh, TO_REDACT)
+    state_writer = getattr(entry.runtime_data, "state_writer", None)
+    if state_writer is not None:
+        diag["state_writes"] = state_writer.as_dict()
+    dispatch_index = getattr(entry.runtime_data, "dispatch_index", None)
+    if dispatch_index is not None:
+        diag["dispatch_index"] = dispatch_index.as_dict()
+    poll_stats = getattr(entry.runtime_data, "poll_stats", None)
+    if poll_stats is not None:
+        diag["long_poll"] = poll_stats.as_dict()
     return diag
@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
-from typing import Any
+import asyncio
+import contextlib
+import functools
+from collections.abc import AsyncIterator, Callable, Collection, Mapping
+from typing import TYPE_CHECKING, Any
 
 from boschshcpy.device import SHCDevice
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers import entity_registry
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.device_registry import (
+    DeviceInfo,
+    DeviceRegistry,
+    EventDeviceRegistryUpdatedData,
+)
 from homeassistant.helpers.device_registry import async_get as get_dev_reg
 from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
@@ -21,6 +29,9 @@ from .const import (
     OPT_LIGHTS_AS_LIGHT,
 )
 
+if TYPE_CHECKING:
+    from .coordinator import SHCPolledResource
+
 # #338: friendlier display names for the light-relay models, so the options
 # picker shows "Light/Shutter Control II" instead of the raw "MICROMODULE_*".
 _LIGHT_RELAY_FRIENDLY_MODEL = {
@@ -96,7 +107,7 @@ async def async_remove_devices(
 
 
 async def async_remove_stale_entity(
-    hass: HomeAssistant, entity_domain: str, unique_id: str
+    hass: HomeAssistant, config_entry: Any, entity_domain: str, unique_id: str
 ) -> None:
     """Remove a single stale entity from the registry, if it exists.
 
@@ -106,51 +117,398 @@ async def async_remove_stale_entity(
     Motion Detector II's indicator light after its installation profile is
     switched from ``[+M]``/OUTDOOR to GENERIC (#356), where the light
     service disappears but the motion sensor itself remains.
+
+    While the entry runs an async_batch_stale_entity_removal block the
+    removal is only recorded and carried out with the rest of the batch.
     """
+    stale = getattr(getattr(config_entry, "runtime_data", None), "stale_entities", None)
+    if isinstance(stale, set):
+        stale.add((entity_domain, unique_id))
+        return
     ent_reg = entity_registry.async_get(hass)
     entity_id = ent_reg.async_get_entity_id(entity_domain, DOMAIN, unique_id)
     if entity_id is not None:
         ent_reg.async_remove(entity_id)
 
 
-async def async_migrate_to_new_unique_id(
-    hass: HomeAssistant,
-    platform: str,
-    device: SHCDevice,
-    attr_name: str | None = None,
-    old_unique_id: str | None = None,
-) -> None:
-    """Migrate old unique ids to new unique ids."""
-    if old_unique_id is None:
-        old_unique_id = (
-            f"{device.serial}"
-            if attr_name is None
-            else f"{device.serial}_{attr_name.lower()}"
-        )
+@contextlib.asynccontextmanager
+async def async_batch_stale_entity_removal(
+    hass: HomeAssistant, config_entry: Any
+) -> AsyncIterator[None]:
+    """Collect the entry's stale entities during the block; remove them in one pass.
 
+    Every platform setup checks its no-longer-applicable unique ids on each
+    start, nearly always finding nothing. Batched, that costs one walk over
+    the entry's registry entries instead of one lookup per candidate. The
+    batch lives on the entry's runtime data, so a nested block joins the
+    outer one and a removal arriving after the block is carried out at once.
+    """
+    runtime = config_entry.runtime_data
+    if runtime.stale_entities is not None:
+        yield
+        return
+    stale: set[tuple[str, str]] = set()
+    runtime.stale_entities = stale
+    try:
+        yield
+    finally:
+        runtime.stale_entities = None
+    if not stale:
+        return
     ent_reg = entity_registry.async_get(hass)
-    entity_id = ent_reg.async_get_entity_id(platform, DOMAIN, old_unique_id)
+    for entry in entity_registry.async_entries_for_config_entry(
+        ent_reg, config_entry.entry_id
+    ):
+        if (entry.domain, entry.unique_id) in stale:
+            LOGGER.debug("Removing stale entity %s", entry.entity_id)
+            ent_reg.async_remove(entry.entity_id)
 
-    if entity_id is not None:
-        new_unique_id = (
-            f"{device.root_device_id}_{device.id}"
-            if attr_name is None
-            else f"{device.root_device_id}_{device.id}_{attr_name.lower()}"
+
+@callback  # type: ignore[untyped-decorator]
+def async_on_platform_unload(
+    config_entry: Any, platform: str, func: Callable[[], None]
+) -> None:
+    """Run `func` when `platform` is unloaded alone, or else with the entry.
+
+    An options change re-runs a platform's setup on the live session (see
+    options.py); a subscription its last setup made must go with it.
+    """
+    done = False
+
+    @functools.wraps(func)
+    def _run() -> None:
+        nonlocal done
+        if not done:
+            done = True
+            func()
+
+    unloads = getattr(config_entry.runtime_data, "platform_unloads", None)
+    if isinstance(unloads, dict):
+        unloads.setdefault(platform, []).append(_run)
+    config_entry.async_on_unload(_run)
+
+
+class SHCStateWriteCoalescer:
+    """Per-entry queue that writes each dirty entity's state once per batch.
+
+    One long-poll batch can touch several services of one device (Twinguard,
+    shutter control) and a scenario can switch dozens of devices at once;
+    each service callback used to schedule its own state write. boschshcpy
+    dispatches a whole batch without yielding to the loop, so a flush
+    scheduled with call_soon runs exactly once, right after the batch.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the coalescer."""
+        self._hass = hass
+        self._pending: dict[Entity, None] = {}
+        self._flush_handle: asyncio.Handle | None = None
+        self.scheduled = 0
+        self.written = 0
+        self.suppressed = 0
+
+    @callback  # type: ignore[untyped-decorator]
+    def async_schedule(self, entity: Entity) -> None:
+        """Mark `entity` dirty; its state is written when the batch ends."""
+        self.scheduled += 1
+        self._pending[entity] = None
+        if self._flush_handle is None:
+            self._flush_handle = self._hass.loop.call_soon(self._async_flush)
+
+    @callback  # type: ignore[untyped-decorator]
+    def _async_flush(self) -> None:
+        self._flush_handle = None
+        pending, self._pending = self._pending, {}
+        for entity in pending:
+            if entity.hass is None:
+                continue
+            self.written += 1
+            try:
+                entity.async_write_ha_state()
+            except Exception:  # noqa: BLE001 -- one entity must not block the rest
+                LOGGER.exception("Failed to write state of %s", entity.entity_id)
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the write counters, for diagnostics."""
+        return {
+            "scheduled": self.scheduled,
+            "written": self.written,
+            "suppressed_unchanged": self.suppressed,
+        }
+
+    @callback  # type: ignore[untyped-decorator]
+    def async_cancel(self) -> None:
+        """Drop pending writes (entry unload)."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending.clear()
+
+
+class SHCDispatchIndex:
+    """Per-entry fan-out from (device id, service id) to dependent entities.
+
+    Each entity used to subscribe a closure to every service of its device,
+    so a push to one service woke every entity of that device. The index
+    subscribes once per (device, service) and wakes only the entities whose
+    description lists that service; entities without `service_ids` still
+    depend on all of them.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._routes: dict[
+            tuple[str, str], tuple[Any, dict[Entity, Callable[[], None]]]
+        ] = {}
+        self.dispatched = 0
+
+    @callback  # type: ignore[untyped-decorator]
+    def async_register(
+        self,
+        device: SHCDevice,
+        entity: Entity,
+        service_ids: Collection[str] | None,
+        on_change: Callable[[], None],
+    ) -> None:
+        """Route pushes of `device`'s `service_ids` services to `on_change`."""
+        for service in device.device_services:
+            if service_ids is not None and service.id not in service_ids:
+                continue
+            key = (device.id, service.id)
+            route = self._routes.get(key)
+            if route is None:
+                route = self._routes[key] = (service, {})
+                service.subscribe_callback(self, self._dispatcher(route[1]))
+            route[1][entity] = on_change
+
+    @callback  # type: ignore[untyped-decorator]
+    def async_unregister(self, device: SHCDevice, entity: Entity) -> None:
+        """Drop `entity`; services nobody depends on any more are released."""
+        for service in device.device_services:
+            key = (device.id, service.id)
+            route = self._routes.get(key)
+            if route is None:
+                continue
+            route[1].pop(entity, None)
+            if not route[1]:
+                del self._routes[key]
+                service.unsubscribe_callback(self)
+
+    def _dispatcher(
+        self, dependents: dict[Entity, Callable[[], None]]
+    ) -> Callable[[], None]:
+        def dispatch() -> None:
+            for on_change in list(dependents.values()):
+                self.dispatched += 1
+                on_change()
+
+        return dispatch
+
+    def dependents(self, device_id: str, service_id: str) -> list[Entity]:
+        """Return the entities woken by a push to this device service."""
+        route = self._routes.get((device_id, service_id))
+        return [] if route is None else list(route[1])
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the index size and dispatch counter, for diagnostics."""
+        return {
+            "routes": len(self._routes),
+            "subscriptions": sum(len(route[1]) for route in self._routes.values()),
+            "dispatched": self.dispatched,
+        }
+
+    @callback  # type: ignore[untyped-decorator]
+    def async_clear(self) -> None:
+        """Unsubscribe from every service (entry unload)."""
+        for service, _dependents in self._routes.values():
+            service.unsubscribe_callback(self)
+        self._routes.clear()
+
+
+class SHCDeviceIndex:
+    """Per-entry map of HA device id -> (SHC device, model), for device_trigger.
+
+    The automation editor asks for a device's triggers every time it opens a
+    picker; scanning every session device with one registry lookup each made
+    that O(devices). Devices are resolved against the device registry when
+    indexed, and after that on the registry's create/remove events; a lookup
+    is a dict lookup.
+    """
+
+    def __init__(
+        self, session: Any, dev_registry: DeviceRegistry, options: Mapping[str, Any]
+    ) -> None:
+        """Index the session's devices, intrusion system and controller."""
+        self._session = session
+        self._dev_registry = dev_registry
+        self._options: Mapping[str, Any] = {}
+        self._by_device_id: dict[str, tuple[Any, str]] = {}
+        # HA device id -> the SHC identifier it was resolved from.
+        self._identifiers: dict[str, str] = {}
+        # No registry device yet; in trigger-precedence order (devices, IDS,
+        # controller). Excluded devices never get one, so are never added.
+        self._pending: dict[str, tuple[Any, str]] = {}
+        self.async_rebuild(options)
+
+    @callback  # type: ignore[untyped-decorator]
+    def async_rebuild(self, options: Mapping[str, Any]) -> None:
+        """Index the session from scratch (setup, device filter change)."""
+        self._options = options
+        self._by_device_id.clear()
+        self._identifiers.clear()
+        self._pending.clear()
+        for shc_device in self._session.devices:
+            if not device_excluded(shc_device, options):
+                self._pending.setdefault(
+                    shc_device.id, (shc_device, getattr(shc_device, "device_model", ""))
+                )
+        ids = self._session.intrusion_system
+        if ids:
+            self._pending.setdefault(ids.id, (ids, "IDS"))
+        info = self._session.information
+        self._pending.setdefault(
+            (info.unique_id or "") if info else "", (self._session, "SHC")
         )
-        try:
-            ent_reg.async_update_entity(entity_id, new_unique_id=new_unique_id)
-        except ValueError:
-            LOGGER.warning(
-                "Skip migration of id [%s] to [%s] because it already exists",
-                old_unique_id,
-                new_unique_id,
-            )
-        else:
-            LOGGER.debug(
-                "Migrating unique_id from [%s] to [%s]",
-                old_unique_id,
-                new_unique_id,
-            )
+        for identifier in list(self._pending):
+            self._resolve(identifier)
+
+    @callback  # type: ignore[untyped-decorator]
+    def async_add_device(self, shc_device: Any) -> None:
+        """Index a device paired at runtime (session subscriber)."""
+        if device_excluded(shc_device, self._options):
+            return
+        self._pending.setdefault(
+            shc_device.id, (shc_device, getattr(shc_device, "device_model", ""))
+        )
+        self._resolve(shc_device.id)
+
+    @callback  # type: ignore[untyped-decorator]
+    def async_device_registry_updated(
+        self, event: Event[EventDeviceRegistryUpdatedData]
+    ) -> None:
+        """Follow devices created in, or removed from, the device registry."""
+        device_id = event.data["device_id"]
+        if event.data["action"] == "create":
+            device = self._dev_registry.async_get(device_id)
+            if device is None:
+                return
+            for domain, identifier in device.identifiers:
+                if domain == DOMAIN and identifier in self._pending:
+                    self._resolve(identifier)
+        elif event.data["action"] == "remove":
+            self._drop(device_id)
+
+    @callback  # type: ignore[untyped-decorator]
+    def async_get(
+        self, dev_registry: DeviceRegistry, device_id: str
+    ) -> tuple[Any, str] | None:
+        """Return (SHC device, model) for the HA `device_id`, if it is ours."""
+        found = self._by_device_id.get(device_id)
+        if found is None:
+            return None
+        if getattr(found[0], "deleted", False) is True:
+            # Deleted on the SHC; the session already dropped it.
+            self._identifiers.pop(device_id, None)
+            del self._by_device_id[device_id]
+            return None
+        if dev_registry.async_get(device_id) is None:
+            # Removed from the registry before this index saw the event.
+            self._drop(device_id)
+            return None
+        return found
+
+    def _resolve(self, identifier: str) -> None:
+        device = self._dev_registry.async_get_device(
+            identifiers={(DOMAIN, identifier)}, connections=set()
+        )
+        if device is None:
+            return
+        found = self._pending.pop(identifier)
+        if device.id not in self._by_device_id:
+            self._by_device_id[device.id] = found
+            self._identifiers[device.id] = identifier
+
+    def _drop(self, device_id: str) -> None:
+        """Forget an HA device; its SHC device waits for the next create."""
+        found = self._by_device_id.pop(device_id, None)
+        identifier = self._identifiers.pop(device_id, None)
+        if found is not None and identifier is not None:
+            self._pending.setdefault(identifier, found)
+
+
+class SHCScenarioIndex:
+    """Per-entry map of scenario name -> scenarios, for trigger_scenario.
+
+    Several scenarios may share a name; the service triggers all of them, as
+    the scan it replaces did. The long poll reports no scenario being added
+    or deleted (the warm-start reconcile reloads the entry for those); a
+    rename shows up as a scenarioTriggered carrying the new name.
+    """
+
+    def __init__(self, session: Any) -> None:
+        """Index the session's scenarios."""
+        self._session = session
+        self._by_id: dict[str, Any] = {}
+        self._by_name: dict[str, list[Any]] = {}
+        self._names: dict[str, str] = {}
+        self.async_rebuild()
+
+    @callback  # type: ignore[untyped-decorator]
+    def async_rebuild(self) -> None:
+        """Index the session's current scenarios from scratch."""
+        self._by_id.clear()
+        self._by_name.clear()
+        self._names.clear()
+        for scenario in self._session.scenarios:
+            self._by_id[scenario.id] = scenario
+            self._names[scenario.id] = scenario.name
+            self._by_name.setdefault(scenario.name, []).append(scenario)
+
+    def get(self, name: str) -> list[Any]:
+        """Return the scenarios called `name`."""
+        return self._by_name.get(name, [])
+
+    @callback  # type: ignore[untyped-decorator]
+    def async_scenario_triggered(self, scenario_id: str, name: str) -> None:
+        """Re-key a scenario the SHC reports under a new name."""
+        old_name = self._names.get(scenario_id)
+        if old_name is None:
+            if any(scenario.id == scenario_id for scenario in self._session.scenarios):
+                self.async_rebuild()
+            return
+        if old_name == name:
+            return
+        scenario = self._by_id[scenario_id]
+        same_name = self._by_name[old_name]
+        same_name.remove(scenario)
+        if not same_name:
+            del self._by_name[old_name]
+        self._by_name.setdefault(name, []).append(scenario)
+        self._names[scenario_id] = name
+
+
+def _entry_runtime_attr(hass: Any, entry_id: str, attr: str) -> Any:
+    """Return `attr` of the entry's runtime data, or None.
+
+    getattr-chained: entities built bare in tests have no hass, or a mock one.
+    """
+    config_entries = getattr(hass, "config_entries", None)
+    if config_entries is None:
+        return None
+    entry = config_entries.async_get_entry(entry_id)
+    return getattr(getattr(entry, "runtime_data", None), attr, None)
+
+
+def entry_state_writer(hass: Any, entry_id: str) -> SHCStateWriteCoalescer | None:
+    """Return the entry's SHCStateWriteCoalescer, if it has one."""
+    writer = _entry_runtime_attr(hass, entry_id, "state_writer")
+    return writer if isinstance(writer, SHCStateWriteCoalescer) else None
+
+
+def entry_dispatch_index(hass: Any, entry_id: str) -> SHCDispatchIndex | None:
+    """Return the entry's SHCDispatchIndex, if it has one."""
+    index = _entry_runtime_attr(hass, entry_id, "dispatch_index")
+    return index if isinstance(index, SHCDispatchIndex) else None
 
 
 class SHCEntity(Entity):  # type: ignore[misc]
@@ -160,6 +518,9 @@ class SHCEntity(Entity):  # type: ignore[misc]
     # SHC entities push state via long-poll by default; subclasses backed by a
     # separately-probed endpoint (no push) override this to True.
     _attr_should_poll = False
+    # Opt-in: properties that make up this entity's written state. When set,
+    # a callback that leaves them (and availability) unchanged skips the write.
+    _state_fingerprint_attrs: tuple[str, ...] = ()
 
     def __init__(self, device: SHCDevice, entry_id: str) -> None:
         """Initialize the generic SHC device."""
@@ -184,10 +545,11 @@ class SHCEntity(Entity):  # type: ignore[misc]
     async def async_added_to_hass(self) -> None:
         """Subscribe to SHC events."""
         await super().async_added_to_hass()
+        self._state_writer = entry_state_writer(self.hass, self._entry_id)
 
         def on_state_changed() -> None:
             self._update_attr()
-            self.schedule_update_ha_state()
+            self._schedule_state_write()
 
         def update_entity_information() -> None:
             if self._device.deleted:
@@ -200,17 +562,56 @@ class SHCEntity(Entity):  # type: ignore[misc]
                 )
             else:
                 self._update_attr()
-                self.schedule_update_ha_state()
+                self._schedule_state_write()
 
-        for service in self._device.device_services:
-            service.subscribe_callback(self.entity_id, on_state_changed)
+        service_ids = self._dependent_service_ids()
+        self._dispatch_index = entry_dispatch_index(self.hass, self._entry_id)
+        if self._dispatch_index is not None:
+            self._dispatch_index.async_register(
+                self._device, self, service_ids, on_state_changed
+            )
+        else:
+            for service in self._device.device_services:
+                if service_ids is None or service.id in service_ids:
+                    service.subscribe_callback(self.entity_id, on_state_changed)
         self._device.subscribe_callback(self.entity_id, update_entity_information)
 
+    def _dependent_service_ids(self) -> Collection[str] | None:
+        """Return the service ids this entity reads (None: all of them)."""
+        description = getattr(self, "entity_description", None)
+        return getattr(description, "service_ids", None)
+
+    def _state_fingerprint(self) -> tuple[Any, ...]:
+        """Return availability plus every `_state_fingerprint_attrs` value."""
+        return (
+            self.available,
+            *(getattr(self, attr) for attr in self._state_fingerprint_attrs),
+        )
+
+    def _schedule_state_write(self) -> None:
+        """Write state via the entry's coalescer (once per long-poll batch)."""
+        writer: SHCStateWriteCoalescer | None = getattr(self, "_state_writer", None)
+        if self._state_fingerprint_attrs:
+            fingerprint = self._state_fingerprint()
+            if fingerprint == getattr(self, "_last_state_fingerprint", None):
+                if writer is not None:
+                    writer.suppressed += 1
+                return
+            self._last_state_fingerprint = fingerprint
+        if writer is None:
+            self.schedule_update_ha_state()
+        else:
+            writer.async_schedule(self)
+
     async def async_will_remove_from_hass(self) -> None:
         """Unsubscribe from SHC events."""
         await super().async_will_remove_from_hass()
-        for service in self._device.device_services:
-            service.unsubscribe_callback(self.entity_id)
+        index: SHCDispatchIndex | None = getattr(self, "_dispatch_index", None)
+        if index is not None:
+            index.async_unregister(self._device, self)
+        else:
+            for service in self._device.device_services:
+                service.unsubscribe_callback(self.entity_id)
         self._device.unsubscribe_callback(self.entity_id)
 
     @property
@@ -248,3 +649,32 @@ class SHCEntity(Entity):  # type: ignore[misc]
     def available(self) -> bool:
         """Return false if status is unavailable."""
         return bool(self._device.status == "AVAILABLE")
+
+
+class SHCPolledEntity(  # type: ignore[misc]
+    CoordinatorEntity["SHCPolledResource"], SHCEntity
+):
+    """SHC device entity whose state is a resource from SHCPollScheduler.
+
+    Keeps SHCEntity's long-poll subscription (availability, device info,
+    deletion) and additionally listens to the shared polled resource.
+    """
+
+    def __init__(
+        self, device: SHCDevice, entry_id: str, coordinator: SHCPolledResource
+    ) -> None:
+        """Initialize the polled SHC entity."""
+        CoordinatorEntity.__init__(self, coordinator)
+        SHCEntity.__init__(self, device, entry_id)
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to both the device's SHC events and the resource."""
+        await SHCEntity.async_added_to_hass(self)
+        self.async_on_remove(
+            self.coordinator.async_add_listener(self._handle_coordinator_update)
+        )
+
+    @property
+    def available(self) -> bool:
+        """Follow the device; the resource keeps its last-known value."""
+        return SHCEntity.available.fget(self)  # type: ignore[no-any-return]
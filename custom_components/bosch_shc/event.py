@@ -85,7 +85,7 @@ async def async_setup_entry(
         ):
             # Excluded, or a runtime SwitchConfiguration change dropped the
             # Keypad service (#282) — clean up any previously created entity.
-            await async_remove_stale_entity(hass, Platform.EVENT, unique_id)
+            await async_remove_stale_entity(hass, entry, Platform.EVENT, unique_id)
             continue
         entities.append(
             LightControlButtonEvent(
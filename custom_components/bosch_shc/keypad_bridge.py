@@ -44,7 +44,11 @@ from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 
 from .const import LOGGER
-from .entity import async_remove_stale_entity, device_excluded
+from .entity import (
+    async_batch_stale_entity_removal,
+    async_remove_stale_entity,
+    device_excluded,
+)
 
 DATA_KEYPAD_BRIDGE_MAP = "keypad_bridge_map"
 
@@ -297,29 +301,32 @@ async def async_sync_keypad_bridge(
 
     # Remove entries no longer wanted (disabled, or device excluded/gone).
     mac = session.information.macAddress if bridge_map else None
-    for key in list(bridge_map):
-        if key in wanted_keys:
-            continue
-        entry_ids = bridge_map.pop(key)
-        try:
-            await session.async_delete_automation_rule(entry_ids["automation_id"])
-        except SHCException as err:
-            LOGGER.debug(
-                "Keypad bridge cleanup: failed to delete automation for %s: %s",
-                key,
-                err,
-            )
-        uds_id = entry_ids["userdefinedstate_id"]
-        try:
-            await session.async_delete_userdefinedstate(uds_id)
-        except SHCException as err:
-            LOGGER.debug(
-                "Keypad bridge cleanup: failed to delete state for %s: %s", key, err
-            )
-        # The now-deleted UserDefinedState's switch entity (switch.py) would
-        # otherwise linger as a permanently "unavailable" registry ghost.
-        if mac is not None:
-            await async_remove_stale_entity(hass, Platform.SWITCH, f"{mac}_{uds_id}")
+    async with async_batch_stale_entity_removal(hass, entry):
+        for key in list(bridge_map):
+            if key in wanted_keys:
+                continue
+            entry_ids = bridge_map.pop(key)
+            try:
+                await session.async_delete_automation_rule(entry_ids["automation_id"])
+            except SHCException as err:
+                LOGGER.debug(
+                    "Keypad bridge cleanup: failed to delete automation for %s: %s",
+                    key,
+                    err,
+                )
+            uds_id = entry_ids["userdefinedstate_id"]
+            try:
+                await session.async_delete_userdefinedstate(uds_id)
+            except SHCException as err:
+                LOGGER.debug(
+                    "Keypad bridge cleanup: failed to delete state for %s: %s", key, err
+                )
+            # The now-deleted UserDefinedState's switch entity (switch.py) would
+            # otherwise linger as a permanently "unavailable" registry ghost.
+            if mac is not None:
+                await async_remove_stale_entity(
+                    hass, entry, Platform.SWITCH, f"{mac}_{uds_id}"
+                )
 
     # Create entries that are missing.
     if enabled:
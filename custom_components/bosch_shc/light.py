@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Coroutine
 from typing import Any
 
 import aiohttp
@@ -41,12 +42,13 @@ from .const import (
 )
 from .entity import (
     SHCEntity,
-    async_migrate_to_new_unique_id,
     async_remove_stale_entity,
     device_excluded,
+    entry_state_writer,
     light_switch_as_light,
     light_switch_devices,
 )
+from .options import async_reload_platforms
 
 PARALLEL_UPDATES = 1
 
@@ -92,7 +94,6 @@ async def async_setup_entry(
     ):
         if device_excluded(light, config_entry.options):
             continue
-        await async_migrate_to_new_unique_id(hass, Platform.LIGHT, device=light)
         entities.append(
             LightSwitch(
                 device=light,
@@ -122,7 +123,9 @@ async def async_setup_entry(
                 )
             )
         else:
-            await async_remove_stale_entity(hass, Platform.LIGHT, unique_id)
+            await async_remove_stale_entity(
+                hass, config_entry, Platform.LIGHT, unique_id
+            )
 
     motion_light_suppressed = config_entry.options.get(
         OPT_SUPPRESS_MOTION_INDICATOR_LIGHT, False
@@ -149,13 +152,11 @@ async def async_setup_entry(
             # The motion sensor itself is unaffected.
             await async_remove_stale_entity(
                 hass,
+                config_entry,
                 Platform.LIGHT,
                 f"{light.root_device_id}_{light.id}_motionlight",
             )
             continue
-        await async_migrate_to_new_unique_id(
-            hass, Platform.LIGHT, device=light, attr_name="MotionLight"
-        )
         entities.append(
             MotionDetectorLight(
                 device=light,
@@ -172,12 +173,12 @@ async def async_setup_entry(
             light, config_entry.options
         ):
             # The device may become excluded, or the "expose as light" option
-            # may get toggled off — in either case, an options change reloads
-            # the entry (OptionsFlowWithReload), so if a light entity was
+            # may get toggled off — in either case, an options change re-runs
+            # this platform's setup (options.py), so if a light entity was
             # previously created for this device, remove the now-stale
             # registry entry instead of leaving an orphaned entity behind.
             await async_remove_stale_entity(
-                hass, Platform.LIGHT, f"{light.root_device_id}_{light.id}"
+                hass, config_entry, Platform.LIGHT, f"{light.root_device_id}_{light.id}"
             )
             continue
         entities.append(
@@ -277,32 +278,51 @@ class LightSwitch(SHCEntity, LightEntity):  # type: ignore[misc]
         return int(color_util.color_temperature_mired_to_kelvin(self._device.color))
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn the light on."""
+        """Turn the light on.
+
+        Each attribute is a separate SHC service with no multi-field write, so
+        the requested attribute writes go out concurrently: one round trip
+        instead of up to three. The light is only switched on once they all
+        landed, so it never lights up at its old brightness or colour.
+        """
         hs_color = kwargs.get(ATTR_HS_COLOR)
         color_temp_kelvin = kwargs.get(ATTR_COLOR_TEMP_KELVIN)
         brightness = kwargs.get(ATTR_BRIGHTNESS)
+        writes: list[Coroutine[Any, Any, None]] = []
+        color_mode: ColorMode | None = None
+
+        if brightness is not None and self._device.supports_brightness:
+            # Bosch API does not accept brightness=0; HA uses brightness=0 to
+            # mean "off", which is handled via binarystate. Clamp to 1 so that
+            # a near-zero HA value (e.g. 1/255) never silently turns off.
+            writes.append(
+                self._device.async_set_brightness(max(round(brightness * 100 / 255), 1))
+            )
 
-        try:
-            if brightness is not None and self._device.supports_brightness:
-                # Bosch API does not accept brightness=0; HA uses brightness=0 to
-                # mean "off", which is handled via binarystate. Clamp to 1 so that
-                # a near-zero HA value (e.g. 1/255) never silently turns off.
-                await self._device.async_set_brightness(
-                    max(round(brightness * 100 / 255), 1)
-                )
-
-            if color_temp_kelvin is not None and self._device.supports_color_temp:
-                await self._device.async_set_color(
+        if color_temp_kelvin is not None and self._device.supports_color_temp:
+            writes.append(
+                self._device.async_set_color(
                     color_util.color_temperature_kelvin_to_mired(color_temp_kelvin)
                 )
-                self._attr_color_mode = ColorMode.COLOR_TEMP
+            )
+            color_mode = ColorMode.COLOR_TEMP
 
-            if hs_color is not None and self._device.supports_color_hsb:
-                rgb = color_util.color_hs_to_RGB(*hs_color)
-                raw_rgb = (rgb[0] << 16) + (rgb[1] << 8) + rgb[2]
-                await self._device.async_set_rgb(raw_rgb)
-                self._attr_color_mode = ColorMode.HS
+        if hs_color is not None and self._device.supports_color_hsb:
+            rgb = color_util.color_hs_to_RGB(*hs_color)
+            writes.append(
+                self._device.async_set_rgb((rgb[0] << 16) + (rgb[1] << 8) + rgb[2])
+            )
+            color_mode = ColorMode.HS
 
+        try:
+            # Let every write finish before raising, so a failure leaves no
+            # write still in flight behind the error.
+            results = await asyncio.gather(*writes, return_exceptions=True)
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            if color_mode is not None:
+                self._attr_color_mode = color_mode
             if not self.is_on:
                 await self._device.async_set_binarystate(True)
         except SHCException as err:
@@ -524,9 +544,14 @@ class SHCRoomLightGroup(LightEntity):  # type: ignore[misc]
     async def async_added_to_hass(self) -> None:
         """Subscribe to every member device's services for local_push updates."""
         await super().async_added_to_hass()
+        # A scenario switching every light in the room is one write, not N.
+        writer = entry_state_writer(self.hass, self._entry_id)
 
         def _on_state_change() -> None:
-            self.schedule_update_ha_state()
+            if writer is None:
+                self.schedule_update_ha_state()
+            else:
+                writer.async_schedule(self)
 
         def _on_device_change() -> None:
             # Unlike SHCEntity (one entity = one device), this group spans
@@ -534,16 +559,16 @@ class SHCRoomLightGroup(LightEntity):  # type: ignore[misc]
             # unpaired/removed live on the SHC (no options change, no config
             # entry reload). A stale member would otherwise keep contributing
             # its last-known state/writes forever and the room's "2+ members"
-            # threshold would never get re-evaluated. Reloading the entry
-            # re-runs async_setup_entry, which rebuilds every room group (or
-            # removes it) from the current device list — the same recovery
+            # threshold would never get re-evaluated. Setting the light
+            # platform up again rebuilds every room group (or removes it) from
+            # the current device list, on the live session — the same recovery
             # already used by InstallationProfileSelect (select.py).
             if any(device.deleted for device in self._devices):
                 self.hass.async_create_task(
-                    self.hass.config_entries.async_reload(self._entry_id)
+                    async_reload_platforms(self.hass, self._entry_id, [Platform.LIGHT])
                 )
             else:
-                self.schedule_update_ha_state()
+                _on_state_change()
 
         for device in self._devices:
             for service in device.device_services:
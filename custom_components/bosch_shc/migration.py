@@ -0,0 +1,233 @@
+"""One-shot migration of legacy entity unique ids (config entry 1.1 -> 1.2).
+
+Entities used to be keyed by the device serial ("<serial>" or
+"<serial>_<attr>"); they are keyed by "<root_device_id>_<device id>[_<attr>]"
+now. The renames are computed for every device at once and applied in a
+single er.async_migrate_entries pass over the entry's entities. The entry's
+minor version records it, so later startups skip the registry entirely.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any, NamedTuple
+
+from boschshcpy import SHCSessionAsync
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+
+from .const import DOMAIN, LOGGER
+
+# Config entry minor version whose entities carry the current unique ids.
+UNIQUE_ID_MINOR_VERSION = 2
+
+
+class _LegacyIds(NamedTuple):
+    """Entities of one platform that were keyed by the device serial."""
+
+    platform: Platform
+    buckets: tuple[str, ...]
+    attr_name: str | None = None
+    # Suffix after "<serial>_" where it differed from attr_name.lower().
+    legacy_suffix: str | None = None
+
+
+_BATTERY_BUCKETS = (
+    "motion_detectors",
+    "motion_detectors2",
+    "shutter_contacts",
+    "shutter_contacts2",
+    "smoke_detectors",
+    "thermostats",
+    "twinguards",
+    "universal_switches",
+    "wallthermostats",
+    "roomthermostats",
+    "water_leakage_detectors",
+    "outdoor_sirens",
+)
+_POWER_METER_BUCKETS = (
+    "smart_plugs",
+    "smart_plugs_compact",
+    "light_switches_bsm",
+    "micromodule_light_controls",
+    "micromodule_shutter_controls",
+    "micromodule_blinds",
+)
+
+# When two rows claim the same legacy id, the later one is the fallback target.
+_LEGACY_IDS = (
+    _LegacyIds(
+        Platform.BINARY_SENSOR,
+        (
+            "shutter_contacts",
+            "shutter_contacts2",
+            "motion_detectors",
+            "motion_detectors2",
+            "smoke_detectors",
+            "water_leakage_detectors",
+        ),
+    ),
+    _LegacyIds(Platform.BINARY_SENSOR, ("motion_detectors2",), "Occupancy"),
+    _LegacyIds(Platform.BINARY_SENSOR, _BATTERY_BUCKETS, "Battery"),
+    _LegacyIds(
+        Platform.COVER,
+        ("shutter_controls", "micromodule_shutter_controls", "micromodule_blinds"),
+    ),
+    _LegacyIds(
+        Platform.LIGHT, ("ledvance_lights", "micromodule_dimmers", "hue_lights")
+    ),
+    _LegacyIds(Platform.LIGHT, ("motion_detectors2",), "MotionLight"),
+    _LegacyIds(
+        Platform.SENSOR,
+        (
+            "thermostats",
+            "wallthermostats",
+            "roomthermostats",
+            "twinguards",
+            "motion_detectors2",
+        ),
+        "Temperature",
+    ),
+    _LegacyIds(Platform.SENSOR, ("thermostats",), "Valvetappet"),
+    _LegacyIds(
+        Platform.SENSOR,
+        ("wallthermostats", "roomthermostats", "twinguards"),
+        "Humidity",
+    ),
+    _LegacyIds(Platform.SENSOR, ("twinguards",), "Purity"),
+    _LegacyIds(Platform.SENSOR, ("twinguards",), "AirQuality"),
+    _LegacyIds(
+        Platform.SENSOR, ("twinguards",), "TemperatureRating", "temperature_rating"
+    ),
+    _LegacyIds(Platform.SENSOR, ("twinguards",), "HumidityRating", "humidity_rating"),
+    _LegacyIds(Platform.SENSOR, ("twinguards",), "PurityRating", "purity_rating"),
+    _LegacyIds(Platform.SENSOR, _POWER_METER_BUCKETS, "Power"),
+    _LegacyIds(Platform.SENSOR, _POWER_METER_BUCKETS, "Energy"),
+    _LegacyIds(
+        Platform.SENSOR,
+        ("smart_plugs_compact",),
+        "CommunicationQuality",
+        "communication_quality",
+    ),
+    _LegacyIds(
+        Platform.SENSOR,
+        ("motion_detectors2", "shutter_contacts2"),
+        "CommunicationQuality",
+    ),
+    _LegacyIds(
+        Platform.SWITCH,
+        (
+            "smart_plugs",
+            "smart_plugs_compact",
+            "light_switches_bsm",
+            "micromodule_light_attached",
+            "micromodule_relays",
+            "camera_eyes",
+            "camera_360",
+            "camera_outdoor_gen2",
+            "presence_simulation_system",
+            "shutter_contacts2",
+        ),
+    ),
+    _LegacyIds(Platform.SWITCH, ("smart_plugs",), "Routing"),
+    _LegacyIds(Platform.SWITCH, ("camera_eyes",), "Light"),
+    _LegacyIds(Platform.SWITCH, ("camera_eyes", "camera_360"), "Notification"),
+    _LegacyIds(Platform.SWITCH, ("camera_outdoor_gen2",), "Frontlight", "light"),
+    # #289: only if Frontlight's id already exists.
+    _LegacyIds(Platform.SWITCH, ("camera_outdoor_gen2",), "AmbientLight", "light"),
+    _LegacyIds(Platform.SWITCH, ("motion_detectors2",), "PetImmunity"),
+)
+
+
+def _bucket_devices(device_helper: Any, buckets: tuple[str, ...]) -> Iterator[Any]:
+    """Yield the devices of `buckets`; single-device attributes count as one."""
+    for bucket in buckets:
+        devices = getattr(device_helper, bucket, None)
+        if devices is None:
+            continue
+        if isinstance(devices, (list, tuple)):
+            yield from devices
+        else:
+            yield devices
+
+
+def _new_unique_id(device: Any, attr_name: str | None) -> str:
+    unique_id = f"{device.root_device_id}_{device.id}"
+    return unique_id if attr_name is None else f"{unique_id}_{attr_name.lower()}"
+
+
+def _add_rename(
+    renames: dict[tuple[str, str], list[str]], key: tuple[str, str], new: str
+) -> None:
+    candidates = renames.setdefault(key, [])
+    if new not in candidates:
+        candidates.append(new)
+
+
+def _legacy_unique_ids(
+    session: SHCSessionAsync, entry_id: str
+) -> dict[tuple[str, str], list[str]]:
+    """Return {(platform, legacy unique id): candidate unique ids, in order}."""
+    renames: dict[tuple[str, str], list[str]] = {}
+    device_helper = session.device_helper
+    if device_helper is not None:
+        for platform, buckets, attr_name, legacy_suffix in _LEGACY_IDS:
+            suffix = legacy_suffix or (attr_name.lower() if attr_name else None)
+            for device in _bucket_devices(device_helper, buckets):
+                serial = getattr(device, "serial", None)
+                if serial is None:
+                    continue
+                old = serial if suffix is None else f"{serial}_{suffix}"
+                _add_rename(renames, (platform, old), _new_unique_id(device, attr_name))
+        # #289: 0.4.106-0.4.111 gave both Gen2 camera lights one "_light" id;
+        # like the serial-keyed one, it becomes the Frontlight (else AmbientLight).
+        for camera in _bucket_devices(device_helper, ("camera_outdoor_gen2",)):
+            for attr_name in ("Frontlight", "AmbientLight"):
+                _add_rename(
+                    renames,
+                    (Platform.SWITCH, _new_unique_id(camera, "Light")),
+                    _new_unique_id(camera, attr_name),
+                )
+    intrusion_system = getattr(session, "intrusion_system", None)
+    if intrusion_system is not None:
+        _add_rename(
+            renames,
+            (Platform.ALARM_CONTROL_PANEL, f"{entry_id}_{intrusion_system.id}"),
+            _new_unique_id(intrusion_system, None),
+        )
+    return renames
+
+
+async def async_migrate_unique_ids(
+    hass: HomeAssistant, entry: ConfigEntry, session: SHCSessionAsync
+) -> None:
+    """Re-key the entry's legacy entities, then bump its minor version."""
+    renames = _legacy_unique_ids(session, entry.entry_id)
+    ent_reg = er.async_get(hass)
+
+    @callback  # type: ignore[untyped-decorator]
+    def _migrate(entity: er.RegistryEntry) -> dict[str, Any] | None:
+        candidates = renames.get((entity.domain, entity.unique_id))
+        if not candidates:
+            return None
+        for new_unique_id in candidates:
+            if ent_reg.async_get_entity_id(entity.domain, DOMAIN, new_unique_id):
+                continue
+            LOGGER.debug(
+                "Migrating unique_id from [%s] to [%s]",
+                entity.unique_id,
+                new_unique_id,
+            )
+            return {"new_unique_id": new_unique_id}
+        LOGGER.warning(
+            "Skip migration of id [%s] to [%s] because it already exists",
+            entity.unique_id,
+            ", ".join(candidates),
+        )
+        return None
+
+    await er.async_migrate_entries(hass, entry.entry_id, _migrate)
+    hass.config_entries.async_update_entry(entry, minor_version=UNIQUE_ID_MINOR_VERSION)
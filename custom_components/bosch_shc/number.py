@@ -41,14 +41,15 @@ from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN, OPT_TEMPERATURE_DROP_ENTITIES
-from .entity import SHCEntity, device_excluded
+from .coordinator import SHCPolledResource, merge_temperature_drop_config
+from .entity import SHCEntity, SHCPolledEntity, device_excluded
 
 LOGGER = logging.getLogger(__name__)
 
 PARALLEL_UPDATES = 1
 
-# Rarely-changing config state; without this, should_poll=True entities
-# default to HA's 15s interval (flagged as an unnecessary load concern).
+# Rarely-changing config state: SHCPollScheduler interval for the polled
+# resources below (HA's 15s default was flagged as an unnecessary load).
 SCAN_INTERVAL = timedelta(minutes=15)
 
 
@@ -615,9 +616,15 @@ async def async_setup_entry(  # noqa: C901
     entities: list[NumberEntity] = []
     session: SHCSession = config_entry.runtime_data.session
 
+    # getattr: bare SimpleNamespace runtime_data (tests) has no scheduler;
+    # the polled entity below is then skipped instead of crashing setup.
+    poll_scheduler = getattr(config_entry.runtime_data, "poll_scheduler", None)
+
     # Temperature-drop service drop value (APK-traced, live-confirmed).
-    # Opt-in: should_poll entity was flagged as an unnecessary load cost.
-    if config_entry.options.get(OPT_TEMPERATURE_DROP_ENTITIES, False):
+    # Opt-in: polled entity was flagged as an unnecessary load cost.
+    if poll_scheduler is not None and config_entry.options.get(
+        OPT_TEMPERATURE_DROP_ENTITIES, False
+    ):
         for climate in getattr(session.device_helper, "climate_controls", []):
             if device_excluded(climate, config_entry.options):
                 continue
@@ -625,15 +632,23 @@ async def async_setup_entry(  # noqa: C901
             if room_id is None:
                 continue
             room = session.room(room_id)
+            # Shared with the switch platform: only the first one GETs the room.
             try:
-                tds = await room.async_temperature_drop_service()
+                coordinator = await poll_scheduler.async_get_probed(
+                    f"temperature_drop_{room_id}",
+                    room.async_temperature_drop_service,
+                    SCAN_INTERVAL,
+                )
             except SHCException:
                 continue
-            if tds is None:
+            if coordinator is None:
                 continue
             entities.append(
                 TemperatureDropValueNumber(
-                    device=climate, room=room, entry_id=config_entry.entry_id
+                    device=climate,
+                    room=room,
+                    entry_id=config_entry.entry_id,
+                    coordinator=coordinator,
                 )
             )
 
@@ -930,33 +945,38 @@ class SHCNumber[_DeviceT: SHCDevice](SHCEntity, NumberEntity):  # type: ignore[m
             )
 
 
-class TemperatureDropValueNumber(SHCEntity, NumberEntity):  # type: ignore[misc]
+class TemperatureDropValueNumber(SHCPolledEntity, NumberEntity):  # type: ignore[misc]
     """How many degrees a room's temperature-drop service lowers the setpoint.
 
     Not in the official OpenAPI spec; APK ground-truth
     (RestRequests.getTemperatureDropService/putTemperatureDropService), live-
     confirmed across 12 real rooms. Reads/writes go through the room (not the
-    climate device) -- a separate resource, so it must be explicitly polled.
+    climate device) -- a separate resource, polled through the entry's
+    SHCPollScheduler and shared with TemperatureDropEnabledSwitch.
     Bounds are conservative engineering defaults (not confirmed from the app's
     own UI limits).
     """
 
     _attr_translation_key = "temperature_drop_value"
     _attr_entity_category = EntityCategory.CONFIG
-    _attr_should_poll = True
     _attr_native_min_value = 0.5
     _attr_native_max_value = 5.0
     _attr_native_step = 0.5
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
 
-    def __init__(self, device: SHCDevice, room: Any, entry_id: str) -> None:
+    def __init__(
+        self,
+        device: SHCDevice,
+        room: Any,
+        entry_id: str,
+        coordinator: SHCPolledResource,
+    ) -> None:
         """Initialize the temperature-drop value number."""
-        super().__init__(device, entry_id)
+        super().__init__(device, entry_id, coordinator)
         self._room = room
         self._attr_unique_id = (
             f"{device.root_device_id}_{device.id}_temperature_drop_value"
         )
-        self._value: float | None = None
 
     @property
     def device_name(self) -> str:
@@ -966,21 +986,9 @@ class TemperatureDropValueNumber(SHCEntity, NumberEntity):  # type: ignore[misc]
     @property
     def native_value(self) -> float | None:
         """Return the configured temperature-drop value."""
-        return self._value
-
-    async def async_update(self) -> None:
-        """Poll this room's temperature-drop service configuration."""
-        try:
-            data = await self._room.async_temperature_drop_service()
-        except SHCException as err:
-            LOGGER.debug(
-                "Failed to poll temperature-drop service for %s: %s",
-                self.device_name,
-                err,
-            )
-            return
-        value = (data or {}).get("configuration", {}).get("dropTemperature")
-        self._value = float(value) if value is not None else None
+        data = self.coordinator.data or {}
+        value = data.get("configuration", {}).get("dropTemperature")
+        return float(value) if value is not None else None
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the temperature-drop value."""
@@ -992,4 +1000,8 @@ class TemperatureDropValueNumber(SHCEntity, NumberEntity):  # type: ignore[misc]
                 translation_domain=DOMAIN,
                 translation_key="number_set_failed",
             ) from err
-        self._value = value
+        self.coordinator.async_set_updated_data(
+            merge_temperature_drop_config(
+                self.coordinator.data, "dropTemperature", value
+            )
+        )
@@ -0,0 +1,179 @@
+"""Apply options changes to a loaded entry without reloading it.
+
+A config-entry reload tears down the long poll, the HTTPS session and the
+whole device model, and misses every push until the controller has been
+enumerated again. Most options only decide which entities the platforms
+build, though, so for those the running session is kept: only the platforms
+that read a changed option are unloaded and set up again. Any other change
+(connection, long poll, presence and silent-mode tracking, keypad bridge,
+services) still reloads the entry. async_reload_platforms offers the same
+in-place path to entities that appear or go away at runtime.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry, OperationNotAllowed
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+
+from .capabilities import async_platforms_to_forward
+from .const import (
+    LOGGER,
+    OPT_ALL_LIGHTS_AS_LIGHT,
+    OPT_AUTOMATION_RULES_AS_ENTITIES,
+    OPT_DIAGNOSTIC_ENTITIES,
+    OPT_EXCLUDED_DEVICES,
+    OPT_EXCLUDED_ROOMS,
+    OPT_KEYPAD_HA_BRIDGE,
+    OPT_LIGHTS_AS_LIGHT,
+    OPT_ROOM_LIGHT_GROUPS,
+    OPT_SCENARIOS_AS_BUTTONS,
+    OPT_SCENARIOS_FILTER,
+    OPT_SUPPRESS_CAMERA_SWITCHES,
+    OPT_SUPPRESS_HUE_LIGHTS,
+    OPT_SUPPRESS_LEDVANCE_LIGHTS,
+    OPT_SUPPRESS_MOTION_INDICATOR_LIGHT,
+    OPT_SUPPRESS_POWER_SENSORS,
+    OPT_TEMPERATURE_DROP_ENTITIES,
+)
+from .data import SHCData
+from .entity import async_batch_stale_entity_removal
+from .keypad_bridge import async_sync_keypad_bridge
+
+# Option -> platforms whose setup reads it; None: every platform does, via
+# device_excluded() (the keypad bridge reads it too).
+_OPTION_PLATFORMS: dict[str, frozenset[Platform] | None] = {
+    OPT_EXCLUDED_DEVICES: None,
+    OPT_EXCLUDED_ROOMS: None,
+    OPT_LIGHTS_AS_LIGHT: frozenset({Platform.LIGHT, Platform.SWITCH}),
+    OPT_ALL_LIGHTS_AS_LIGHT: frozenset({Platform.LIGHT, Platform.SWITCH}),
+    OPT_SUPPRESS_HUE_LIGHTS: frozenset({Platform.LIGHT}),
+    OPT_SUPPRESS_LEDVANCE_LIGHTS: frozenset({Platform.LIGHT}),
+    OPT_SUPPRESS_MOTION_INDICATOR_LIGHT: frozenset({Platform.LIGHT}),
+    OPT_ROOM_LIGHT_GROUPS: frozenset({Platform.LIGHT}),
+    OPT_SUPPRESS_CAMERA_SWITCHES: frozenset({Platform.SWITCH}),
+    OPT_SUPPRESS_POWER_SENSORS: frozenset({Platform.SENSOR}),
+    OPT_DIAGNOSTIC_ENTITIES: frozenset({Platform.SENSOR}),
+    OPT_SCENARIOS_AS_BUTTONS: frozenset({Platform.BUTTON}),
+    OPT_SCENARIOS_FILTER: frozenset({Platform.BUTTON}),
+    OPT_AUTOMATION_RULES_AS_ENTITIES: frozenset({Platform.BUTTON, Platform.SWITCH}),
+    OPT_TEMPERATURE_DROP_ENTITIES: frozenset({Platform.NUMBER, Platform.SWITCH}),
+}
+
+
+def changed_options(old: Mapping[str, Any], new: Mapping[str, Any]) -> set[str]:
+    """Return the option keys whose value differs between `old` and `new`."""
+    return {key for key in old.keys() | new.keys() if old.get(key) != new.get(key)}
+
+
+def platforms_to_reload(
+    changed: set[str], loaded: set[Platform]
+) -> set[Platform] | None:
+    """Return the loaded platforms `changed` affects; None if it needs a reload."""
+    platforms: set[Platform] = set()
+    for key in changed:
+        if key not in _OPTION_PLATFORMS:
+            return None
+        affected = _OPTION_PLATFORMS[key]
+        platforms |= loaded if affected is None else affected & loaded
+    return platforms
+
+
+async def _async_set_up_again(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    platforms: set[Platform],
+    candidates: Iterable[Platform],
+) -> None:
+    """Unload `platforms`, then forward those of `candidates` with sources.
+
+    Called under the entry's options_lock.
+    """
+    runtime = entry.runtime_data
+    loaded = runtime.loaded_platforms
+    if platforms and not await hass.config_entries.async_unload_platforms(
+        entry, platforms
+    ):
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+        return
+    for platform in platforms:
+        for unload in runtime.platform_unloads.pop(platform, []):
+            unload()
+    loaded.difference_update(platforms)
+    forward = async_platforms_to_forward(
+        hass,
+        entry,
+        runtime.session,
+        [p for p in candidates if p in platforms or p not in loaded],
+    )
+    if not forward:
+        return
+    loaded.update(forward)
+    try:
+        async with async_batch_stale_entity_removal(hass, entry):
+            await hass.config_entries.async_forward_entry_setups(entry, forward)
+    except OperationNotAllowed:
+        # The entry is unloading; the next setup forwards them anyway.
+        loaded.difference_update(forward)
+
+
+async def async_apply_options(
+    hass: HomeAssistant, entry: ConfigEntry, all_platforms: Iterable[Platform]
+) -> None:
+    """Entry update listener: hot-apply an options change where possible."""
+    runtime = entry.runtime_data
+    async with runtime.options_lock:
+        changed = changed_options(runtime.applied_options, entry.options)
+        if not changed:
+            # A data-only update (keypad bridge map, unique-id version).
+            return
+        platforms = platforms_to_reload(changed, runtime.loaded_platforms)
+        if platforms is None:
+            LOGGER.debug(
+                "Bosch SHC '%s': options %s need a reload", entry.title, changed
+            )
+            hass.config_entries.async_schedule_reload(entry.entry_id)
+            return
+        runtime.applied_options = dict(entry.options)
+        LOGGER.debug(
+            "Bosch SHC '%s': applying options %s to platforms %s",
+            entry.title,
+            changed,
+            platforms,
+        )
+        if changed & {OPT_EXCLUDED_DEVICES, OPT_EXCLUDED_ROOMS} and entry.options.get(
+            OPT_KEYPAD_HA_BRIDGE, False
+        ):
+            await async_sync_keypad_bridge(hass, entry, True)
+        # The change may also give a skipped platform something to build.
+        await _async_set_up_again(hass, entry, platforms, all_platforms)
+        if changed & {OPT_EXCLUDED_DEVICES, OPT_EXCLUDED_ROOMS} and (
+            runtime.device_index is not None
+        ):
+            runtime.device_index.async_rebuild(entry.options)
+
+
+async def async_reload_platforms(
+    hass: HomeAssistant, entry_id: str, platforms: Iterable[str] | None = None
+) -> None:
+    """Set the entry's `platforms` (default: every loaded one) up again.
+
+    For entities that come or go without an options change: a room light
+    group losing a member, a switched installation profile. An entry without
+    live runtime data is reloaded instead.
+    """
+    entry = hass.config_entries.async_get_entry(entry_id)
+    runtime = getattr(entry, "runtime_data", None)
+    if not isinstance(runtime, SHCData):
+        await hass.config_entries.async_reload(entry_id)
+        return
+    async with runtime.options_lock:
+        loaded = runtime.loaded_platforms
+        wanted = set(loaded) if platforms is None else {Platform(p) for p in platforms}
+        LOGGER.debug(
+            "Bosch SHC '%s': setting up platforms %s again", entry.title, wanted
+        )
+        await _async_set_up_again(hass, entry, wanted & loaded, wanted & loaded)
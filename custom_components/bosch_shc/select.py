@@ -41,14 +41,16 @@ from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
-from .entity import SHCEntity, device_excluded
+from .coordinator import SHCPolledResource
+from .entity import SHCEntity, SHCPolledEntity, device_excluded
+from .options import async_reload_platforms
 
 LOGGER = logging.getLogger(__name__)
 
 PARALLEL_UPDATES = 1
 
-# Rarely-changing config state; without this, should_poll=True entities
-# default to HA's 15s interval (flagged as an unnecessary load concern).
+# Rarely-changing config state: SHCPollScheduler interval for the polled
+# resources below (HA's 15s default was flagged as an unnecessary load).
 SCAN_INTERVAL = timedelta(minutes=15)
 
 
@@ -554,6 +556,10 @@ async def async_setup_entry(  # noqa: C901
     entities: list[SelectEntity] = []
     session: SHCSession = config_entry.runtime_data.session
 
+    # getattr: bare SimpleNamespace runtime_data (tests) has no scheduler;
+    # the polled entity below is then skipped instead of crashing setup.
+    poll_scheduler = getattr(config_entry.runtime_data, "poll_scheduler", None)
+
     # Thermostat regulation algorithm (APK-traced): thermostat-only probe,
     # 404 (SHCException) means this device lacks the config, skipped.
     for device in (
@@ -561,7 +567,7 @@ async def async_setup_entry(  # noqa: C901
         + list(getattr(session.device_helper, "wallthermostats", []))
         + list(getattr(session.device_helper, "roomthermostats", []))
     ):
-        if device_excluded(device, config_entry.options):
+        if poll_scheduler is None or device_excluded(device, config_entry.options):
             continue
         try:
             algorithm = await device.async_thermostat_regulation_algorithm()
@@ -571,7 +577,14 @@ async def async_setup_entry(  # noqa: C901
             continue
         entities.append(
             ThermostatRegulationAlgorithmSelect(
-                device=device, entry_id=config_entry.entry_id
+                device=device,
+                entry_id=config_entry.entry_id,
+                coordinator=poll_scheduler.async_get(
+                    f"regulation_algorithm_{device.id}",
+                    device.async_thermostat_regulation_algorithm,
+                    SCAN_INTERVAL,
+                    data=algorithm,
+                ),
             )
         )
 
@@ -848,11 +861,11 @@ class SHCSelect[_DeviceT: SHCDevice](SHCEntity, SelectEntity):  # type: ignore[m
             ) from err
         if self.entity_description.reload_after_select:
             # #356: switching e.g. the profile can add/remove capability-gated
-            # entities (the Motion Detector II [+M] indicator light) — reload
-            # so the entity list reflects the change immediately, instead of
-            # only after the user manually reloads the integration/restarts.
+            # entities (the Motion Detector II [+M] indicator light) — set the
+            # platforms up again so the entity list reflects the change
+            # immediately, instead of only after a manual reload/restart.
             self.hass.async_create_task(
-                self.hass.config_entries.async_reload(self._entry_id)
+                async_reload_platforms(self.hass, self._entry_id)
             )
 
 
@@ -1040,54 +1053,44 @@ class InstallationProfileSelect(SHCSelect):
         ]
 
 
-class ThermostatRegulationAlgorithmSelect(SHCEntity, SelectEntity):  # type: ignore[misc]
+class ThermostatRegulationAlgorithmSelect(SHCPolledEntity, SelectEntity):  # type: ignore[misc]
     """Select the regulation algorithm used by a thermostat (INTERNAL/CUSTOM).
 
     Not in the official OpenAPI spec; APK ground-truth
     (RestRequests.get/putThermostatRegulationAlgorithmConfiguration), live-
     confirmed against a real TRV_GEN2. A separate resource from the normal
-    device-service model, so it must be explicitly polled.
+    device-service model, polled through the entry's SHCPollScheduler.
     """
 
     _attr_translation_key = "thermostat_regulation_algorithm"
     _attr_entity_category = EntityCategory.CONFIG
-    _attr_should_poll = True
     _attr_options = ["internal", "custom"]
 
-    def __init__(self, device: SHCDevice, entry_id: str) -> None:
+    def __init__(
+        self, device: SHCDevice, entry_id: str, coordinator: SHCPolledResource
+    ) -> None:
         """Initialize the thermostat regulation-algorithm select."""
-        super().__init__(device, entry_id)
+        super().__init__(device, entry_id, coordinator)
         self._attr_unique_id = (
             f"{device.root_device_id}_{device.id}_regulation_algorithm"
         )
-        self._algorithm: str | None = None
-
-    async def async_update(self) -> None:
-        """Poll this thermostat's current regulation algorithm."""
-        try:
-            self._algorithm = await self._device.async_thermostat_regulation_algorithm()
-        except SHCException as err:
-            LOGGER.debug(
-                "Failed to poll regulation algorithm for %s: %s",
-                self.device_name,
-                err,
-            )
 
     @property
     def current_option(self) -> str | None:
         """Return the currently selected regulation algorithm."""
-        if self._algorithm is None:
+        algorithm = self.coordinator.data
+        if algorithm is None:
             return None
-        return self._algorithm.lower()
+        return str(algorithm).lower()
 
     async def async_select_option(self, option: str) -> None:
         """Set the regulation algorithm."""
         try:
             await self._device.async_set_thermostat_regulation_algorithm(option.upper())
-            self._algorithm = option.upper()
         except SHCException as err:
             raise HomeAssistantError(
                 f"Failed to set regulation algorithm for {self.device_name}: {err}",
                 translation_domain=DOMAIN,
                 translation_key="select_option_failed",
             ) from err
+        self.coordinator.async_set_updated_data(option.upper())
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections import Counter
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
-from datetime import timedelta
+from datetime import datetime, timedelta
+from functools import partial
+from itertools import chain
 from typing import Any, cast
 
 from boschshcpy import (
@@ -19,6 +22,7 @@ from boschshcpy import (
     SHCOutdoorSiren,
     SHCPresenceSimulationSystem,
     SHCSession,
+    SHCShutterContact,
     SHCShutterContact2,
     SHCShutterControl,
     SHCSmartPlug,
@@ -27,9 +31,9 @@ from boschshcpy import (
     SHCTwinguard,
     SHCUniversalSwitch,
     SHCWallThermostat,
+    ShutterContactService,
 )
 from boschshcpy.device import SHCDevice
-from boschshcpy.exceptions import SHCException
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
@@ -39,7 +43,6 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     LIGHT_LUX,
-    Platform,
     UnitOfEnergy,
     UnitOfPower,
     UnitOfTemperature,
@@ -63,7 +66,7 @@ except ImportError:
         PARTS_PER_MILLION = _ppm
 
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceEntry, DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -75,14 +78,33 @@ from .const import (
     OPT_DIAGNOSTIC_ENTITIES,
     OPT_SUPPRESS_POWER_SENSORS,
 )
-from .coordinator import SHCZigbeeRoutingCoordinator
-from .entity import SHCEntity, async_migrate_to_new_unique_id, device_excluded
+from .coordinator import (
+    SHCPolledResource,
+    SHCPollStats,
+    SHCZigbeeRoutingCoordinator,
+)
+from .entity import SHCEntity, device_excluded
 
 PARALLEL_UPDATES = 1
 
-# Without this, should_poll=True entities default to HA's 15s interval;
-# real state still arrives instantly via the per-contact entities either way.
-SCAN_INTERVAL = timedelta(minutes=5)
+# SHCPollScheduler interval for the open-windows summary. Only a reconcile:
+# the count itself follows the contacts' long-poll pushes.
+SCAN_INTERVAL = timedelta(minutes=30)
+
+# Open-set categories of the doors-windows/openwindows summary.
+_OPENING_CATEGORIES = ("openDoors", "openWindows", "openOthers")
+# Summary list naming every contact of a category, open or not.
+_ALL_OPENINGS = {
+    "openDoors": "allDoors",
+    "openWindows": "allWindows",
+    "openOthers": "allOthers",
+}
+# A contact's category until a reconcile names it, from its profile.
+_PROFILE_CATEGORY = {
+    "ENTRANCE_DOOR": "openDoors",
+    "FRENCH_WINDOW": "openDoors",
+    "REGULAR_WINDOW": "openWindows",
+}
 
 
 async def async_setup_entry(  # noqa: C901
@@ -140,9 +162,6 @@ async def async_setup_entry(  # noqa: C901
     for sensor in session.device_helper.thermostats:
         if device_excluded(sensor, config_entry.options):
             continue
-        await async_migrate_to_new_unique_id(
-            hass, Platform.SENSOR, device=sensor, attr_name="Temperature"
-        )
         entities.append(
             TemperatureSensor(
                 device=sensor,
@@ -150,9 +169,6 @@ async def async_setup_entry(  # noqa: C901
             )
         )
         if diagnostic_enabled:
-            await async_migrate_to_new_unique_id(
-                hass, Platform.SENSOR, device=sensor, attr_name="Valvetappet"
-            )
             entities.append(
                 ValveTappetSensor(
                     device=sensor,
@@ -171,18 +187,12 @@ async def async_setup_entry(  # noqa: C901
     ):
         if device_excluded(sensor, config_entry.options):
             continue
-        await async_migrate_to_new_unique_id(
-            hass, Platform.SENSOR, device=sensor, attr_name="Temperature"
-        )
         entities.append(
             TemperatureSensor(
                 device=sensor,
                 entry_id=config_entry.entry_id,
             )
         )
-        await async_migrate_to_new_unique_id(
-            hass, Platform.SENSOR, device=sensor, attr_name="Humidity"
-        )
         if getattr(sensor, "supports_humidity", True):
             entities.append(
                 HumiditySensor(
@@ -205,18 +215,12 @@ async def async_setup_entry(  # noqa: C901
     for sensor in session.device_helper.twinguards:
         if device_excluded(sensor, config_entry.options):
             continue
-        await async_migrate_to_new_unique_id(
-            hass, Platform.SENSOR, device=sensor, attr_name="Temperature"
-        )
         entities.append(
             TemperatureSensor(
                 device=sensor,
                 entry_id=config_entry.entry_id,
             )
         )
-        await async_migrate_to_new_unique_id(
-            hass, Platform.SENSOR, device=sensor, attr_name="Humidity"
-        )
         if getattr(sensor, "supports_humidity", True):
             entities.append(
                 HumiditySensor(
@@ -224,57 +228,30 @@ async def async_setup_entry(  # noqa: C901
                     entry_id=config_entry.entry_id,
                 )
             )
-        await async_migrate_to_new_unique_id(
-            hass, Platform.SENSOR, device=sensor, attr_name="Purity"
-        )
         entities.append(
             PuritySensor(
                 device=sensor,
                 entry_id=config_entry.entry_id,
             )
         )
-        await async_migrate_to_new_unique_id(
-            hass, Platform.SENSOR, device=sensor, attr_name="AirQuality"
-        )
         entities.append(
             AirQualitySensor(
                 device=sensor,
                 entry_id=config_entry.entry_id,
             )
         )
-        await async_migrate_to_new_unique_id(
-            hass,
-            Platform.SENSOR,
-            device=sensor,
-            attr_name="TemperatureRating",
-            old_unique_id=f"{sensor.serial}_temperature_rating",
-        )
         entities.append(
             TemperatureRatingSensor(
                 device=sensor,
                 entry_id=config_entry.entry_id,
             )
         )
-        await async_migrate_to_new_unique_id(
-            hass,
-            Platform.SENSOR,
-            device=sensor,
-            attr_name="HumidityRating",
-            old_unique_id=f"{sensor.serial}_humidity_rating",
-        )
         entities.append(
             HumidityRatingSensor(
                 device=sensor,
                 entry_id=config_entry.entry_id,
             )
         )
-        await async_migrate_to_new_unique_id(
-            hass,
-            Platform.SENSOR,
-            device=sensor,
-            attr_name="PurityRating",
-            old_unique_id=f"{sensor.serial}_purity_rating",
-        )
         entities.append(
             PurityRatingSensor(
                 device=sensor,
@@ -305,26 +282,12 @@ async def async_setup_entry(  # noqa: C901
         ):
             if device_excluded(sensor, config_entry.options):
                 continue
-            await async_migrate_to_new_unique_id(
-                hass,
-                Platform.SENSOR,
-                device=sensor,
-                attr_name="Power",
-                old_unique_id=f"{sensor.serial}_power",
-            )
             entities.append(
                 PowerSensor(
                     device=sensor,
                     entry_id=config_entry.entry_id,
                 )
             )
-            await async_migrate_to_new_unique_id(
-                hass,
-                Platform.SENSOR,
-                device=sensor,
-                attr_name="Energy",
-                old_unique_id=f"{sensor.serial}_energy",
-            )
             entities.append(
                 EnergySensor(
                     device=sensor,
@@ -367,26 +330,12 @@ async def async_setup_entry(  # noqa: C901
         if device_excluded(sensor, config_entry.options):
             continue
         if power_sensors_enabled:
-            await async_migrate_to_new_unique_id(
-                hass,
-                Platform.SENSOR,
-                device=sensor,
-                attr_name="Power",
-                old_unique_id=f"{sensor.serial}_power",
-            )
             entities.append(
                 PowerSensor(
                     device=sensor,
                     entry_id=config_entry.entry_id,
                 )
             )
-            await async_migrate_to_new_unique_id(
-                hass,
-                Platform.SENSOR,
-                device=sensor,
-                attr_name="Energy",
-                old_unique_id=f"{sensor.serial}_energy",
-            )
             entities.append(
                 EnergySensor(
                     device=sensor,
@@ -401,13 +350,6 @@ async def async_setup_entry(  # noqa: C901
                     PowerYieldSensor(device=sensor, entry_id=config_entry.entry_id)
                 )
         if diagnostic_enabled:
-            await async_migrate_to_new_unique_id(
-                hass,
-                Platform.SENSOR,
-                device=sensor,
-                attr_name="CommunicationQuality",
-                old_unique_id=f"{sensor.serial}_communication_quality",
-            )
             entities.append(
                 CommunicationQualitySensor(
                     device=sensor,
@@ -434,12 +376,6 @@ async def async_setup_entry(  # noqa: C901
                 entry_id=config_entry.entry_id,
             )
         )
-        await async_migrate_to_new_unique_id(
-            hass,
-            Platform.SENSOR,
-            device=sensor,
-            attr_name="Temperature",
-        )
         entities.append(
             TemperatureSensor(
                 device=sensor,
@@ -468,12 +404,6 @@ async def async_setup_entry(  # noqa: C901
                         entry_id=config_entry.entry_id,
                     )
                 )
-            await async_migrate_to_new_unique_id(
-                hass,
-                Platform.SENSOR,
-                device=sensor,
-                attr_name="CommunicationQuality",
-            )
             entities.append(
                 CommunicationQualitySensor(
                     device=sensor,
@@ -487,12 +417,6 @@ async def async_setup_entry(  # noqa: C901
                 continue
             if not hasattr(sensor, "communicationquality"):
                 continue
-            await async_migrate_to_new_unique_id(
-                hass,
-                Platform.SENSOR,
-                device=sensor,
-                attr_name="CommunicationQuality",
-            )
             entities.append(
                 CommunicationQualitySensor(
                     device=sensor,
@@ -587,13 +511,42 @@ async def async_setup_entry(  # noqa: C901
                 )
             )
 
-    entities.append(
-        SHCOpenWindowsSensor(
-            session=session,
-            entry_id=config_entry.entry_id,
-            shc_device=getattr(config_entry.runtime_data, "shc_device", None),
+    # getattr: same bare-runtime_data degrade as the Zigbee sensors above.
+    poll_scheduler = getattr(config_entry.runtime_data, "poll_scheduler", None)
+    if poll_scheduler is not None:
+        entities.append(
+            SHCOpenWindowsSensor(
+                session=session,
+                entry_id=config_entry.entry_id,
+                coordinator=poll_scheduler.async_get(
+                    "open_windows",
+                    lambda: session.api.get_open_windows(),
+                    SCAN_INTERVAL,
+                ),
+                shc_device=getattr(config_entry.runtime_data, "shc_device", None),
+                contacts=lambda: [
+                    contact
+                    for contact in chain(
+                        session.device_helper.shutter_contacts,
+                        session.device_helper.shutter_contacts2,
+                    )
+                    if not device_excluded(contact, config_entry.options)
+                ],
+            )
+        )
+
+    # getattr: same bare-runtime_data degrade as the Zigbee sensors above.
+    poll_stats = getattr(config_entry.runtime_data, "poll_stats", None)
+    if diagnostic_enabled and poll_stats is not None:
+        entities.extend(
+            SHCPollHealthSensor(
+                description=description,
+                entry_id=config_entry.entry_id,
+                stats=poll_stats,
+                shc_device=getattr(config_entry.runtime_data, "shc_device", None),
+            )
+            for description in POLL_HEALTH_DESCRIPTIONS
         )
-    )
 
     if entities:
         async_add_entities(entities)
@@ -639,6 +592,8 @@ class SHCSensorEntityDescription[_DeviceT: SHCDevice](SensorEntityDescription):
 
     value_fn: Callable[[_DeviceT], StateType]
     attributes_fn: Callable[[_DeviceT], dict[str, Any] | None] | None = None
+    # Device services value_fn/attributes_fn read; None wakes on every service.
+    service_ids: tuple[str, ...] | None = None
 
 
 TEMPERATURE_SENSOR = "temperature"
@@ -923,6 +878,7 @@ def _reference_moving_time_bottom_to_top_value(
 SENSOR_DESCRIPTIONS: dict[str, SHCSensorEntityDescription[Any]] = {
     TEMPERATURE_SENSOR: SHCSensorEntityDescription[_TemperatureDevice](
         key=TEMPERATURE_SENSOR,
+        service_ids=("TemperatureLevel", "AirQualityLevel"),
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
@@ -946,6 +902,7 @@ SENSOR_DESCRIPTIONS: dict[str, SHCSensorEntityDescription[Any]] = {
     ),
     HUMIDITY_SENSOR: SHCSensorEntityDescription[_HumidityDevice](
         key=HUMIDITY_SENSOR,
+        service_ids=("HumidityLevel", "AirQualityLevel"),
         device_class=SensorDeviceClass.HUMIDITY,
         native_unit_of_measurement=UnitOfRatio.PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
@@ -954,6 +911,7 @@ SENSOR_DESCRIPTIONS: dict[str, SHCSensorEntityDescription[Any]] = {
     ),
     PURITY_SENSOR: SHCSensorEntityDescription[SHCTwinguard](
         key=PURITY_SENSOR,
+        service_ids=("AirQualityLevel",),
         # Bosch "purity" is an air-purity/VOC ppm value, NOT CO2. HA Core's own
         # bosch_shc integration assigns no device_class here either; a
         # previous SensorDeviceClass.CO2 mis-classified the reading. #204
@@ -965,22 +923,26 @@ SENSOR_DESCRIPTIONS: dict[str, SHCSensorEntityDescription[Any]] = {
     ),
     AIR_QUALITY_SENSOR: SHCSensorEntityDescription[SHCTwinguard](
         key=AIR_QUALITY_SENSOR,
+        service_ids=("AirQualityLevel",),
         translation_key="air_quality",
         value_fn=_air_quality_value,
         attributes_fn=_air_quality_attributes,
     ),
     TEMPERATURE_RATING_SENSOR: SHCSensorEntityDescription[SHCTwinguard](
         key=TEMPERATURE_RATING_SENSOR,
+        service_ids=("AirQualityLevel",),
         translation_key="temperature_rating",
         value_fn=_temperature_rating_value,
     ),
     HUMIDITY_RATING_SENSOR: SHCSensorEntityDescription[SHCTwinguard](
         key=HUMIDITY_RATING_SENSOR,
+        service_ids=("AirQualityLevel",),
         translation_key="humidity_rating",
         value_fn=_humidity_rating_value,
     ),
     PURITY_RATING_SENSOR: SHCSensorEntityDescription[SHCTwinguard](
         key=PURITY_RATING_SENSOR,
+        service_ids=("AirQualityLevel",),
         translation_key="purity_rating",
         value_fn=_purity_rating_value,
     ),
@@ -990,6 +952,7 @@ SENSOR_DESCRIPTIONS: dict[str, SHCSensorEntityDescription[Any]] = {
         # #339: a pure diagnostic (Diagnostics category) ENUM sensor; state
         # values are lowercase slugs so HA can translate them.
         key=COMMUNICATION_QUALITY_SENSOR,
+        service_ids=("CommunicationQuality",),
         translation_key="communication_quality",
         device_class=SensorDeviceClass.ENUM,
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -1015,6 +978,7 @@ SENSOR_DESCRIPTIONS: dict[str, SHCSensorEntityDescription[Any]] = {
     ),
     POWER_SENSOR: SHCSensorEntityDescription[_PowerMeterDevice](
         key=POWER_SENSOR,
+        service_ids=("PowerMeter",),
         device_class=SensorDeviceClass.POWER,
         native_unit_of_measurement=UnitOfPower.WATT,
         state_class=SensorStateClass.MEASUREMENT,
@@ -1023,6 +987,7 @@ SENSOR_DESCRIPTIONS: dict[str, SHCSensorEntityDescription[Any]] = {
     ),
     ENERGY_SENSOR: SHCSensorEntityDescription[_PowerMeterDevice](
         key=ENERGY_SENSOR,
+        service_ids=("PowerMeter",),
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         state_class=SensorStateClass.TOTAL_INCREASING,
@@ -1032,6 +997,7 @@ SENSOR_DESCRIPTIONS: dict[str, SHCSensorEntityDescription[Any]] = {
     ENERGY_YIELD_SENSOR: SHCSensorEntityDescription[_PowerMeterDevice](
         # PV energy yield of a Smart Plug [+M] in Mini-PV mode (#331).
         key=ENERGY_YIELD_SENSOR,
+        service_ids=("PowerMeter",),
         translation_key="energy_yield",
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
@@ -1045,6 +1011,7 @@ SENSOR_DESCRIPTIONS: dict[str, SHCSensorEntityDescription[Any]] = {
         # sensor exposes that production as a positive number (0 W while
         # consuming), so it can be added directly to the HA Energy dashboard.
         key=POWER_YIELD_SENSOR,
+        service_ids=("PowerMeter",),
         translation_key="power_yield",
         device_class=SensorDeviceClass.POWER,
         native_unit_of_measurement=UnitOfPower.WATT,
@@ -1054,6 +1021,7 @@ SENSOR_DESCRIPTIONS: dict[str, SHCSensorEntityDescription[Any]] = {
     ),
     VALVE_TAPPET_SENSOR: SHCSensorEntityDescription[SHCThermostat](
         key=VALVE_TAPPET_SENSOR,
+        service_ids=("ValveTappet",),
         translation_key="valve_tappet",
         native_unit_of_measurement=UnitOfRatio.PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
@@ -1067,6 +1035,7 @@ SENSOR_DESCRIPTIONS: dict[str, SHCSensorEntityDescription[Any]] = {
         # First-class, alertable ENUM sensor for ValveTappetService.State
         # (#410) — distinct from ValveTappetSensor's buried attribute above.
         key=VALVE_TAPPET_STATE_SENSOR,
+        service_ids=("ValveTappet",),
         translation_key="valve_tappet_state",
         device_class=SensorDeviceClass.ENUM,
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -1097,6 +1066,7 @@ SENSOR_DESCRIPTIONS: dict[str, SHCSensorEntityDescription[Any]] = {
         # alone coerces a non-numeric value to None, so metadata never
         # flip-flops (#315).
         key=ILLUMINANCE_SENSOR,
+        service_ids=("MultiLevelSensor",),
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.ILLUMINANCE,
         native_unit_of_measurement=LIGHT_LUX,
@@ -1110,6 +1080,7 @@ SENSOR_DESCRIPTIONS: dict[str, SHCSensorEntityDescription[Any]] = {
         # duplicates the binary "Battery" sensor for most users, so it is
         # disabled by default (power users can enable it per-entity).
         key=BATTERY_LEVEL_SENSOR,
+        service_ids=("BatteryLevel",),
         translation_key="battery_level",
         device_class=SensorDeviceClass.ENUM,
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -1130,6 +1101,7 @@ SENSOR_DESCRIPTIONS: dict[str, SHCSensorEntityDescription[Any]] = {
         # which exposes the same value as its primary state — this entity is
         # diagnostic-only so it does not clutter the default device view.
         key=COMBINED_RATING_SENSOR,
+        service_ids=("AirQualityLevel",),
         translation_key="combined_rating",
         device_class=SensorDeviceClass.ENUM,
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -1145,6 +1117,7 @@ SENSOR_DESCRIPTIONS: dict[str, SHCSensorEntityDescription[Any]] = {
         # Surfaces the description field from AirQualityLevelService (CAT-3e
         # gap).
         key=AIR_QUALITY_DESCRIPTION_SENSOR,
+        service_ids=("AirQualityLevel",),
         translation_key="air_quality_description",
         entity_category=EntityCategory.DIAGNOSTIC,
         value_fn=lambda device: device.description,
@@ -1293,6 +1266,8 @@ class SHCSensor[_DeviceT: SHCDevice](SHCEntity, SensorEntity):  # type: ignore[m
     """
 
     entity_description: SHCSensorEntityDescription[_DeviceT]
+    # e.g. a PowerMeter push updating energy must not rewrite the power sensor.
+    _state_fingerprint_attrs = ("native_value", "extra_state_attributes")
 
     def __init__(
         self,
@@ -1723,35 +1698,174 @@ def _zigbee_hop_device_and_quality(hop: Any) -> tuple[Any, Any]:
     return device_id, quality
 
 
-class SHCOpenWindowsSensor(SensorEntity):  # type: ignore[misc]
+class OpenWindowsTracker:
+    """Push-driven open set, per summary category, of the door/window contacts.
+
+    Each contact's ShutterContact push moves it in or out of its category's
+    open set, keyed by device id. The polled doors-windows/openwindows
+    summary only reconciles: it replaces the open sets and names each
+    contact's category (until then, from its profile). Its entries are
+    matched to contacts by `identifier`, else by a unique name; one matching
+    no contact is dropped, as no push could ever close it again. `contacts`
+    is read again on every reconcile, so contacts paired at runtime join.
+    """
+
+    def __init__(
+        self, entry_id: str, contacts: Callable[[], Iterable[SHCShutterContact]]
+    ) -> None:
+        """Initialize the tracker from the contacts' current states."""
+        self._listener_id = f"{entry_id}_open_windows"
+        self._source = contacts
+        self._contacts: dict[str, SHCShutterContact] = {}
+        self._category: dict[str, str] = {}
+        self._open: dict[str, dict[str, str]] = {
+            category: {} for category in _OPENING_CATEGORIES
+        }
+        self._by_name: dict[str, str] = {}
+        self._listeners: list[Callable[[], None]] = []
+        self._started = False
+        self._refresh_contacts()
+
+    def open_names(self, category: str) -> list[str]:
+        """Return the names of the open contacts in `category`."""
+        return list(self._open[category].values())
+
+    @property
+    def open_count(self) -> int:
+        """Return how many doors, windows and other openings are open."""
+        return sum(len(opened) for opened in self._open.values())
+
+    @callback  # type: ignore[untyped-decorator]
+    def async_start(self, listener: Callable[[], None]) -> None:
+        """Follow the contacts' pushes, calling `listener` on every change."""
+        self._listeners.append(listener)
+        self._started = True
+        for contact in self._contacts.values():
+            self._subscribe(contact)
+
+    @callback  # type: ignore[untyped-decorator]
+    def async_stop(self) -> None:
+        """Stop following the contacts' pushes."""
+        self._listeners.clear()
+        self._started = False
+        for contact in self._contacts.values():
+            self._unsubscribe(contact)
+
+    @callback  # type: ignore[untyped-decorator]
+    def async_reconcile(self, summary: dict[str, Any]) -> None:
+        """Replace the open sets with a polled summary's."""
+        self._refresh_contacts()
+        for category in _OPENING_CATEGORIES:
+            for item in summary.get(_ALL_OPENINGS[category]) or []:
+                contact_id = self._contact_id(item)
+                if contact_id is not None:
+                    self._category[contact_id] = category
+        open_sets: dict[str, dict[str, str]] = {
+            category: {} for category in _OPENING_CATEGORIES
+        }
+        for category in _OPENING_CATEGORIES:
+            for item in summary.get(category) or []:
+                contact_id = self._contact_id(item)
+                if contact_id is None:
+                    LOGGER.debug(
+                        "Open windows summary names no known contact: %s", item
+                    )
+                    continue
+                open_sets[category][contact_id] = self._contacts[contact_id].name
+        if open_sets != self._open:
+            LOGGER.debug(
+                "Open windows summary differs from pushed state: %s", open_sets
+            )
+        self._open = open_sets
+
+    def _contact_id(self, item: dict[str, Any]) -> str | None:
+        identifier = item.get("identifier")
+        if identifier in self._contacts:
+            return cast(str, identifier)
+        return self._by_name.get(item.get("name", ""))
+
+    def _refresh_contacts(self) -> None:
+        contacts = {contact.id: contact for contact in self._source()}
+        for contact_id in self._contacts.keys() - contacts.keys():
+            if self._started:
+                self._unsubscribe(self._contacts[contact_id])
+            for opened in self._open.values():
+                opened.pop(contact_id, None)
+            del self._category[contact_id]
+        for contact_id, contact in contacts.items():
+            if contact_id in self._contacts:
+                continue
+            self._category[contact_id] = _PROFILE_CATEGORY.get(
+                getattr(contact, "device_class", None) or "", "openOthers"
+            )
+            if self._started:
+                self._subscribe(contact)
+            self._apply(contact)
+        self._contacts = contacts
+        names = Counter(contact.name for contact in contacts.values())
+        self._by_name = {
+            contact.name: contact.id
+            for contact in contacts.values()
+            if names[contact.name] == 1
+        }
+
+    def _subscribe(self, contact: SHCShutterContact) -> None:
+        service = contact.device_service("ShutterContact")
+        if service is not None:
+            service.subscribe_callback(
+                self._listener_id, partial(self._handle_push, contact)
+            )
+
+    def _unsubscribe(self, contact: SHCShutterContact) -> None:
+        service = contact.device_service("ShutterContact")
+        if service is not None:
+            service.unsubscribe_callback(self._listener_id)
+
+    def _apply(self, contact: SHCShutterContact) -> None:
+        for opened in self._open.values():
+            opened.pop(contact.id, None)
+        if getattr(contact, "state", None) is ShutterContactService.State.OPEN:
+            self._open[self._category[contact.id]][contact.id] = contact.name
+
+    def _handle_push(self, contact: SHCShutterContact) -> None:
+        self._apply(contact)
+        for listener in list(self._listeners):
+            listener()
+
+
+class SHCOpenWindowsSensor(  # type: ignore[misc]
+    CoordinatorEntity[SHCPolledResource], SensorEntity
+):
     """Whole-home summary of open doors/windows (official OpenAPI spec).
 
     Not tied to one SHC device -- scoped to the config entry like
     SHCEnableAllDiagnosticsButton -- so this does not inherit SHCEntity.
-    The underlying `doors-windows/openwindows` endpoint is a plain GET, not
-    delivered by the long-poll stream, so this is should_poll=True like the
-    other new probe-based entities added this session.
+    The count follows the contacts' long-poll pushes through an
+    OpenWindowsTracker; the `doors-windows/openwindows` summary, a plain
+    GET, is only polled through the entry's SHCPollScheduler to reconcile it.
     """
 
     _attr_has_entity_name = True
     _attr_translation_key = "open_windows_doors"
-    _attr_should_poll = True
 
     def __init__(
         self,
         session: SHCSession,
         entry_id: str,
+        coordinator: SHCPolledResource,
         shc_device: DeviceEntry | None = None,
+        contacts: Callable[[], Iterable[SHCShutterContact]] = tuple,
     ) -> None:
         """Initialize the open-windows/doors summary sensor."""
+        super().__init__(coordinator)
         self._session = session
         self._entry_id = entry_id
         self._shc_device = shc_device
+        self._tracker = OpenWindowsTracker(entry_id, contacts)
+        if coordinator.data:
+            self._tracker.async_reconcile(coordinator.data)
         prefix = shc_device.id if shc_device is not None else entry_id
         self._attr_unique_id = f"{prefix}_open_windows_doors"
-        self._open_doors: list[dict[str, Any]] = []
-        self._open_windows: list[dict[str, Any]] = []
-        self._open_others: list[dict[str, Any]] = []
 
     @property
     def device_info(self) -> DeviceInfo | None:
@@ -1760,30 +1874,162 @@ class SHCOpenWindowsSensor(SensorEntity):  # type: ignore[misc]
             return None
         return DeviceInfo(identifiers=self._shc_device.identifiers)
 
+    async def async_added_to_hass(self) -> None:
+        """Follow the contacts' pushes."""
+        await super().async_added_to_hass()
+        self._tracker.async_start(self.async_write_ha_state)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop following the contacts' pushes."""
+        self._tracker.async_stop()
+        await super().async_will_remove_from_hass()
+
+    @callback  # type: ignore[untyped-decorator]
+    def _handle_coordinator_update(self) -> None:
+        """Reconcile the pushed open sets with a fresh summary."""
+        if self.coordinator.data:
+            self._tracker.async_reconcile(self.coordinator.data)
+        super()._handle_coordinator_update()
+
     @property
     def native_value(self) -> int:
         """Return the total count of open doors, windows, and other openings."""
-        return len(self._open_doors) + len(self._open_windows) + len(self._open_others)
+        return self._tracker.open_count
 
     @property
     def extra_state_attributes(self) -> dict[str, list[str]]:
         """Return the names of each currently-open door/window/other opening."""
         return {
-            "open_doors": [d.get("name", "") for d in self._open_doors],
-            "open_windows": [w.get("name", "") for w in self._open_windows],
-            "open_others": [o.get("name", "") for o in self._open_others],
+            "open_doors": self._tracker.open_names("openDoors"),
+            "open_windows": self._tracker.open_names("openWindows"),
+            "open_others": self._tracker.open_names("openOthers"),
         }
 
-    async def async_update(self) -> None:
-        """Poll the whole-home open-doors/open-windows summary."""
-        try:
-            data = await self._session.api.get_open_windows()
-        except SHCException as err:
-            LOGGER.debug("Failed to poll open-windows summary: %s", err)
+
+@dataclass(frozen=True, kw_only=True)
+class SHCPollHealthSensorEntityDescription(SensorEntityDescription):
+    """Describes a long-poll health sensor."""
+
+    value_fn: Callable[[SHCPollStats], StateType | datetime]
+    attributes_fn: Callable[[SHCPollStats], dict[str, Any]] | None = None
+
+
+POLL_HEALTH_DESCRIPTIONS: tuple[SHCPollHealthSensorEntityDescription, ...] = (
+    SHCPollHealthSensorEntityDescription(
+        key="long_poll_round_trip",
+        translation_key="long_poll_round_trip",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=2,
+        value_fn=lambda stats: stats.last_round_trip,
+        attributes_fn=lambda stats: {
+            "average": stats.average_round_trip,
+            "max": stats.max_round_trip,
+            "histogram": stats.round_trip_histogram(),
+        },
+    ),
+    SHCPollHealthSensorEntityDescription(
+        key="long_poll_events",
+        translation_key="long_poll_events",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda stats: stats.events,
+        attributes_fn=lambda stats: {
+            "polls": stats.polls,
+            "events_per_poll": stats.events_histogram(),
+        },
+    ),
+    SHCPollHealthSensorEntityDescription(
+        # A timestamp, so the frontend shows the time since the last event.
+        key="long_poll_last_event",
+        translation_key="long_poll_last_event",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=lambda stats: stats.last_event,
+    ),
+    SHCPollHealthSensorEntityDescription(
+        key="long_poll_resubscribes",
+        translation_key="long_poll_resubscribes",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda stats: stats.resubscribes,
+    ),
+    SHCPollHealthSensorEntityDescription(
+        key="long_poll_errors",
+        translation_key="long_poll_errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda stats: stats.errors,
+        attributes_fn=lambda stats: {
+            "rpc_errors": stats.rpc_errors,
+            "connection_errors": stats.connection_errors,
+            "last_error": stats.last_error,
+        },
+    ),
+)
+
+
+class SHCPollHealthSensor(SensorEntity):  # type: ignore[misc]
+    """Long-poll health counter of one config entry, for tuning its timeout.
+
+    Entry-scoped like SHCOpenWindowsSensor and linked to the controller
+    device; the state is rewritten when a subscribe, poll or failure the
+    entry's SHCPollStats records changes this sensor's value.
+    """
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    # Change with every poll; diagnostics exports them.
+    _unrecorded_attributes = frozenset({"histogram", "events_per_poll"})
+    entity_description: SHCPollHealthSensorEntityDescription
+
+    def __init__(
+        self,
+        description: SHCPollHealthSensorEntityDescription,
+        entry_id: str,
+        stats: SHCPollStats,
+        shc_device: DeviceEntry | None = None,
+    ) -> None:
+        """Initialize the long-poll health sensor."""
+        self.entity_description = description
+        self._stats = stats
+        self._shc_device = shc_device
+        prefix = shc_device.id if shc_device is not None else entry_id
+        self._attr_unique_id = f"{prefix}_{description.key}"
+        self._written_value: StateType | datetime = None
+
+    @property
+    def device_info(self) -> DeviceInfo | None:
+        """Return the device info (links this sensor to the SHC controller device)."""
+        if self._shc_device is None:
+            return None
+        return DeviceInfo(identifiers=self._shc_device.identifiers)
+
+    async def async_added_to_hass(self) -> None:
+        """Follow the entry's poll stats."""
+        await super().async_added_to_hass()
+        self._written_value = self.native_value
+        self.async_on_remove(self._stats.async_add_listener(self._handle_stats_update))
+
+    @callback  # type: ignore[untyped-decorator]
+    def _handle_stats_update(self) -> None:
+        """Write the state, unless this sensor's value is unchanged."""
+        value = self.native_value
+        if value == self._written_value:
             return
-        self._open_doors = data.get("openDoors", [])
-        self._open_windows = data.get("openWindows", [])
-        self._open_others = data.get("openOthers", [])
+        self._written_value = value
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> StateType | datetime:
+        """Return the counter this sensor describes."""
+        return self.entity_description.value_fn(self._stats)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the counter's breakdown, if it has one."""
+        if self.entity_description.attributes_fn is None:
+            return None
+        return self.entity_description.attributes_fn(self._stats)
 
 
 class ZigbeeRoutingQualitySensor(  # type: ignore[misc]
@@ -0,0 +1,213 @@
+"""Warm-start snapshot of the SHC device and service model.
+
+SHCSessionAsync.async_init() enumerates devices, services, rooms, scenarios
+and user-defined states over HTTPS before a single entity can exist, so after
+every HA restart the whole integration is unavailable for as long as that
+takes. The raw responses of the enumeration are kept in .storage; the next
+setup builds its session from them without a round trip, forwards the
+platforms at once, and reconciles against the live controller in the
+background before the long poll starts.
+
+Only the model is replayed: the HTTPS client, certificates and long poll are
+the live session's own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections.abc import Awaitable, Callable, Iterator
+from typing import Any
+
+from boschshcpy import SHCSessionAsync
+from boschshcpy.exceptions import SHCException
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+STORAGE_VERSION = 1
+# Saving is deferred so a burst of reconciles/reloads costs one disk write.
+SAVE_DELAY = 10
+
+# session.api getters async_init() enumerates through. The water-alarm domain
+# is optional: a controller without one has no entry in the snapshot.
+_REQUIRED_CALLS = (
+    "get_public_information",
+    "get_information",
+    "get_services",
+    "get_devices",
+    "get_rooms",
+    "get_scenarios",
+    "get_automation_rules",
+    "get_messages",
+    "get_userdefinedstates",
+    "get_domain_intrusion_detection",
+)
+_WATER_ALARM_CALL = "get_water_alarm_system_state"
+
+
+def _is_complete(calls: Any) -> bool:
+    """Return True if `calls` holds a usable response for every required getter."""
+    return isinstance(calls, dict) and all(
+        calls.get(name) is not None for name in _REQUIRED_CALLS
+    )
+
+
+class SHCSnapshotStore:
+    """Persists one controller's enumeration responses under .storage."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, host: str) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.snapshot"
+        )
+        self._host = host
+
+    async def async_load(self) -> dict[str, Any] | None:
+        """Return the stored responses; None if absent or for another host."""
+        data = await self._store.async_load()
+        if not data or data.get("host") != self._host:
+            return None
+        calls = data.get("calls")
+        return calls if _is_complete(calls) else None
+
+    @callback  # type: ignore[untyped-decorator]
+    def async_save_later(self, calls: dict[str, Any]) -> None:
+        """Schedule `calls` to be saved, unless a required response is missing."""
+        if not _is_complete(calls):
+            return
+        payload = {"host": self._host, "calls": calls}
+        self._store.async_delay_save(lambda: payload, SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        """Drop the snapshot, so the next setup enumerates live."""
+        await self._store.async_remove()
+
+
+@contextlib.contextmanager
+def _api_calls(
+    session: SHCSessionAsync, calls: dict[str, Callable[[], Awaitable[Any]]]
+) -> Iterator[None]:
+    """Temporarily route the session's api getters in `calls` elsewhere."""
+    api = session.api
+    originals = {name: getattr(api, name) for name in calls}
+    for name, call in calls.items():
+        setattr(api, name, call)
+    try:
+        yield
+    finally:
+        for name, original in originals.items():
+            setattr(api, name, original)
+
+
+async def async_init_recording(session: SHCSessionAsync) -> dict[str, Any]:
+    """Run session.async_init() live; return its responses by getter name."""
+    recorded: dict[str, Any] = {}
+
+    def recorder(name: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        async def call() -> Any:
+            recorded[name] = result = await fetch()
+            return result
+
+        return call
+
+    api = session.api
+    with _api_calls(
+        session,
+        {
+            name: recorder(name, getattr(api, name))
+            for name in (*_REQUIRED_CALLS, _WATER_ALARM_CALL)
+        },
+    ):
+        await session.async_init()
+    return recorded
+
+
+async def async_init_from_snapshot(
+    session: SHCSessionAsync, calls: dict[str, Any]
+) -> None:
+    """Run session.async_init() against stored responses instead of the SHC."""
+
+    def replay(name: str) -> Any:
+        async def call() -> Any:
+            if name not in calls:
+                # Same as a live controller without this (optional) domain.
+                raise SHCException(f"{name} is not in the snapshot")
+            return calls[name]
+
+        return call
+
+    with _api_calls(
+        session,
+        {name: replay(name) for name in (*_REQUIRED_CALLS, _WATER_ALARM_CALL)},
+    ):
+        await session.async_init()
+
+
+async def async_fetch(session: SHCSessionAsync) -> dict[str, Any]:
+    """Fetch the enumeration responses live, concurrently."""
+    api = session.api
+    responses = await asyncio.gather(
+        *(getattr(api, name)() for name in _REQUIRED_CALLS)
+    )
+    calls = dict(zip(_REQUIRED_CALLS, responses, strict=True))
+    with contextlib.suppress(SHCException):
+        calls[_WATER_ALARM_CALL] = await getattr(api, _WATER_ALARM_CALL)()
+    return calls
+
+
+def _model_keys(calls: dict[str, Any]) -> tuple[Any, ...]:
+    """Return what entities are built from: which objects exist, names, rooms."""
+    return (
+        {
+            (raw["id"], raw.get("name"), raw.get("roomId"))
+            for raw in calls["get_devices"]
+        },
+        {(raw["deviceId"], raw["id"]) for raw in calls["get_services"]},
+        {(raw["id"], raw.get("name")) for raw in calls["get_rooms"]},
+        {(raw["id"], raw.get("name")) for raw in calls["get_scenarios"]},
+        {raw["id"] for raw in calls["get_automation_rules"]},
+        {raw["id"] for raw in calls["get_userdefinedstates"]},
+        _WATER_ALARM_CALL in calls,
+    )
+
+
+async def async_reconcile(
+    session: SHCSessionAsync, snapshot: dict[str, Any], live: dict[str, Any]
+) -> bool:
+    """Bring a session built from `snapshot` up to date with `live`.
+
+    States are pushed through the same model methods the long poll uses, so
+    subscribed entities update as they would for a push. Returns False, with
+    nothing applied, when the model itself changed (a device, service, room,
+    scenario, rule or user-defined state was added, removed or renamed, or a
+    device moved to another room): the entities no longer match and the
+    session has to be rebuilt.
+    """
+    if _model_keys(snapshot) != _model_keys(live):
+        return False
+    for raw in live["get_devices"]:
+        with contextlib.suppress(KeyError):
+            session.device(raw["id"]).update_raw_information(raw)
+    for raw in live["get_services"]:
+        with contextlib.suppress(KeyError):
+            session.device(raw["deviceId"]).process_long_polling_poll_result(raw)
+    for raw in live["get_automation_rules"]:
+        session.automation_rule(raw["id"]).update_raw_rule(raw)
+    for raw in live["get_userdefinedstates"]:
+        session.userdefinedstate(raw["id"]).update_raw_information(raw)
+    intrusion_system = session.intrusion_system
+    if intrusion_system is not None:
+        raw_ids = live["get_domain_intrusion_detection"]
+        for state_type in intrusion_system.DOMAIN_STATES:
+            if isinstance(raw_ids.get(state_type), dict):
+                intrusion_system.process_long_polling_poll_result(
+                    {**raw_ids[state_type], "@type": state_type}
+                )
+    if session.water_alarm_system is not None:
+        session.water_alarm_system.process_long_polling_poll_result(
+            {**live[_WATER_ALARM_CALL], "@type": "waterAlarmSystemState"}
+        )
+    await session.information.async_refresh()
+    return True
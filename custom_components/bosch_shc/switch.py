@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from datetime import timedelta
 from typing import Any
@@ -40,6 +41,7 @@ from homeassistant.helpers.device_registry import DeviceEntry, DeviceInfo
 from homeassistant.helpers.device_registry import async_get as get_dev_reg
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
@@ -47,9 +49,11 @@ from .const import (
     OPT_SUPPRESS_CAMERA_SWITCHES,
     OPT_TEMPERATURE_DROP_ENTITIES,
 )
+from .coordinator import SHCPolledResource, merge_temperature_drop_config
 from .entity import (
     SHCEntity,
-    async_migrate_to_new_unique_id,
+    SHCPolledEntity,
+    async_on_platform_unload,
     async_remove_stale_entity,
     device_excluded,
     light_switch_as_light,
@@ -393,9 +397,6 @@ async def async_setup_entry(  # noqa: C901
     for switch in session.device_helper.smart_plugs:
         if device_excluded(switch, config_entry.options):
             continue
-        await async_migrate_to_new_unique_id(
-            hass=hass, platform=Platform.SWITCH, device=switch
-        )
         entities.append(
             SHCSwitch(
                 device=switch,
@@ -403,9 +404,6 @@ async def async_setup_entry(  # noqa: C901
                 description=SWITCH_TYPES["smartplug"],
             )
         )
-        await async_migrate_to_new_unique_id(
-            hass=hass, platform=Platform.SWITCH, device=switch, attr_name="Routing"
-        )
         entities.append(
             SHCSwitch(
                 device=switch,
@@ -449,18 +447,18 @@ async def async_setup_entry(  # noqa: C901
         # the device is not exposed twice.  (Child-lock / swap config switches
         # below stay regardless, they are independent CONFIG entities.)
         if light_switch_as_light(switch, config_entry.options):
-            # An options change reloads the entry (OptionsFlowWithReload), so
+            # An options change re-runs this platform's setup (options.py), so
             # if a switch entity was previously created for this device
             # (before the option was turned on), remove the now-stale
             # registry entry — same unique_id as RelayLight's default, since
             # neither passes attr_name.
             await async_remove_stale_entity(
-                hass, Platform.SWITCH, f"{switch.root_device_id}_{switch.id}"
+                hass,
+                config_entry,
+                Platform.SWITCH,
+                f"{switch.root_device_id}_{switch.id}",
             )
             continue
-        await async_migrate_to_new_unique_id(
-            hass=hass, platform=Platform.SWITCH, device=switch
-        )
         entities.append(
             SHCSwitch(
                 device=switch,
@@ -472,9 +470,6 @@ async def async_setup_entry(  # noqa: C901
     for switch in session.device_helper.smart_plugs_compact:  # type: ignore[assignment]
         if device_excluded(switch, config_entry.options):
             continue
-        await async_migrate_to_new_unique_id(
-            hass=hass, platform=Platform.SWITCH, device=switch
-        )
         entities.append(
             SHCSwitch(
                 device=switch,
@@ -510,9 +505,6 @@ async def async_setup_entry(  # noqa: C901
     for switch in session.device_helper.micromodule_relays:  # type: ignore[assignment]
         if device_excluded(switch, config_entry.options):
             continue
-        await async_migrate_to_new_unique_id(
-            hass=hass, platform=Platform.SWITCH, device=switch
-        )
         entities.append(
             SHCSwitch(
                 device=switch,
@@ -591,11 +583,6 @@ async def async_setup_entry(  # noqa: C901
     for switch in session.device_helper.camera_eyes:  # type: ignore[assignment]
         if suppress_cameras or device_excluded(switch, config_entry.options):
             continue
-        await async_migrate_to_new_unique_id(
-            hass=hass,
-            platform=Platform.SWITCH,
-            device=switch,
-        )
         entities.append(
             SHCSwitch(
                 device=switch,
@@ -603,9 +590,6 @@ async def async_setup_entry(  # noqa: C901
                 description=SWITCH_TYPES["cameraeyes"],
             )
         )
-        await async_migrate_to_new_unique_id(
-            hass=hass, platform=Platform.SWITCH, device=switch, attr_name="Light"
-        )
         entities.append(
             SHCSwitch(
                 device=switch,
@@ -614,9 +598,6 @@ async def async_setup_entry(  # noqa: C901
                 attr_name="Light",
             )
         )
-        await async_migrate_to_new_unique_id(
-            hass=hass, platform=Platform.SWITCH, device=switch, attr_name="Notification"
-        )
         entities.append(
             SHCSwitch(
                 device=switch,
@@ -629,9 +610,6 @@ async def async_setup_entry(  # noqa: C901
     for switch in session.device_helper.camera_360:  # type: ignore[assignment]
         if suppress_cameras or device_excluded(switch, config_entry.options):
             continue
-        await async_migrate_to_new_unique_id(
-            hass=hass, platform=Platform.SWITCH, device=switch
-        )
         entities.append(
             SHCSwitch(
                 device=switch,
@@ -639,9 +617,6 @@ async def async_setup_entry(  # noqa: C901
                 description=SWITCH_TYPES["camera360"],
             )
         )
-        await async_migrate_to_new_unique_id(
-            hass=hass, platform=Platform.SWITCH, device=switch, attr_name="Notification"
-        )
         entities.append(
             SHCSwitch(
                 device=switch,
@@ -654,11 +629,6 @@ async def async_setup_entry(  # noqa: C901
     for switch in session.device_helper.camera_outdoor_gen2:  # type: ignore[assignment]
         if suppress_cameras or device_excluded(switch, config_entry.options):
             continue
-        await async_migrate_to_new_unique_id(
-            hass=hass,
-            platform=Platform.SWITCH,
-            device=switch,
-        )
         entities.append(
             SHCSwitch(
                 device=switch,
@@ -666,26 +636,6 @@ async def async_setup_entry(  # noqa: C901
                 description=SWITCH_TYPES["cameraoutdoorgen2"],
             )
         )
-        # #289-safe migration: in 0.4.106-0.4.111 both Gen2 camera lights shared
-        # attr_name="Light" (uid _light); the Frontlight/AmbientLight split left
-        # the old migration pointing at a phantom _light and gave AmbientLight no
-        # migration at all.  Map the old id (both historical formats) to the real
-        # Frontlight uid; async_migrate skips if the target already exists, so
-        # already-upgraded users are unaffected.
-        await async_migrate_to_new_unique_id(
-            hass=hass,
-            platform=Platform.SWITCH,
-            device=switch,
-            attr_name="Frontlight",
-            old_unique_id=f"{switch.serial}_light",
-        )
-        await async_migrate_to_new_unique_id(
-            hass=hass,
-            platform=Platform.SWITCH,
-            device=switch,
-            attr_name="Frontlight",
-            old_unique_id=f"{switch.root_device_id}_{switch.id}_light",
-        )
         entities.append(
             SHCSwitch(
                 device=switch,
@@ -694,23 +644,6 @@ async def async_setup_entry(  # noqa: C901
                 attr_name="Frontlight",
             )
         )
-        # AmbientLight had no prior migration; the old single _light entity is
-        # claimed by Frontlight above, so these no-op for upgraders but cover a
-        # registry where only AmbientLight's id survived.
-        await async_migrate_to_new_unique_id(
-            hass=hass,
-            platform=Platform.SWITCH,
-            device=switch,
-            attr_name="AmbientLight",
-            old_unique_id=f"{switch.serial}_light",
-        )
-        await async_migrate_to_new_unique_id(
-            hass=hass,
-            platform=Platform.SWITCH,
-            device=switch,
-            attr_name="AmbientLight",
-            old_unique_id=f"{switch.root_device_id}_{switch.id}_light",
-        )
         entities.append(
             SHCSwitch(
                 device=switch,
@@ -724,11 +657,6 @@ async def async_setup_entry(  # noqa: C901
     if presence_simulation_system and not device_excluded(
         presence_simulation_system, config_entry.options
     ):
-        await async_migrate_to_new_unique_id(
-            hass=hass,
-            platform=Platform.SWITCH,
-            device=presence_simulation_system,
-        )
         entities.append(
             SHCSwitch(
                 device=presence_simulation_system,
@@ -740,9 +668,6 @@ async def async_setup_entry(  # noqa: C901
     for switch in session.device_helper.shutter_contacts2:  # type: ignore[assignment]
         if device_excluded(switch, config_entry.options):
             continue
-        await async_migrate_to_new_unique_id(
-            hass=hass, platform=Platform.SWITCH, device=switch
-        )
         entities.append(
             SHCSwitch(
                 device=switch,
@@ -827,12 +752,6 @@ async def async_setup_entry(  # noqa: C901
     for switch in session.device_helper.motion_detectors2:  # type: ignore[assignment]
         if device_excluded(switch, config_entry.options):
             continue
-        await async_migrate_to_new_unique_id(
-            hass=hass,
-            platform=Platform.SWITCH,
-            device=switch,
-            attr_name="PetImmunity",
-        )
         entities.append(
             SHCSwitch(
                 device=switch,
@@ -936,9 +855,15 @@ async def async_setup_entry(  # noqa: C901
                 )
             )
 
+    # getattr: bare SimpleNamespace runtime_data (tests) has no scheduler;
+    # the polled entities below are then skipped instead of crashing setup.
+    poll_scheduler = getattr(config_entry.runtime_data, "poll_scheduler", None)
+
     # Temperature-drop service (anti-frost/window-open, APK-traced).
-    # Opt-in: should_poll entity was flagged as an unnecessary load cost.
-    if config_entry.options.get(OPT_TEMPERATURE_DROP_ENTITIES, False):
+    # Opt-in: polled entity was flagged as an unnecessary load cost.
+    if poll_scheduler is not None and config_entry.options.get(
+        OPT_TEMPERATURE_DROP_ENTITIES, False
+    ):
         for climate in getattr(session.device_helper, "climate_controls", []):
             if device_excluded(climate, config_entry.options):
                 continue
@@ -946,24 +871,42 @@ async def async_setup_entry(  # noqa: C901
             if room_id is None:
                 continue
             room = session.room(room_id)
+            # Shared with the number platform: only the first one GETs the room.
             try:
-                tds = await room.async_temperature_drop_service()
+                coordinator = await poll_scheduler.async_get_probed(
+                    f"temperature_drop_{room_id}",
+                    room.async_temperature_drop_service,
+                    SCAN_INTERVAL,
+                )
             except SHCException:
                 continue
-            if tds is None:
+            if coordinator is None:
                 continue
             entities.append(
                 TemperatureDropEnabledSwitch(
-                    device=climate, room=room, entry_id=config_entry.entry_id
+                    device=climate,
+                    room=room,
+                    entry_id=config_entry.entry_id,
+                    coordinator=coordinator,
                 )
             )
 
-    if config_entry.options.get(OPT_AUTOMATION_RULES_AS_ENTITIES, False):
+    if poll_scheduler is not None and config_entry.options.get(
+        OPT_AUTOMATION_RULES_AS_ENTITIES, False
+    ):
         shc_device_for_rules: DeviceEntry = config_entry.runtime_data.shc_device
+        # One system/automation GET per cycle for every rule switch.
+        rules_coordinator = poll_scheduler.async_get(
+            "automation_rules",
+            _automation_rules_fetch(session),
+            SCAN_INTERVAL,
+            data=_automation_rules_state(session),
+        )
         entities.extend(
             SHCAutomationRuleSwitch(
                 rule=rule,
                 entry_id=config_entry.entry_id,
+                coordinator=rules_coordinator,
                 shc_device=shc_device_for_rules,
             )
             for rule in session.automation_rules
@@ -1001,7 +944,7 @@ async def async_setup_entry(  # noqa: C901
         with contextlib.suppress(ValueError):
             session._subscribers.remove(_uds_subscriber)  # noqa: SLF001
 
-    config_entry.async_on_unload(_unsubscribe_uds)
+    async_on_platform_unload(config_entry, Platform.SWITCH, _unsubscribe_uds)
 
 
 class SHCSwitch(SHCEntity, SwitchEntity):  # type: ignore[misc]
@@ -1292,31 +1235,57 @@ class SHCUserDefinedStateSwitch(SwitchEntity):  # type: ignore[misc]
         )
 
 
-class SHCAutomationRuleSwitch(SwitchEntity):  # type: ignore[misc]
+def _automation_rules_state(session: SHCSession) -> dict[str, bool]:
+    """Return every automation rule's enabled flag, keyed by rule id."""
+    return {rule.id: bool(rule.enabled) for rule in session.automation_rules}
+
+
+def _automation_rules_fetch(
+    session: SHCSession,
+) -> Callable[[], Awaitable[dict[str, bool]]]:
+    """Return the poll fetch for all automation rules (one list GET).
+
+    async_refresh_automation_rules updates the existing rule objects in
+    place, so each switch keeps reading its own rule afterwards.
+    """
+
+    async def _fetch() -> dict[str, bool]:
+        await session.async_refresh_automation_rules()
+        return _automation_rules_state(session)
+
+    return _fetch
+
+
+class SHCAutomationRuleSwitch(  # type: ignore[misc]
+    CoordinatorEntity[SHCPolledResource], SwitchEntity
+):
     """Enable/disable a single Bosch automation rule (system/automation).
 
     Not an SHC device -- Bosch's own local rule engine, entirely separate
     from Home Assistant's automations (#OPT_AUTOMATION_RULES_AS_ENTITIES).
-    Rule state isn't part of the long-poll device-service push model, so it
-    must be explicitly polled (default HA polling interval).
+    Rule state isn't part of the long-poll device-service push model, so all
+    rules are polled together through one SHCPollScheduler resource; a
+    switch only writes state when its own rule's enabled flag changed.
     """
 
     _attr_has_entity_name = True
     _attr_translation_key = "automation_rule"
     _attr_entity_category = EntityCategory.CONFIG
-    _attr_should_poll = True
 
     def __init__(
         self,
         rule: Any,
         entry_id: str,
+        coordinator: SHCPolledResource,
         shc_device: DeviceEntry | None = None,
     ) -> None:
         """Initialize an automation rule switch."""
+        super().__init__(coordinator)
         self._rule = rule
         self._shc_device = shc_device
         self._attr_unique_id = f"{entry_id}_automation_rule_{rule.id}"
         self._attr_name = rule.name
+        self._written_enabled: bool | None = bool(rule.enabled)
 
     @property
     def device_info(self) -> DeviceInfo | None:
@@ -1335,12 +1304,14 @@ class SHCAutomationRuleSwitch(SwitchEntity):  # type: ignore[misc]
         """Return True if this automation rule is enabled."""
         return bool(self._rule.enabled)
 
-    async def async_update(self) -> None:
-        """Poll this rule's current enabled state."""
-        try:
-            await self._rule.async_refresh()
-        except SHCException as err:
-            LOGGER.debug("Failed to poll automation rule %s: %s", self._rule.name, err)
+    @callback  # type: ignore[untyped-decorator]
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if this rule's enabled flag changed."""
+        enabled = bool(self._rule.enabled)
+        if enabled == self._written_enabled:
+            return
+        self._written_enabled = enabled
+        super()._handle_coordinator_update()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Enable this automation rule."""
@@ -1352,6 +1323,8 @@ class SHCAutomationRuleSwitch(SwitchEntity):  # type: ignore[misc]
                 translation_domain=DOMAIN,
                 translation_key="automation_rule_update_failed",
             ) from err
+        self._written_enabled = bool(self._rule.enabled)
+        self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Disable this automation rule."""
@@ -1363,29 +1336,36 @@ class SHCAutomationRuleSwitch(SwitchEntity):  # type: ignore[misc]
                 translation_domain=DOMAIN,
                 translation_key="automation_rule_update_failed",
             ) from err
+        self._written_enabled = bool(self._rule.enabled)
+        self.async_write_ha_state()
 
 
-class TemperatureDropEnabledSwitch(SHCEntity, SwitchEntity):  # type: ignore[misc]
+class TemperatureDropEnabledSwitch(SHCPolledEntity, SwitchEntity):  # type: ignore[misc]
     """Enable/disable a room's temperature-drop (anti-frost/window-open) service.
 
     Not in the official OpenAPI spec; APK ground-truth
     (RestRequests.getTemperatureDropService/putTemperatureDropService), live-
     confirmed across 12 real rooms. Reads/writes go through the room (not the
-    climate device) -- a separate resource, so it must be explicitly polled.
+    climate device) -- a separate resource, polled through the entry's
+    SHCPollScheduler and shared with TemperatureDropValueNumber.
     """
 
     _attr_translation_key = "temperature_drop_enabled"
     _attr_entity_category = EntityCategory.CONFIG
-    _attr_should_poll = True
 
-    def __init__(self, device: SHCDevice, room: Any, entry_id: str) -> None:
+    def __init__(
+        self,
+        device: SHCDevice,
+        room: Any,
+        entry_id: str,
+        coordinator: SHCPolledResource,
+    ) -> None:
         """Initialize the temperature-drop enabled switch."""
-        super().__init__(device, entry_id)
+        super().__init__(device, entry_id, coordinator)
         self._room = room
         self._attr_unique_id = (
             f"{device.root_device_id}_{device.id}_temperature_drop_enabled"
         )
-        self._enabled: bool | None = None
 
     @property
     def device_name(self) -> str:
@@ -1395,20 +1375,8 @@ class TemperatureDropEnabledSwitch(SHCEntity, SwitchEntity):  # type: ignore[mis
     @property
     def is_on(self) -> bool:
         """Return True if the temperature-drop service is enabled."""
-        return bool(self._enabled)
-
-    async def async_update(self) -> None:
-        """Poll this room's temperature-drop service configuration."""
-        try:
-            data = await self._room.async_temperature_drop_service()
-        except SHCException as err:
-            LOGGER.debug(
-                "Failed to poll temperature-drop service for %s: %s",
-                self.device_name,
-                err,
-            )
-            return
-        self._enabled = bool((data or {}).get("configuration", {}).get("enabled"))
+        data = self.coordinator.data or {}
+        return bool(data.get("configuration", {}).get("enabled"))
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Enable the temperature-drop service."""
@@ -1420,7 +1388,9 @@ class TemperatureDropEnabledSwitch(SHCEntity, SwitchEntity):  # type: ignore[mis
                 translation_domain=DOMAIN,
                 translation_key="switch_action_failed",
             ) from err
-        self._enabled = True
+        self.coordinator.async_set_updated_data(
+            merge_temperature_drop_config(self.coordinator.data, "enabled", True)
+        )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Disable the temperature-drop service."""
@@ -1432,4 +1402,6 @@ class TemperatureDropEnabledSwitch(SHCEntity, SwitchEntity):  # type: ignore[mis
                 translation_domain=DOMAIN,
                 translation_key="switch_action_failed",
             ) from err
-        self._enabled = False
+        self.coordinator.async_set_updated_data(
+            merge_temperature_drop_config(self.coordinator.data, "enabled", False)
+        )
@@ -13,6 +13,7 @@ after pressing Install, staying fully functional throughout.
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
 from datetime import timedelta
 from typing import Any
 
@@ -26,25 +27,28 @@ from homeassistant.components.update import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
     ISSUE_UPDATE_BATTERY_LOW,
     ISSUE_UPDATE_CALIBRATION_REQUIRED,
-    LOGGER,
 )
-from .entity import SHCEntity, async_remove_stale_entity, device_excluded
+from .coordinator import SHCPolledResource
+from .entity import SHCPolledEntity, async_remove_stale_entity, device_excluded
 
 PARALLEL_UPDATES = 1
 
 # Firmware updates change rarely; poll a few times a day rather than on the
-# default fast entity interval.
+# default fast entity interval (the idle SHCPollScheduler interval here).
 SCAN_INTERVAL = timedelta(hours=6)
+# While an install runs, re-probe this often (stretching while it's stuck).
+_FAST_POLL_INTERVAL = timedelta(seconds=5)
 
 # swUpdateState values that mean an install is currently running (controller,
 # from the public /information endpoint's own, differently-shaped enum).
@@ -114,12 +118,33 @@ async def async_setup_entry(
 ) -> None:
     """Set up the SHC controller + per-device update entities."""
     session: SHCSession = config_entry.runtime_data.session
+    # getattr: bare SimpleNamespace runtime_data (tests) has no scheduler;
+    # the per-device entities are then skipped instead of crashing setup.
+    poll_scheduler = getattr(config_entry.runtime_data, "poll_scheduler", None)
     entities: list[UpdateEntity] = []
 
     information = session.information
-    if information is not None and information.unique_id is not None:
+    if (
+        poll_scheduler is not None
+        and information is not None
+        and information.unique_id is not None
+    ):
+        # Seeded from async_init's fresh /information: not unset until the
+        # first poll after a restart (#373), and no extra startup GET.
         entities.append(
-            ControllerUpdate(information, config_entry.title, config_entry.entry_id)
+            ControllerUpdate(
+                information,
+                config_entry.title,
+                config_entry.entry_id,
+                poll_scheduler.async_get(
+                    "controller_update",
+                    _controller_update_fetch(information),
+                    SCAN_INTERVAL,
+                    data=_controller_update_state(information),
+                    fast_interval=_FAST_POLL_INTERVAL,
+                    fast_poll_while=_controller_in_progress,
+                ),
+            )
         )
 
     device: SHCDevice
@@ -130,21 +155,77 @@ async def async_setup_entry(
         ):
             # Options-reload may exclude a device or drop its firmware-
             # capable model; remove its stale entity (#356-class pattern).
-            await async_remove_stale_entity(hass, Platform.UPDATE, unique_id)
+            await async_remove_stale_entity(
+                hass, config_entry, Platform.UPDATE, unique_id
+            )
             continue
-        entities.append(DeviceUpdate(device, config_entry.entry_id))
+        if poll_scheduler is None:
+            continue
+        entities.append(
+            DeviceUpdate(
+                device,
+                config_entry.entry_id,
+                poll_scheduler.async_get(
+                    f"firmware_{device.id}",
+                    device.async_firmware_update_state,
+                    SCAN_INTERVAL,
+                    fast_interval=_FAST_POLL_INTERVAL,
+                    fast_poll_while=_DEVICE_IN_PROGRESS_STATES.__contains__,
+                ),
+            )
+        )
+
+    # No update_before_add: the scheduler holds each device's first probe
+    # until the long poll is up, then staggers it (#373).
+    if entities:
+        async_add_entities(entities)
+
+
+def _controller_update_state(information: Any) -> tuple[str | None, ...]:
+    """Return the controller's software-update fields, for change detection."""
+    return (
+        getattr(information, "update_state", None),
+        information.version,
+        getattr(information, "available_version", None),
+    )
+
+
+def _controller_in_progress(state: tuple[str | None, ...]) -> bool:
+    """Return True if a `_controller_update_state` snapshot is mid-install."""
+    return state[0] in _IN_PROGRESS_STATES
+
+
+def _controller_update_fetch(
+    information: Any,
+) -> Callable[[], Awaitable[tuple[str | None, ...]]]:
+    """Return the poll fetch for the controller's /information block (#186).
+
+    getattr-guarded so an older boschshcpy without async_refresh degrades to
+    a static (boot-time) value instead of crashing.
+    """
+
+    async def _fetch() -> tuple[str | None, ...]:
+        refresh = getattr(information, "async_refresh", None)
+        if refresh is not None:
+            await refresh()
+        return _controller_update_state(information)
+
+    return _fetch
 
-    # Without this, HA schedules the first poll a full SCAN_INTERVAL from now
-    # (#373) -- entities would sit unset for up to 6h after every restart.
-    async_add_entities(entities, update_before_add=True)
 
+def _poll_interval_attributes(coordinator: SHCPolledResource) -> dict[str, Any]:
+    """Return the resource's current effective poll interval (seconds)."""
+    interval = coordinator.update_interval or coordinator.idle_interval
+    return {"poll_interval": int(interval.total_seconds())}
 
-class ControllerUpdate(UpdateEntity):  # type: ignore[misc]
+
+class ControllerUpdate(CoordinatorEntity[SHCPolledResource], UpdateEntity):  # type: ignore[misc]
     """Firmware-update entity for the SHC controller.
 
     INSTALL triggers boschshcpy's start_software_update (POST
     rootdevices/startSoftwareUpdate) — no version selection, no backup: the
-    SHC's own endpoint takes no parameters.
+    SHC's own endpoint takes no parameters. /information is polled through
+    the entry's SHCPollScheduler, every few seconds while an install runs.
     """
 
     _attr_has_entity_name = True
@@ -153,10 +234,16 @@ class ControllerUpdate(UpdateEntity):  # type: ignore[misc]
     _attr_supported_features = (
         UpdateEntityFeature.INSTALL | UpdateEntityFeature.PROGRESS
     )
-    _attr_should_poll = True
 
-    def __init__(self, information: Any, title: str, entry_id: str) -> None:
+    def __init__(
+        self,
+        information: Any,
+        title: str,
+        entry_id: str,
+        coordinator: SHCPolledResource,
+    ) -> None:
         """Initialize the controller update entity."""
+        super().__init__(coordinator)
         self._information = information
         self._entry_id = entry_id
         self._title = title
@@ -189,19 +276,10 @@ class ControllerUpdate(UpdateEntity):  # type: ignore[misc]
         state = getattr(self._information, "update_state", None)
         return state in _IN_PROGRESS_STATES
 
-    async def async_update(self) -> None:
-        """Refresh the controller's software-update state (#186).
-
-        Re-fetches /information so an update that appears after startup shows up.
-        getattr-guarded so an older boschshcpy without async_refresh degrades to
-        a static (boot-time) value instead of crashing.
-        """
-        refresh = getattr(self._information, "async_refresh", None)
-        if refresh is not None:
-            try:
-                await refresh()
-            except Exception as err:  # noqa: BLE001 -- never raise from a poll
-                LOGGER.debug("Failed to poll controller update state: %s", err)
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the effective poll interval."""
+        return _poll_interval_attributes(self.coordinator)
 
     async def async_install(
         self, version: str | None, backup: bool, **kwargs: Any
@@ -240,17 +318,18 @@ class ControllerUpdate(UpdateEntity):  # type: ignore[misc]
                 translation_placeholders={"name": self._title, "error": str(err)},
             ) from err
         finally:
-            await self.async_update()
+            # Re-poll now: an accepted start switches to fast polling.
+            await self.coordinator.async_refresh()
 
 
-class DeviceUpdate(SHCEntity, UpdateEntity):  # type: ignore[misc]
+class DeviceUpdate(SHCPolledEntity, UpdateEntity):  # type: ignore[misc]
     """Per-device firmware-update entity (APK-traced probe + install).
 
     The firmware lifecycle state (devicemanagement/firmware/{id}) is a
     separate endpoint from this device's normal device-service model, so it
     does not arrive via the long-poll callbacks (SHCEntity) like every other
-    entity in this integration — it must be explicitly polled, same as
-    ControllerUpdate. Created only for FIRMWARE_CAPABLE_MODELS.
+    entity in this integration -- it is polled through the entry's
+    SHCPollScheduler. Created only for FIRMWARE_CAPABLE_MODELS.
     """
 
     _attr_translation_key = "device_firmware"
@@ -258,27 +337,25 @@ class DeviceUpdate(SHCEntity, UpdateEntity):  # type: ignore[misc]
     _attr_supported_features = (
         UpdateEntityFeature.INSTALL | UpdateEntityFeature.PROGRESS
     )
-    _attr_should_poll = True
 
-    def __init__(self, device: SHCDevice, entry_id: str) -> None:
+    def __init__(
+        self, device: SHCDevice, entry_id: str, coordinator: SHCPolledResource
+    ) -> None:
         """Initialize the per-device firmware update entity."""
-        super().__init__(device, entry_id)
+        super().__init__(device, entry_id, coordinator)
         self._attr_unique_id = f"{device.root_device_id}_{device.id}_software_update"
-        self._firmware_state: str | None = None
+        self._firmware_state: str | None = coordinator.data
 
-    async def async_update(self) -> None:
-        """Poll this device's firmware lifecycle state (#186 follow-up).
+    @callback  # type: ignore[untyped-decorator]
+    def _handle_coordinator_update(self) -> None:
+        """Take over the probed firmware state (#186 follow-up).
 
-        Errors are logged, not raised — a transient probe failure shouldn't
-        make the entity unavailable; it just keeps the last-known state.
+        A failed probe leaves the resource at its last-known value, so a
+        transient error never makes the entity unavailable.
         """
-        try:
-            self._firmware_state = await self._device.async_firmware_update_state()
-        except Exception as err:  # noqa: BLE001 -- never raise from a poll
-            LOGGER.debug(
-                "Failed to poll firmware state for %s: %s", self.device_name, err
-            )
+        self._firmware_state = self.coordinator.data
         self._sync_repair_issues()
+        super()._handle_coordinator_update()
 
     def _sync_repair_issues(self) -> None:
         """Create/delete the two SHC-precondition repair issues (#377 follow-up).
@@ -360,6 +437,11 @@ class DeviceUpdate(SHCEntity, UpdateEntity):  # type: ignore[misc]
         """Return True if a firmware update is currently in progress."""
         return self._firmware_state in _DEVICE_IN_PROGRESS_STATES
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the effective poll interval."""
+        return _poll_interval_attributes(self.coordinator)
+
     @property
     def release_summary(self) -> str | None:
         """Return the raw device-reported firmware lifecycle state.
@@ -412,4 +494,4 @@ class DeviceUpdate(SHCEntity, UpdateEntity):  # type: ignore[misc]
         finally:
             # Re-poll now so a second click before the next 6h poll doesn't
             # re-activate a since-moved-on state and 409 again (#373).
-            await self.async_update()
+            await self.coordinator.async_refresh()
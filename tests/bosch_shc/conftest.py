@@ -13,12 +13,18 @@ volume) don't go through async_setup_entry at all and are unaffected by
 these fixtures.
 """
 
+from datetime import timedelta
 from types import SimpleNamespace
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from custom_components.bosch_shc.coordinator import (
+    SHCPolledResource,
+    SHCPollScheduler,
+)
+
 # Every device_helper bucket any bosch_shc platform reads (boschshcpy's
 # SHCDeviceHelper, ground truth: boschshcpy/device_helper.py). All but the
 # two SUPPORTED_MODELS-gated singletons default to an empty list; those two
@@ -76,10 +82,31 @@ def mock_config_entry(request: pytest.FixtureRequest) -> SimpleNamespace:
         options=overrides.get("options", {}),
         entry_id=overrides.get("entry_id", "E1"),
     )
-    entry.runtime_data = SimpleNamespace(session=None)
+    entry.runtime_data = SimpleNamespace(
+        session=None, poll_scheduler=make_poll_scheduler()
+    )
     return entry
 
 
+def make_poll_scheduler() -> SHCPollScheduler:
+    """SHCPollScheduler on a MagicMock hass/entry, for polled-entity setup.
+
+    Only scheduling (hass.loop.call_at) and entry bookkeeping touch hass or
+    the entry; nothing actually fires without a running HA event loop.
+    """
+    return SHCPollScheduler(MagicMock(), MagicMock())
+
+
+def make_polled_resource(fetch: Any = None, data: Any = None) -> SHCPolledResource:
+    """Standalone SHCPolledResource for entity tests; async_refresh() really
+    calls `fetch` (the HA-side scheduling is all on the MagicMock hass)."""
+    resource = SHCPolledResource(
+        MagicMock(), MagicMock(), "test", fetch or MagicMock(), timedelta(minutes=5)
+    )
+    resource.data = data
+    return resource
+
+
 @pytest.fixture
 def device_buckets(request: pytest.FixtureRequest) -> dict[str, Any]:
     """device_helper buckets for the mock session.
@@ -162,3 +189,56 @@ def mock_async_get_clientsession():
         ),
     ):
         yield
+
+
+@pytest.fixture(autouse=True)
+def mock_snapshot_store():
+    """Patch the warm-start snapshot's HA Store for all tests in this package.
+
+    async_setup_entry loads the snapshot through homeassistant.helpers.storage,
+    which needs a real hass (config dir, executor). The patched Store has no
+    snapshot, so setup takes the cold path unless a test seeds async_load.
+    """
+    store = MagicMock()
+    store.async_load = AsyncMock(return_value=None)
+    store.async_remove = AsyncMock()
+    with patch("custom_components.bosch_shc.snapshot.Store", return_value=store):
+        yield store
+
+
+@pytest.fixture(autouse=True)
+def mock_registered_platforms():
+    """Patch the capability map's entity-registry lookup for all tests.
+
+    async_setup_entry asks the entity registry which platforms already have
+    entities for the entry; a MagicMock hass has no registry. Empty by default,
+    so only the device_helper buckets decide which platforms are forwarded.
+    """
+    with patch(
+        "custom_components.bosch_shc.capabilities._registered_platforms",
+        return_value=set(),
+    ) as registered:
+        yield registered
+
+
+@pytest.fixture(autouse=True)
+def mock_migration_registry():
+    """Patch the unique-id migration's entity registry for all tests.
+
+    The migration runs er.async_migrate_entries over the entry's registry
+    entries; a MagicMock hass has no registry. The fake walks
+    `registry.entries` (none by default) and applies each update to
+    async_get's registry, where no unique id is taken unless a test says so.
+    """
+    with patch("custom_components.bosch_shc.migration.er") as registry:
+        registry.entries = []
+        ent_reg = registry.async_get.return_value
+        ent_reg.async_get_entity_id.return_value = None
+
+        async def _migrate_entries(hass, config_entry_id, entry_callback):
+            for entity in registry.entries:
+                if (updates := entry_callback(entity)) is not None:
+                    ent_reg.async_update_entity(entity.entity_id, **updates)
+
+        registry.async_migrate_entries = AsyncMock(side_effect=_migrate_entries)
+        yield registry
@@ -201,12 +201,7 @@ async def _run_setup_entry():
     def async_add_entities(entities):
         added.extend(entities)
 
-    # Patch async_migrate_to_new_unique_id to a coroutine no-op
-    with patch(
-        "custom_components.bosch_shc.alarm_control_panel.async_migrate_to_new_unique_id",
-        new=AsyncMock(return_value=None),
-    ):
-        await async_setup_entry(hass, config_entry, async_add_entities)
+    await async_setup_entry(hass, config_entry, async_add_entities)
 
     return added, device, entry_id
 
@@ -235,31 +230,6 @@ def test_async_setup_entry_entity_uses_correct_entry_id():
     assert panel._entry_id == entry_id
 
 
-def test_async_setup_entry_calls_migrate_with_old_unique_id():
-    """async_migrate_to_new_unique_id is called with old_unique_id=entry_id_device_id."""
-    entry_id = "cfg-entry-migrate"
-    device = _fake_device(root_device_id="r3", device_id="dev-migrate")
-
-    session = SimpleNamespace(intrusion_system=device)
-    hass = SimpleNamespace()
-    config_entry = SimpleNamespace(options={}, entry_id=entry_id)
-    config_entry.runtime_data = SimpleNamespace(session=session)
-
-    migrate_mock = AsyncMock(return_value=None)
-
-    with patch(
-        "custom_components.bosch_shc.alarm_control_panel.async_migrate_to_new_unique_id",
-        new=migrate_mock,
-    ):
-        asyncio.run(async_setup_entry(hass, config_entry, lambda e: None))
-
-    migrate_mock.assert_awaited_once()
-    kwargs = migrate_mock.call_args
-    assert kwargs.kwargs.get("old_unique_id") == f"{entry_id}_{device.id}"
-    assert kwargs.kwargs.get("device") is device
-    assert kwargs.kwargs.get("attr_name") is None
-
-
 # ---------------------------------------------------------------------------
 # unique_id (set during __init__ — verify via __new__ + manual construction)
 # ---------------------------------------------------------------------------
@@ -23,6 +23,7 @@ from __future__ import annotations
 
 import asyncio
 import inspect
+import time
 from enum import Enum
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -75,6 +76,7 @@ from custom_components.bosch_shc.const import (
     EVENT_BOSCH_SHC,
     OPT_EXCLUDED_DEVICES,
 )
+from custom_components.bosch_shc.coordinator import SHCMessagesCache
 
 
 def _run(coro):
@@ -420,10 +422,6 @@ def _run_setup_with_options(session, options):
 
     async def _inner():
         with (
-            patch(
-                "custom_components.bosch_shc.binary_sensor.async_migrate_to_new_unique_id",
-                return_value=None,
-            ),
             patch(
                 "custom_components.bosch_shc.binary_sensor.entity_platform.current_platform"
             ) as _cp,
@@ -769,9 +767,7 @@ class TestSirenSensorInits:
 
         platform_mock = MagicMock()
         platform_mock.async_register_entity_service = MagicMock()
-        with patch("custom_components.bosch_shc.binary_sensor.async_migrate_to_new_unique_id",
-                   new_callable=AsyncMock), \
-             patch("custom_components.bosch_shc.binary_sensor.entity_platform.current_platform") as _cp:
+        with patch("custom_components.bosch_shc.binary_sensor.entity_platform.current_platform") as _cp:
             _cp.get.return_value = platform_mock
             collected = []
             _run(async_setup_entry(hass, entry, lambda ents, **kw: collected.extend(ents)))
@@ -819,9 +815,7 @@ class TestBinarySensorSirenExcluded:
 
         platform_mock = MagicMock()
         platform_mock.async_register_entity_service = MagicMock()
-        with patch("custom_components.bosch_shc.binary_sensor.async_migrate_to_new_unique_id",
-                   new_callable=AsyncMock), \
-             patch("custom_components.bosch_shc.binary_sensor.entity_platform.current_platform") as _cp:
+        with patch("custom_components.bosch_shc.binary_sensor.entity_platform.current_platform") as _cp:
             _cp.get.return_value = platform_mock
             collected = []
             _run(async_setup_entry(hass, entry, lambda ents, **kw: collected.extend(ents)))
@@ -2570,10 +2564,9 @@ class TestTwinguardAlarmTracker:
 
     def test_concurrent_refresh_newer_result_not_overwritten_by_stale_slower_call(self):
         """Regression: two async_refresh() calls in flight at once (e.g. a
-        burst of SurveillanceAlarm callbacks) must not let an
-        earlier-started-but-slower-to-respond get_messages() call overwrite
-        the result of a later-started-but-faster call. The generation guard
-        must discard the stale (first-started) result."""
+        burst of SurveillanceAlarm callbacks) must not let the result of the
+        GET already in flight when the second alarm fired overwrite the one
+        the second alarm queued behind it."""
         surv_svc = _make_service("SurveillanceAlarm")
         sds = _make_base_device("smokeDetectionSystem", device_services=[surv_svc])
         sds.alarm = SurveillanceAlarmService.State.ALARM_ON
@@ -2616,13 +2609,14 @@ class TestTwinguardAlarmTracker:
         async def _run_inner():
             task1 = asyncio.ensure_future(tracker.async_refresh())
             await asyncio.sleep(0)  # let task1 start and reach the blocked await
-            task2 = asyncio.ensure_future(tracker.async_refresh())
-            await task2
+            task2 = asyncio.ensure_future(tracker.async_refresh(time.monotonic()))
+            await asyncio.sleep(0)
             resume_first.set()
-            await task1
+            await asyncio.gather(task1, task2)
 
         asyncio.run(_run_inner())
 
+        assert call_count[0] == 2
         assert tracker.is_alarm_active_for("fresh-tw") is True
         assert tracker.is_alarm_active_for("stale-tw") is False
 
@@ -2995,6 +2989,7 @@ class TestExtractTriggerIdsNonSmokeAlarm:
             )
         )
 
+        tracker._messages_cache = SHCMessagesCache(tracker._session)
         result = asyncio.run(tracker._extract_trigger_ids_from_messages())
         assert isinstance(result, set)
         assert len(result) == 0
@@ -3016,6 +3011,7 @@ class TestExtractTriggerIdsNonSmokeAlarm:
             )
         )
 
+        tracker._messages_cache = SHCMessagesCache(tracker._session)
         result = asyncio.run(tracker._extract_trigger_ids_from_messages())
         assert "tg-dev-001" in result
 
@@ -3189,11 +3185,6 @@ class TestBinarySensorCleanupTrackerBody:
 
         async def _run_setup():
             with (
-                patch(
-                    "custom_components.bosch_shc.binary_sensor."
-                    "async_migrate_to_new_unique_id",
-                    return_value=None,
-                ),
                 patch(
                     "custom_components.bosch_shc.binary_sensor."
                     "entity_platform.current_platform",
@@ -3316,11 +3307,6 @@ class TestCleanupTrackerActualClosure:
 
         async def _run_setup():
             with (
-                patch(
-                    "custom_components.bosch_shc.binary_sensor"
-                    ".async_migrate_to_new_unique_id",
-                    return_value=None,
-                ),
                 patch(
                     "custom_components.bosch_shc.binary_sensor"
                     ".entity_platform.current_platform"
@@ -3864,10 +3850,6 @@ class TestAsyncSetupEntry:
 
         async def _run_setup():
             with (
-                patch(
-                    "custom_components.bosch_shc.binary_sensor.async_migrate_to_new_unique_id",
-                    return_value=None,
-                ) as _migrate,
                 patch(
                     "custom_components.bosch_shc.binary_sensor.entity_platform.current_platform"
                 ) as _cp,
@@ -3954,7 +3936,6 @@ class TestAsyncSetupEntry:
 
         async def _run_setup():
             with (
-                patch("custom_components.bosch_shc.binary_sensor.async_migrate_to_new_unique_id", return_value=None),
                 patch("custom_components.bosch_shc.binary_sensor.entity_platform.current_platform") as _cp,
             ):
                 _cp.get.return_value = MagicMock()
@@ -3984,7 +3965,6 @@ class TestAsyncSetupEntry:
 
         async def _run_setup():
             with (
-                patch("custom_components.bosch_shc.binary_sensor.async_migrate_to_new_unique_id", return_value=None),
                 patch("custom_components.bosch_shc.binary_sensor.entity_platform.current_platform") as _cp,
                 patch(
                     "custom_components.bosch_shc.binary_sensor.async_get_device_id",
@@ -4030,7 +4010,6 @@ class TestAsyncSetupEntry:
 
         async def _run_setup():
             with (
-                patch("custom_components.bosch_shc.binary_sensor.async_migrate_to_new_unique_id", return_value=None),
                 patch("custom_components.bosch_shc.binary_sensor.entity_platform.current_platform") as _cp,
                 patch(
                     "custom_components.bosch_shc.binary_sensor.async_get_device_id",
@@ -4079,7 +4058,6 @@ class TestAsyncSetupEntry:
 
         async def _run_setup():
             with (
-                patch("custom_components.bosch_shc.binary_sensor.async_migrate_to_new_unique_id", return_value=None),
                 patch("custom_components.bosch_shc.binary_sensor.entity_platform.current_platform") as _cp,
                 patch(
                     "custom_components.bosch_shc.binary_sensor.async_get_device_id",
@@ -4210,7 +4188,6 @@ class TestAsyncSetupEntry:
 
         async def _run_setup():
             with (
-                patch("custom_components.bosch_shc.binary_sensor.async_migrate_to_new_unique_id", return_value=None),
                 patch("custom_components.bosch_shc.binary_sensor.entity_platform.current_platform") as _cp,
             ):
                 _cp.get.return_value = MagicMock()
@@ -4240,7 +4217,6 @@ class TestAsyncSetupEntry:
 
         async def _run_setup():
             with (
-                patch("custom_components.bosch_shc.binary_sensor.async_migrate_to_new_unique_id", return_value=None),
                 patch("custom_components.bosch_shc.binary_sensor.entity_platform.current_platform") as _cp,
                 patch(
                     "custom_components.bosch_shc.binary_sensor.async_get_device_id",
@@ -4290,7 +4266,6 @@ class TestAsyncSetupEntry:
 
         async def _run_setup():
             with (
-                patch("custom_components.bosch_shc.binary_sensor.async_migrate_to_new_unique_id", return_value=None),
                 patch("custom_components.bosch_shc.binary_sensor.entity_platform.current_platform") as _cp,
             ):
                 _cp.get.return_value = MagicMock()
@@ -4322,7 +4297,6 @@ class TestAsyncSetupEntry:
 
         async def _run_setup():
             with (
-                patch("custom_components.bosch_shc.binary_sensor.async_migrate_to_new_unique_id", return_value=None),
                 patch("custom_components.bosch_shc.binary_sensor.entity_platform.current_platform") as _cp,
             ):
                 _cp.get.return_value = MagicMock()
@@ -4349,7 +4323,6 @@ class TestAsyncSetupEntry:
 
         async def _run_setup():
             with (
-                patch("custom_components.bosch_shc.binary_sensor.async_migrate_to_new_unique_id", return_value=None),
                 patch("custom_components.bosch_shc.binary_sensor.entity_platform.current_platform") as _cp,
             ):
                 _cp.get.return_value = MagicMock()
@@ -4386,7 +4359,6 @@ class TestAsyncSetupEntry:
 
         async def _run_setup():
             with (
-                patch("custom_components.bosch_shc.binary_sensor.async_migrate_to_new_unique_id", return_value=None),
                 patch("custom_components.bosch_shc.binary_sensor.entity_platform.current_platform") as _cp,
             ):
                 _cp.get.return_value = MagicMock()
@@ -0,0 +1,215 @@
+"""Unit tests for bulk_command.py: the bulk command dispatcher and fleet apply.
+
+Pattern: pure-unit tests, no HA harness. The session is a SimpleNamespace
+whose device(id) looks devices up in a dict (KeyError when unknown, like
+SHCSessionAsync); devices are SimpleNamespaces exposing only the async_set_*
+methods of the boschshcpy model they stand in for.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import voluptuous as vol
+from boschshcpy.exceptions import SHCException
+
+from custom_components.bosch_shc.bulk_command import (
+    BULK_COMMAND_ITEM_SCHEMA,
+    SHCCommandDispatcher,
+    async_fleet_apply,
+)
+
+
+def _session(**devices):
+    return SimpleNamespace(device=lambda device_id: devices[device_id])
+
+
+def _run(dispatcher, commands, max_concurrency=4):
+    return asyncio.run(dispatcher.async_run(commands, max_concurrency))
+
+
+class TestDispatcher:
+    def test_operations_call_the_device_methods(self):
+        shutter = SimpleNamespace(async_set_level=AsyncMock(), async_stop=AsyncMock())
+        plug = SimpleNamespace(async_set_switchstate=AsyncMock())
+        light = SimpleNamespace(
+            async_set_binarystate=AsyncMock(), async_set_brightness=AsyncMock()
+        )
+        dispatcher = SHCCommandDispatcher(
+            _session(shutter=shutter, plug=plug, light=light)
+        )
+
+        results = _run(
+            dispatcher,
+            [
+                {"device_id": "shutter", "operation": "set_position", "value": 40.0},
+                {"device_id": "plug", "operation": "turn_on"},
+                {"device_id": "light", "operation": "turn_off"},
+                {"device_id": "light", "operation": "set_brightness", "value": 55.0},
+                {"device_id": "shutter", "operation": "stop"},
+            ],
+        )
+
+        assert all(result["success"] for result in results)
+        shutter.async_set_level.assert_awaited_once_with(0.4)
+        shutter.async_stop.assert_awaited_once_with()
+        plug.async_set_switchstate.assert_awaited_once_with(True)
+        light.async_set_binarystate.assert_awaited_once_with(False)
+        light.async_set_brightness.assert_awaited_once_with(55)
+
+    def test_failures_are_reported_per_item(self):
+        good = SimpleNamespace(async_set_level=AsyncMock())
+        bad = SimpleNamespace(async_set_level=AsyncMock(side_effect=SHCException("busy")))
+        plug = SimpleNamespace(async_set_switchstate=AsyncMock())
+        dispatcher = SHCCommandDispatcher(_session(good=good, bad=bad, plug=plug))
+
+        results = _run(
+            dispatcher,
+            [
+                {"device_id": "bad", "operation": "close"},
+                {"device_id": "missing", "operation": "close"},
+                {"device_id": "plug", "operation": "open"},
+                {"device_id": "good", "operation": "close"},
+            ],
+        )
+
+        assert [result.get("error") for result in results] == [
+            str(SHCException("busy")),
+            "unknown_device",
+            "unsupported_operation",
+            None,
+        ]
+        assert [result["device_id"] for result in results] == [
+            "bad",
+            "missing",
+            "plug",
+            "good",
+        ]
+        good.async_set_level.assert_awaited_once_with(0.0)
+
+    @pytest.mark.parametrize(
+        ("max_concurrency", "controller_limit", "expected"), [(3, 8, 3), (8, 2, 2)]
+    )
+    def test_concurrency_is_bounded(self, max_concurrency, controller_limit, expected):
+        in_flight = 0
+        peak = 0
+
+        async def move(_level):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        devices = {
+            f"shutter{i}": SimpleNamespace(async_set_level=move) for i in range(10)
+        }
+        dispatcher = SHCCommandDispatcher(_session(**devices), controller_limit)
+
+        results = _run(
+            dispatcher,
+            [{"device_id": device_id, "operation": "close"} for device_id in devices],
+            max_concurrency,
+        )
+
+        assert all(result["success"] for result in results)
+        assert peak == expected
+
+
+class TestItemSchema:
+    def test_value_required_and_in_range(self):
+        assert BULK_COMMAND_ITEM_SCHEMA(
+            {"device_id": "d", "operation": "set_position", "value": "40"}
+        ) == {"device_id": "d", "operation": "set_position", "value": 40.0}
+        for bad in (
+            {"device_id": "d", "operation": "set_position"},
+            {"device_id": "d", "operation": "set_position", "value": 140},
+            {"device_id": "d", "operation": "set_brightness", "value": 0},
+            {"device_id": "d", "operation": "explode"},
+        ):
+            with pytest.raises(vol.Invalid):
+                BULK_COMMAND_ITEM_SCHEMA(bad)
+
+    def test_operations_without_value(self):
+        assert BULK_COMMAND_ITEM_SCHEMA({"device_id": "d", "operation": "open"}) == {
+            "device_id": "d",
+            "operation": "open",
+        }
+
+
+def _fleet(devices, target=True, **kwargs):
+    async def write(device, value):
+        await device.async_set(value)
+
+    return asyncio.run(
+        async_fleet_apply(
+            devices,
+            target,
+            label="child_lock",
+            current=lambda device: device.state,
+            write=write,
+            **kwargs,
+        )
+    )
+
+
+class TestFleetApply:
+    def test_devices_already_at_target_are_skipped(self):
+        locked = SimpleNamespace(id="a", state=True, async_set=AsyncMock())
+        unlocked = SimpleNamespace(id="b", state=False, async_set=AsyncMock())
+        unknown = SimpleNamespace(id="c", state=None, async_set=AsyncMock())
+
+        counts = _fleet([locked, unlocked, unknown])
+
+        assert counts == {"written": 2, "skipped": 1, "failed": 0}
+        locked.async_set.assert_not_awaited()
+        unlocked.async_set.assert_awaited_once_with(True)
+        unknown.async_set.assert_awaited_once_with(True)
+
+    def test_transient_failure_is_retried(self, caplog):
+        flaky = SimpleNamespace(
+            id="flaky",
+            state=False,
+            async_set=AsyncMock(side_effect=[SHCException("busy"), None]),
+        )
+        broken = SimpleNamespace(
+            id="broken",
+            state=False,
+            async_set=AsyncMock(side_effect=SHCException("busy")),
+        )
+        missing = SimpleNamespace(
+            id="missing", state=None, async_set=AsyncMock(side_effect=AttributeError)
+        )
+
+        with patch("custom_components.bosch_shc.bulk_command.FLEET_RETRY_DELAY", 0):
+            counts = _fleet([flaky, broken, missing], attempts=3)
+
+        assert counts == {"written": 1, "skipped": 0, "failed": 2}
+        assert flaky.async_set.await_count == 2
+        assert broken.async_set.await_count == 3
+        assert missing.async_set.await_count == 1
+        assert "Failed to set child_lock=True on broken" in caplog.text
+
+    def test_concurrency_is_bounded(self):
+        in_flight = 0
+        peak = 0
+
+        async def lock(_value):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        devices = [
+            SimpleNamespace(id=f"trv{i}", state=False, async_set=lock)
+            for i in range(25)
+        ]
+
+        counts = _fleet(devices, max_concurrency=4)
+
+        assert counts["written"] == 25
+        assert peak == 4
@@ -1400,7 +1400,7 @@ class TestScenariosAsButtonsBlock:
             mock_config_entry, mock_session
         )
         assert not any(isinstance(e, SHCScenarioButton) for e in entities)
-        remove_mock.assert_awaited_once_with(ANY, "button", "uid-001_scenario_sc-1")
+        remove_mock.assert_awaited_once_with(ANY, ANY, "button", "uid-001_scenario_sc-1")
 
     def test_narrowing_filter_removes_stale_scenario_button(
         self, mock_config_entry, mock_session
@@ -1428,7 +1428,7 @@ class TestScenariosAsButtonsBlock:
         scenario_buttons = [e for e in entities if isinstance(e, SHCScenarioButton)]
         assert len(scenario_buttons) == 1
         assert scenario_buttons[0]._attr_name == "Keep"
-        remove_mock.assert_awaited_once_with(ANY, "button", "uid-001_scenario_sc-drop")
+        remove_mock.assert_awaited_once_with(ANY, ANY, "button", "uid-001_scenario_sc-drop")
 
 
 class TestSHCScenarioButtonInit:
@@ -1787,8 +1787,8 @@ class TestSHCWalkTestButtons:
         )
         assert not any(isinstance(e, SHCWalkTestButton) for e in entities)
         assert not any(isinstance(e, SHCWalkTestStopButton) for e in entities)
-        remove_mock.assert_any_await(ANY, "button", "root1_dev1_walk_test")
-        remove_mock.assert_any_await(ANY, "button", "root1_dev1_walk_test_stop")
+        remove_mock.assert_any_await(ANY, ANY, "button", "root1_dev1_walk_test")
+        remove_mock.assert_any_await(ANY, ANY, "button", "root1_dev1_walk_test_stop")
 
     def test_excluded_device_removes_stale_walk_test_buttons(
         self, mock_config_entry, mock_session
@@ -1809,8 +1809,8 @@ class TestSHCWalkTestButtons:
                 mock_config_entry, mock_session
             )
         assert not any(isinstance(e, SHCWalkTestButton) for e in entities)
-        remove_mock.assert_any_await(ANY, "button", "root1_dev1_walk_test")
-        remove_mock.assert_any_await(ANY, "button", "root1_dev1_walk_test_stop")
+        remove_mock.assert_any_await(ANY, ANY, "button", "root1_dev1_walk_test")
+        remove_mock.assert_any_await(ANY, ANY, "button", "root1_dev1_walk_test_stop")
 
 
 class TestWalkTestButtonSetup:
@@ -2107,9 +2107,9 @@ class TestSHCDetectionTestButtons:
         )
         assert not any(isinstance(e, SHCDetectionTestButton) for e in entities)
         assert not any(isinstance(e, SHCDetectionTestStopButton) for e in entities)
-        remove_mock.assert_any_await(ANY, "button", "root1_dev1_detection_test")
+        remove_mock.assert_any_await(ANY, ANY, "button", "root1_dev1_detection_test")
         remove_mock.assert_any_await(
-            ANY, "button", "root1_dev1_detection_test_stop"
+            ANY, ANY, "button", "root1_dev1_detection_test_stop"
         )
 
     def test_supports_tamper_reset_flipping_false_removes_stale_button(
@@ -2128,7 +2128,7 @@ class TestSHCDetectionTestButtons:
             mock_config_entry, mock_session
         )
         assert not any(isinstance(e, SHCTamperResetButton) for e in entities)
-        remove_mock.assert_any_await(ANY, "button", "root1_dev1_reset_tamper")
+        remove_mock.assert_any_await(ANY, ANY, "button", "root1_dev1_reset_tamper")
 
     def test_excluded_device_removes_stale_detection_and_tamper_buttons(
         self, mock_config_entry, mock_session
@@ -2150,11 +2150,11 @@ class TestSHCDetectionTestButtons:
             )
         assert not any(isinstance(e, SHCDetectionTestButton) for e in entities)
         assert not any(isinstance(e, SHCTamperResetButton) for e in entities)
-        remove_mock.assert_any_await(ANY, "button", "root1_dev1_detection_test")
+        remove_mock.assert_any_await(ANY, ANY, "button", "root1_dev1_detection_test")
         remove_mock.assert_any_await(
-            ANY, "button", "root1_dev1_detection_test_stop"
+            ANY, ANY, "button", "root1_dev1_detection_test_stop"
         )
-        remove_mock.assert_any_await(ANY, "button", "root1_dev1_reset_tamper")
+        remove_mock.assert_any_await(ANY, ANY, "button", "root1_dev1_reset_tamper")
 
 
 class TestButtonSetup:
@@ -2636,7 +2636,7 @@ class TestAutomationRuleButtonSetupEntry:
             isinstance(e, SHCAutomationRuleTriggerButton) for e in entities
         )
         remove_mock.assert_awaited_once_with(
-            ANY, "button", "E1_automation_rule_r1_trigger"
+            ANY, ANY, "button", "E1_automation_rule_r1_trigger"
         )
 
 
@@ -0,0 +1,117 @@
+"""Unit tests for capabilities.py: which platforms an entry forwards.
+
+Pattern: the conftest's mock_session/device_buckets fixtures (every bucket
+empty unless parametrized) and a MagicMock hass; the entity-registry lookup is
+the conftest's autouse mock_registered_platforms.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.const import Platform
+
+from custom_components.bosch_shc.__init__ import PLATFORMS
+from custom_components.bosch_shc.capabilities import (
+    async_platforms_to_forward,
+    platform_has_sources,
+)
+from custom_components.bosch_shc.const import OPT_TEMPERATURE_DROP_ENTITIES
+
+from .conftest import run_setup_entry
+
+_ALWAYS = {
+    Platform.BINARY_SENSOR,
+    Platform.BUTTON,
+    Platform.SENSOR,
+    Platform.SWITCH,
+    Platform.UPDATE,
+}
+
+
+def _entry(options=None):
+    return SimpleNamespace(entry_id="E1", options=options or {})
+
+
+def _forwarded(session, options=None):
+    session.scenarios = getattr(session, "scenarios", [])
+    return set(
+        async_platforms_to_forward(MagicMock(), _entry(options), session, PLATFORMS)
+    )
+
+
+class TestPlatformsToForward:
+    def test_empty_home_forwards_only_the_always_on_platforms(self, mock_session):
+        assert _forwarded(mock_session) == _ALWAYS
+
+    @pytest.mark.parametrize(
+        "device_buckets", [{"smart_plugs": [MagicMock()]}], indirect=True
+    )
+    def test_smart_plug_home(self, mock_session):
+        assert _forwarded(mock_session) == _ALWAYS | {
+            Platform.NUMBER,
+            Platform.SELECT,
+        }
+
+    @pytest.mark.parametrize(
+        "device_buckets", [{"thermostats": [MagicMock()]}], indirect=True
+    )
+    def test_thermostat_brings_valve_number_select(self, mock_session):
+        assert {Platform.VALVE, Platform.NUMBER, Platform.SELECT} <= _forwarded(
+            mock_session
+        )
+        assert Platform.COVER not in _forwarded(mock_session)
+
+    def test_alarm_and_scenarios(self, mock_session):
+        mock_session.intrusion_system = MagicMock()
+        mock_session.scenarios = [MagicMock()]
+
+        forwarded = _forwarded(mock_session)
+
+        assert Platform.ALARM_CONTROL_PANEL in forwarded
+        assert Platform.EVENT in forwarded
+
+    @pytest.mark.parametrize(
+        "device_buckets", [{"climate_controls": [MagicMock()]}], indirect=True
+    )
+    def test_temperature_drop_option_gates_number(self, mock_session):
+        mock_session.scenarios = []
+        assert not platform_has_sources(Platform.NUMBER, mock_session, {})
+        assert platform_has_sources(
+            Platform.NUMBER, mock_session, {OPT_TEMPERATURE_DROP_ENTITIES: True}
+        )
+
+    def test_registered_platform_is_forwarded(
+        self, mock_session, mock_registered_platforms
+    ):
+        mock_registered_platforms.return_value = {Platform.COVER}
+        assert Platform.COVER in _forwarded(mock_session)
+
+    def test_unmapped_platform_is_forwarded(self, mock_session):
+        assert platform_has_sources("siren", mock_session, {})
+
+
+@pytest.mark.parametrize(
+    "platform",
+    sorted(set(PLATFORMS) - _ALWAYS),
+)
+def test_skipped_platform_would_have_no_entities(
+    platform, mock_config_entry, mock_session
+):
+    """The map never skips a platform whose setup would build something."""
+    mock_session.scenarios = []
+    mock_session.rooms = []
+    assert not platform_has_sources(platform, mock_session, mock_config_entry.options)
+    if platform is Platform.ALARM_CONTROL_PANEL:
+        return  # its setup assumes the intrusion system exists
+    module = importlib.import_module(f"custom_components.bosch_shc.{platform.value}")
+
+    entities = asyncio.run(
+        run_setup_entry(module.async_setup_entry, mock_config_entry, mock_session)
+    )
+
+    assert entities == []
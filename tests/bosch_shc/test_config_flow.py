@@ -3507,12 +3507,8 @@ class TestDiagnosticEntitiesOption:
         added = []
 
         async def run():
-            with patch(
-                "custom_components.bosch_shc.sensor.async_migrate_to_new_unique_id",
-                new=AsyncMock(return_value=None),
-            ):
-                from custom_components.bosch_shc.sensor import async_setup_entry
-                await async_setup_entry(hass, entry, lambda entities: added.extend(entities))
+            from custom_components.bosch_shc.sensor import async_setup_entry
+            await async_setup_entry(hass, entry, lambda entities: added.extend(entities))
 
         asyncio.run(run())
 
@@ -3533,12 +3529,8 @@ class TestDiagnosticEntitiesOption:
         added = []
 
         async def run():
-            with patch(
-                "custom_components.bosch_shc.sensor.async_migrate_to_new_unique_id",
-                new=AsyncMock(return_value=None),
-            ):
-                from custom_components.bosch_shc.sensor import async_setup_entry
-                await async_setup_entry(hass, entry, lambda entities: added.extend(entities))
+            from custom_components.bosch_shc.sensor import async_setup_entry
+            await async_setup_entry(hass, entry, lambda entities: added.extend(entities))
 
         asyncio.run(run())
 
@@ -9,12 +9,23 @@ device's failure doesn't take down the whole refresh.
 from __future__ import annotations
 
 import asyncio
+import time
+from datetime import timedelta
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from boschshcpy.exceptions import SHCConnectionError, SHCException
+import pytest
+from boschshcpy.exceptions import JSONRPCError, SHCConnectionError, SHCException
+from boschshcpy.zigbee_routing import SHCZigbeeRoutingInfo
 
-from custom_components.bosch_shc.coordinator import SHCZigbeeRoutingCoordinator
+from custom_components.bosch_shc.coordinator import (
+    SHCMessagesCache,
+    SHCPollScheduler,
+    SHCPollStats,
+    SHCZigbeeRoutingCoordinator,
+    _spread_offset,
+    merge_temperature_drop_config,
+)
 
 
 def _run(coro):
@@ -117,3 +128,575 @@ class TestAsyncUpdateData:
 
         assert result == {}
         session.get_zigbee_routing_info.assert_not_awaited()
+
+
+class TestRefreshEngine:
+    """Bounded concurrency, router-first ordering, timeouts and stats."""
+
+    def test_in_flight_queries_never_exceed_concurrency(self):
+        in_flight = 0
+        peak = 0
+
+        async def _get(device_id: str):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return SimpleNamespace(route=[])
+
+        session = SimpleNamespace(
+            devices=[_fake_device(f"hdm:ZigBee:{i:03}") for i in range(10)],
+            get_zigbee_routing_info=_get,
+        )
+        coordinator = SHCZigbeeRoutingCoordinator(
+            MagicMock(), MagicMock(), session, concurrency=2
+        )
+
+        result = _run(coordinator._async_update_data())
+
+        assert len(result) == 10
+        assert peak == 2
+
+    def test_routers_are_queried_before_end_devices(self):
+        order: list[str] = []
+
+        async def _get(device_id: str):
+            order.append(device_id)
+            return SimpleNamespace(route=[])
+
+        sleepy = SimpleNamespace(id="hdm:ZigBee:sleepy", supports_batterylevel=True)
+        plug = SimpleNamespace(id="hdm:ZigBee:plug", supports_batterylevel=False)
+        session = SimpleNamespace(devices=[sleepy, plug], get_zigbee_routing_info=_get)
+        coordinator = SHCZigbeeRoutingCoordinator(
+            MagicMock(), MagicMock(), session, concurrency=1
+        )
+
+        _run(coordinator._async_update_data())
+
+        assert order == ["hdm:ZigBee:plug", "hdm:ZigBee:sleepy"]
+
+    def test_battery_device_seen_as_hop_last_cycle_counts_as_router(self):
+        order: list[str] = []
+
+        async def _get(device_id: str):
+            order.append(device_id)
+            return SimpleNamespace(route=[])
+
+        end = SimpleNamespace(id="hdm:ZigBee:end", supports_batterylevel=True)
+        relay = SimpleNamespace(id="hdm:ZigBee:relay", supports_batterylevel=True)
+        session = SimpleNamespace(devices=[end, relay], get_zigbee_routing_info=_get)
+        coordinator = SHCZigbeeRoutingCoordinator(
+            MagicMock(), MagicMock(), session, concurrency=1
+        )
+        coordinator.data = {
+            "hdm:ZigBee:end": SimpleNamespace(
+                route=[
+                    SimpleNamespace(device_id="hdm:ZigBee:end"),
+                    SimpleNamespace(device_id="hdm:ZigBee:relay"),
+                ]
+            )
+        }
+
+        _run(coordinator._async_update_data())
+
+        assert order == ["hdm:ZigBee:relay", "hdm:ZigBee:end"]
+
+    def test_timeout_is_isolated_and_reported(self):
+        info = SimpleNamespace(route=[])
+
+        async def _get(device_id: str):
+            if device_id == "hdm:ZigBee:slow":
+                await asyncio.sleep(1)
+            return info
+
+        session = SimpleNamespace(
+            devices=[_fake_device("hdm:ZigBee:slow"), _fake_device("hdm:ZigBee:ok")],
+            get_zigbee_routing_info=_get,
+        )
+        coordinator = SHCZigbeeRoutingCoordinator(
+            MagicMock(), MagicMock(), session, device_timeout=0.01
+        )
+
+        result = _run(coordinator._async_update_data())
+
+        assert result == {"hdm:ZigBee:ok": info}
+        stats = coordinator.last_refresh_stats
+        assert stats.timed_out == ["hdm:ZigBee:slow"]
+        assert set(stats.latency) == {"hdm:ZigBee:slow", "hdm:ZigBee:ok"}
+        rows = {row["device_id"]: row["result"] for row in stats.as_dict()["devices"]}
+        assert rows == {"hdm:ZigBee:slow": "timeout", "hdm:ZigBee:ok": "ok"}
+
+    def test_failed_device_reported_in_stats(self):
+        async def _get(device_id: str):
+            raise SHCException("offline")
+
+        session = SimpleNamespace(
+            devices=[_fake_device("hdm:ZigBee:bad")], get_zigbee_routing_info=_get
+        )
+        coordinator = _make_coordinator(session)
+
+        _run(coordinator._async_update_data())
+
+        assert coordinator.last_refresh_stats.failed == ["hdm:ZigBee:bad"]
+        assert coordinator.last_refresh_stats.timed_out == []
+
+    def test_concurrency_is_at_least_one(self):
+        coordinator = SHCZigbeeRoutingCoordinator(
+            MagicMock(), MagicMock(), SimpleNamespace(), concurrency=0
+        )
+        assert coordinator.concurrency == 1
+
+
+class TestIncrementalRefresh:
+    """Incremental mode: reuse fresh answers, skip routers already reported."""
+
+    @staticmethod
+    def _routing_info(device_id: str, hops: list[str]) -> SHCZigbeeRoutingInfo:
+        return SHCZigbeeRoutingInfo(
+            {
+                "device": device_id,
+                "aggregatedQuality": "GOOD",
+                "route": [
+                    {"deviceId": hop, "quality": "GOOD"}
+                    for hop in [device_id, *hops]
+                ],
+            }
+        )
+
+    def test_router_in_end_device_route_is_inferred_not_queried(self):
+        queried: list[str] = []
+
+        async def _get(device_id: str):
+            queried.append(device_id)
+            if device_id == "hdm:ZigBee:end":
+                return SHCZigbeeRoutingInfo(
+                    {
+                        "device": device_id,
+                        "aggregatedQuality": "MEDIUM",
+                        "route": [
+                            {"deviceId": "hdm:ZigBee:end", "quality": "GOOD"},
+                            {"deviceId": "hdm:ZigBee:plug", "quality": "BAD"},
+                            {"deviceId": "shc", "quality": "GOOD"},
+                        ],
+                    }
+                )
+            return self._routing_info(device_id, ["shc"])
+
+        end = SimpleNamespace(id="hdm:ZigBee:end", supports_batterylevel=True)
+        plug = SimpleNamespace(id="hdm:ZigBee:plug", supports_batterylevel=False)
+        session = SimpleNamespace(devices=[plug, end], get_zigbee_routing_info=_get)
+        coordinator = SHCZigbeeRoutingCoordinator(
+            MagicMock(), MagicMock(), session, concurrency=1, incremental=True
+        )
+
+        result = _run(coordinator._async_update_data())
+
+        assert queried == ["hdm:ZigBee:end"]
+        inferred = result["hdm:ZigBee:plug"]
+        assert [hop.device_id for hop in inferred.route] == ["hdm:ZigBee:plug", "shc"]
+        assert inferred.aggregated_quality.value == "BAD"
+        assert coordinator.last_refresh_stats.inferred == ["hdm:ZigBee:plug"]
+
+    def test_fresh_answers_are_reused_stale_ones_requeried(self):
+        queried: list[str] = []
+
+        async def _get(device_id: str):
+            queried.append(device_id)
+            return self._routing_info(device_id, [])
+
+        session = SimpleNamespace(
+            devices=[_fake_device("hdm:ZigBee:a"), _fake_device("hdm:ZigBee:b")],
+            get_zigbee_routing_info=_get,
+        )
+        coordinator = SHCZigbeeRoutingCoordinator(
+            MagicMock(), MagicMock(), session, incremental=True, max_age=60
+        )
+        coordinator.data = _run(coordinator._async_update_data())
+        coordinator._fetched_at["hdm:ZigBee:b"] -= 120
+        queried.clear()
+
+        result = _run(coordinator._async_update_data())
+
+        assert queried == ["hdm:ZigBee:b"]
+        assert set(result) == {"hdm:ZigBee:a", "hdm:ZigBee:b"}
+        assert coordinator.last_refresh_stats.reused == ["hdm:ZigBee:a"]
+
+    def test_full_mode_requeries_everything(self):
+        get = AsyncMock(return_value=SimpleNamespace(route=[]))
+        session = SimpleNamespace(
+            devices=[_fake_device("hdm:ZigBee:a")], get_zigbee_routing_info=get
+        )
+        coordinator = _make_coordinator(session)
+        coordinator.data = _run(coordinator._async_update_data())
+
+        _run(coordinator._async_update_data())
+
+        assert get.await_count == 2
+        assert coordinator.last_refresh_stats.incremental is False
+
+    def test_requested_incremental_refresh_applies_once(self):
+        coordinator = _make_coordinator(SimpleNamespace())
+        coordinator.async_request_refresh = AsyncMock()
+
+        _run(coordinator.async_request_incremental_refresh(10))
+
+        assert coordinator._requested_max_age == 10
+        coordinator.async_request_refresh.assert_awaited_once()
+        _run(coordinator._async_update_data())
+        assert coordinator.last_refresh_stats.incremental is True
+        assert coordinator._requested_max_age is None
+
+
+class TestPollScheduler:
+    def test_same_key_returns_same_resource(self):
+        scheduler = SHCPollScheduler(MagicMock(), MagicMock())
+        first = scheduler.async_get("room_1", AsyncMock(), timedelta(minutes=5))
+        second = scheduler.async_get("room_1", AsyncMock(), timedelta(minutes=5))
+        assert first is second
+        assert list(scheduler.resources) == ["room_1"]
+
+    def test_seeded_data_is_served_before_first_fetch(self):
+        fetch = AsyncMock()
+        scheduler = SHCPollScheduler(MagicMock(), MagicMock())
+        resource = scheduler.async_get(
+            "room_1", fetch, timedelta(minutes=5), data={"enabled": True}
+        )
+        assert resource.data == {"enabled": True}
+        fetch.assert_not_awaited()
+
+    def test_spread_offset_is_stable_and_within_window(self):
+        offsets = {_spread_offset(f"firmware_dev{i}", 120.0) for i in range(50)}
+        assert all(0 <= o < 120.0 for o in offsets)
+        assert len(offsets) > 40  # spread, not one burst
+        assert _spread_offset("firmware_dev1", 120.0) == _spread_offset(
+            "firmware_dev1", 120.0
+        )
+
+    def test_unseeded_first_fetch_capped_to_startup_window(self):
+        delays = []
+        with patch(
+            "custom_components.bosch_shc.coordinator.async_call_later",
+            side_effect=lambda _hass, delay, _cb: delays.append(delay) or MagicMock(),
+        ):
+            scheduler = SHCPollScheduler(MagicMock(), MagicMock())
+            scheduler.async_get("a", AsyncMock(), timedelta(hours=6))
+            scheduler.async_get("b", AsyncMock(), timedelta(hours=6), data="x")
+            assert delays == []  # held until the long poll is up
+            scheduler.async_start()
+        assert delays[0] < 120.0
+        assert delays[1] == _spread_offset("b", 6 * 3600.0)
+
+    def test_fetch_error_keeps_last_value(self):
+        fetch = AsyncMock(side_effect=SHCException("boom"))
+        scheduler = SHCPollScheduler(MagicMock(), MagicMock())
+        resource = scheduler.async_get("r", fetch, timedelta(minutes=5), data=3)
+        _run(resource.async_refresh())
+        assert resource.data == 3
+
+    def test_shutdown_cancels_pending_first_refresh(self):
+        unsub = MagicMock()
+        with patch(
+            "custom_components.bosch_shc.coordinator.async_call_later",
+            return_value=unsub,
+        ):
+            scheduler = SHCPollScheduler(MagicMock(), MagicMock())
+            scheduler.async_start()
+            scheduler.async_get("r", AsyncMock(), timedelta(minutes=5))
+        _run(scheduler.async_shutdown())
+        unsub.assert_called_once()
+
+    def test_concurrent_probes_share_one_fetch(self):
+        scheduler = SHCPollScheduler(MagicMock(), MagicMock())
+
+        async def slow_fetch():
+            await asyncio.sleep(0)
+            return {"configuration": {"enabled": True}}
+
+        fetch = AsyncMock(side_effect=slow_fetch)
+
+        async def both():
+            return await asyncio.gather(
+                scheduler.async_get_probed("room_1", fetch, timedelta(minutes=5)),
+                scheduler.async_get_probed("room_1", fetch, timedelta(minutes=5)),
+            )
+
+        first, second = _run(both())
+        assert first is second
+        assert first.data == {"configuration": {"enabled": True}}
+        fetch.assert_awaited_once()
+
+    def test_probe_without_data_creates_no_resource(self):
+        scheduler = SHCPollScheduler(MagicMock(), MagicMock())
+        fetch = AsyncMock(return_value=None)
+        assert (
+            _run(scheduler.async_get_probed("room_1", fetch, timedelta(minutes=5)))
+            is None
+        )
+        assert scheduler.resources == {}
+
+    def test_merge_temperature_drop_config_keeps_siblings(self):
+        data = {
+            "supportsDrop": True,
+            "configuration": {"enabled": False, "dropTemperature": 1.0},
+        }
+        merged = merge_temperature_drop_config(data, "enabled", True)
+        assert merged == {
+            "supportsDrop": True,
+            "configuration": {"enabled": True, "dropTemperature": 1.0},
+        }
+        assert data["configuration"]["enabled"] is False  # not mutated
+        assert merge_temperature_drop_config(None, "enabled", True) is None
+
+
+class TestPolledResourceInterval:
+    def _resource(self, fetch, **kwargs):
+        scheduler = SHCPollScheduler(MagicMock(), MagicMock())
+        return scheduler.async_get("firmware_d1", fetch, timedelta(hours=6), **kwargs)
+
+    def test_unseeded_resource_moves_into_its_slot_after_first_fetch(self):
+        resource = self._resource(AsyncMock(return_value="UpToDate"))
+        slot = timedelta(seconds=_spread_offset("firmware_d1", 6 * 3600.0))
+        _run(resource.async_refresh())
+        assert resource.update_interval == timedelta(hours=6) + slot
+        _run(resource.async_refresh())
+        assert resource.update_interval == timedelta(hours=6)
+
+    def test_failing_fetch_backs_off_exponentially_and_resets(self):
+        fetch = AsyncMock(side_effect=SHCException("boom"))
+        resource = self._resource(fetch, data="UpToDate")
+        intervals = []
+        for _ in range(5):
+            _run(resource.async_refresh())
+            intervals.append(resource.update_interval)
+        assert intervals == [
+            timedelta(hours=12),
+            timedelta(hours=24),
+            timedelta(hours=48),
+            timedelta(hours=48),
+            timedelta(hours=48),
+        ]
+        assert resource.data == "UpToDate"
+        fetch.side_effect = None
+        fetch.return_value = "UpToDate"
+        _run(resource.async_refresh())
+        assert resource.update_interval == timedelta(hours=6)
+        assert resource.consecutive_failures == 0
+
+    def test_fast_poll_stretches_while_unchanged_then_decays(self):
+        fetch = AsyncMock(return_value="UpdateRunning")
+        resource = self._resource(
+            fetch,
+            data="UpToDate",
+            fast_interval=timedelta(seconds=5),
+            fast_poll_while={"UpdateRunning", "TransferringUpdate"}.__contains__,
+        )
+        intervals = []
+        for state in (
+            "UpdateRunning",
+            "UpdateRunning",
+            "UpdateRunning",
+            "TransferringUpdate",
+        ):
+            fetch.return_value = state
+            _run(resource.async_refresh())
+            intervals.append(resource.update_interval.total_seconds())
+        # Fast on entering, stretched while stuck, fast again on a change.
+        assert intervals == [5, 10, 20, 5]
+        for _ in range(60):
+            _run(resource.async_refresh())
+        assert resource.update_interval == timedelta(minutes=5)  # capped
+
+        fetch.return_value = "UpToDate"
+        decay = []
+        for _ in range(8):
+            _run(resource.async_refresh())
+            decay.append(resource.update_interval)
+        assert decay[0] == timedelta(minutes=10)
+        assert decay == sorted(decay)
+        assert decay[-1] == timedelta(hours=6)
+
+
+    def test_failed_probe_during_an_install_keeps_the_fast_poll(self):
+        fetch = AsyncMock(return_value="UpdateRunning")
+        resource = self._resource(
+            fetch,
+            data="UpToDate",
+            fast_interval=timedelta(seconds=5),
+            fast_poll_while={"UpdateRunning", "TransferringUpdate"}.__contains__,
+        )
+        _run(resource.async_refresh())
+        assert resource.update_interval == timedelta(seconds=5)
+
+        # The SHC reboots to install the update.
+        fetch.side_effect = SHCException("rebooting")
+        intervals = []
+        for _ in range(6):
+            _run(resource.async_refresh())
+            intervals.append(resource.update_interval.total_seconds())
+        assert intervals == [10, 20, 40, 40, 40, 40]
+        assert resource.data == "UpdateRunning"
+
+        fetch.side_effect = None
+        fetch.return_value = "UpdateRunning"
+        _run(resource.async_refresh())
+        assert resource.update_interval <= timedelta(minutes=5)
+        fetch.return_value = "TransferringUpdate"
+        _run(resource.async_refresh())
+        assert resource.update_interval == timedelta(seconds=5)
+
+class TestMessagesCache:
+    def _cache(self, ttl=5.0):
+        release = asyncio.Event()
+        calls = []
+
+        async def _get_messages():
+            calls.append(len(calls))
+            await release.wait()
+            return [{"id": f"m{len(calls)}"}]
+
+        session = SimpleNamespace(api=SimpleNamespace(get_messages=_get_messages))
+        return SHCMessagesCache(session, ttl=ttl), release, calls
+
+    def test_concurrent_readers_share_one_get(self):
+        async def _inner():
+            cache, release, calls = self._cache()
+            readers = [asyncio.ensure_future(cache.async_get()) for _ in range(5)]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*readers)
+            assert calls == [0]
+            assert all(result == [{"id": "m1"}] for result in results)
+            assert await cache.async_get() == [{"id": "m1"}]
+            assert calls == [0]
+
+        _run(_inner())
+
+    def test_expired_list_is_fetched_again(self):
+        async def _inner():
+            cache, release, calls = self._cache(ttl=0.0)
+            release.set()
+            await cache.async_get()
+            await cache.async_get()
+            assert calls == [0, 1]
+
+        _run(_inner())
+
+    def test_newer_readers_share_one_get_queued_behind_the_in_flight_one(self):
+        async def _inner():
+            cache, release, calls = self._cache()
+            first = asyncio.ensure_future(cache.async_get())
+            await asyncio.sleep(0)
+            since = time.monotonic()
+            later = [asyncio.ensure_future(cache.async_get(since)) for _ in range(3)]
+            await asyncio.sleep(0)
+            release.set()
+            assert await first == [{"id": "m1"}]
+            assert await asyncio.gather(*later) == [[{"id": "m2"}]] * 3
+            assert calls == [0, 1]
+
+        _run(_inner())
+
+    def test_failure_reaches_every_reader_and_is_not_cached(self):
+        get_messages = AsyncMock(side_effect=[SHCException("down"), [{"id": "m"}]])
+        cache = SHCMessagesCache(SimpleNamespace(api=SimpleNamespace(get_messages=get_messages)))
+
+        async def _inner():
+            results = await asyncio.gather(
+                cache.async_get(), cache.async_get(), return_exceptions=True
+            )
+            assert all(isinstance(result, SHCException) for result in results)
+            assert await cache.async_get() == [{"id": "m"}]
+
+        _run(_inner())
+        assert get_messages.await_count == 2
+
+
+class TestPollStats:
+    @staticmethod
+    def _api(results=(), poll_error=None):
+        async def _subscribe():
+            return "poll-1"
+
+        async def _poll(poll_id, wait_seconds=30):
+            if poll_error is not None:
+                raise poll_error
+            return list(results)
+
+        return SimpleNamespace(long_polling_subscribe=_subscribe, long_polling_poll=_poll)
+
+    def test_polls_feed_the_counters_and_histograms(self):
+        stats = SHCPollStats()
+        api = self._api(results=[{"id": "e1"}, {"id": "e2"}])
+        stats.async_instrument(api)
+
+        async def _inner():
+            assert await api.long_polling_subscribe() == "poll-1"
+            assert await api.long_polling_poll("poll-1", 10) == [
+                {"id": "e1"},
+                {"id": "e2"},
+            ]
+
+        _run(_inner())
+
+        assert (stats.polls, stats.events, stats.resubscribes) == (1, 2, 0)
+        assert 0 <= stats.last_round_trip == stats.max_round_trip < 0.5
+        assert stats.last_event is not None
+        assert stats.round_trip_histogram()["<=0.5"] == 1
+        assert stats.events_histogram()["<=2"] == 1
+        assert sum(stats.events_histogram().values()) == 1
+
+    def test_idle_poll_keeps_the_last_event(self):
+        stats = SHCPollStats()
+        api = self._api()
+        stats.async_instrument(api)
+        _run(api.long_polling_poll("poll-1"))
+        assert stats.polls == 1
+        assert stats.last_event is None
+        assert stats.events_histogram()["<=0"] == 1
+
+    def test_subscribes_after_the_first_are_resubscribes(self):
+        stats = SHCPollStats()
+        api = self._api()
+        stats.async_instrument(api)
+        for _ in range(3):
+            _run(api.long_polling_subscribe())
+        assert stats.resubscribes == 2
+
+    def test_errors_are_counted_by_kind_and_reraised(self):
+        stats = SHCPollStats()
+        for error in (JSONRPCError(-32001, "unknown poll id"), SHCConnectionError("x")):
+            api = self._api(poll_error=error)
+            stats.async_instrument(api)
+            with pytest.raises(type(error)):
+                _run(api.long_polling_poll("poll-1"))
+        assert (stats.rpc_errors, stats.connection_errors, stats.errors) == (1, 1, 2)
+        assert stats.last_error == "SHCConnectionError"
+        assert stats.polls == 0
+
+    def test_listeners_and_restore(self):
+        stats = SHCPollStats()
+        api = self._api()
+        poll = api.long_polling_poll
+        listener = MagicMock()
+        remove = stats.async_add_listener(listener)
+        restore = stats.async_instrument(api)
+
+        _run(api.long_polling_poll("poll-1"))
+        listener.assert_called_once()
+        remove()
+        restore()
+        assert api.long_polling_poll is poll
+        _run(api.long_polling_poll("poll-1"))
+        assert stats.polls == 1
+        listener.assert_called_once()
+
+    def test_as_dict(self):
+        stats = SHCPollStats()
+        assert stats.as_dict()["last_round_trip"] is None
+        stats._record_poll(0.25, 1)
+        diag = stats.as_dict()
+        assert diag["average_round_trip"] == 0.25
+        assert diag["round_trip_histogram"]["<=0.5"] == 1
+        assert diag["round_trip_histogram"][">60"] == 0
+        assert diag["events_histogram"][">50"] == 0
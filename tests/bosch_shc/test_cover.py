@@ -249,13 +249,9 @@ class TestCoverSetupEntry:
     """Cover async_setup_entry with ShutterControlCover and BlindsControlCover."""
 
     def _run(self, mock_config_entry, mock_session) -> list:
-        with patch(
-            "custom_components.bosch_shc.cover.async_migrate_to_new_unique_id",
-            new_callable=AsyncMock,
-        ):
-            return asyncio.run(
-                run_setup_entry(async_setup_entry, mock_config_entry, mock_session)
-            )
+        return asyncio.run(
+            run_setup_entry(async_setup_entry, mock_config_entry, mock_session)
+        )
 
     @pytest.mark.parametrize(
         "device_buckets", [{"shutter_controls": [_cover_device()]}], indirect=True
@@ -350,13 +346,9 @@ class TestCoverDeviceExcluded:
     """device_excluded continue for shutter/blind cover paths."""
 
     def _run(self, mock_config_entry, mock_session) -> list:
-        with patch(
-            "custom_components.bosch_shc.cover.async_migrate_to_new_unique_id",
-            new=AsyncMock(return_value=None),
-        ):
-            return asyncio.run(
-                run_setup_entry(async_setup_entry, mock_config_entry, mock_session)
-            )
+        return asyncio.run(
+            run_setup_entry(async_setup_entry, mock_config_entry, mock_session)
+        )
 
     @pytest.mark.parametrize(
         ("device_buckets", "mock_config_entry"),
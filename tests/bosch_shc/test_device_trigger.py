@@ -20,6 +20,7 @@ and never runs it under pytest).
 from __future__ import annotations
 
 import asyncio
+import functools
 import inspect
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
@@ -48,6 +49,7 @@ from custom_components.bosch_shc.const import (
     DOMAIN,
     EVENT_BOSCH_SHC,
     INPUTS_EVENTS_SUBTYPES_SWITCH2,
+    OPT_EXCLUDED_DEVICES,
     SUPPORTED_INPUTS_EVENTS_TYPES,
 )
 from custom_components.bosch_shc.device_trigger import (
@@ -56,22 +58,33 @@ from custom_components.bosch_shc.device_trigger import (
     async_get_triggers,
     get_device_from_id,
 )
+from custom_components.bosch_shc.entity import SHCDeviceIndex
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+class _Runtime:
+    """runtime_data whose SHCDeviceIndex is built on first use, over the
+    registry device_registry.async_get returns then (the tests patch it)."""
+
+    def __init__(self, session):
+        self.session = session
+
+    @functools.cached_property
+    def device_index(self):
+        return SHCDeviceIndex(self.session, device_registry.async_get(None), {})
+
+
 def _make_hass(sessions=None):
     """Return a minimal hass mock whose config_entries.async_entries(DOMAIN)
-    yields one fake ConfigEntry (carrying .runtime_data.session) per session
-    in `sessions` — get_device_from_id() iterates hass.config_entries
-    .async_entries(DOMAIN) and reads entry.runtime_data.session for each,
-    skipping any entry that lacks a runtime_data attribute entirely."""
+    yields one fake ConfigEntry (carrying .runtime_data.session and the
+    SHCDeviceIndex setup builds over it) per session in `sessions` —
+    get_device_from_id() iterates hass.config_entries.async_entries(DOMAIN)
+    and asks each entry's runtime_data.device_index, skipping any entry
+    without one."""
     hass = MagicMock()
-    entries = [
-        SimpleNamespace(runtime_data=SimpleNamespace(session=s))
-        for s in (sessions or [])
-    ]
+    entries = [SimpleNamespace(runtime_data=_Runtime(s)) for s in (sessions or [])]
     hass.config_entries = MagicMock()
     hass.config_entries.async_entries = MagicMock(return_value=entries)
     return hass
@@ -376,9 +389,7 @@ class TestDeviceTriggerGetDeviceFromId:
         session.scenario_names = []
 
         entry = SimpleNamespace(entry_id="eid1")
-        entry.runtime_data = SimpleNamespace(
-            session=session, shc_device=None, title="Test SHC"
-        )
+        entry.runtime_data = _Runtime(session)
 
         hass = MagicMock()
         hass.config_entries.async_entries = MagicMock(return_value=[entry])
@@ -447,6 +458,120 @@ class TestDeviceTriggerGetDeviceFromId:
         assert model == "WRC2"
 
 
+# ===========================================================================
+# 2c. SHCDeviceIndex — registry lookups happen once per device
+# ===========================================================================
+
+class TestSHCDeviceIndex:
+
+    def _registry(self, mapping):
+        """Registry mock: SHC id -> HA device id, per mapping (mutable)."""
+        registry = MagicMock()
+
+        def fake_get_device(identifiers, connections):
+            for _, dev_id in identifiers:
+                if dev_id in mapping:
+                    return SimpleNamespace(id=mapping[dev_id])
+            return None
+
+        def fake_get(device_id):
+            for shc_id, ha_id in mapping.items():
+                if ha_id == device_id:
+                    return SimpleNamespace(id=ha_id, identifiers={(DOMAIN, shc_id)})
+            return None
+
+        registry.async_get_device = MagicMock(side_effect=fake_get_device)
+        registry.async_get = MagicMock(side_effect=fake_get)
+        return registry
+
+    @staticmethod
+    def _event(action, device_id):
+        return SimpleNamespace(data={"action": action, "device_id": device_id})
+
+    def test_hit_does_not_touch_the_registry(self):
+        shc_a = _make_shc_device(device_id="shc-a", model="WRC2")
+        shc_b = _make_shc_device(device_id="shc-b", model="MD")
+        registry = self._registry({"shc-a": "ha-a", "shc-b": "ha-b"})
+        index = SHCDeviceIndex(_make_session(devices=[shc_a, shc_b]), registry, {})
+        calls = registry.async_get_device.call_count
+
+        assert index.async_get(registry, "ha-a") == (shc_a, "WRC2")
+        assert index.async_get(registry, "ha-b") == (shc_b, "MD")
+        assert index.async_get(registry, "unknown") is None
+
+        assert registry.async_get_device.call_count == calls
+
+    def test_device_paired_at_runtime_is_indexed_on_create(self):
+        mapping = {}
+        registry = self._registry(mapping)
+        index = SHCDeviceIndex(_make_session(devices=[]), registry, {})
+        shc_new = _make_shc_device(device_id="shc-new", model="SWITCH2")
+        index.async_add_device(shc_new)
+        assert index.async_get(registry, "ha-new") is None
+
+        mapping["shc-new"] = "ha-new"
+        index.async_device_registry_updated(self._event("create", "ha-new"))
+
+        assert index.async_get(registry, "ha-new") == (shc_new, "SWITCH2")
+
+    def test_deleted_device_is_dropped(self):
+        shc_dev = _make_shc_device(device_id="shc-a", model="WRC2")
+        shc_dev.deleted = False
+        registry = self._registry({"shc-a": "ha-a"})
+        index = SHCDeviceIndex(_make_session(devices=[shc_dev]), registry, {})
+        assert index.async_get(registry, "ha-a") == (shc_dev, "WRC2")
+
+        shc_dev.deleted = True
+
+        assert index.async_get(registry, "ha-a") is None
+
+    def test_removed_registry_device_is_not_returned(self):
+        shc_dev = _make_shc_device(device_id="shc-a", model="WRC2")
+        mapping = {"shc-a": "ha-a"}
+        registry = self._registry(mapping)
+        index = SHCDeviceIndex(_make_session(devices=[shc_dev]), registry, {})
+
+        del mapping["shc-a"]
+        assert index.async_get(registry, "ha-a") is None
+
+        # Re-created under a new HA device id.
+        mapping["shc-a"] = "ha-a2"
+        index.async_device_registry_updated(self._event("create", "ha-a2"))
+        assert index.async_get(registry, "ha-a2") == (shc_dev, "WRC2")
+
+    def test_remove_event_drops_the_device(self):
+        shc_dev = _make_shc_device(device_id="shc-a", model="WRC2")
+        registry = self._registry({"shc-a": "ha-a"})
+        index = SHCDeviceIndex(_make_session(devices=[shc_dev]), registry, {})
+
+        index.async_device_registry_updated(self._event("remove", "ha-a"))
+
+        assert index.async_get(registry, "ha-a") is None
+
+    def test_excluded_device_is_not_indexed(self):
+        shc_dev = _make_shc_device(device_id="shc-a", model="WRC2")
+        shc_dev.room_id = "hz_1"
+        registry = self._registry({"shc-a": "ha-a"})
+        options = {OPT_EXCLUDED_DEVICES: ["shc-a"]}
+        index = SHCDeviceIndex(_make_session(devices=[shc_dev]), registry, options)
+        assert index.async_get(registry, "ha-a") is None
+        index.async_add_device(shc_dev)
+        assert index.async_get(registry, "ha-a") is None
+
+        index.async_rebuild({})
+
+        assert index.async_get(registry, "ha-a") == (shc_dev, "WRC2")
+
+    def test_entry_without_index_is_skipped(self):
+        hass = MagicMock()
+        hass.config_entries.async_entries = MagicMock(
+            return_value=[SimpleNamespace(entry_id="not-loaded")]
+        )
+
+        with patch("custom_components.bosch_shc.device_trigger.dr.async_get"):
+            assert asyncio.run(get_device_from_id(hass, "ha-a")) == (None, "")
+
+
 # ===========================================================================
 # 3. async_get_triggers
 # ===========================================================================
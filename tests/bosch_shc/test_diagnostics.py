@@ -9,9 +9,14 @@ from types import SimpleNamespace
 
 from homeassistant.components.diagnostics import REDACTED
 
+from custom_components.bosch_shc.coordinator import (
+    SHCPollStats,
+    ZigbeeRoutingRefreshStats,
+)
 from custom_components.bosch_shc.diagnostics import (
     async_get_config_entry_diagnostics,
 )
+from custom_components.bosch_shc.entity import SHCStateWriteCoalescer
 
 
 def _entry(session=None):
@@ -158,3 +163,55 @@ def test_integration_version_present():
     diag = _run(hass, _entry(_session()))
     assert isinstance(diag["integration_version"], str)
     assert diag["integration_version"]  # non-empty
+
+
+def test_zigbee_routing_refresh_stats_included_and_redacted():
+    stats = ZigbeeRoutingRefreshStats(concurrency=3, device_timeout=20.0)
+    stats.latency["hdm:ZigBee:abc123"] = 1.25
+    stats.timed_out.append("hdm:ZigBee:abc123")
+    entry = _entry(_session())
+    entry.runtime_data.zigbee_routing_coordinator = SimpleNamespace(
+        last_refresh_stats=stats
+    )
+
+    diag = _run(SimpleNamespace(), entry)
+
+    refresh = diag["zigbee_routing_refresh"]
+    assert refresh["concurrency"] == 3
+    row = refresh["devices"][0]
+    assert row["device_id"] == REDACTED
+    assert row["name"] == "Living Room Shutter"
+    assert row["result"] == "timeout"
+
+
+def test_zigbee_routing_refresh_absent_before_first_refresh():
+    diag = _run(SimpleNamespace(), _entry(_session()))
+    assert "zigbee_routing_refresh" not in diag
+
+
+def test_state_write_counters_included():
+    writer = SHCStateWriteCoalescer(SimpleNamespace(loop=None))
+    writer.scheduled, writer.written, writer.suppressed = 10, 4, 3
+    entry = _entry(_session())
+    entry.runtime_data.state_writer = writer
+
+    diag = _run(SimpleNamespace(), entry)
+
+    assert diag["state_writes"] == {
+        "scheduled": 10,
+        "written": 4,
+        "suppressed_unchanged": 3,
+    }
+
+
+def test_long_poll_stats_included():
+    stats = SHCPollStats()
+    stats._record_poll(10.0, 0)
+    entry = _entry(_session())
+    entry.runtime_data.poll_stats = stats
+
+    diag = _run(SimpleNamespace(), entry)
+
+    assert diag["long_poll"]["polls"] == 1
+    assert diag["long_poll"]["last_event"] is None
+    assert diag["long_poll"]["round_trip_histogram"]["<=10"] == 1
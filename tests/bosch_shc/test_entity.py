@@ -3,7 +3,7 @@
 Covers the device_excluded() filter helper, SHCEntity properties, the
 async_added_to_hass/async_will_remove_from_hass subscribe/unsubscribe wiring
 (including the on_state_changed and update_entity_information callbacks), and
-async_remove_stale_entity().
+async_remove_stale_entity() with its batched variant.
 
 Pattern: bypass __init__ via SHCEntity.__new__(SHCEntity) + inject fake device
 via SimpleNamespace. No HA harness, no tests.common.
@@ -15,9 +15,15 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 from custom_components.bosch_shc.const import DOMAIN
 from custom_components.bosch_shc.entity import (
+    SHCDispatchIndex,
     SHCEntity,
+    SHCScenarioIndex,
+    SHCStateWriteCoalescer,
+    async_batch_stale_entity_removal,
     async_remove_stale_entity,
     device_excluded,
+    entry_dispatch_index,
+    entry_state_writer,
 )
 
 # ---------------------------------------------------------------------------
@@ -506,6 +512,13 @@ class TestOnStateChangedCallback:
 # ---------------------------------------------------------------------------
 
 
+def _batch_entry():
+    """Config entry whose runtime data carries the stale-entity batch."""
+    return SimpleNamespace(
+        entry_id="E1", runtime_data=SimpleNamespace(stale_entities=None)
+    )
+
+
 class TestAsyncRemoveStaleEntity:
     def test_removes_entity_when_registered(self):
         """A registered stale entity is looked up by (domain, DOMAIN, unique_id)
@@ -520,6 +533,7 @@ class TestAsyncRemoveStaleEntity:
             asyncio.run(
                 async_remove_stale_entity(
                     hass=SimpleNamespace(),
+                    config_entry=_batch_entry(),
                     entity_domain="light",
                     unique_id="root_dev-1_motionlight",
                 )
@@ -542,9 +556,461 @@ class TestAsyncRemoveStaleEntity:
             asyncio.run(
                 async_remove_stale_entity(
                     hass=SimpleNamespace(),
+                    config_entry=_batch_entry(),
                     entity_domain="light",
                     unique_id="root_dev-1_motionlight",
                 )
             )
 
         fake_ent_reg.async_remove.assert_not_called()
+
+
+    def test_batch_removes_in_one_registry_pass(self):
+        """Inside a batch, candidates from setups running in child tasks are
+        only recorded; one walk over the entry's entities removes them."""
+        fake_ent_reg = MagicMock()
+        registered = [
+            SimpleNamespace(entity_id="light.md2", domain="light", unique_id="md2"),
+            SimpleNamespace(entity_id="update.plug", domain="update", unique_id="p"),
+            SimpleNamespace(entity_id="switch.plug", domain="switch", unique_id="p"),
+        ]
+        entry = _batch_entry()
+
+        async def _setup():
+            async with async_batch_stale_entity_removal(SimpleNamespace(), entry):
+                await asyncio.gather(
+                    async_remove_stale_entity(SimpleNamespace(), entry, "light", "md2"),
+                    async_remove_stale_entity(SimpleNamespace(), entry, "update", "p"),
+                    async_remove_stale_entity(
+                        SimpleNamespace(), entry, "light", "gone"
+                    ),
+                )
+                fake_ent_reg.async_remove.assert_not_called()
+
+        with (
+            patch(
+                "custom_components.bosch_shc.entity.entity_registry.async_get",
+                return_value=fake_ent_reg,
+            ),
+            patch(
+                "custom_components.bosch_shc.entity.entity_registry"
+                ".async_entries_for_config_entry",
+                return_value=registered,
+            ) as entries,
+        ):
+            asyncio.run(_setup())
+
+        entries.assert_called_once_with(fake_ent_reg, "E1")
+        fake_ent_reg.async_get_entity_id.assert_not_called()
+        assert [c.args[0] for c in fake_ent_reg.async_remove.call_args_list] == [
+            "light.md2",
+            "update.plug",
+        ]
+        assert entry.runtime_data.stale_entities is None
+
+    def test_batch_without_candidates_skips_the_registry(self):
+        async def _setup():
+            async with async_batch_stale_entity_removal(
+                SimpleNamespace(), _batch_entry()
+            ):
+                pass
+
+        with patch(
+            "custom_components.bosch_shc.entity.entity_registry.async_get"
+        ) as get_registry:
+            asyncio.run(_setup())
+
+        get_registry.assert_not_called()
+
+    def test_task_outliving_the_batch_removes_at_once(self):
+        """A task spawned during forwarding that only gets to its removal
+        after the batch is done must not record into the finished batch."""
+        fake_ent_reg = MagicMock()
+        fake_ent_reg.async_get_entity_id.return_value = "light.md2"
+        entry = _batch_entry()
+        release = asyncio.Event()
+
+        async def _late_removal():
+            await release.wait()
+            await async_remove_stale_entity(SimpleNamespace(), entry, "light", "md2")
+
+        async def _setup():
+            async with async_batch_stale_entity_removal(SimpleNamespace(), entry):
+                task = asyncio.create_task(_late_removal())
+            release.set()
+            await task
+
+        with patch(
+            "custom_components.bosch_shc.entity.entity_registry.async_get",
+            return_value=fake_ent_reg,
+        ):
+            asyncio.run(_setup())
+
+        fake_ent_reg.async_remove.assert_called_once_with("light.md2")
+
+    def test_nested_batch_joins_the_outer_one(self):
+        fake_ent_reg = MagicMock()
+        registered = [
+            SimpleNamespace(entity_id="light.md2", domain="light", unique_id="md2")
+        ]
+        entry = _batch_entry()
+
+        async def _setup():
+            async with async_batch_stale_entity_removal(SimpleNamespace(), entry):
+                async with async_batch_stale_entity_removal(SimpleNamespace(), entry):
+                    await async_remove_stale_entity(
+                        SimpleNamespace(), entry, "light", "md2"
+                    )
+                fake_ent_reg.async_remove.assert_not_called()
+
+        with (
+            patch(
+                "custom_components.bosch_shc.entity.entity_registry.async_get",
+                return_value=fake_ent_reg,
+            ),
+            patch(
+                "custom_components.bosch_shc.entity.entity_registry"
+                ".async_entries_for_config_entry",
+                return_value=registered,
+            ),
+        ):
+            asyncio.run(_setup())
+
+        fake_ent_reg.async_remove.assert_called_once_with("light.md2")
+
+
+# ---------------------------------------------------------------------------
+# SHCStateWriteCoalescer
+# ---------------------------------------------------------------------------
+
+
+class TestStateWriteCoalescer:
+    @staticmethod
+    def _entity(entity_id="switch.a"):
+        # MagicMock, not SimpleNamespace: entities are queued by identity.
+        return MagicMock(hass=object(), entity_id=entity_id)
+
+    def test_one_write_per_entity_per_batch(self):
+        a, b = self._entity("switch.a"), self._entity("switch.b")
+
+        async def batch():
+            writer = SHCStateWriteCoalescer(
+                SimpleNamespace(loop=asyncio.get_running_loop())
+            )
+            # One long-poll batch: three services of `a`, one of `b`, no yield.
+            for entity in (a, a, b, a):
+                writer.async_schedule(entity)
+            a.async_write_ha_state.assert_not_called()
+            await asyncio.sleep(0)
+            return writer
+
+        writer = asyncio.run(batch())
+        a.async_write_ha_state.assert_called_once()
+        b.async_write_ha_state.assert_called_once()
+        assert (writer.scheduled, writer.written) == (4, 2)
+
+    def test_next_batch_writes_again(self):
+        a = self._entity()
+
+        async def two_batches():
+            writer = SHCStateWriteCoalescer(
+                SimpleNamespace(loop=asyncio.get_running_loop())
+            )
+            writer.async_schedule(a)
+            await asyncio.sleep(0)
+            writer.async_schedule(a)
+            await asyncio.sleep(0)
+
+        asyncio.run(two_batches())
+        assert a.async_write_ha_state.call_count == 2
+
+    def test_removed_entity_and_failing_write_do_not_block_others(self):
+        removed = self._entity("switch.removed")
+        removed.hass = None
+        failing = self._entity("switch.failing")
+        failing.async_write_ha_state.side_effect = RuntimeError("boom")
+        ok = self._entity("switch.ok")
+
+        async def batch():
+            writer = SHCStateWriteCoalescer(
+                SimpleNamespace(loop=asyncio.get_running_loop())
+            )
+            for entity in (removed, failing, ok):
+                writer.async_schedule(entity)
+            await asyncio.sleep(0)
+
+        asyncio.run(batch())
+        removed.async_write_ha_state.assert_not_called()
+        ok.async_write_ha_state.assert_called_once()
+
+    def test_cancel_drops_pending_writes(self):
+        a = self._entity()
+
+        async def cancelled():
+            writer = SHCStateWriteCoalescer(
+                SimpleNamespace(loop=asyncio.get_running_loop())
+            )
+            writer.async_schedule(a)
+            writer.async_cancel()
+            await asyncio.sleep(0)
+
+        asyncio.run(cancelled())
+        a.async_write_ha_state.assert_not_called()
+
+    def test_entry_state_writer_lookup(self):
+        writer = SHCStateWriteCoalescer(SimpleNamespace(loop=None))
+        entry = SimpleNamespace(runtime_data=SimpleNamespace(state_writer=writer))
+        hass = SimpleNamespace(
+            config_entries=SimpleNamespace(async_get_entry=lambda _id: entry)
+        )
+        assert entry_state_writer(hass, "e1") is writer
+        assert entry_state_writer(None, "e1") is None
+        assert entry_state_writer(MagicMock(), "e1") is None
+
+    def test_shc_entity_routes_callbacks_through_writer(self):
+        svc = FakeService()
+        ent = TrackingEntity()
+        ent._device = SimpleNamespace(
+            deleted=False,
+            device_services=[svc],
+            subscribe_callback=lambda eid, cb: None,
+        )
+        ent._entry_id = "entry1"
+        ent.entity_id = "switch.test"
+        writer = MagicMock(spec=SHCStateWriteCoalescer)
+        with (
+            patch(
+                "homeassistant.helpers.entity.Entity.async_added_to_hass",
+                new=AsyncMock(return_value=None),
+            ),
+            patch(
+                "custom_components.bosch_shc.entity.entry_state_writer",
+                return_value=writer,
+            ),
+        ):
+            asyncio.run(ent.async_added_to_hass())
+        on_state_changed = next(c[2] for c in svc.calls if c[0] == "subscribe")
+        on_state_changed()
+        on_state_changed()
+        assert writer.async_schedule.call_count == 2
+        assert getattr(ent, "schedule_calls", 0) == 0
+
+
+class _FingerprintedEntity(TrackingEntity):
+    _state_fingerprint_attrs = ("native_value",)
+
+    def __init__(self):
+        self.native_value = 1
+        self._device = SimpleNamespace(status="AVAILABLE")
+
+
+class TestSkipUnchangedWrites:
+    def test_unchanged_state_is_not_rewritten(self):
+        ent = _FingerprintedEntity()
+        ent._schedule_state_write()
+        ent._schedule_state_write()
+        assert ent.schedule_calls == 1
+        ent.native_value = 2
+        ent._schedule_state_write()
+        assert ent.schedule_calls == 2
+
+    def test_availability_change_is_written(self):
+        ent = _FingerprintedEntity()
+        ent._schedule_state_write()
+        ent._device.status = "UNAVAILABLE"
+        ent._schedule_state_write()
+        assert ent.schedule_calls == 2
+
+    def test_suppressed_writes_are_counted(self):
+        ent = _FingerprintedEntity()
+        ent._state_writer = MagicMock(spec=SHCStateWriteCoalescer)
+        ent._state_writer.suppressed = 0
+        for _ in range(3):
+            ent._schedule_state_write()
+        ent._state_writer.async_schedule.assert_called_once_with(ent)
+        assert ent._state_writer.suppressed == 2
+
+    def test_not_opted_in_always_writes(self):
+        ent = TrackingEntity()
+        ent._schedule_state_write()
+        ent._schedule_state_write()
+        assert ent.schedule_calls == 2
+
+    def test_sensor_and_binary_sensor_opt_in(self):
+        from custom_components.bosch_shc.binary_sensor import SHCBinarySensor
+        from custom_components.bosch_shc.sensor import SHCSensor
+
+        assert "native_value" in SHCSensor._state_fingerprint_attrs
+        assert "is_on" in SHCBinarySensor._state_fingerprint_attrs
+
+
+# ---------------------------------------------------------------------------
+# SHCDispatchIndex
+# ---------------------------------------------------------------------------
+
+
+class _IndexedService:
+    """boschshcpy-shaped service: callbacks keyed by subscriber, fired on push."""
+
+    def __init__(self, service_id):
+        self.id = service_id
+        self._callbacks = {}
+
+    def subscribe_callback(self, key, cb):
+        self._callbacks[key] = cb
+
+    def unsubscribe_callback(self, key):
+        self._callbacks.pop(key, None)
+
+    def push(self):
+        for cb in list(self._callbacks.values()):
+            cb()
+
+
+def _indexed_device(*service_ids):
+    services = {sid: _IndexedService(sid) for sid in service_ids}
+    device = SimpleNamespace(id="dev1", device_services=list(services.values()))
+    return device, services
+
+
+class TestDispatchIndex:
+    def test_push_wakes_only_dependent_entities(self):
+        device, services = _indexed_device("PowerMeter", "PowerSwitch", "Routing")
+        index = SHCDispatchIndex()
+        power, switch, unscoped = MagicMock(), MagicMock(), MagicMock()
+        index.async_register(device, power, ("PowerMeter",), power.on_change)
+        index.async_register(device, switch, ("PowerSwitch",), switch.on_change)
+        index.async_register(device, unscoped, None, unscoped.on_change)
+
+        services["PowerMeter"].push()
+
+        power.on_change.assert_called_once_with()
+        switch.on_change.assert_not_called()
+        unscoped.on_change.assert_called_once_with()
+        assert index.dependents("dev1", "Routing") == [unscoped]
+
+    def test_one_subscription_per_service(self):
+        device, services = _indexed_device("PowerMeter")
+        index = SHCDispatchIndex()
+        for _ in range(5):
+            entity = MagicMock()
+            index.async_register(device, entity, None, entity.on_change)
+        assert len(services["PowerMeter"]._callbacks) == 1
+        assert index.as_dict() == {"routes": 1, "subscriptions": 5, "dispatched": 0}
+
+    def test_unregister_releases_service_after_last_dependent(self):
+        device, services = _indexed_device("PowerMeter")
+        index = SHCDispatchIndex()
+        a, b = MagicMock(), MagicMock()
+        index.async_register(device, a, None, a.on_change)
+        index.async_register(device, b, None, b.on_change)
+        index.async_unregister(device, a)
+        services["PowerMeter"].push()
+        a.on_change.assert_not_called()
+        b.on_change.assert_called_once_with()
+        index.async_unregister(device, b)
+        assert services["PowerMeter"]._callbacks == {}
+
+    def test_clear_unsubscribes_everything(self):
+        device, services = _indexed_device("PowerMeter", "PowerSwitch")
+        index = SHCDispatchIndex()
+        entity = MagicMock()
+        index.async_register(device, entity, None, entity.on_change)
+        index.async_clear()
+        assert all(not svc._callbacks for svc in services.values())
+        assert index.as_dict()["routes"] == 0
+
+    def test_entry_dispatch_index_lookup(self):
+        index = SHCDispatchIndex()
+        entry = SimpleNamespace(runtime_data=SimpleNamespace(dispatch_index=index))
+        hass = SimpleNamespace(
+            config_entries=SimpleNamespace(async_get_entry=lambda _id: entry)
+        )
+        assert entry_dispatch_index(hass, "e1") is index
+        assert entry_dispatch_index(None, "e1") is None
+        assert entry_dispatch_index(MagicMock(), "e1") is None
+
+    def _described_entity(self, device, service_ids):
+        ent = TrackingEntity()
+        ent._device = device
+        ent._entry_id = "entry1"
+        ent.entity_id = "sensor.test"
+        ent.entity_description = SimpleNamespace(service_ids=service_ids)
+        return ent
+
+    def test_entity_registers_description_services(self):
+        device, services = _indexed_device("PowerMeter", "PowerSwitch")
+        device.subscribe_callback = lambda eid, cb: None
+        device.unsubscribe_callback = lambda eid: None
+        ent = self._described_entity(device, ("PowerMeter",))
+        index = SHCDispatchIndex()
+        with (
+            patch(
+                "homeassistant.helpers.entity.Entity.async_added_to_hass",
+                new=AsyncMock(return_value=None),
+            ),
+            patch(
+                "homeassistant.helpers.entity.Entity.async_will_remove_from_hass",
+                new=AsyncMock(return_value=None),
+            ),
+            patch(
+                "custom_components.bosch_shc.entity.entry_dispatch_index",
+                return_value=index,
+            ),
+        ):
+            asyncio.run(ent.async_added_to_hass())
+            services["PowerSwitch"].push()
+            assert getattr(ent, "schedule_calls", 0) == 0
+            services["PowerMeter"].push()
+            assert ent.schedule_calls == 1
+            asyncio.run(ent.async_will_remove_from_hass())
+        assert services["PowerMeter"]._callbacks == {}
+
+    def test_entity_without_index_subscribes_only_its_services(self):
+        device, services = _indexed_device("PowerMeter", "PowerSwitch")
+        device.subscribe_callback = lambda eid, cb: None
+        ent = self._described_entity(device, ("PowerMeter",))
+        with patch(
+            "homeassistant.helpers.entity.Entity.async_added_to_hass",
+            new=AsyncMock(return_value=None),
+        ):
+            asyncio.run(ent.async_added_to_hass())
+        assert list(services["PowerMeter"]._callbacks) == ["sensor.test"]
+        assert services["PowerSwitch"]._callbacks == {}
+
+    def test_sensor_descriptions_name_their_services(self):
+        from custom_components.bosch_shc.sensor import (
+            POWER_SENSOR,
+            SENSOR_DESCRIPTIONS,
+            TERMINAL_TEMPERATURE_SENSOR,
+        )
+
+        assert SENSOR_DESCRIPTIONS[POWER_SENSOR].service_ids == ("PowerMeter",)
+        assert SENSOR_DESCRIPTIONS[TERMINAL_TEMPERATURE_SENSOR].service_ids is None
+
+
+class TestScenarioIndex:
+    def _index(self, *scenarios):
+        session = SimpleNamespace(scenarios=list(scenarios))
+        return session, SHCScenarioIndex(session)
+
+    def test_duplicate_names_share_a_bucket(self):
+        a = SimpleNamespace(id="s1", name="Night")
+        b = SimpleNamespace(id="s2", name="Night")
+        _, index = self._index(a, b)
+        assert index.get("Night") == [a, b]
+        assert index.get("Day") == []
+
+    def test_rename_rekeys_the_scenario(self):
+        scenario = SimpleNamespace(id="s1", name="Night")
+        _, index = self._index(scenario)
+        index.async_scenario_triggered("s1", "Sleep")
+        assert index.get("Night") == []
+        assert index.get("Sleep") == [scenario]
+
+    def test_unknown_scenario_in_the_session_rebuilds(self):
+        session, index = self._index()
+        scenario = SimpleNamespace(id="s1", name="Night")
+        session.scenarios.append(scenario)
+        index.async_scenario_triggered("s1", "Night")
+        assert index.get("Night") == [scenario]
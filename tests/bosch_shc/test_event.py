@@ -7,9 +7,8 @@ SHCScenarioEvent, LightControlButtonEvent) - their __init__ wiring,
 async_added_to_hass subscribe wiring, async_will_remove_from_hass
 unsubscribe wiring, _event_callback dedup/guard logic, _dispatch_event
 attribute payloads, device_* properties - plus a few entity.py helpers
-(async_get_device_id, async_remove_devices, async_migrate_to_new_unique_id,
-SHCEntity._update_attr) that were historically covered alongside event.py,
-and slugify-based entity_id validity checks for Bosch device/scenario names.
+(async_get_device_id, async_remove_devices, SHCEntity._update_attr) that were
+historically covered alongside event.py, and slugify-based entity_id validity checks for Bosch device/scenario names.
 
 Pattern: this is a pure-unit test suite. Most tests bypass __init__ via
 Cls.__new__(Cls) + SimpleNamespace/MagicMock mocks; a few exercise the real
@@ -41,7 +40,6 @@ from custom_components.bosch_shc.const import (
 from custom_components.bosch_shc.entity import (
     SHCEntity,
     async_get_device_id,
-    async_migrate_to_new_unique_id,
     async_remove_devices,
 )
 from custom_components.bosch_shc.event import (
@@ -735,8 +733,8 @@ class TestEventSetupLightControlsStaleCleanup:
         assert not any(isinstance(e, LightControlButtonEvent) for e in collected)
         remove_mock.assert_awaited_once()
         args = remove_mock.await_args.args
-        assert args[1] == Platform.EVENT
-        assert args[2] == "root1_lc1_button"
+        assert args[2] == Platform.EVENT
+        assert args[3] == "root1_lc1_button"
 
     def test_excluded_light_control_removes_stale_entity(
         self, mock_config_entry, mock_session
@@ -754,8 +752,8 @@ class TestEventSetupLightControlsStaleCleanup:
         assert not any(isinstance(e, LightControlButtonEvent) for e in collected)
         remove_mock.assert_awaited_once()
         args = remove_mock.await_args.args
-        assert args[1] == Platform.EVENT
-        assert args[2] == "root1_lc1_button"
+        assert args[2] == Platform.EVENT
+        assert args[3] == "root1_lc1_button"
 
     def test_keypad_present_does_not_remove_entity(
         self, mock_config_entry, mock_session
@@ -2957,7 +2955,7 @@ class TestEventEntityStructureExtended:
 
 # ===========================================================================
 # entity.py helpers (async_get_device_id, async_remove_devices,
-# async_migrate_to_new_unique_id, SHCEntity._update_attr / else-branch)
+# SHCEntity._update_attr / else-branch)
 # ===========================================================================
 
 
@@ -3058,104 +3056,6 @@ class TestAsyncRemoveDevices:
         assert update_calls == []
 
 
-class TestAsyncMigrateToNewUniqueId:
-    """async_migrate_to_new_unique_id migrates old->new unique_id via entity registry."""
-
-    def _make_device(self, serial="SER-001", dev_id="hdm:dev:1", root_id="root:1"):
-        return SimpleNamespace(
-            serial=serial,
-            id=dev_id,
-            root_device_id=root_id,
-        )
-
-    def test_entity_found_migrates_unique_id(self):
-        ent_registry = MagicMock()
-        ent_registry.async_get_entity_id.return_value = "sensor.some_entity"
-
-        async def _run_migrate():
-            with patch(
-                "custom_components.bosch_shc.entity.entity_registry.async_get",
-                return_value=ent_registry,
-            ):
-                dev = self._make_device(serial="OLD-SER", dev_id="hdm:new:id", root_id="root:new")
-                await async_migrate_to_new_unique_id(
-                    object(), "sensor", dev
-                )
-
-        asyncio.run(_run_migrate())
-        ent_registry.async_update_entity.assert_called_once()
-        call_kwargs = ent_registry.async_update_entity.call_args[1]
-        assert call_kwargs["new_unique_id"] == "root:new_hdm:new:id"
-
-    def test_entity_not_found_skips_migration(self):
-        ent_registry = MagicMock()
-        ent_registry.async_get_entity_id.return_value = None
-
-        async def _run_migrate():
-            with patch(
-                "custom_components.bosch_shc.entity.entity_registry.async_get",
-                return_value=ent_registry,
-            ):
-                dev = self._make_device()
-                await async_migrate_to_new_unique_id(object(), "sensor", dev)
-
-        asyncio.run(_run_migrate())
-        ent_registry.async_update_entity.assert_not_called()
-
-    def test_with_attr_name_appends_lowercase(self):
-        ent_registry = MagicMock()
-        ent_registry.async_get_entity_id.return_value = "sensor.with_attr"
-
-        async def _run_migrate():
-            with patch(
-                "custom_components.bosch_shc.entity.entity_registry.async_get",
-                return_value=ent_registry,
-            ):
-                dev = self._make_device(serial="SER", dev_id="hdm:d:1", root_id="root:r")
-                await async_migrate_to_new_unique_id(
-                    object(), "sensor", dev, attr_name="Temperature"
-                )
-
-        asyncio.run(_run_migrate())
-        call_kwargs = ent_registry.async_update_entity.call_args[1]
-        assert call_kwargs["new_unique_id"] == "root:r_hdm:d:1_temperature"
-
-    def test_value_error_on_update_logs_warning(self):
-        """ValueError from async_update_entity logs a warning, does not raise."""
-        ent_registry = MagicMock()
-        ent_registry.async_get_entity_id.return_value = "sensor.duplicate"
-        ent_registry.async_update_entity.side_effect = ValueError("already exists")
-
-        async def _run_migrate():
-            with patch(
-                "custom_components.bosch_shc.entity.entity_registry.async_get",
-                return_value=ent_registry,
-            ):
-                dev = self._make_device()
-                await async_migrate_to_new_unique_id(object(), "sensor", dev)
-
-        asyncio.run(_run_migrate())  # must not raise
-
-    def test_old_unique_id_override_used_for_lookup(self):
-        ent_registry = MagicMock()
-        ent_registry.async_get_entity_id.return_value = None
-
-        async def _run_migrate():
-            with patch(
-                "custom_components.bosch_shc.entity.entity_registry.async_get",
-                return_value=ent_registry,
-            ):
-                dev = self._make_device(serial="SER-X")
-                await async_migrate_to_new_unique_id(
-                    object(), "sensor", dev, old_unique_id="my-custom-old-id"
-                )
-
-        asyncio.run(_run_migrate())
-        ent_registry.async_get_entity_id.assert_called_once_with(
-            "sensor", DOMAIN, "my-custom-old-id"
-        )
-
-
 class TestSHCEntityUpdateAttr:
     """_update_attr default implementation is a no-op pass (line 85)."""
 
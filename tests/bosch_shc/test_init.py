@@ -35,6 +35,7 @@ from homeassistant.const import (
     ATTR_ID,
     ATTR_NAME,
     EVENT_HOMEASSISTANT_STOP,
+    Platform,
 )
 from homeassistant.exceptions import ServiceValidationError
 
@@ -49,11 +50,14 @@ from custom_components.bosch_shc.const import (
     OPT_CHILD_LOCK_ENABLED,
     OPT_LONG_POLL_TIMEOUT,
     OPT_PRESENCE_ENTITY,
+    SERVICE_BULK_COMMAND,
     SERVICE_EXPORT_ZIGBEE_TOPOLOGY,
     SERVICE_REFRESH_ZIGBEE_ROUTING,
     SERVICE_TRIGGER_RAWSCAN,
     SERVICE_TRIGGER_SCENARIO,
 )
+from custom_components.bosch_shc.data import SHCEntryRegistry, async_get_entry_registry
+from custom_components.bosch_shc.entity import SHCScenarioIndex
 
 SERVICES_YAML = (
     pathlib.Path(__file__).parent.parent.parent
@@ -137,6 +141,8 @@ def _make_fake_entry(entry_id="test_entry_id", title="Test SHC",
         "host": host,
     }
     entry.options = options or {}
+    entry.version = 1
+    entry.minor_version = 2
     entry.add_update_listener = MagicMock(return_value=MagicMock())
     entry.async_on_unload = MagicMock()
     # SHCZigbeeRoutingCoordinator.async_config_entry_first_refresh (called
@@ -265,6 +271,24 @@ def _run(coro):
     return asyncio.run(coro)
 
 
+def _register_entries(hass, *entries):
+    """Register the set-up entries (those with runtime_data) as setup would."""
+    if not isinstance(hass.data, dict):
+        hass.data = {}
+    registry = async_get_entry_registry(hass)
+    for entry in entries:
+        if hasattr(entry, "runtime_data"):
+            registry.async_add(entry.entry_id, entry.runtime_data)
+
+
+def _scenario_runtime(*scenarios):
+    """runtime_data stand-in carrying the scenario index setup would build."""
+    session = SimpleNamespace(scenarios=list(scenarios))
+    return SimpleNamespace(
+        title="SHC Test", session=session, scenario_index=SHCScenarioIndex(session)
+    )
+
+
 # ---------------------------------------------------------------------------
 # Tests: async_setup_entry — happy path (no cert)
 # ---------------------------------------------------------------------------
@@ -306,6 +330,14 @@ class TestAsyncSetupEntryHappyPath:
         fwd_args = hass.config_entries.async_forward_entry_setups.call_args
         assert fwd_args[0][0] is entry  # first positional arg = entry
 
+    def test_poll_scheduler_started_after_platforms(
+        self, fake_hass, fake_entry, fake_session
+    ):
+        """Polled resources' first fetches are only released once the long
+        poll is up and every platform has registered its resources."""
+        _, _, entry, _ = self._do_setup(fake_hass, fake_entry, fake_session)
+        assert entry.runtime_data.poll_scheduler._started is True
+
     def test_services_registered(self, fake_hass, fake_entry, fake_session):
         """Services are registered in async_setup (module-level Bronze action); test
         must call async_setup first so the handlers exist.
@@ -328,13 +360,10 @@ class TestAsyncSetupEntryHappyPath:
         listen_args = [c.args[0] for c in hass.bus.async_listen_once.call_args_list]
         assert EVENT_HOMEASSISTANT_STOP in listen_args
 
-    def test_update_listener_not_registered(self, fake_hass, fake_entry, fake_session):
-        """B2: add_update_listener must NOT be called — HA auto-reloads on options_flow
-        async_create_entry; registering an extra reload listener caused a double-reload
-        and a DeprecationWarning in HA 2026.6 (hard error in 2026.12).
-        """
+    def test_update_listener_registered(self, fake_hass, fake_entry, fake_session):
+        """B2: the one update listener applies options; the flow never reloads."""
         _, _, entry, _ = self._do_setup(fake_hass, fake_entry, fake_session)
-        entry.add_update_listener.assert_not_called()
+        entry.add_update_listener.assert_called_once()
 
     def test_cert_check_unsub_stored(self, fake_hass, fake_entry, fake_session):
         _, hass, entry, _ = self._do_setup(fake_hass, fake_entry, fake_session)
@@ -346,6 +375,287 @@ class TestAsyncSetupEntryHappyPath:
         fake_session.async_init.assert_awaited_once()
 
 
+# ---------------------------------------------------------------------------
+# Tests: async_setup_entry — only platforms with entity sources are forwarded
+# ---------------------------------------------------------------------------
+
+class TestCapabilityForwarding:
+    def _do_setup(self, fake_hass, fake_entry, session):
+        from custom_components.bosch_shc.__init__ import async_setup_entry
+
+        from .conftest import _EMPTY_DEVICE_BUCKETS
+
+        session.device_helper = SimpleNamespace(**_EMPTY_DEVICE_BUCKETS)
+        with (
+            patch(PATCH_SESSION, return_value=session),
+            patch(PATCH_DR_GET, return_value=_make_fake_device_registry()),
+            patch(PATCH_PARSE_CERT, return_value=None),
+            patch(PATCH_TRACK_INTERVAL, return_value=MagicMock()),
+        ):
+            assert _run(async_setup_entry(fake_hass, fake_entry)) is True
+        return fake_hass.config_entries.async_forward_entry_setups
+
+    def test_platforms_without_devices_are_skipped(
+        self, fake_hass, fake_entry, fake_session
+    ):
+        forward = self._do_setup(fake_hass, fake_entry, fake_session)
+
+        forwarded = forward.call_args[0][1]
+        assert Platform.COVER not in forwarded
+        assert Platform.SENSOR in forwarded
+        assert fake_entry.runtime_data.loaded_platforms == set(forwarded)
+
+    def test_new_device_loads_its_platform(self, fake_hass, fake_entry, fake_session):
+        forward = self._do_setup(fake_hass, fake_entry, fake_session)
+        (_device_cls, new_device), = [
+            c.args[0] for c in fake_session.subscribe.call_args_list
+        ]
+        fake_hass.async_create_task = MagicMock(side_effect=_run)
+        forward.reset_mock()
+
+        fake_session.device_helper.shutter_controls = [MagicMock()]
+        new_device(MagicMock(id="hdm:ZigBee:shutter"))
+        new_device(MagicMock(id="hdm:ZigBee:shutter"))
+
+        forward.assert_awaited_once_with(fake_entry, [Platform.COVER])
+        assert Platform.COVER in fake_entry.runtime_data.loaded_platforms
+
+    def test_unload_only_unloads_forwarded_platforms(
+        self, fake_hass, fake_entry, fake_session
+    ):
+        from custom_components.bosch_shc.__init__ import async_unload_entry
+
+        forward = self._do_setup(fake_hass, fake_entry, fake_session)
+        _run(async_unload_entry(fake_hass, fake_entry))
+
+        fake_hass.config_entries.async_unload_platforms.assert_awaited_once_with(
+            fake_entry, set(forward.call_args[0][1])
+        )
+
+
+# ---------------------------------------------------------------------------
+# Tests: async_setup_entry — warm start from the stored snapshot
+# ---------------------------------------------------------------------------
+
+PATCH_INIT_FROM_SNAPSHOT = "custom_components.bosch_shc.__init__.async_init_from_snapshot"
+PATCH_FETCH = "custom_components.bosch_shc.__init__.async_fetch"
+PATCH_RECONCILE = "custom_components.bosch_shc.__init__.async_reconcile"
+
+
+class TestWarmStart:
+    """A stored snapshot replaces async_init's enumeration; the live session is
+    reconciled (then polled) in the background once the platforms are up."""
+
+    def _do_setup(
+        self,
+        hass,
+        entry,
+        session,
+        store,
+        *,
+        in_sync=True,
+        fetch_error=None,
+        reconcile_error=None,
+    ):
+        from custom_components.bosch_shc.__init__ import async_setup_entry
+        from custom_components.bosch_shc.snapshot import _REQUIRED_CALLS
+
+        calls = {name: {} for name in _REQUIRED_CALLS}
+        store.async_load.return_value = {"host": entry.data["host"], "calls": calls}
+        order = []
+        hass.config_entries.async_forward_entry_setups.side_effect = (
+            lambda *_: order.append("platforms")
+        )
+        session.start_polling.side_effect = lambda: order.append("polling")
+
+        async def _setup_and_settle():
+            result = await async_setup_entry(hass, entry)
+            await asyncio.gather(*entry._background_tasks, return_exceptions=True)
+            return result
+
+        with (
+            patch(PATCH_SESSION, return_value=session),
+            patch(PATCH_DR_GET, return_value=_make_fake_device_registry()),
+            patch(PATCH_PARSE_CERT, return_value=None),
+            patch(PATCH_TRACK_INTERVAL, return_value=MagicMock()),
+            patch(PATCH_INIT_FROM_SNAPSHOT, new_callable=AsyncMock) as replay,
+            patch(
+                PATCH_FETCH,
+                new_callable=AsyncMock,
+                return_value=calls,
+                side_effect=fetch_error,
+            ),
+            patch(
+                PATCH_RECONCILE,
+                new_callable=AsyncMock,
+                return_value=in_sync,
+                side_effect=reconcile_error,
+            ),
+            patch(
+                "custom_components.bosch_shc.coordinator.SHCPollScheduler.async_start",
+                side_effect=lambda: order.append("scheduler"),
+            ),
+        ):
+            assert _run(_setup_and_settle()) is True
+        return replay, order
+
+    def test_platforms_forwarded_before_any_round_trip(
+        self, fake_hass, fake_entry, fake_session, mock_snapshot_store
+    ):
+        replay, order = self._do_setup(
+            fake_hass, fake_entry, fake_session, mock_snapshot_store
+        )
+
+        replay.assert_awaited_once()
+        fake_session.async_init.assert_not_awaited()
+        # Polled resources wait for the reconcile to start the long poll.
+        assert order == ["platforms", "polling", "scheduler"]
+        mock_snapshot_store.async_delay_save.assert_called_once()
+        fake_hass.config_entries.async_schedule_reload.assert_not_called()
+
+    def test_model_change_reloads(
+        self, fake_hass, fake_entry, fake_session, mock_snapshot_store
+    ):
+        _, order = self._do_setup(
+            fake_hass, fake_entry, fake_session, mock_snapshot_store, in_sync=False
+        )
+
+        assert order == ["platforms"]
+        mock_snapshot_store.async_delay_save.assert_called_once()
+        fake_hass.config_entries.async_schedule_reload.assert_called_once_with(
+            fake_entry.entry_id
+        )
+
+    def test_unreachable_controller_drops_snapshot_and_reloads(
+        self, fake_hass, fake_entry, fake_session, mock_snapshot_store
+    ):
+        _, order = self._do_setup(
+            fake_hass,
+            fake_entry,
+            fake_session,
+            mock_snapshot_store,
+            fetch_error=SHCConnectionError("unreachable"),
+        )
+
+        assert order == ["platforms"]
+        mock_snapshot_store.async_remove.assert_awaited_once()
+        fake_hass.config_entries.async_schedule_reload.assert_called_once_with(
+            fake_entry.entry_id
+        )
+
+    def test_unexpected_reconcile_error_drops_snapshot_and_reloads(
+        self, fake_hass, fake_entry, fake_session, mock_snapshot_store
+    ):
+        _, order = self._do_setup(
+            fake_hass,
+            fake_entry,
+            fake_session,
+            mock_snapshot_store,
+            reconcile_error=KeyError("deviceModel"),
+        )
+
+        assert order == ["platforms"]
+        mock_snapshot_store.async_remove.assert_awaited_once()
+        fake_hass.config_entries.async_schedule_reload.assert_called_once_with(
+            fake_entry.entry_id
+        )
+
+    def test_snapshot_removed_with_the_entry(
+        self, fake_hass, fake_entry, mock_snapshot_store
+    ):
+        from custom_components.bosch_shc.__init__ import async_remove_entry
+
+        _run(async_remove_entry(fake_hass, fake_entry))
+        mock_snapshot_store.async_remove.assert_awaited_once()
+
+    def test_unload_before_reconcile_closes_the_session(
+        self, fake_hass, fake_entry, fake_session
+    ):
+        from custom_components.bosch_shc.__init__ import async_unload_entry
+        from custom_components.bosch_shc.data import SHCData
+
+        fake_session.stop_polling = AsyncMock(side_effect=SHCSessionError("Not polling!"))
+        fake_session.api.close = AsyncMock()
+        fake_entry.runtime_data = SHCData(
+            session=fake_session, shc_device=MagicMock(), title="Test SHC"
+        )
+
+        assert _run(async_unload_entry(fake_hass, fake_entry)) is True
+        fake_session.api.close.assert_awaited_once()
+
+
+# ---------------------------------------------------------------------------
+# Tests: async_migrate_entry — 1.1 -> 1.2 unique id migration
+# ---------------------------------------------------------------------------
+
+PATCH_MIGRATE_IDS = "custom_components.bosch_shc.__init__.async_migrate_unique_ids"
+
+
+class TestMigrateEntry:
+    def _migrate(self, hass, entry, session):
+        from custom_components.bosch_shc.__init__ import async_migrate_entry
+
+        entry.minor_version = 1
+        session.api.close = AsyncMock()
+        with (
+            patch(PATCH_SESSION, return_value=session),
+            patch(PATCH_MIGRATE_IDS, new_callable=AsyncMock) as migrate_ids,
+        ):
+            result = _run(async_migrate_entry(hass, entry))
+        return result, migrate_ids
+
+    def test_migrates_from_the_snapshot_without_a_round_trip(
+        self, fake_hass, fake_entry, fake_session, mock_snapshot_store
+    ):
+        from custom_components.bosch_shc.snapshot import _REQUIRED_CALLS
+
+        mock_snapshot_store.async_load.return_value = {
+            "host": fake_entry.data["host"],
+            "calls": {name: {} for name in _REQUIRED_CALLS},
+        }
+        with patch(PATCH_INIT_FROM_SNAPSHOT, new_callable=AsyncMock) as replay:
+            result, migrate_ids = self._migrate(fake_hass, fake_entry, fake_session)
+
+        assert result is True
+        replay.assert_awaited_once()
+        fake_session.async_init.assert_not_awaited()
+        migrate_ids.assert_awaited_once_with(fake_hass, fake_entry, fake_session)
+        fake_session.api.close.assert_awaited_once()
+
+    def test_unreachable_controller_leaves_it_to_setup(
+        self, fake_hass, fake_entry, fake_session
+    ):
+        fake_session.async_init = AsyncMock(side_effect=SHCConnectionError("down"))
+
+        result, migrate_ids = self._migrate(fake_hass, fake_entry, fake_session)
+
+        assert result is True
+        migrate_ids.assert_not_awaited()
+        fake_session.api.close.assert_awaited_once()
+
+    def test_newer_major_version_is_not_migrated(self, fake_hass, fake_entry):
+        from custom_components.bosch_shc.__init__ import async_migrate_entry
+
+        fake_entry.version = 2
+        assert _run(async_migrate_entry(fake_hass, fake_entry)) is False
+
+    def test_setup_migrates_an_entry_still_at_1_1(
+        self, fake_hass, fake_entry, fake_session
+    ):
+        from custom_components.bosch_shc.__init__ import async_setup_entry
+
+        fake_entry.minor_version = 1
+        with (
+            patch(PATCH_SESSION, return_value=fake_session),
+            patch(PATCH_DR_GET, return_value=_make_fake_device_registry()),
+            patch(PATCH_PARSE_CERT, return_value=None),
+            patch(PATCH_TRACK_INTERVAL, return_value=MagicMock()),
+            patch(PATCH_MIGRATE_IDS, new_callable=AsyncMock) as migrate_ids,
+        ):
+            assert _run(async_setup_entry(fake_hass, fake_entry)) is True
+        migrate_ids.assert_awaited_once_with(fake_hass, fake_entry, fake_session)
+
+
 # ---------------------------------------------------------------------------
 # Tests: async_setup_entry — update_state branch
 # ---------------------------------------------------------------------------
@@ -933,18 +1243,21 @@ class TestAsyncUnloadEntry:
         _, hass, entry, _, _ = self._setup_and_unload(fake_hass, fake_entry, fake_session)
         hass.config_entries.async_unload_platforms.assert_called_once()
 
+    def test_unload_drops_entry_from_registry(self, fake_hass, fake_entry, fake_session):
+        _, hass, _, _, _ = self._setup_and_unload(fake_hass, fake_entry, fake_session)
+        assert async_get_entry_registry(hass).resolve() == []
+
 
 # ---------------------------------------------------------------------------
-# Tests: B2 — no update listener (options-flow auto-reload)
+# Tests: B2 — a single update listener hot-applies options
 # ---------------------------------------------------------------------------
 
-class TestB2NoUpdateListener:
-    """B2: async_update_options and add_update_listener were removed.
+class TestB2UpdateListener:
+    """B2: one update listener, and no reload from the options flow itself.
 
-    HA auto-reloads the config entry when OptionsFlow.async_create_entry is
-    called (the options flow already does this).  Registering an extra
-    add_update_listener that also calls async_reload caused a double-reload
-    and a DeprecationWarning in 2026.6 / hard error in 2026.12.
+    The options flow is a plain OptionsFlow; the listener applies the change
+    (options.py) and only reloads for options it cannot hot-apply, so an
+    options save never reloads the entry twice.
     """
 
     def test_async_update_options_removed(self):
@@ -954,11 +1267,14 @@ class TestB2NoUpdateListener:
             "async_update_options was removed (B2 fix) but still present"
         )
 
-    def test_add_update_listener_not_called_during_setup(
+    def test_options_listener_registered_once_during_setup(
         self, fake_hass, fake_entry, fake_session
     ):
-        """Setup must not register an add_update_listener (B2 fix)."""
-        from custom_components.bosch_shc.__init__ import async_setup_entry
+        """Setup registers exactly the options listener."""
+        from custom_components.bosch_shc.__init__ import (
+            _async_options_updated,
+            async_setup_entry,
+        )
 
         session = fake_session
         hass = fake_hass
@@ -973,7 +1289,8 @@ class TestB2NoUpdateListener:
         ):
             _run(async_setup_entry(hass, entry))
 
-        entry.add_update_listener.assert_not_called()
+        entry.add_update_listener.assert_called_once_with(_async_options_updated)
+        assert entry.runtime_data.applied_options == dict(entry.options)
 
 
 # ---------------------------------------------------------------------------
@@ -1088,6 +1405,39 @@ class TestServiceHandlers:
         _run(handler(call_obj))
         fake_scenario.async_trigger.assert_awaited_once()
 
+    def test_scenario_service_triggers_a_list_concurrently(
+        self, fake_hass, fake_entry, fake_session
+    ):
+        """Every named scenario is in flight before any of them finishes."""
+        started = []
+        release = asyncio.Event()
+
+        def _scenario(scenario_id, name):
+            async def _trigger():
+                started.append(name)
+                if len(started) == 2:
+                    release.set()
+                await release.wait()
+
+            scenario = MagicMock()
+            scenario.id = scenario_id
+            scenario.name = name
+            scenario.async_trigger = AsyncMock(side_effect=_trigger)
+            return scenario
+
+        night, away = _scenario("s1", "Night Mode"), _scenario("s2", "Away")
+        fake_session.scenarios = [night, away]
+
+        handlers, *_ = self._setup_with_session(fake_hass, fake_entry, fake_session)
+        call_obj = self._make_service_call(
+            **{ATTR_NAME: ["Night Mode", "Away"], "title": ""}
+        )
+        _run(handlers[SERVICE_TRIGGER_SCENARIO](call_obj))
+
+        assert sorted(started) == ["Away", "Night Mode"]
+        night.async_trigger.assert_awaited_once()
+        away.async_trigger.assert_awaited_once()
+
     # -- rawscan service --
 
     def test_rawscan_service_calls_api_get_devices(self, fake_hass, fake_entry, fake_session):
@@ -1177,12 +1527,12 @@ class TestServiceHandlers:
     def test_rawscan_service_skips_entry_not_loaded(
         self, fake_hass, fake_entry, fake_session
     ):
-        """A matching-title entry whose state isn't LOADED (e.g. mid-reload,
-        after async_unload_entry already tore down the session but before
-        async_setup_entry re-assigns runtime_data) must be skipped, not
-        dispatched against — surfacing as the same clean
-        ServiceValidationError as "no entry found", never a raw exception
-        from a half-torn-down session/api.
+        """A matching-title entry that async_unload_entry has taken out of
+        the entry registry (e.g. mid-reload, session torn down but
+        runtime_data not yet re-assigned) must be skipped, not dispatched
+        against — surfacing as the same clean ServiceValidationError as
+        "no entry found", never a raw exception from a half-torn-down
+        session/api.
         """
         from homeassistant.exceptions import ServiceValidationError
 
@@ -1194,9 +1544,9 @@ class TestServiceHandlers:
         handler = handlers[SERVICE_TRIGGER_RAWSCAN]
 
         # Simulate the entry being mid-reload: runtime_data is still the
-        # stale object from before, but HA has already flipped the entry's
-        # own state away from LOADED.
+        # stale object, but unload has already dropped it from the registry.
         entry.state = ConfigEntryState.SETUP_IN_PROGRESS
+        async_get_entry_registry(hass).async_remove(entry.entry_id)
 
         call_obj = self._make_service_call(**{
             "title": "",
@@ -1370,6 +1720,24 @@ class TestServiceHandlers:
 
         coordinator.async_request_refresh.assert_awaited_once()
 
+    def test_refresh_zigbee_routing_incremental_passes_max_age(
+        self, fake_hass, fake_entry, fake_session
+    ):
+        session = fake_session
+        handlers, hass, entry, _ = self._setup_with_session(
+            fake_hass, fake_entry, session
+        )
+        handler = handlers[SERVICE_REFRESH_ZIGBEE_ROUTING]
+        coordinator = entry.runtime_data.zigbee_routing_coordinator
+        coordinator.async_request_refresh = AsyncMock()
+        coordinator.async_request_incremental_refresh = AsyncMock()
+
+        call_obj = self._make_service_call(title="", incremental=True, max_age=600.0)
+        _run(handler(call_obj))
+
+        coordinator.async_request_incremental_refresh.assert_awaited_once_with(600.0)
+        coordinator.async_request_refresh.assert_not_awaited()
+
     def test_refresh_zigbee_routing_filters_by_title(
         self, fake_hass, fake_entry, fake_session
     ):
@@ -1385,6 +1753,51 @@ class TestServiceHandlers:
         with pytest.raises(ServiceValidationError):
             _run(handler(call_obj))
 
+    # -- bulk_command service --
+
+    def test_bulk_command_returns_per_item_results(
+        self, fake_hass, fake_entry, fake_session
+    ):
+        shutter = SimpleNamespace(async_set_level=AsyncMock())
+        session = fake_session
+        session.device = MagicMock(
+            side_effect=lambda device_id: {"shutter": shutter}[device_id]
+        )
+        handlers, hass, entry, _ = self._setup_with_session(
+            fake_hass, fake_entry, session
+        )
+        handler = handlers[SERVICE_BULK_COMMAND]
+
+        call_obj = self._make_service_call(
+            title="",
+            max_concurrency=4,
+            commands=[
+                {"device_id": "shutter", "operation": "close"},
+                {"device_id": "gone", "operation": "close"},
+            ],
+        )
+        response = _run(handler(call_obj))
+
+        shutter.async_set_level.assert_awaited_once_with(0.0)
+        assert [r["success"] for r in response["results"]] == [True, False]
+        assert response["results"][1]["error"] == "unknown_device"
+
+    def test_bulk_command_filters_by_title(self, fake_hass, fake_entry, fake_session):
+        from homeassistant.exceptions import ServiceValidationError
+
+        handlers, hass, entry, _ = self._setup_with_session(
+            fake_hass, fake_entry, fake_session
+        )
+        handler = handlers[SERVICE_BULK_COMMAND]
+
+        call_obj = self._make_service_call(
+            title="WrongTitle",
+            max_concurrency=4,
+            commands=[{"device_id": "shutter", "operation": "close"}],
+        )
+        with pytest.raises(ServiceValidationError):
+            _run(handler(call_obj))
+
 
 # ---------------------------------------------------------------------------
 # Tests: SwitchDeviceEventListener
@@ -1848,6 +2261,65 @@ def _full_setup(*, fake_session=None, hass=None, entry=None, cert_return=None,
     return result, hass, entry
 
 
+# ---------------------------------------------------------------------------
+# SHCEntryRegistry: domain services resolve their controller by title or id
+# ---------------------------------------------------------------------------
+
+class TestEntryRegistry:
+    def _registry(self):
+        registry = SHCEntryRegistry()
+        first = SimpleNamespace(title="SHC")
+        second = SimpleNamespace(title="SHC")
+        other = SimpleNamespace(title="Barn")
+        registry.async_add("e1", first)
+        registry.async_add("e2", second)
+        registry.async_add("e3", other)
+        return registry, first, second, other
+
+    def test_title_resolves_every_entry_carrying_it(self):
+        registry, first, second, _ = self._registry()
+        assert registry.resolve("SHC") == [("e1", first), ("e2", second)]
+
+    def test_entry_id_wins_over_title(self):
+        registry, _, second, _ = self._registry()
+        assert registry.resolve("Barn", "e2") == [("e2", second)]
+        assert registry.resolve("", "missing") == []
+
+    def test_no_selector_resolves_all_entries(self):
+        registry, *_ = self._registry()
+        assert [entry_id for entry_id, _ in registry.resolve()] == ["e1", "e2", "e3"]
+
+    def test_remove_forgets_the_entry(self):
+        registry, first, *_ = self._registry()
+        registry.async_remove("e2")
+        registry.async_remove("e2")
+        assert registry.resolve("SHC") == [("e1", first)]
+
+    def test_service_targets_the_selected_entry(self):
+        night, barn_night = MagicMock(), MagicMock()
+        for scenario in (night, barn_night):
+            scenario.id = "s1"
+            scenario.name = "Night"
+            scenario.async_trigger = AsyncMock()
+        hass = _make_fake_hass()
+        _register_entries(
+            hass,
+            SimpleNamespace(entry_id="e1", runtime_data=_scenario_runtime(night)),
+            SimpleNamespace(entry_id="e2", runtime_data=_scenario_runtime(barn_night)),
+        )
+        from custom_components.bosch_shc import async_setup
+
+        _run(async_setup(hass, {}))
+        handler = hass.services.async_register.call_args.args[2]
+        call = SimpleNamespace(
+            data={ATTR_NAME: ["Night"], ATTR_TITLE: "", "config_entry_id": "e2"}
+        )
+        _run(handler(call))
+
+        night.async_trigger.assert_not_called()
+        barn_night.async_trigger.assert_awaited_once()
+
+
 # ---------------------------------------------------------------------------
 # 1 — scenario_service_call skips entry without runtime_data
 # ---------------------------------------------------------------------------
@@ -1867,7 +2339,7 @@ class TestScenarioServiceCallSkipsNoRuntimeData:
             title="NoRT",
         )
         # Inject it as the only config entry for the domain
-        hass.config_entries.async_entries = MagicMock(return_value=[entry_no_rt])
+        _register_entries(hass, entry_no_rt)
 
         _run(async_setup(hass, {}))
 
@@ -1897,21 +2369,19 @@ class TestScenarioServiceCallSkipsNoRuntimeData:
         triggered = []
 
         class _FakeScenario:
+            id = "sc-test"
             name = "test_scene"
 
             async def async_trigger(self_):
                 triggered.append(True)
 
-        fake_runtime = SimpleNamespace(
-            title="SHC Test",
-            session=SimpleNamespace(scenarios=[_FakeScenario()]),
-        )
+        fake_runtime = _scenario_runtime(_FakeScenario())
         entry_with_rt = SimpleNamespace(
             entry_id="with-rt",
             title="SHC Test",
             runtime_data=fake_runtime,
         )
-        hass.config_entries.async_entries = MagicMock(return_value=[entry_with_rt])
+        _register_entries(hass, entry_with_rt)
 
         async def _executor_job(fn, *args):
             return fn(*args)
@@ -2416,6 +2886,8 @@ class TestAsyncUnloadEntryPresenceUnsub:
 # ---------------------------------------------------------------------------
 
 PATCH_TRACK_STATE = "custom_components.bosch_shc.__init__.async_track_state_change_event"
+PATCH_CALL_LATER = "custom_components.bosch_shc.__init__.async_call_later"
+PATCH_FLEET_RETRY_DELAY = "custom_components.bosch_shc.bulk_command.FLEET_RETRY_DELAY"
 
 
 def _make_fake_hass_presence(states=None):
@@ -2528,11 +3000,25 @@ def _make_fake_session_presence(thermostats=None, roomthermostats=None,
 # ---------------------------------------------------------------------------
 
 
+def _call_now(_hass, _delay, action):
+    """Stand-in for async_call_later: the debounce window elapses at once."""
+    action(None)
+    return MagicMock()
+
+
 @pytest.fixture
 def fake_hass_presence(request: pytest.FixtureRequest):
-    """Fake hass mock for presence/child-lock tests. See _make_fake_hass_presence."""
+    """Fake hass mock for presence/child-lock tests. See _make_fake_hass_presence.
+
+    Presence changes are debounced via async_call_later; it is patched to fire
+    immediately (and retries to not wait) so tests observe the write directly.
+    """
     overrides = getattr(request, "param", {}) or {}
-    return _make_fake_hass_presence(**overrides)
+    with (
+        patch(PATCH_CALL_LATER, side_effect=_call_now),
+        patch(PATCH_FLEET_RETRY_DELAY, 0),
+    ):
+        yield _make_fake_hass_presence(**overrides)
 
 
 @pytest.fixture
@@ -3349,6 +3835,71 @@ class TestInitialStateAppliedAtStartup:
         therm.async_set_child_lock.assert_awaited_once_with(False)
 
 
+# ---------------------------------------------------------------------------
+# Tests: presence changes are debounced; devices already there are skipped
+# ---------------------------------------------------------------------------
+
+class TestDebouncedFleetApply:
+    def test_presence_burst_evaluates_once(
+        self, fake_hass_presence, fake_entry, fake_session_presence
+    ):
+        therm = _make_device("therm-1")
+        fake_session_presence.device_helper.thermostats = [therm]
+        opts = {OPT_PRESENCE_ENTITY: ["person.felix"]}
+        hass, entry, state_cb = _do_setup(
+            fake_hass_presence, fake_entry, fake_session_presence, opts,
+            capture_state_cb=True,
+            hass_states={"person.felix": "not_home"},
+        )
+        hass.async_create_task.reset_mock()
+        timers = []
+
+        def _capture_call_later(_hass, _delay, action):
+            timers.append((action, MagicMock()))
+            return timers[-1][1]
+
+        with patch(PATCH_CALL_LATER, side_effect=_capture_call_later):
+            for state in ("home", "not_home", "home"):
+                hass._set_state("person.felix", state)
+                state_cb(_state_event(state))
+
+        assert len(timers) == 3
+        timers[0][1].assert_called_once()
+        timers[1][1].assert_called_once()
+        hass.async_create_task.assert_not_called()
+
+        timers[2][0](None)
+        hass.async_create_task.assert_called_once()
+        _run(hass.async_create_task.call_args[0][0])
+        therm.async_set_child_lock.assert_awaited_once_with(True)
+
+    def test_devices_already_locked_are_not_written(
+        self, fake_hass_presence, fake_entry, fake_session_presence
+    ):
+        from boschshcpy.services_impl import ThermostatService
+
+        locked_bool = _make_device("therm-bool")
+        locked_bool.child_lock = True
+        locked_enum = _make_device("therm-enum")
+        locked_enum.child_lock = ThermostatService.State.ON
+        unlocked = _make_device("therm-off")
+        unlocked.child_lock = ThermostatService.State.OFF
+        fake_session_presence.device_helper.thermostats = [
+            locked_bool, locked_enum, unlocked
+        ]
+        opts = {OPT_PRESENCE_ENTITY: ["person.felix"]}
+        hass, entry, state_cb = _do_setup(
+            fake_hass_presence, fake_entry, fake_session_presence, opts,
+            capture_state_cb=True,
+            hass_states={"person.felix": "home"},
+        )
+
+        _run(hass.async_create_task.call_args[0][0])
+        locked_bool.async_set_child_lock.assert_not_awaited()
+        locked_enum.async_set_child_lock.assert_not_awaited()
+        unlocked.async_set_child_lock.assert_awaited_once_with(True)
+
+
 # ---------------------------------------------------------------------------
 # Tests: unload cleans up presence_unsub
 # ---------------------------------------------------------------------------
@@ -3511,6 +4062,7 @@ def _gaps2_run_setup_with_presence(presence_entities, hass_states=None):
     fake_session = _gaps2_make_shc_session()
 
     entry = MagicMock()
+    entry.minor_version = 2
     entry.entry_id = "E1"
     entry.title = "Test"
     entry.data = {"ssl_certificate": "", "ssl_key": "", "host": "192.168.1.1"}
@@ -3651,6 +4203,7 @@ class TestInitParsetime:
         )
 
         entry = MagicMock()
+        entry.minor_version = 2
         entry.entry_id = "eid_parsetime"
         entry.title = "ParseTime SHC"
         entry.data = {
@@ -3748,6 +4301,7 @@ class TestInitCameraToolIssue:
         hass.async_create_task = MagicMock()
 
         entry = MagicMock()
+        entry.minor_version = 2
         entry.entry_id = "eid_cam"
         entry.title = "Camera SHC"
         entry.data = {
@@ -3863,6 +4417,7 @@ class TestInitUnloadPollingAndListeners:
         hass.services.has_service = MagicMock(return_value=False)
 
         entry = MagicMock()
+        entry.minor_version = 2
         entry.entry_id = "eid_unload"
         # async_unload_entry reads from entry.runtime_data (not hass.data)
         entry.runtime_data = rt
@@ -3912,6 +4467,7 @@ class TestInitUnloadSilentModeUnsub:
         hass.services.has_service = MagicMock(return_value=False)
 
         entry = MagicMock()
+        entry.minor_version = 2
         entry.entry_id = "eid_silent"
         entry.runtime_data = rt
 
@@ -3978,6 +4534,7 @@ class TestInitParseTimeError:
         hass.states.get = MagicMock(return_value=SimpleNamespace(state="home"))
 
         entry = MagicMock()
+        entry.minor_version = 2
         entry.entry_id = "eid_parsetime_err"
         entry.title = "ParseTime Error SHC"
         entry.data = {
@@ -4115,13 +4672,13 @@ class TestZigbeeCoordinatorFailureDoesNotBlockSetup:
         from custom_components.bosch_shc.__init__ import async_setup_entry
 
         session = fake_session
-        # A plain TimeoutError (not SHCException/SHCConnectionError) isn't
-        # swallowed per-device by the coordinator's own isolation — it
-        # propagates out of _async_update_data, the scenario that actually
-        # reproduces #362 (a per-device SHC error is already isolated and
-        # never reaches async_setup_entry at all).
+        # An unwrapped error (not SHCException/SHCConnectionError, and not a
+        # per-device timeout) isn't swallowed per-device by the coordinator's
+        # own isolation — it propagates out of _async_update_data, the
+        # scenario that actually reproduces #362 (a per-device SHC error or
+        # timeout is already isolated and never reaches async_setup_entry).
         session.devices = [SimpleNamespace(id="hdm:ZigBee:abc")]
-        session.get_zigbee_routing_info = AsyncMock(side_effect=TimeoutError)
+        session.get_zigbee_routing_info = AsyncMock(side_effect=ValueError)
 
         hass = fake_hass
         entry = fake_entry
@@ -4288,7 +4845,7 @@ class TestRawscanNoRuntimeData:
         # Entry with no runtime_data attr
         entry_no_rt = SimpleNamespace(entry_id="no-rt", title="NoRT")
         hass.config_entries = MagicMock()
-        hass.config_entries.async_entries = MagicMock(return_value=[entry_no_rt])
+        _register_entries(hass, entry_no_rt)
 
         fake_call = SimpleNamespace(
             data={ATTR_TITLE: "", ATTR_COMMAND: "devices",
@@ -4358,6 +4915,7 @@ class TestEntityIsPresentZoneDomain:
         fake_session.get_zigbee_routing_info = AsyncMock()
 
         entry = MagicMock()
+        entry.minor_version = 2
         entry.entry_id = "E1"
         entry.title = "Test"
         entry.data = {"ssl_certificate": "", "ssl_key": "", "host": "192.168.1.1"}
@@ -4500,6 +5058,7 @@ class TestUnloadPresenceUnsub:
         hass.services.has_service = MagicMock(return_value=False)
 
         entry = MagicMock()
+        entry.minor_version = 2
         entry.entry_id = "E1"
         entry.runtime_data = runtime
 
@@ -4588,6 +5147,7 @@ class TestPresenceStateNoneEntity:
 
     def _make_entry(self, options=None):
         entry = MagicMock()
+        entry.minor_version = 2
         entry.entry_id = "eid1"
         entry.title = "Test SHC"
         entry.data = {"ssl_certificate": "", "ssl_key": "", "host": "1.2.3.4"}
@@ -4684,15 +5244,13 @@ class TestScenarioServiceCallTriggerError:
     def _make_runtime_with_failing_scenario(self, exc):
         """Build a fake runtime_data whose scenario.async_trigger raises exc."""
         class _FailingScenario:
+            id = "sc-failing"
             name = "failing_scene"
 
             async def async_trigger(self_):
                 raise exc
 
-        return SimpleNamespace(
-            title="SHC Test",
-            session=SimpleNamespace(scenarios=[_FailingScenario()]),
-        )
+        return _scenario_runtime(_FailingScenario())
 
     def _make_entry_with_runtime(self, runtime):
         return SimpleNamespace(
@@ -4702,7 +5260,7 @@ class TestScenarioServiceCallTriggerError:
         )
 
     def _patch_entries(self, hass, entry):
-        hass.config_entries.async_entries = MagicMock(return_value=[entry])
+        _register_entries(hass, entry)
 
     def test_shcexception_raises_service_validation_error(self):
         """SHCException from scenario.trigger → ServiceValidationError (lines 126-127)."""
@@ -4771,21 +5329,19 @@ class TestScenarioServiceCallTriggerError:
         triggered = []
 
         class _OkScenario:
+            id = "sc-ok"
             name = "ok_scene"
 
             async def async_trigger(self_):
                 triggered.append(True)
 
-        runtime = SimpleNamespace(
-            title="SHC Test",
-            session=SimpleNamespace(scenarios=[_OkScenario()]),
-        )
+        runtime = _scenario_runtime(_OkScenario())
         entry = SimpleNamespace(
             entry_id="eid-ok",
             title="SHC Test",
             runtime_data=runtime,
         )
-        hass.config_entries.async_entries = MagicMock(return_value=[entry])
+        _register_entries(hass, entry)
 
         fake_call = SimpleNamespace(
             data={ATTR_NAME: "ok_scene", ATTR_TITLE: ""},
@@ -57,7 +57,7 @@ def _make_entry(data=None, options=None, session=None):
         options=options or {},
         entry_id="E1",
     )
-    entry.runtime_data = SimpleNamespace(session=session)
+    entry.runtime_data = SimpleNamespace(session=session, stale_entities=None)
     return entry
 
 
@@ -152,7 +152,7 @@ class TestDisabledNoOp:
         _run(async_sync_keypad_bridge(hass, entry, enabled=False))
 
         mock_remove_stale_entity.assert_awaited_once_with(
-            hass, Platform.SWITCH, "AA:BB:CC:DD:EE:FF_u1"
+            hass, entry, Platform.SWITCH, "AA:BB:CC:DD:EE:FF_u1"
         )
 
 
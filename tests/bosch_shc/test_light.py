@@ -22,6 +22,7 @@ import aiohttp
 import pytest
 
 from boschshcpy import PowerSwitchService
+from boschshcpy.exceptions import SHCException
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
     ATTR_COLOR_TEMP_KELVIN,
@@ -29,6 +30,7 @@ from homeassistant.components.light import (
     ColorMode,
 )
 from homeassistant.const import Platform
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.util import color as color_util
 
 from custom_components.bosch_shc.const import (
@@ -87,13 +89,9 @@ def _fake_dev(dev_id="dev1", root_id="root1", serial="SER1", **kw):
 
 def _run_light_setup(mock_config_entry, mock_session) -> list:
     """Run light.async_setup_entry via the shared run_setup_entry helper, with
-    async_migrate_to_new_unique_id/async_remove_stale_entity patched to AsyncMock
-    (their side effects aren't under test here)."""
+    async_remove_stale_entity patched to AsyncMock (its side effects aren't
+    under test here)."""
     with (
-        patch(
-            "custom_components.bosch_shc.light.async_migrate_to_new_unique_id",
-            new_callable=AsyncMock,
-        ),
         patch(
             "custom_components.bosch_shc.light.async_remove_stale_entity",
             new_callable=AsyncMock,
@@ -108,10 +106,6 @@ def _run_light_setup_with_remove_mock(mock_config_entry, mock_session) -> tuple[
     """Same as _run_light_setup, but returns the async_remove_stale_entity mock
     too, so a test can assert on stale-entity cleanup calls/args."""
     with (
-        patch(
-            "custom_components.bosch_shc.light.async_migrate_to_new_unique_id",
-            new_callable=AsyncMock,
-        ),
         patch(
             "custom_components.bosch_shc.light.async_remove_stale_entity",
             new_callable=AsyncMock,
@@ -123,30 +117,6 @@ def _run_light_setup_with_remove_mock(mock_config_entry, mock_session) -> tuple[
     return entities, remove_mock
 
 
-def _run_light_setup_track_migrate(mock_config_entry, mock_session) -> tuple[list, list]:
-    """Same as _run_light_setup, but records each async_migrate_to_new_unique_id
-    call as (platform, device, attr_name) so a test can assert on migrate args."""
-    migrate_calls: list = []
-
-    async def _fake_migrate(hass_arg, platform, device, attr_name=None, **kw):
-        migrate_calls.append((platform, device, attr_name))
-
-    with (
-        patch(
-            "custom_components.bosch_shc.light.async_migrate_to_new_unique_id",
-            side_effect=_fake_migrate,
-        ),
-        patch(
-            "custom_components.bosch_shc.light.async_remove_stale_entity",
-            new_callable=AsyncMock,
-        ),
-    ):
-        entities = asyncio.run(
-            run_setup_entry(async_setup_entry, mock_config_entry, mock_session)
-        )
-    return entities, migrate_calls
-
-
 def _run_light_setup_with_dev_reg(mock_config_entry, mock_session, dev_reg_mock) -> list:
     """Same as _run_light_setup, but also patches get_dev_reg (HUE/Ledvance
     suppress paths look the device up in the entity/device registry)."""
@@ -154,10 +124,6 @@ def _run_light_setup_with_dev_reg(mock_config_entry, mock_session, dev_reg_mock)
         patch(
             "custom_components.bosch_shc.light.get_dev_reg", return_value=dev_reg_mock
         ),
-        patch(
-            "custom_components.bosch_shc.light.async_migrate_to_new_unique_id",
-            new_callable=AsyncMock,
-        ),
     ):
         return asyncio.run(
             run_setup_entry(async_setup_entry, mock_config_entry, mock_session)
@@ -1505,7 +1471,7 @@ class TestMotionDetector2Setup:
         mock_session.device_helper.motion_detectors2 = [dev]
         _, remove_mock = _run_light_setup_with_remove_mock(mock_config_entry, mock_session)
         remove_mock.assert_awaited_once_with(
-            ANY, Platform.LIGHT, "shc-root_was-plusm-md2_motionlight"
+            ANY, ANY, Platform.LIGHT, "shc-root_was-plusm-md2_motionlight"
         )
 
     def test_excluded_motion_detector2_removes_stale_entity(
@@ -1518,30 +1484,7 @@ class TestMotionDetector2Setup:
         mock_config_entry.options = {OPT_EXCLUDED_DEVICES: ["excl-had-light"]}
         _, remove_mock = _run_light_setup_with_remove_mock(mock_config_entry, mock_session)
         remove_mock.assert_awaited_once_with(
-            ANY, Platform.LIGHT, "shc-root_excl-had-light_motionlight"
-        )
-
-    def test_async_migrate_called_for_motion_detector2(
-        self, mock_config_entry, mock_session
-    ):
-        """async_migrate_to_new_unique_id must be called with attr_name='MotionLight'."""
-        dev = _make_motion_detector2(device_id="md2-migrate")
-        mock_session.device_helper.motion_detectors2 = [dev]
-        _, migrate_calls = _run_light_setup_track_migrate(mock_config_entry, mock_session)
-        assert any(
-            call[1] is dev and call[2] == "MotionLight" for call in migrate_calls
-        ), f"Expected migrate call with attr_name='MotionLight', got: {migrate_calls}"
-
-    def test_excluded_motion_detector2_skips_migrate(
-        self, mock_config_entry, mock_session
-    ):
-        """async_migrate must NOT be called for excluded MD2 devices."""
-        dev = _make_motion_detector2(device_id="excl-migrate")
-        mock_session.device_helper.motion_detectors2 = [dev]
-        mock_config_entry.options = {OPT_EXCLUDED_DEVICES: ["excl-migrate"]}
-        _, migrate_calls = _run_light_setup_track_migrate(mock_config_entry, mock_session)
-        assert not any(c[1] is dev for c in migrate_calls), (
-            "Excluded MD2 must not trigger async_migrate_to_new_unique_id"
+            ANY, ANY, Platform.LIGHT, "shc-root_excl-had-light_motionlight"
         )
 
 
@@ -1938,14 +1881,14 @@ class TestRelayLightOptOutSetup:
         """Regression: a device previously opted in to "expose as light"
         (RelayLight created, unique_id = root_device_id_device_id) that gets
         opted back out must have that entity actively removed — an options
-        change reloads the entry (OptionsFlowWithReload), so simply not
+        change re-runs the platform setup (options.py), so simply not
         re-creating the entity left an orphaned registry entry behind,
         exactly the failure mode #356 already fixed for MotionDetectorLight."""
         dev = _make_light_switch_bsm(device_id="was-light")
         mock_session.device_helper.light_switches_bsm = [dev]
         mock_config_entry.options = {OPT_LIGHTS_AS_LIGHT: []}
         _, remove_mock = _run_light_setup_with_remove_mock(mock_config_entry, mock_session)
-        remove_mock.assert_awaited_once_with(ANY, Platform.LIGHT, "shc-root_was-light")
+        remove_mock.assert_awaited_once_with(ANY, ANY, Platform.LIGHT, "shc-root_was-light")
 
     def test_excluded_bsm_that_was_opted_in_removes_stale_relaylight_entity(
         self, mock_config_entry, mock_session
@@ -1958,7 +1901,7 @@ class TestRelayLightOptOutSetup:
         }
         _, remove_mock = _run_light_setup_with_remove_mock(mock_config_entry, mock_session)
         remove_mock.assert_awaited_once_with(
-            ANY, Platform.LIGHT, "shc-root_excl-was-light"
+            ANY, ANY, Platform.LIGHT, "shc-root_excl-was-light"
         )
 
 
@@ -2182,14 +2125,14 @@ def test_subscribes_to_every_member_device_and_service_on_add():
     d1.unsubscribe_callback.assert_called_once_with("light.wohnzimmer_light")
 
 
-def test_device_deletion_triggers_config_entry_reload():
-    """A member unpaired live (no options change) must trigger a full reload.
+def test_device_deletion_sets_up_the_light_platform_again():
+    """A member unpaired live (no options change) must rebuild the groups.
 
     Unlike SHCEntity (one entity = one device, which just detaches itself),
-    this group can't locally repair its membership — reloading re-runs
-    async_setup_entry, which rebuilds/removes the group from the current
-    device list. Same recovery already used by select.py's
-    InstallationProfileSelect after a profile write.
+    this group can't locally repair its membership — setting the light
+    platform up again rebuilds/removes the group from the current device
+    list, without reloading the entry. Same recovery already used by
+    select.py's InstallationProfileSelect after a profile write.
     """
     d1 = _make_room_light_device(device_id="d1")
     d2 = _make_room_light_device(device_id="d2")
@@ -2201,17 +2144,25 @@ def test_device_deletion_triggers_config_entry_reload():
     group.entity_id = "light.wohnzimmer_light"
     group.hass = SimpleNamespace(
         async_create_task=MagicMock(),
-        config_entries=SimpleNamespace(async_reload=AsyncMock()),
+        config_entries=SimpleNamespace(
+            async_reload=AsyncMock(), async_get_entry=MagicMock(return_value=None)
+        ),
     )
 
     asyncio.run(group.async_added_to_hass())
     device_callback = d1.subscribe_callback.call_args.args[1]
 
     d1.deleted = True
-    device_callback()
+    with patch(
+        "custom_components.bosch_shc.light.async_reload_platforms", MagicMock()
+    ) as reload_platforms:
+        device_callback()
 
-    group.hass.async_create_task.assert_called_once()
-    group.hass.config_entries.async_reload.assert_called_once_with("E1")
+    group.hass.async_create_task.assert_called_once_with(
+        reload_platforms.return_value
+    )
+    reload_platforms.assert_called_once_with(group.hass, "E1", [Platform.LIGHT])
+    group.hass.config_entries.async_reload.assert_not_called()
 
 
 def test_device_change_without_deletion_just_refreshes_state():
@@ -2249,7 +2200,7 @@ def test_option_disabled_creates_no_group(mock_config_entry, mock_session):
     assert len(entities) == 2  # the 2 LightSwitch entities only
     # Option off -> cleanup path runs once, for the one room that has devices.
     assert remove_mock.await_count == 1
-    assert remove_mock.await_args.args[1:] == (Platform.LIGHT, "room_hz_1_light_group")
+    assert remove_mock.await_args.args[2:] == (Platform.LIGHT, "room_hz_1_light_group")
 
 
 def test_option_enabled_two_lights_same_room_creates_group(mock_config_entry, mock_session):
@@ -2302,3 +2253,118 @@ def test_missing_rooms_attribute_does_not_crash(mock_config_entry, mock_session)
     entities, _ = _run_light_setup_with_remove_mock(mock_config_entry, mock_session)
     assert len(entities) == 1
     assert isinstance(entities[0], LightSwitch)
+
+
+# ---------------------------------------------------------------------------
+# LightSwitch.async_turn_on -- concurrent attribute writes, then switch on,
+# with a latency benchmark against the old sequential path
+# ---------------------------------------------------------------------------
+
+
+# Simulated SHC round trip of one service write, for the latency benchmark.
+_FAKE_SHC_ROUND_TRIP = 0.1
+
+
+class _FakeSHCLight(SimpleNamespace):
+    """Light recording each service write and how many were in flight."""
+
+    def __init__(self, fail=None, round_trip=0, **kwargs):
+        super().__init__(**vars(_make_device(**kwargs)))
+        self.name = "Lamp"
+        self.fail = fail
+        self.round_trip = round_trip
+        self.applied = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.in_flight_at_switch_on = None
+        for name in (
+            "async_set_brightness",
+            "async_set_color",
+            "async_set_rgb",
+            "async_set_binarystate",
+        ):
+            setattr(self, name, self._writer(name))
+
+    def _writer(self, name):
+        async def write(value):
+            if name == "async_set_binarystate":
+                self.in_flight_at_switch_on = self.in_flight
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            # Yield like a real round trip, so concurrent writes overlap.
+            await asyncio.sleep(self.round_trip)
+            self.in_flight -= 1
+            if name == self.fail:
+                raise SHCException("rejected")
+            self.applied.append((name, value))
+
+        return write
+
+
+async def _sequential_turn_on(device):
+    """The previous turn_on path: one awaited write after the other."""
+    await device.async_set_brightness(40)
+    await device.async_set_color(370)
+    await device.async_set_binarystate(True)
+
+
+class TestTurnOnConcurrentWrites:
+    def test_turn_on_latency_vs_sequential(self):
+        """40 % warm white from off: two round trips instead of three."""
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            device = _FakeSHCLight(
+                round_trip=_FAKE_SHC_ROUND_TRIP,
+                binarystate=False,
+                supports_color_temp=True,
+            )
+            start = loop.time()
+            await _sequential_turn_on(device)
+            sequential = loop.time() - start
+
+            device = _FakeSHCLight(
+                round_trip=_FAKE_SHC_ROUND_TRIP,
+                binarystate=False,
+                supports_color_temp=True,
+            )
+            sw = _make_switch(device)
+            start = loop.time()
+            await sw.async_turn_on(brightness=102, color_temp_kelvin=2700)
+            concurrent = loop.time() - start
+            return sequential, concurrent
+
+        sequential, concurrent = asyncio.run(run())
+        assert sequential >= 2.9 * _FAKE_SHC_ROUND_TRIP
+        # Attribute writes in one round trip, then the switch-on write.
+        assert 1.9 * _FAKE_SHC_ROUND_TRIP <= concurrent < 2.9 * _FAKE_SHC_ROUND_TRIP
+
+    def test_attribute_writes_overlap_then_the_light_switches_on(self):
+        """40 % warm white from off: both attributes in one round, then on."""
+        device = _FakeSHCLight(binarystate=False, supports_color_temp=True)
+        sw = _make_switch(device)
+        asyncio.run(sw.async_turn_on(brightness=102, color_temp_kelvin=2700))
+        assert device.max_in_flight == 2
+        assert device.in_flight_at_switch_on == 0
+        assert sorted(name for name, _ in device.applied[:2]) == [
+            "async_set_brightness",
+            "async_set_color",
+        ]
+        assert device.applied[-1] == ("async_set_binarystate", True)
+        assert sw._attr_color_mode == ColorMode.COLOR_TEMP
+
+    def test_failed_write_does_not_switch_the_light_on(self):
+        device = _FakeSHCLight(
+            fail="async_set_brightness", binarystate=False, supports_color_temp=True
+        )
+        sw = _make_switch(device)
+        color_mode = sw._attr_color_mode
+        with pytest.raises(HomeAssistantError) as err:
+            asyncio.run(sw.async_turn_on(brightness=128, color_temp_kelvin=2700))
+        assert err.value.translation_key == "light_action_failed"
+        # The other write still finished; nothing was left in flight.
+        assert device.applied == [("async_set_color", 370)]
+        assert device.in_flight == 0
+        assert device.in_flight_at_switch_on is None
+        assert sw._attr_color_mode == color_mode
+        sw.schedule_update_ha_state.assert_not_called()
@@ -0,0 +1,149 @@
+"""Unit tests for migration.py: the one-shot legacy unique-id migration.
+
+Pattern: the conftest's mock_session/device_buckets fixtures for the device
+model and its autouse mock_migration_registry for the entity registry, seeded
+with SimpleNamespace registry entries; hass is a MagicMock whose
+config_entries.async_update_entry records the minor version bump.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.bosch_shc.migration import (
+    UNIQUE_ID_MINOR_VERSION,
+    async_migrate_unique_ids,
+)
+
+
+def _device(device_id, serial):
+    return SimpleNamespace(id=device_id, serial=serial, root_device_id="root")
+
+
+def _entity(domain, unique_id):
+    return SimpleNamespace(
+        entity_id=f"{domain}.{unique_id.lower()}", domain=domain, unique_id=unique_id
+    )
+
+
+def _migrate(session, entities, registry):
+    hass = MagicMock()
+    entry = SimpleNamespace(entry_id="E1", data={"host": "1.2.3.4"})
+    registry.entries = entities
+    asyncio.run(async_migrate_unique_ids(hass, entry, session))
+    ent_reg = registry.async_get.return_value
+    renamed = {
+        call.args[0]: call.kwargs["new_unique_id"]
+        for call in ent_reg.async_update_entity.call_args_list
+    }
+    return hass, entry, renamed
+
+
+_TWINGUARD = _device("hdm:ZigBee:tg", "TG1")
+_CAMERA = _device("hdm:Cameras:gen2", "CAM1")
+_PLUG = _device("hdm:ZigBee:plug", "PLUG1")
+_SIREN = _device("hdm:ZigBee:siren", "SIREN1")
+
+
+@pytest.mark.parametrize(
+    "device_buckets",
+    [
+        {
+            "twinguards": [_TWINGUARD],
+            "camera_outdoor_gen2": [_CAMERA],
+            "smart_plugs": [_PLUG],
+            "outdoor_sirens": [_SIREN],
+        }
+    ],
+    indirect=True,
+)
+class TestMigrateUniqueIds:
+    def test_legacy_ids_are_renamed_in_one_pass(
+        self, mock_session, mock_migration_registry
+    ):
+        mock_session.intrusion_system = _device("intrusionDetectionSystem", None)
+        entities = [
+            _entity("sensor", "TG1_temperature"),
+            _entity("sensor", "TG1_temperature_rating"),
+            _entity("binary_sensor", "TG1_battery"),
+            _entity("binary_sensor", "SIREN1_battery"),
+            _entity("switch", "PLUG1"),
+            _entity("switch", "CAM1_light"),
+            _entity("alarm_control_panel", "E1_intrusionDetectionSystem"),
+            # Already current, or of a platform the legacy id never lived on.
+            _entity("sensor", "root_hdm:ZigBee:plug_power"),
+            _entity("light", "PLUG1"),
+        ]
+
+        hass, entry, renamed = _migrate(mock_session, entities, mock_migration_registry)
+
+        assert renamed == {
+            "sensor.tg1_temperature": "root_hdm:ZigBee:tg_temperature",
+            "sensor.tg1_temperature_rating": "root_hdm:ZigBee:tg_temperaturerating",
+            "binary_sensor.tg1_battery": "root_hdm:ZigBee:tg_battery",
+            "binary_sensor.siren1_battery": "root_hdm:ZigBee:siren_battery",
+            "switch.plug1": "root_hdm:ZigBee:plug",
+            "switch.cam1_light": "root_hdm:Cameras:gen2_frontlight",
+            "alarm_control_panel.e1_intrusiondetectionsystem": (
+                "root_intrusionDetectionSystem"
+            ),
+        }
+        mock_migration_registry.async_migrate_entries.assert_awaited_once()
+        hass.config_entries.async_update_entry.assert_called_once_with(
+            entry, minor_version=UNIQUE_ID_MINOR_VERSION
+        )
+
+    def test_gen2_camera_light_of_the_new_scheme(
+        self, mock_session, mock_migration_registry
+    ):
+        _, _, renamed = _migrate(
+            mock_session,
+            [_entity("switch", "root_hdm:Cameras:gen2_light")],
+            mock_migration_registry,
+        )
+
+        assert renamed == {
+            "switch.root_hdm:cameras:gen2_light": "root_hdm:Cameras:gen2_frontlight"
+        }
+
+    @pytest.mark.parametrize(
+        "unique_id", ["CAM1_light", "root_hdm:Cameras:gen2_light"]
+    )
+    def test_gen2_camera_light_falls_back_to_the_ambient_light(
+        self, mock_session, mock_migration_registry, unique_id
+    ):
+        """#289: the old "_light" id goes to AmbientLight once Frontlight exists."""
+        ent_reg = mock_migration_registry.async_get.return_value
+        ent_reg.async_get_entity_id.side_effect = lambda domain, platform, uid: (
+            "switch.front" if uid.endswith("_frontlight") else None
+        )
+
+        _, _, renamed = _migrate(
+            mock_session, [_entity("switch", unique_id)], mock_migration_registry
+        )
+
+        assert renamed == {
+            f"switch.{unique_id.lower()}": "root_hdm:Cameras:gen2_ambientlight"
+        }
+
+    def test_taken_target_is_skipped(
+        self, mock_session, mock_migration_registry, caplog
+    ):
+        ent_reg = mock_migration_registry.async_get.return_value
+        ent_reg.async_get_entity_id.side_effect = lambda domain, platform, uid: (
+            "switch.taken" if uid == "root_hdm:ZigBee:plug" else None
+        )
+
+        hass, _, renamed = _migrate(
+            mock_session,
+            [_entity("switch", "PLUG1"), _entity("switch", "PLUG1_routing")],
+            mock_migration_registry,
+        )
+
+        assert renamed == {"switch.plug1_routing": "root_hdm:ZigBee:plug_routing"}
+        assert "Skip migration of id [PLUG1]" in caplog.text
+        hass.config_entries.async_update_entry.assert_called_once()
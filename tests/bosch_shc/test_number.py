@@ -60,7 +60,7 @@ from custom_components.bosch_shc.number import (
     async_setup_entry,
 )
 
-from .conftest import run_setup_entry
+from .conftest import make_polled_resource, run_setup_entry
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -2850,11 +2850,14 @@ class TestNumberErrorPaths:
 # ---------------------------------------------------------------------------
 
 
-def _make_tds_number(room=None):
+def _make_tds_number(room=None, data=None):
     num = TemperatureDropValueNumber.__new__(TemperatureDropValueNumber)
     num._device = SimpleNamespace(name="Kinderzimmer")
     num._room = room if room is not None else MagicMock()
-    num._value = None
+    num.coordinator = make_polled_resource(
+        getattr(num._room, "async_temperature_drop_service", None), data=data
+    )
+    num.coordinator.async_request_refresh = AsyncMock()
     return num
 
 
@@ -2863,40 +2866,46 @@ def test_tds_number_native_value_none_initially():
     assert num.native_value is None
 
 
-def test_tds_number_async_update_sets_value():
+def test_tds_number_poll_sets_value():
     room = MagicMock()
     room.async_temperature_drop_service = AsyncMock(
         return_value={"configuration": {"dropTemperature": 1.5}}
     )
     num = _make_tds_number(room)
-    asyncio.run(num.async_update())
+    asyncio.run(num.coordinator.async_refresh())
     assert num.native_value == 1.5
 
 
-def test_tds_number_async_update_handles_missing_value():
+def test_tds_number_poll_handles_missing_value():
     room = MagicMock()
     room.async_temperature_drop_service = AsyncMock(
         return_value={"configuration": {}}
     )
     num = _make_tds_number(room)
-    asyncio.run(num.async_update())
+    asyncio.run(num.coordinator.async_refresh())
     assert num.native_value is None
 
 
-def test_tds_number_async_update_logs_on_error():
+def test_tds_number_poll_error_keeps_last_value():
     room = MagicMock()
     room.async_temperature_drop_service = AsyncMock(side_effect=SHCException("boom"))
-    num = _make_tds_number(room)
-    asyncio.run(num.async_update())  # must not raise
+    num = _make_tds_number(room, data={"configuration": {"dropTemperature": 2.0}})
+    asyncio.run(num.coordinator.async_refresh())  # must not raise
+    assert num.native_value == 2.0
 
 
 def test_tds_number_async_set_native_value_calls_room():
     room = MagicMock()
     room.async_set_temperature_drop_value = AsyncMock()
-    num = _make_tds_number(room)
+    num = _make_tds_number(
+        room, data={"configuration": {"enabled": True, "dropTemperature": 1.0}}
+    )
     asyncio.run(num.async_set_native_value(2.0))
     room.async_set_temperature_drop_value.assert_awaited_once_with(2.0)
+    # Written through to the shared resource -- no follow-up GET.
     assert num.native_value == 2.0
+    assert num.coordinator.data["configuration"]["enabled"] is True
+    num.coordinator.async_request_refresh.assert_not_awaited()
 
 
 def test_tds_number_async_set_native_value_wraps_shc_exception():
@@ -2947,6 +2956,57 @@ class TestTemperatureDropNumberSetupEntry:
         # ROOM_CLIMATE_CONTROL device's generic raw name.
         assert drop_number.device_name == "Kinderzimmer"
 
+    @pytest.mark.parametrize(
+        "mock_config_entry",
+        [{"options": {OPT_TEMPERATURE_DROP_ENTITIES: True}}],
+        indirect=True,
+    )
+    def test_shares_room_resource_with_switch(self, mock_config_entry, mock_session):
+        """Switch and number read the same room endpoint: one resource."""
+        from custom_components.bosch_shc.switch import (
+            TemperatureDropEnabledSwitch,
+        )
+        from custom_components.bosch_shc.switch import (
+            async_setup_entry as switch_setup_entry,
+        )
+
+        climate = SimpleNamespace(
+            id="roomClimateControl_hz_1",
+            root_device_id="shc1",
+            room_id="hz_1",
+            name="Kinderzimmer",
+            manufacturer="BOSCH",
+            device_model="ROOM_CLIMATE_CONTROL",
+            status="AVAILABLE",
+            subscribe_callback=MagicMock(),
+            unsubscribe_callback=MagicMock(),
+        )
+        mock_session.device_helper.climate_controls = [climate]
+        room = MagicMock()
+        room.async_temperature_drop_service = AsyncMock(
+            return_value={"configuration": {"enabled": True, "dropTemperature": 1.0}}
+        )
+        mock_session.room = MagicMock(return_value=room)
+        mock_session.userdefinedstates = []
+        mock_session.subscribe = MagicMock()
+        mock_config_entry.async_on_unload = MagicMock()
+        numbers = asyncio.run(
+            run_setup_entry(async_setup_entry, mock_config_entry, mock_session)
+        )
+        switches = asyncio.run(
+            run_setup_entry(switch_setup_entry, mock_config_entry, mock_session)
+        )
+        drop_number = next(
+            e for e in numbers if isinstance(e, TemperatureDropValueNumber)
+        )
+        drop_switch = next(
+            e for e in switches if isinstance(e, TemperatureDropEnabledSwitch)
+        )
+        assert drop_number.coordinator is drop_switch.coordinator
+        room.async_temperature_drop_service.assert_awaited_once()
+        assert drop_number.native_value == 1.0
+        assert drop_switch.is_on is True
+
     @pytest.mark.parametrize(
         "mock_config_entry",
         [{"options": {OPT_TEMPERATURE_DROP_ENTITIES: True}}],
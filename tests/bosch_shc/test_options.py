@@ -0,0 +1,209 @@
+"""Unit tests for options.py: applying an options change without a reload.
+
+Pattern: the conftest's mock_session/device_buckets fixtures for the device
+model (the registry lookup is its autouse mock_registered_platforms); the
+entry is a SimpleNamespace around a real SHCData, hass a MagicMock whose
+config_entries unload/forward calls are AsyncMocks.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.const import Platform
+
+from custom_components.bosch_shc.__init__ import PLATFORMS
+from custom_components.bosch_shc.const import (
+    OPT_EXCLUDED_DEVICES,
+    OPT_KEYPAD_HA_BRIDGE,
+    OPT_LIGHTS_AS_LIGHT,
+    OPT_LONG_POLL_TIMEOUT,
+    OPT_SCENARIOS_AS_BUTTONS,
+    OPT_TEMPERATURE_DROP_ENTITIES,
+)
+from custom_components.bosch_shc.data import SHCData
+from custom_components.bosch_shc.entity import async_on_platform_unload
+from custom_components.bosch_shc.options import (
+    async_apply_options,
+    async_reload_platforms,
+    changed_options,
+    platforms_to_reload,
+)
+
+# What an entry with lights always has loaded.
+_LOADED = {
+    Platform.BINARY_SENSOR,
+    Platform.BUTTON,
+    Platform.LIGHT,
+    Platform.SENSOR,
+    Platform.SWITCH,
+    Platform.UPDATE,
+}
+
+
+def _entry(session, applied, options):
+    runtime = SHCData(session=session, shc_device=MagicMock(), title="SHC")
+    runtime.loaded_platforms = set(_LOADED)
+    runtime.applied_options = dict(applied)
+    entry = SimpleNamespace(
+        entry_id="E1", title="SHC", options=options, runtime_data=runtime
+    )
+    entry.async_on_unload = MagicMock()
+    return entry
+
+
+def _hass(unload_ok=True):
+    hass = MagicMock()
+    hass.config_entries.async_unload_platforms = AsyncMock(return_value=unload_ok)
+    hass.config_entries.async_forward_entry_setups = AsyncMock()
+    return hass
+
+
+def _apply(hass, entry):
+    asyncio.run(async_apply_options(hass, entry, PLATFORMS))
+
+
+class TestPlatformsToReload:
+    def test_changed_options(self):
+        assert changed_options({"a": 1, "b": 2}, {"a": 1, "b": 3, "c": 4}) == {
+            "b",
+            "c",
+        }
+
+    def test_option_maps_to_its_loaded_platforms(self):
+        assert platforms_to_reload({OPT_LIGHTS_AS_LIGHT}, _LOADED) == {
+            Platform.LIGHT,
+            Platform.SWITCH,
+        }
+
+    def test_exclusion_affects_every_loaded_platform(self):
+        assert platforms_to_reload({OPT_EXCLUDED_DEVICES}, _LOADED) == _LOADED
+
+    def test_unmapped_option_needs_a_reload(self):
+        assert (
+            platforms_to_reload(
+                {OPT_SCENARIOS_AS_BUTTONS, OPT_LONG_POLL_TIMEOUT}, _LOADED
+            )
+            is None
+        )
+
+
+class TestApplyOptions:
+    def test_affected_platforms_are_set_up_again(self, mock_session):
+        mock_session.scenarios = []
+        hass = _hass()
+        entry = _entry(mock_session, {}, {OPT_SCENARIOS_AS_BUTTONS: True})
+        unsub = MagicMock()
+        async_on_platform_unload(entry, Platform.BUTTON, unsub)
+
+        _apply(hass, entry)
+
+        hass.config_entries.async_unload_platforms.assert_awaited_once_with(
+            entry, {Platform.BUTTON}
+        )
+        hass.config_entries.async_forward_entry_setups.assert_awaited_once_with(
+            entry, [Platform.BUTTON]
+        )
+        hass.config_entries.async_schedule_reload.assert_not_called()
+        unsub.assert_called_once()
+        assert entry.runtime_data.platform_unloads == {}
+        assert entry.runtime_data.loaded_platforms == _LOADED
+        assert entry.runtime_data.applied_options == {OPT_SCENARIOS_AS_BUTTONS: True}
+
+    @pytest.mark.parametrize(
+        "device_buckets", [{"climate_controls": [MagicMock()]}], indirect=True
+    )
+    def test_option_forwards_a_newly_needed_platform(self, mock_session):
+        mock_session.scenarios = []
+        hass = _hass()
+        entry = _entry(mock_session, {}, {OPT_TEMPERATURE_DROP_ENTITIES: True})
+
+        _apply(hass, entry)
+
+        (_, forwarded), _ = hass.config_entries.async_forward_entry_setups.call_args
+        assert Platform.NUMBER in forwarded
+        assert Platform.NUMBER in entry.runtime_data.loaded_platforms
+
+    def test_exclusion_resyncs_the_keypad_bridge(self, mock_session):
+        mock_session.scenarios = []
+        entry = _entry(
+            mock_session,
+            {OPT_KEYPAD_HA_BRIDGE: True},
+            {OPT_KEYPAD_HA_BRIDGE: True, OPT_EXCLUDED_DEVICES: ["d1"]},
+        )
+
+        with patch(
+            "custom_components.bosch_shc.options.async_sync_keypad_bridge",
+            new_callable=AsyncMock,
+        ) as sync:
+            _apply(_hass(), entry)
+
+        sync.assert_awaited_once()
+
+    def test_exclusion_rebuilds_the_device_trigger_index(self, mock_session):
+        mock_session.scenarios = []
+        options = {OPT_EXCLUDED_DEVICES: ["d1"]}
+        entry = _entry(mock_session, {}, options)
+        entry.runtime_data.device_index = MagicMock()
+
+        _apply(_hass(), entry)
+
+        entry.runtime_data.device_index.async_rebuild.assert_called_once_with(options)
+
+    def test_unmapped_option_schedules_a_reload(self, mock_session):
+        hass = _hass()
+        entry = _entry(mock_session, {}, {OPT_LONG_POLL_TIMEOUT: 30})
+
+        _apply(hass, entry)
+
+        hass.config_entries.async_schedule_reload.assert_called_once_with("E1")
+        hass.config_entries.async_unload_platforms.assert_not_called()
+
+    def test_failed_unload_falls_back_to_a_reload(self, mock_session):
+        hass = _hass(unload_ok=False)
+        entry = _entry(mock_session, {}, {OPT_LIGHTS_AS_LIGHT: ["d1"]})
+
+        _apply(hass, entry)
+
+        hass.config_entries.async_schedule_reload.assert_called_once_with("E1")
+        hass.config_entries.async_forward_entry_setups.assert_not_called()
+
+    def test_data_only_update_is_ignored(self, mock_session):
+        hass = _hass()
+        options = {OPT_LIGHTS_AS_LIGHT: ["d1"]}
+        entry = _entry(mock_session, options, options)
+
+        _apply(hass, entry)
+
+        hass.config_entries.async_unload_platforms.assert_not_called()
+        hass.config_entries.async_schedule_reload.assert_not_called()
+
+
+class TestReloadPlatforms:
+    def test_live_entry_sets_up_only_the_loaded_platforms(self, mock_session):
+        hass = _hass()
+        entry = _entry(mock_session, {}, {})
+        hass.config_entries.async_get_entry.return_value = entry
+
+        asyncio.run(async_reload_platforms(hass, "E1", ["sensor", Platform.COVER]))
+
+        hass.config_entries.async_unload_platforms.assert_awaited_once_with(
+            entry, {Platform.SENSOR}
+        )
+        hass.config_entries.async_forward_entry_setups.assert_awaited_once_with(
+            entry, [Platform.SENSOR]
+        )
+        hass.config_entries.async_reload.assert_not_called()
+
+    def test_entry_without_runtime_data_is_reloaded(self):
+        hass = _hass()
+        hass.config_entries.async_get_entry.return_value = None
+        hass.config_entries.async_reload = AsyncMock()
+
+        asyncio.run(async_reload_platforms(hass, "E1"))
+
+        hass.config_entries.async_reload.assert_awaited_once_with("E1")
+        hass.config_entries.async_unload_platforms.assert_not_called()
@@ -62,7 +62,12 @@ from custom_components.bosch_shc.select import (
     async_setup_entry,
 )
 
-from .conftest import _EMPTY_DEVICE_BUCKETS, run_setup_entry
+from .conftest import (
+    _EMPTY_DEVICE_BUCKETS,
+    make_poll_scheduler,
+    make_polled_resource,
+    run_setup_entry,
+)
 
 # ---------------------------------------------------------------------------
 # Shared helpers
@@ -371,7 +376,9 @@ class TestSirenSoundLevelSelectAsyncSelect:
 
 def _make_entry(options=None, entry_id="E1"):
     entry = SimpleNamespace(options=options or {}, entry_id=entry_id)
-    entry.runtime_data = SimpleNamespace(session=None)
+    entry.runtime_data = SimpleNamespace(
+        session=None, poll_scheduler=make_poll_scheduler()
+    )
     return entry
 
 
@@ -3497,8 +3504,8 @@ class TestInstallationProfileSelect:
         asyncio.run(e.async_select_option("outdoor"))
         dev.async_set_profile.assert_called_once_with("OUTDOOR")
 
-    def test_async_select_option_reloads_entry(self):
-        """#356: a profile switch must reload the config entry so capability
+    def test_async_select_option_sets_up_platforms_again(self):
+        """#356: a profile switch must set the platforms up again so capability
         -gated entities (e.g. the MD2 [+M] indicator light) are added/removed
         immediately, instead of only after a manual reload/restart."""
         dev = _fake_md2(
@@ -3511,9 +3518,13 @@ class TestInstallationProfileSelect:
         e._attr_options = ["outdoor", "generic"]
         e._entry_id = "entry-1"
         e.hass = MagicMock()
-        asyncio.run(e.async_select_option("outdoor"))
-        e.hass.async_create_task.assert_called_once()
-        e.hass.config_entries.async_reload.assert_called_once_with("entry-1")
+        with patch(
+            "custom_components.bosch_shc.select.async_reload_platforms", MagicMock()
+        ) as reload_platforms:
+            asyncio.run(e.async_select_option("outdoor"))
+        e.hass.async_create_task.assert_called_once_with(reload_platforms.return_value)
+        reload_platforms.assert_called_once_with(e.hass, "entry-1")
+        e.hass.config_entries.async_reload.assert_not_called()
 
     def test_options_lowercased_from_supported_profiles(self):
         md2 = _fake_md2(profile="GENERIC", supported_profiles=["OUTDOOR", "GENERIC"])
@@ -3811,10 +3822,11 @@ class TestAsyncSelectOptionWriteFailureSurfacesAsHomeAssistantError:
 # ---------------------------------------------------------------------------
 
 
-def _make_regulation_select():
+def _make_regulation_select(fetch=None, data=None):
     e = ThermostatRegulationAlgorithmSelect.__new__(ThermostatRegulationAlgorithmSelect)
     e._device = SimpleNamespace(name="Heizkoerper")
-    e._algorithm = None
+    e.coordinator = make_polled_resource(fetch, data=data)
+    e.coordinator.async_update_listeners = MagicMock()
     return e
 
 
@@ -3823,27 +3835,16 @@ def test_regulation_select_current_option_none_initially():
     assert e.current_option is None
 
 
-def test_regulation_select_async_update_sets_option():
-    dev = SimpleNamespace(
-        name="Heizkoerper",
-        async_thermostat_regulation_algorithm=AsyncMock(return_value="INTERNAL"),
-    )
-    e = _make_regulation_select()
-    e._device = dev
-    _run(e.async_update())
+def test_regulation_select_poll_sets_option():
+    e = _make_regulation_select(AsyncMock(return_value="INTERNAL"))
+    _run(e.coordinator.async_refresh())
     assert e.current_option == "internal"
 
 
-def test_regulation_select_async_update_logs_on_error():
-    dev = SimpleNamespace(
-        name="Heizkoerper",
-        async_thermostat_regulation_algorithm=AsyncMock(
-            side_effect=SHCException("boom")
-        ),
-    )
-    e = _make_regulation_select()
-    e._device = dev
-    _run(e.async_update())  # must not raise
+def test_regulation_select_poll_error_keeps_last_option():
+    e = _make_regulation_select(AsyncMock(side_effect=SHCException("boom")), "CUSTOM")
+    _run(e.coordinator.async_refresh())  # must not raise
+    assert e.current_option == "custom"
 
 
 def test_regulation_select_async_select_option_calls_device():
@@ -3851,11 +3852,12 @@ def test_regulation_select_async_select_option_calls_device():
         name="Heizkoerper",
         async_set_thermostat_regulation_algorithm=AsyncMock(),
     )
-    e = _make_regulation_select()
+    e = _make_regulation_select(data="INTERNAL")
     e._device = dev
     _run(e.async_select_option("custom"))
     dev.async_set_thermostat_regulation_algorithm.assert_awaited_once_with("CUSTOM")
     assert e.current_option == "custom"
+    e.coordinator.async_update_listeners.assert_called_once()
 
 
 def test_regulation_select_async_select_option_wraps_shc_exception():
@@ -3878,7 +3880,12 @@ class TestRegulationAlgorithmSelectSetupEntry:
         )
         session = _make_session(thermostats=[dev])
         entities = _setup(session)
-        assert any(isinstance(e, ThermostatRegulationAlgorithmSelect) for e in entities)
+        select = next(
+            e for e in entities if isinstance(e, ThermostatRegulationAlgorithmSelect)
+        )
+        # Seeded from the setup probe -- no second GET just to show a state.
+        assert select.current_option == "internal"
+        dev.async_thermostat_regulation_algorithm.assert_awaited_once()
 
     def test_skipped_when_config_absent(self):
         dev = _fake_device(
@@ -9,8 +9,7 @@ multi-platform coverage-gap files (siren/APK/MD2/battery gap tests that
 happen to exercise sensor.py entities). Pattern: bypass __init__ via
 Cls.__new__(Cls) and inject a fake device via SimpleNamespace/MagicMock (no
 HA harness, no tests.common); a smaller subset exercises the real __init__
-chain and async_setup_entry via asyncio.run with async_migrate_to_new_unique_id
-patched to a no-op.
+chain and async_setup_entry via asyncio.run.
 """
 
 from __future__ import annotations
@@ -21,9 +20,11 @@ from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from boschshcpy import CommunicationQualityService
+from boschshcpy.exceptions import SHCConnectionError
 from boschshcpy.services_impl import (
     AirQualityLevelService,
     BatteryLevelService,
+    ShutterContactService,
     ValveTappetService,
 )
 from boschshcpy.zigbee_routing import SHCZigbeeRoutingInfo
@@ -42,6 +43,7 @@ from custom_components.bosch_shc.const import (
     OPT_DIAGNOSTIC_ENTITIES,
     OPT_EXCLUDED_DEVICES,
 )
+from custom_components.bosch_shc.coordinator import SHCPollStats
 from custom_components.bosch_shc.sensor import (
     AirQualitySensor,
     BatteryLevelSensor,
@@ -63,7 +65,9 @@ from custom_components.bosch_shc.sensor import (
     PuritySensor,
     ReferenceMovingTimeBottomToTopSensor,
     ReferenceMovingTimeTopToBottomSensor,
+    OpenWindowsTracker,
     SHCOpenWindowsSensor,
+    SHCPollHealthSensor,
     SirenBatterySensor,
     SirenMainPowerSensor,
     SirenSolarChargingSensor,
@@ -79,12 +83,14 @@ from custom_components.bosch_shc.sensor import (
     async_setup_entry,
 )
 
+from .conftest import make_poll_scheduler, make_polled_resource
+
 # ===========================================================================
 # Shared helpers
 #
 # NOTE on naming collisions resolved during consolidation: several source
 # files defined a same-named helper (_fake_device, _make_fake_session,
-# _run_setup, _make_sensor, _emma, ENTRY_ID, _PATCH/_PATCH_MIGRATE) with
+# _run_setup, _make_sensor, _emma, ENTRY_ID, _PATCH) with
 # DIFFERENT bodies/defaults. Identical ones were deduped to a single copy;
 # non-identical ones were renamed with a distinguishing suffix (_ne, _excl,
 # _for_battery_session, etc.) and every call site within that section was
@@ -93,13 +99,6 @@ from custom_components.bosch_shc.sensor import (
 
 ENTRY_ID = "entry-001"
 
-_PATCH_MIGRATE = "custom_components.bosch_shc.sensor.async_migrate_to_new_unique_id"
-
-
-async def _noop_migrate(hass, platform, device, attr_name=None, old_unique_id=None):
-    return None
-
-
 def _new(cls):
     return cls.__new__(cls)
 
@@ -271,15 +270,16 @@ def _run_setup(session, options=None):
     """Run async_setup_entry with a fake session. Returns list of added entities."""
     hass = SimpleNamespace()
     config_entry = SimpleNamespace(options=options or {}, entry_id=ENTRY_ID)
-    config_entry.runtime_data = SimpleNamespace(session=session)
+    config_entry.runtime_data = SimpleNamespace(
+        session=session, poll_scheduler=make_poll_scheduler()
+    )
     collected: list = []
 
     def _add_entities(entity_list):
         collected.extend(entity_list)
 
     async def _inner():
-        with patch(_PATCH_MIGRATE, side_effect=_noop_migrate):
-            await async_setup_entry(hass, config_entry, _add_entities)
+        await async_setup_entry(hass, config_entry, _add_entities)
 
     asyncio.run(_inner())
     return collected
@@ -370,8 +370,7 @@ def _run_setup_ne(session, options=None):
         collected.extend(entity_list)
 
     async def _inner():
-        with patch(_PATCH_MIGRATE, side_effect=_noop_migrate):
-            await async_setup_entry(hass, config_entry, _add_entities)
+        await async_setup_entry(hass, config_entry, _add_entities)
 
     asyncio.run(_inner())
     return collected
@@ -431,15 +430,16 @@ def _run_setup_with_options(session, options):
     """Run async_setup_entry with custom options dict. Returns list of entities."""
     hass = SimpleNamespace()
     config_entry = SimpleNamespace(options=options, entry_id="E1")
-    config_entry.runtime_data = SimpleNamespace(session=session)
+    config_entry.runtime_data = SimpleNamespace(
+        session=session, poll_scheduler=make_poll_scheduler()
+    )
     collected = []
 
     def _add_entities(entity_list):
         collected.extend(entity_list)
 
     async def _inner():
-        with patch(_PATCH_MIGRATE, side_effect=_noop_migrate):
-            await async_setup_entry(hass, config_entry, _add_entities)
+        await async_setup_entry(hass, config_entry, _add_entities)
 
     asyncio.run(_inner())
     return collected
@@ -505,8 +505,7 @@ def _run_sensor_setup(session, options):
     collected = []
 
     async def _inner():
-        with patch(_PATCH_MIGRATE, side_effect=_noop_migrate):
-            await async_setup_entry(hass, config_entry, lambda e: collected.extend(e))
+        await async_setup_entry(hass, config_entry, lambda e: collected.extend(e))
 
     asyncio.run(_inner())
     return collected
@@ -559,8 +558,7 @@ def _setup_sensors(md2_list, options=None):
     entities = []
 
     async def _run_inner():
-        with patch(_PATCH_MIGRATE, new=AsyncMock(return_value=None)):
-            await async_setup_entry(hass, entry, lambda e, *a, **k: entities.extend(e))
+        await async_setup_entry(hass, entry, lambda e, *a, **k: entities.extend(e))
 
     asyncio.run(_run_inner())
     return entities
@@ -707,9 +705,8 @@ class TestSensorTerminalTempSetup:
         hass = _fake_hass(session=session)
         entry = _fake_entry(hass=hass, options=options or {})
 
-        with patch(_PATCH_MIGRATE, new_callable=AsyncMock):
-            collected = []
-            _run(async_setup_entry(hass, entry, lambda ents, **kw: collected.extend(ents)))
+        collected = []
+        _run(async_setup_entry(hass, entry, lambda ents, **kw: collected.extend(ents)))
         return collected
 
     def test_terminal_temperature_sensor_added_when_present(self):
@@ -1463,7 +1460,9 @@ def test_device_update_and_keypad_sensor_drop_attr_name():
     """#342: translated names actually resolve (SHCEntity._attr_name shadow fix)."""
     from custom_components.bosch_shc.update import DeviceUpdate
 
-    u = DeviceUpdate(device=_FAKE_DEVICE, entry_id="e1")
+    u = DeviceUpdate(
+        device=_FAKE_DEVICE, entry_id="e1", coordinator=make_polled_resource()
+    )
     assert not hasattr(u, "_attr_name")
     assert u.translation_key == "device_firmware"
 
@@ -1503,9 +1502,8 @@ class TestSensorKeypadTriggerSetup:
         hass = _fake_hass(session=session)
         entry = _fake_entry(hass=hass, options=options or {})
 
-        with patch(_PATCH_MIGRATE, new_callable=AsyncMock):
-            collected = []
-            _run(async_setup_entry(hass, entry, lambda ents, **kw: collected.extend(ents)))
+        collected = []
+        _run(async_setup_entry(hass, entry, lambda ents, **kw: collected.extend(ents)))
         return collected
 
     def test_keypad_trigger_added_when_supported(self):
@@ -1551,9 +1549,8 @@ class TestSensorKeypadTriggerExcluded:
         hass = _fake_hass(session=session)
         entry = _fake_entry(hass=hass, options={OPT_EXCLUDED_DEVICES: ["us_excl"]})
 
-        with patch(_PATCH_MIGRATE, new_callable=AsyncMock):
-            collected = []
-            _run(async_setup_entry(hass, entry, lambda ents, **kw: collected.extend(ents)))
+        collected = []
+        _run(async_setup_entry(hass, entry, lambda ents, **kw: collected.extend(ents)))
 
         assert not any(isinstance(e, KeypadTriggerSensor) for e in collected)
 
@@ -1931,9 +1928,8 @@ class TestSensorEnergyYieldSmartPlug:
         hass = _fake_hass(session=session)
         entry = _fake_entry(hass=hass, options=options or {})
 
-        with patch(_PATCH_MIGRATE, new_callable=AsyncMock):
-            collected = []
-            _run(async_setup_entry(hass, entry, lambda ents, **kw: collected.extend(ents)))
+        collected = []
+        _run(async_setup_entry(hass, entry, lambda ents, **kw: collected.extend(ents)))
         return collected
 
     def test_energy_yield_sensors_added_when_supported(self):
@@ -2470,9 +2466,6 @@ class TestBatterySensorSupportsFalse:
     produce BatteryLevelSensor."""
 
     def test_no_battery_entity_when_not_supported(self):
-        async def _noop_migrate_local(*a, **kw):
-            return None
-
         dev = SimpleNamespace(
             id="md-no-bat",
             name="Motion NoBat",
@@ -2517,8 +2510,7 @@ class TestBatterySensorSupportsFalse:
         collected = []
 
         async def _inner():
-            with patch(_PATCH_MIGRATE, side_effect=_noop_migrate_local):
-                await async_setup_entry(hass, config_entry, lambda e: collected.extend(e))
+            await async_setup_entry(hass, config_entry, lambda e: collected.extend(e))
 
         asyncio.run(_inner())
 
@@ -2655,13 +2647,12 @@ class TestBatteryLevelSensorCreationRawMock:
 
         added = []
 
-        with patch(_PATCH_MIGRATE, new=AsyncMock(return_value=None)):
-            asyncio.run(
-                __import__(
-                    "custom_components.bosch_shc.sensor",
-                    fromlist=["async_setup_entry"],
-                ).async_setup_entry(hass, entry, lambda e: added.extend(e))
-            )
+        asyncio.run(
+            __import__(
+                "custom_components.bosch_shc.sensor",
+                fromlist=["async_setup_entry"],
+            ).async_setup_entry(hass, entry, lambda e: added.extend(e))
+        )
 
         # BatteryLevelSensor uses _attr_translation_key (Silver gap); check by type
         bat_sensors = [e for e in added if isinstance(e, BatteryLevelSensor)]
@@ -2887,8 +2878,7 @@ class TestWalkStateSensorSetup:
         def add_entities(new_ents, *args, **kwargs):
             entities.extend(new_ents)
 
-        with patch(_PATCH_MIGRATE, new=AsyncMock(return_value=None)):
-            asyncio.run(async_setup_entry(hass, config_entry, add_entities))
+        asyncio.run(async_setup_entry(hass, config_entry, add_entities))
 
         return entities
 
@@ -3184,9 +3174,7 @@ class TestSirenPowerSupplyFaultSensors:
 
         platform_mock = MagicMock()
         platform_mock.async_register_entity_service = MagicMock()
-        with patch("custom_components.bosch_shc.binary_sensor.async_migrate_to_new_unique_id",
-                   new_callable=AsyncMock), \
-             patch("custom_components.bosch_shc.binary_sensor.entity_platform.current_platform") as _cp:
+        with patch("custom_components.bosch_shc.binary_sensor.entity_platform.current_platform") as _cp:
             _cp.get.return_value = platform_mock
             collected = []
             _run(binary_sensor_setup_entry(hass, entry, lambda ents, **kw: collected.extend(ents)))
@@ -3255,9 +3243,8 @@ class TestSensorSirenSetup:
         hass = _fake_hass(session=session)
         entry = _fake_entry(hass=hass, options=options or {})
 
-        with patch(_PATCH_MIGRATE, new_callable=AsyncMock):
-            collected = []
-            _run(async_setup_entry(hass, entry, lambda ents, **kw: collected.extend(ents)))
+        collected = []
+        _run(async_setup_entry(hass, entry, lambda ents, **kw: collected.extend(ents)))
         return collected
 
     def test_siren_battery_solar_added_when_power_supply_supported(self):
@@ -4042,9 +4029,8 @@ def _run_zigbee_setup(devices, options=None, device_lookup=None, coordinator=Non
     entry = _fake_entry(hass=hass, options=options or {})
     entry.runtime_data.zigbee_routing_coordinator = coordinator or _fake_coordinator()
 
-    with patch(_PATCH_MIGRATE, new_callable=AsyncMock):
-        collected: list = []
-        _run(async_setup_entry(hass, entry, lambda ents, **kw: collected.extend(ents)))
+    collected: list = []
+    _run(async_setup_entry(hass, entry, lambda ents, **kw: collected.extend(ents)))
     return collected, session
 
 
@@ -4085,14 +4071,15 @@ class TestZigbeeRoutingQualitySensorSetup:
         )
         hass = SimpleNamespace()
         config_entry = SimpleNamespace(options={}, entry_id=ENTRY_ID)
-        config_entry.runtime_data = SimpleNamespace(session=session)
+        config_entry.runtime_data = SimpleNamespace(
+            session=session, poll_scheduler=make_poll_scheduler()
+        )
         collected: list = []
 
         async def _inner():
-            with patch(_PATCH_MIGRATE, side_effect=_noop_migrate):
-                await async_setup_entry(
-                    hass, config_entry, lambda ents: collected.extend(ents)
-                )
+            await async_setup_entry(
+                hass, config_entry, lambda ents: collected.extend(ents)
+            )
 
         asyncio.run(_inner())
         assert len(collected) == 1  # only the always-on open-windows sensor
@@ -4111,10 +4098,9 @@ class TestZigbeeRoutingQualitySensorSetup:
         collected: list = []
 
         async def _inner():
-            with patch(_PATCH_MIGRATE, side_effect=_noop_migrate):
-                await async_setup_entry(
-                    hass, config_entry, lambda ents: collected.extend(ents)
-                )
+            await async_setup_entry(
+                hass, config_entry, lambda ents: collected.extend(ents)
+            )
 
         asyncio.run(_inner())
         assert not any(isinstance(e, ZigbeeRoutingQualitySensor) for e in collected)
@@ -4335,12 +4321,136 @@ class TestZigbeeRoutingQualitySensorState:
 # SHCOpenWindowsSensor -- whole-home open-doors/open-windows summary
 # ---------------------------------------------------------------------------
 
+_OPEN = ShutterContactService.State.OPEN
+
+
+class _PushService:
+    def __init__(self):
+        self.callbacks = {}
+
+    def subscribe_callback(self, key, callback):
+        self.callbacks[key] = callback
+
+    def unsubscribe_callback(self, key):
+        self.callbacks.pop(key, None)
+
+    def push(self):
+        for callback in list(self.callbacks.values()):
+            callback()
+
+
+def _shutter_contact(device_id, name, profile, state=None):
+    service = _PushService()
+    return SimpleNamespace(
+        id=device_id,
+        name=name,
+        device_class=profile,
+        state=state or ShutterContactService.State.CLOSED,
+        service=service,
+        device_service=lambda service_id: service
+        if service_id == "ShutterContact"
+        else None,
+    )
+
+
+class TestOpenWindowsTracker:
+    def test_initial_states_fill_the_profile_categories(self):
+        tracker = OpenWindowsTracker(
+            "entry1",
+            lambda: [
+                _shutter_contact("d1", "Front Door", "ENTRANCE_DOOR", _OPEN),
+                _shutter_contact("w1", "Office", "REGULAR_WINDOW"),
+                _shutter_contact("g1", "Shed", "GENERIC", _OPEN),
+            ],
+        )
+        assert tracker.open_count == 2
+        assert tracker.open_names("openDoors") == ["Front Door"]
+        assert tracker.open_names("openOthers") == ["Shed"]
+
+    def test_reconcile_replaces_open_sets_and_names_categories(self):
+        contact = _shutter_contact("fw1", "Patio", "FRENCH_WINDOW")
+        tracker = OpenWindowsTracker("entry1", lambda: [contact])
+        tracker.async_start(MagicMock())
+        tracker.async_reconcile(
+            {"allWindows": [{"identifier": "fw1", "name": "Patio"}], "openDoors": []}
+        )
+
+        contact.state = _OPEN
+        contact.service.push()
+        assert tracker.open_names("openWindows") == ["Patio"]
+        assert tracker.open_names("openDoors") == []
+
+    def test_reconciled_entry_is_closed_by_a_push_whatever_its_identifier(self):
+        """The summary's identifier is not known to be the device id."""
+        contact = _shutter_contact("hdm:ZigBee:w1", "Office", "REGULAR_WINDOW")
+        tracker = OpenWindowsTracker("entry1", lambda: [contact])
+        tracker.async_start(MagicMock())
+        tracker.async_reconcile(
+            {
+                "openWindows": [
+                    {"identifier": "window-17", "name": "Office", "roomName": "Den"},
+                    {"identifier": "window-18", "name": "Unknown"},
+                ]
+            }
+        )
+        assert tracker.open_names("openWindows") == ["Office"]
+
+        contact.service.push()  # closed
+        assert tracker.open_count == 0
+
+    def test_reconcile_does_not_match_an_ambiguous_name(self):
+        contacts = [
+            _shutter_contact("w1", "Window", "REGULAR_WINDOW"),
+            _shutter_contact("w2", "Window", "REGULAR_WINDOW"),
+        ]
+        tracker = OpenWindowsTracker("entry1", lambda: contacts)
+        tracker.async_reconcile({"openWindows": [{"name": "Window"}]})
+        assert tracker.open_count == 0
+
+    def test_contact_paired_at_runtime_is_counted_on_reconcile(self):
+        contacts = [_shutter_contact("w1", "Office", "REGULAR_WINDOW")]
+        tracker = OpenWindowsTracker("entry1", lambda: contacts)
+        tracker.async_start(MagicMock())
+        added = _shutter_contact("w2", "Attic", "REGULAR_WINDOW", _OPEN)
+        contacts.append(added)
+
+        tracker.async_reconcile({"openWindows": [{"identifier": "w2", "name": "Attic"}]})
+        assert tracker.open_names("openWindows") == ["Attic"]
+
+        added.state = ShutterContactService.State.CLOSED
+        added.service.push()
+        assert tracker.open_count == 0
+
+    def test_contact_gone_at_reconcile_is_unsubscribed(self):
+        contact = _shutter_contact("w1", "Office", "REGULAR_WINDOW", _OPEN)
+        contacts = [contact]
+        tracker = OpenWindowsTracker("entry1", lambda: contacts)
+        tracker.async_start(MagicMock())
+        contacts.clear()
+
+        tracker.async_reconcile({})
+
+        assert tracker.open_count == 0
+        assert contact.service.callbacks == {}
+
+    def test_stop_unsubscribes_every_contact(self):
+        contact = _shutter_contact("w1", "Office", "REGULAR_WINDOW")
+        tracker = OpenWindowsTracker("entry1", lambda: [contact])
+        tracker.async_start(MagicMock())
+        assert list(contact.service.callbacks) == ["entry1_open_windows"]
+        tracker.async_stop()
+        assert contact.service.callbacks == {}
+
+
 class TestSHCOpenWindowsSensor:
-    def _sensor(self, session=None, shc_device=None):
+    def _sensor(self, session=None, shc_device=None, coordinator=None, contacts=()):
+        contacts = list(contacts)
         return SHCOpenWindowsSensor(
             session=session if session is not None else MagicMock(),
             entry_id="entry1",
+            coordinator=coordinator or make_polled_resource(),
             shc_device=shc_device,
+            contacts=lambda: contacts,
         )
 
     def test_native_value_defaults_zero(self):
@@ -4356,9 +4466,8 @@ class TestSHCOpenWindowsSensor:
         s = self._sensor(shc_device=shc_device)
         assert s.device_info["identifiers"] == {("bosch_shc", "shc1")}
 
-    def test_async_update_populates_counts_and_attributes(self):
-        session = MagicMock()
-        session.api.get_open_windows = AsyncMock(
+    def test_poll_populates_counts_and_attributes(self):
+        fetch = AsyncMock(
             return_value={
                 "openDoors": [{"name": "Front Door", "roomName": "Hall"}],
                 "openWindows": [
@@ -4368,8 +4477,15 @@ class TestSHCOpenWindowsSensor:
                 "openOthers": [],
             }
         )
-        s = self._sensor(session=session)
-        asyncio.run(s.async_update())
+        contacts = [
+            _shutter_contact("d1", "Front Door", "ENTRANCE_DOOR"),
+            _shutter_contact("w1", "Kitchen Window", "REGULAR_WINDOW"),
+            _shutter_contact("w2", "Office Window", "REGULAR_WINDOW"),
+        ]
+        s = self._sensor(coordinator=make_polled_resource(fetch), contacts=contacts)
+        asyncio.run(s.coordinator.async_refresh())
+        with patch.object(s, "async_write_ha_state"):
+            s._handle_coordinator_update()
         assert s.native_value == 3
         assert s.extra_state_attributes == {
             "open_doors": ["Front Door"],
@@ -4377,11 +4493,140 @@ class TestSHCOpenWindowsSensor:
             "open_others": [],
         }
 
-    def test_async_update_handles_shc_exception(self):
+    def test_poll_handles_shc_exception(self):
         from boschshcpy.exceptions import SHCException
 
-        session = MagicMock()
-        session.api.get_open_windows = AsyncMock(side_effect=SHCException("boom"))
-        s = self._sensor(session=session)
-        asyncio.run(s.async_update())  # must not raise
+        fetch = AsyncMock(side_effect=SHCException("boom"))
+        s = self._sensor(coordinator=make_polled_resource(fetch))
+        asyncio.run(s.coordinator.async_refresh())  # must not raise
         assert s.native_value == 0
+
+    def test_contact_push_updates_the_count_without_a_poll(self):
+        contact = _shutter_contact("sc1", "Kitchen Window", "REGULAR_WINDOW")
+        fetch = AsyncMock()
+        s = self._sensor(coordinator=make_polled_resource(fetch))
+        s._tracker = OpenWindowsTracker("entry1", lambda: [contact])
+        written = MagicMock()
+        s._tracker.async_start(written)
+
+        contact.state = _OPEN
+        contact.service.push()
+
+        written.assert_called_once()
+        assert s.native_value == 1
+        assert s.extra_state_attributes["open_windows"] == ["Kitchen Window"]
+        fetch.assert_not_awaited()
+
+    def test_setup_leaves_excluded_contacts_out(self):
+        kept = _shutter_contact("w1", "Office", "REGULAR_WINDOW", _OPEN)
+        excluded = _shutter_contact("w2", "Garage", "REGULAR_WINDOW", _OPEN)
+        session = _make_fake_session(shutter_contacts=[kept, excluded])
+        entities = _run_setup(session, options={OPT_EXCLUDED_DEVICES: ["w2"]})
+        sensor = next(e for e in entities if isinstance(e, SHCOpenWindowsSensor))
+        assert sensor.native_value == 1
+
+        sensor._tracker.async_reconcile(
+            {"openWindows": [{"identifier": "w1"}, {"identifier": "w2"}]}
+        )
+        assert sensor.extra_state_attributes["open_windows"] == ["Office"]
+
+    def test_setup_polls_open_windows_through_the_scheduler(self):
+        session = _make_fake_session()
+        entities = _run_setup(session)
+        sensor = next(e for e in entities if isinstance(e, SHCOpenWindowsSensor))
+        assert sensor.coordinator.key == "open_windows"
+        assert sensor.should_poll is False
+
+
+class TestPollHealthSensors:
+    @staticmethod
+    def _setup(options=None):
+        stats = SHCPollStats()
+        config_entry = SimpleNamespace(options=options or {}, entry_id=ENTRY_ID)
+        config_entry.runtime_data = SimpleNamespace(
+            session=_make_fake_session(),
+            poll_scheduler=make_poll_scheduler(),
+            poll_stats=stats,
+            shc_device=SimpleNamespace(id="shc1", identifiers={("bosch_shc", "x")}),
+        )
+        collected: list = []
+        asyncio.run(
+            async_setup_entry(SimpleNamespace(), config_entry, collected.extend)
+        )
+        return stats, [e for e in collected if isinstance(e, SHCPollHealthSensor)]
+
+    def test_setup_adds_disabled_diagnostic_sensors_on_the_controller(self):
+        _, sensors = self._setup()
+        assert [s.entity_description.key for s in sensors] == [
+            "long_poll_round_trip",
+            "long_poll_events",
+            "long_poll_last_event",
+            "long_poll_resubscribes",
+            "long_poll_errors",
+        ]
+        for sensor in sensors:
+            assert sensor.entity_category == EntityCategory.DIAGNOSTIC
+            assert sensor.entity_registry_enabled_default is False
+            assert sensor.unique_id == f"shc1_{sensor.entity_description.key}"
+            assert sensor.device_info == {"identifiers": {("bosch_shc", "x")}}
+
+    def test_setup_skips_them_without_diagnostic_entities(self):
+        _, sensors = self._setup({OPT_DIAGNOSTIC_ENTITIES: False})
+        assert sensors == []
+
+    def test_values_follow_the_stats(self):
+        stats, sensors = self._setup()
+        by_key = {s.entity_description.key: s for s in sensors}
+        stats._record_poll(10.2, 0)
+        stats._record_poll(0.3, 3)
+        stats.subscribes = 3
+        stats._record_error(SHCConnectionError("down"))
+
+        round_trip = by_key["long_poll_round_trip"]
+        assert round_trip.native_value == 0.3
+        assert round_trip.extra_state_attributes["max"] == 10.2
+        assert round_trip.extra_state_attributes["histogram"]["<=0.5"] == 1
+        assert by_key["long_poll_events"].native_value == 3
+        assert by_key["long_poll_events"].extra_state_attributes["polls"] == 2
+        assert by_key["long_poll_last_event"].native_value == stats.last_event
+        assert by_key["long_poll_resubscribes"].native_value == 2
+        assert by_key["long_poll_errors"].native_value == 1
+        assert by_key["long_poll_errors"].extra_state_attributes == {
+            "rpc_errors": 0,
+            "connection_errors": 1,
+            "last_error": "SHCConnectionError",
+        }
+        assert by_key["long_poll_resubscribes"].extra_state_attributes is None
+
+    def test_recorded_calls_write_the_state(self):
+        stats, sensors = self._setup()
+        sensor = sensors[0]
+        sensor.hass = MagicMock()
+        with patch.object(sensor, "async_write_ha_state") as write:
+            asyncio.run(sensor.async_added_to_hass())
+            stats._record_poll(1.0, 1)
+            write.assert_called_once()
+            sensor._call_on_remove_callbacks()
+            stats._record_poll(1.0, 1)
+        write.assert_called_once()
+
+    def test_unchanged_value_is_not_written_again(self):
+        stats, sensors = self._setup()
+        errors = next(
+            s for s in sensors if s.entity_description.key == "long_poll_errors"
+        )
+        errors.hass = MagicMock()
+        with patch.object(errors, "async_write_ha_state") as write:
+            asyncio.run(errors.async_added_to_hass())
+            stats._record_poll(1.0, 1)
+            stats._record_poll(2.0, 0)
+            write.assert_not_called()
+            stats._record_error(SHCConnectionError("down"))
+        write.assert_called_once()
+
+    def test_per_poll_histograms_are_not_recorded(self):
+        _, sensors = self._setup()
+        for sensor in sensors:
+            assert sensor._unrecorded_attributes == frozenset(
+                {"histogram", "events_per_poll"}
+            )
@@ -0,0 +1,184 @@
+"""Unit tests for snapshot.py: the warm-start snapshot of the SHC model.
+
+Pattern: a real SHCSessionAsync whose api getters are replaced by fakes
+serving a generated controller (150 smart plugs by default), each fake call
+recording itself, so a warm start can be shown to make no round trip. The HA
+Store is the conftest's autouse mock.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from boschshcpy import SHCSessionAsync
+
+from custom_components.bosch_shc.snapshot import (
+    SHCSnapshotStore,
+    async_fetch,
+    async_init_from_snapshot,
+    async_init_recording,
+    async_reconcile,
+)
+
+def _controller(devices=150, switch_state="ON"):
+    """Return enumeration responses for a controller with `devices` plugs."""
+    raw_devices = []
+    raw_services = []
+    for i in range(devices):
+        device_id = f"hdm:ZigBee:plug{i:03d}"
+        raw_devices.append(
+            {
+                "@type": "device",
+                "id": device_id,
+                "deviceModel": "PSM",
+                "manufacturer": "BOSCH",
+                "name": f"Plug {i}",
+                "roomId": "hz_1",
+                "status": "AVAILABLE",
+                "serial": f"plug{i:03d}",
+                "deviceServiceIds": ["PowerSwitch"],
+            }
+        )
+        raw_services.append(
+            {
+                "@type": "DeviceServiceData",
+                "id": "PowerSwitch",
+                "deviceId": device_id,
+                "state": {"@type": "powerSwitchState", "switchState": switch_state},
+            }
+        )
+    return {
+        "get_public_information": {
+            "apiVersions": ["3.2"],
+            "shcIpAddress": "192.168.1.2",
+            "macAddress": "64-da-a0-00-00-01",
+        },
+        "get_information": {"version": "10.0", "updateState": "NO_UPDATE_AVAILABLE"},
+        "get_services": raw_services,
+        "get_devices": raw_devices,
+        "get_rooms": [{"@type": "room", "id": "hz_1", "name": "Living"}],
+        "get_scenarios": [],
+        "get_automation_rules": [],
+        "get_messages": [],
+        "get_userdefinedstates": [],
+        "get_domain_intrusion_detection": {"@type": "systemState"},
+    }
+
+
+def _session(responses, calls=None):
+    """Return an SHCSessionAsync whose getters serve `responses`."""
+    session = SHCSessionAsync(
+        "192.168.1.2",
+        "cert.pem",
+        "key.pem",
+        ssl_context=MagicMock(),
+        external_session=MagicMock(),
+    )
+
+    def getter(name):
+        async def call():
+            if calls is not None:
+                calls.append(name)
+            await asyncio.sleep(0)
+            return responses[name]
+
+        return call
+
+    for name in responses:
+        setattr(session.api, name, getter(name))
+
+    async def no_water_alarm():
+        from boschshcpy.exceptions import SHCException
+
+        raise SHCException("no water alarm system")
+
+    session.api.get_water_alarm_system_state = no_water_alarm
+    return session
+
+
+class TestWarmStart:
+    def test_warm_start_makes_no_round_trip(self):
+        """Warm start builds the 150-device model without any round trip."""
+        calls = []
+        cold = _session(_controller(), calls)
+        warm_calls = []
+        warm = _session(_controller(), warm_calls)
+        recorded = asyncio.run(async_init_recording(cold))
+        asyncio.run(async_init_from_snapshot(warm, recorded))
+
+        assert len(calls) == 10
+        assert warm_calls == []
+        assert len(warm.device_helper.smart_plugs) == 150
+        assert [d.id for d in warm.devices] == [d.id for d in cold.devices]
+
+    def test_replay_restores_the_api_getters(self):
+        session = _session(_controller(devices=1))
+        asyncio.run(async_init_from_snapshot(session, _controller(devices=1)))
+
+        assert asyncio.run(session.api.get_rooms())[0]["name"] == "Living"
+
+
+class TestReconcile:
+    def test_live_states_are_pushed_to_subscribers(self):
+        snapshot = _controller(devices=3, switch_state="OFF")
+        live = _controller(devices=3, switch_state="ON")
+        session = _session(live)
+        asyncio.run(async_init_from_snapshot(session, snapshot))
+        plug = session.device_helper.smart_plugs[0]
+        service = plug.device_service("PowerSwitch")
+        pushed = MagicMock()
+        service.subscribe_callback("test", pushed)
+
+        fetched = asyncio.run(async_fetch(session))
+        in_sync = asyncio.run(async_reconcile(session, snapshot, fetched))
+
+        assert in_sync is True
+        pushed.assert_called()
+        assert plug.switchstate.name == "ON"
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda calls: calls["get_devices"].pop(),
+            lambda calls: calls["get_rooms"][0].update(name="Kitchen"),
+            lambda calls: calls["get_devices"][0].update(name="Desk Lamp"),
+            lambda calls: calls["get_devices"][0].update(roomId="hz_2"),
+        ],
+    )
+    def test_model_change_is_not_applied(self, change):
+        snapshot = _controller(devices=3, switch_state="OFF")
+        live = _controller(devices=3, switch_state="ON")
+        change(live)
+        session = _session(snapshot)
+        asyncio.run(async_init_from_snapshot(session, snapshot))
+
+        assert asyncio.run(async_reconcile(session, snapshot, live)) is False
+        assert session.device_helper.smart_plugs[0].switchstate.name == "OFF"
+
+
+class TestSnapshotStore:
+    def test_snapshot_of_another_host_is_ignored(self, mock_snapshot_store):
+        calls = _controller(devices=1)
+        mock_snapshot_store.async_load.return_value = {
+            "host": "192.168.1.2",
+            "calls": calls,
+        }
+
+        assert asyncio.run(SHCSnapshotStore(None, "E1", "192.168.1.2").async_load())
+        assert (
+            asyncio.run(SHCSnapshotStore(None, "E1", "192.168.1.9").async_load())
+            is None
+        )
+
+    def test_incomplete_snapshot_is_not_saved(self, mock_snapshot_store):
+        calls = _controller(devices=1)
+        del calls["get_devices"]
+        store = SHCSnapshotStore(None, "E1", "192.168.1.2")
+
+        store.async_save_later(calls)
+        mock_snapshot_store.async_delay_save.assert_not_called()
+
+        store.async_save_later(_controller(devices=1))
+        mock_snapshot_store.async_delay_save.assert_called_once()
@@ -66,10 +66,11 @@ from custom_components.bosch_shc.switch import (
     SHCAutomationRuleSwitch,
     SHCSwitch,
     SHCUserDefinedStateSwitch,
+    _automation_rules_fetch,
     async_setup_entry,
 )
 
-from .conftest import run_setup_entry
+from .conftest import make_polled_resource, run_setup_entry
 
 
 
@@ -301,8 +302,7 @@ def _setup_switch(mock_config_entry, mock_session):
     def add(entities, *args, **kwargs):
         collected.extend(entities)
 
-    with patch(PATCH_MIGRATE, new=AsyncMock(return_value=None)):
-        asyncio.run(async_setup_entry(hass, mock_config_entry, add))
+    asyncio.run(async_setup_entry(hass, mock_config_entry, add))
     return collected
 
 
@@ -413,9 +413,6 @@ def _make_hass(session, entry, shc_device=None):
     return hass
 
 
-PATCH_MIGRATE = "custom_components.bosch_shc.switch.async_migrate_to_new_unique_id"
-
-
 PATCH_DEVICE_EXCLUDED = "custom_components.bosch_shc.switch.device_excluded"
 
 
@@ -1011,10 +1008,6 @@ class TestSwitchLightRelayOptInSkip:
         entry.async_on_unload = MagicMock()
 
         with (
-            patch(
-                "custom_components.bosch_shc.switch.async_migrate_to_new_unique_id",
-                new_callable=AsyncMock,
-            ),
             patch(
                 "custom_components.bosch_shc.switch.async_remove_stale_entity",
                 new_callable=AsyncMock,
@@ -1774,8 +1767,7 @@ class TestThermostatChildLockIncluded:
         added: list = []
         async_add_entities = MagicMock(side_effect=lambda ents, **kw: added.extend(ents))
 
-        with patch(PATCH_MIGRATE, new=AsyncMock(return_value=None)):
-            _run(_run_setup(hass, entry, async_add_entities))
+        _run(_run_setup(hass, entry, async_add_entities))
 
         child_lock_entities = [
             e for e in added
@@ -1816,8 +1808,7 @@ class TestChildProtectionBoolDeviceIncluded:
         added: list = []
         async_add_entities = MagicMock(side_effect=lambda ents, **kw: added.extend(ents))
 
-        with patch(PATCH_MIGRATE, new=AsyncMock(return_value=None)):
-            _run(_run_setup(hass, entry, async_add_entities))
+        _run(_run_setup(hass, entry, async_add_entities))
 
         child_lock_entities = [
             e for e in added
@@ -1937,21 +1928,15 @@ class TestMotionDetectors2IncludedPath:
         hass = _make_hass(session, entry, shc_dev)
         added: list = []
         async_add_entities = MagicMock(side_effect=lambda ents, **kw: added.extend(ents))
-        migrate_calls: list = []
-
-        async def _fake_migrate(**kwargs):
-            migrate_calls.append(kwargs)
+        _run(_run_setup(hass, entry, async_add_entities))
 
-        with patch(PATCH_MIGRATE, side_effect=_fake_migrate):
-            _run(_run_setup(hass, entry, async_add_entities))
-
-        return added, migrate_calls
+        return added
 
     def test_pet_immunity_entity_created(self):
         """Included motion_detectors2 device produces a PetImmunity switch entity."""
         from custom_components.bosch_shc.switch import SHCSwitch
 
-        added, _ = self._setup_motion_included()
+        added = self._setup_motion_included()
         pet_entities = [
             e for e in added
             if isinstance(e, SHCSwitch)
@@ -1959,12 +1944,6 @@ class TestMotionDetectors2IncludedPath:
         ]
         assert len(pet_entities) == 1
 
-    def test_migrate_called_for_pet_immunity(self):
-        """async_migrate_to_new_unique_id is called with attr_name=PetImmunity."""
-        _, migrate_calls = self._setup_motion_included()
-        attr_names = [c.get("attr_name") for c in migrate_calls]
-        assert "PetImmunity" in attr_names
-
 
 class TestPetImmunitySwitch:
     """Tests for the pet_immunity_enabled SWITCH_TYPE and SHCSwitch integration."""
@@ -2891,10 +2870,8 @@ class TestSwitchMotionDetector2TamperProtection:
         entry = _fake_entry(hass=hass, options=options or {})
         entry.async_on_unload = MagicMock()
 
-        with patch("custom_components.bosch_shc.switch.async_migrate_to_new_unique_id",
-                   new_callable=AsyncMock):
-            collected = []
-            _run(async_setup_entry(hass, entry, lambda ents, **kw: collected.extend(ents)))
+        collected = []
+        _run(async_setup_entry(hass, entry, lambda ents, **kw: collected.extend(ents)))
         return collected
 
     def test_motion_detector2_with_tamper_protection_switch(self):
@@ -3288,8 +3265,7 @@ class TestUserDefinedStatesPath:
         added: list = []
         async_add_entities = MagicMock(side_effect=lambda ents, **kw: added.extend(ents))
 
-        with patch(PATCH_MIGRATE, new=AsyncMock(return_value=None)):
-            _run(_run_setup(hass, entry, async_add_entities))
+        _run(_run_setup(hass, entry, async_add_entities))
 
         return added, session
 
@@ -3821,10 +3797,8 @@ class TestSwitchSmokeDetectorIntrusionAlarm:
         entry = _fake_entry(hass=hass, options=options or {})
         entry.async_on_unload = MagicMock()
 
-        with patch("custom_components.bosch_shc.switch.async_migrate_to_new_unique_id",
-                   new_callable=AsyncMock):
-            collected = []
-            _run(async_setup_entry(hass, entry, lambda ents, **kw: collected.extend(ents)))
+        collected = []
+        _run(async_setup_entry(hass, entry, lambda ents, **kw: collected.extend(ents)))
         return collected
 
     def test_smoke_detector_with_intrusion_alarm_switch(self):
@@ -4685,8 +4659,7 @@ class TestAllDeviceTypesExcluded:
         added: list = []
         async_add_entities = MagicMock(side_effect=lambda ents, **kw: added.extend(ents))
 
-        with patch(PATCH_MIGRATE, new=AsyncMock(return_value=None)):
-            _run(_run_setup(hass, entry, async_add_entities))
+        _run(_run_setup(hass, entry, async_add_entities))
 
         return added
 
@@ -4715,8 +4688,7 @@ class TestAllDeviceTypesExcluded:
         added: list = []
         async_add_entities = MagicMock(side_effect=lambda ents, **kw: added.extend(ents))
 
-        with patch(PATCH_MIGRATE, new=AsyncMock(return_value=None)):
-            _run(_run_setup(hass, entry, async_add_entities))
+        _run(_run_setup(hass, entry, async_add_entities))
 
         # All device loops hit the continue branch -> 0 entities from loops
         assert len(added) == 0
@@ -4845,9 +4817,7 @@ class TestSwitchSuppressCamerasRegistry:
         entry.async_on_unload = MagicMock()
 
         with patch("custom_components.bosch_shc.switch.get_dev_reg",
-                   return_value=dr_mock), \
-             patch("custom_components.bosch_shc.switch.async_migrate_to_new_unique_id",
-                   new_callable=AsyncMock):
+                   return_value=dr_mock):
             collected = []
             _run(async_setup_entry(hass, entry, lambda ents, **kw: collected.extend(ents)))
 
@@ -4901,6 +4871,7 @@ def _make_rule_switch(rule=None, shc_device=None):
         id="r1", name="TV aus", enabled=True
     )
     sw._shc_device = shc_device
+    sw.async_write_ha_state = MagicMock()
     return sw
 
 
@@ -4932,19 +4903,46 @@ def test_automation_rule_switch_device_info_links_shc_device():
     assert info["name"] == "Bosch SHC"
 
 
-def test_automation_rule_switch_async_update_calls_refresh():
-    rule = SimpleNamespace(id="r1", name="TV aus", enabled=True)
-    rule.async_refresh = AsyncMock()
-    sw = _make_rule_switch(rule)
-    _run(sw.async_update())
-    rule.async_refresh.assert_awaited_once()
+def test_automation_rules_fetch_is_one_bulk_refresh():
+    rules = [
+        SimpleNamespace(id="r1", name="TV aus", enabled=True),
+        SimpleNamespace(id="r2", name="Licht", enabled=True),
+    ]
 
+    async def _refresh():
+        rules[0].enabled = False
 
-def test_automation_rule_switch_async_update_logs_on_error():
+    session = SimpleNamespace(
+        automation_rules=rules,
+        async_refresh_automation_rules=AsyncMock(side_effect=_refresh),
+    )
+    assert _run(_automation_rules_fetch(session)()) == {"r1": False, "r2": True}
+    session.async_refresh_automation_rules.assert_awaited_once()
+
+
+def test_automation_rule_poll_error_keeps_last_state():
+    session = SimpleNamespace(
+        automation_rules=[],
+        async_refresh_automation_rules=AsyncMock(side_effect=SHCException("boom")),
+    )
+    resource = make_polled_resource(
+        _automation_rules_fetch(session), data={"r1": True}
+    )
+    _run(resource.async_refresh())  # must not raise
+    assert resource.data == {"r1": True}
+
+
+def test_automation_rule_switch_writes_only_when_enabled_changed():
     rule = SimpleNamespace(id="r1", name="TV aus", enabled=True)
-    rule.async_refresh = AsyncMock(side_effect=SHCException("boom"))
     sw = _make_rule_switch(rule)
-    _run(sw.async_update())  # must not raise
+    sw._written_enabled = True
+    sw._handle_coordinator_update()
+    sw.async_write_ha_state.assert_not_called()
+    rule.enabled = False
+    sw._handle_coordinator_update()
+    sw.async_write_ha_state.assert_called_once()
+    sw._handle_coordinator_update()
+    sw.async_write_ha_state.assert_called_once()
 
 
 def test_automation_rule_switch_turn_on_calls_set_enabled_true():
@@ -4953,6 +4951,7 @@ def test_automation_rule_switch_turn_on_calls_set_enabled_true():
     sw = _make_rule_switch(rule)
     _run(sw.async_turn_on())
     rule.async_set_enabled.assert_awaited_once_with(True)
+    sw.async_write_ha_state.assert_called_once()
 
 
 def test_automation_rule_switch_turn_off_calls_set_enabled_false():
@@ -5006,6 +5005,9 @@ class TestAutomationRulesSwitchSetupEntry:
         )
         rule_switches = [e for e in entities if isinstance(e, SHCAutomationRuleSwitch)]
         assert len(rule_switches) == 2
+        # Both switches ride one bulk resource, not one GET per rule.
+        assert rule_switches[0].coordinator is rule_switches[1].coordinator
+        assert rule_switches[0].coordinator.data == {"r1": True, "r2": False}
 
     def test_no_switches_when_option_disabled(self, mock_config_entry, mock_session):
         mock_config_entry.runtime_data.shc_device = SimpleNamespace()
@@ -5026,13 +5028,16 @@ class TestAutomationRulesSwitchSetupEntry:
 # ---------------------------------------------------------------------------
 
 
-def _make_tds_switch(room=None):
+def _make_tds_switch(room=None, data=None):
     from custom_components.bosch_shc.switch import TemperatureDropEnabledSwitch
 
     sw = TemperatureDropEnabledSwitch.__new__(TemperatureDropEnabledSwitch)
     sw._device = SimpleNamespace(name="Kinderzimmer")
     sw._room = room if room is not None else MagicMock()
-    sw._enabled = None
+    sw.coordinator = make_polled_resource(
+        getattr(sw._room, "async_temperature_drop_service", None), data=data
+    )
+    sw.coordinator.async_request_refresh = AsyncMock()
     return sw
 
 
@@ -5041,39 +5046,46 @@ def test_tds_switch_is_on_false_initially():
     assert sw.is_on is False
 
 
-def test_tds_switch_async_update_sets_enabled():
+def test_tds_switch_poll_sets_enabled():
     room = MagicMock()
     room.async_temperature_drop_service = AsyncMock(
         return_value={"configuration": {"enabled": True}}
     )
     sw = _make_tds_switch(room)
-    _run(sw.async_update())
+    _run(sw.coordinator.async_refresh())
     assert sw.is_on is True
 
 
-def test_tds_switch_async_update_logs_on_error():
+def test_tds_switch_poll_error_keeps_last_state():
     room = MagicMock()
     room.async_temperature_drop_service = AsyncMock(side_effect=SHCException("boom"))
-    sw = _make_tds_switch(room)
-    _run(sw.async_update())  # must not raise
+    sw = _make_tds_switch(room, data={"configuration": {"enabled": True}})
+    _run(sw.coordinator.async_refresh())  # must not raise
+    assert sw.is_on is True
 
 
 def test_tds_switch_turn_on_calls_room():
     room = MagicMock()
     room.async_set_temperature_drop_enabled = AsyncMock()
-    sw = _make_tds_switch(room)
+    sw = _make_tds_switch(
+        room, data={"configuration": {"enabled": False, "dropTemperature": 1.0}}
+    )
     _run(sw.async_turn_on())
     room.async_set_temperature_drop_enabled.assert_awaited_once_with(True)
+    # Written through to the shared resource -- no follow-up GET.
     assert sw.is_on is True
+    assert sw.coordinator.data["configuration"]["dropTemperature"] == 1.0
+    sw.coordinator.async_request_refresh.assert_not_awaited()
 
 
 def test_tds_switch_turn_off_calls_room():
     room = MagicMock()
     room.async_set_temperature_drop_enabled = AsyncMock()
-    sw = _make_tds_switch(room)
+    sw = _make_tds_switch(room, data={"configuration": {"enabled": True}})
     _run(sw.async_turn_off())
     room.async_set_temperature_drop_enabled.assert_awaited_once_with(False)
     assert sw.is_on is False
+    sw.coordinator.async_request_refresh.assert_not_awaited()
 
 
 def test_tds_switch_turn_on_wraps_shc_exception():
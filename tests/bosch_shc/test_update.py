@@ -19,18 +19,23 @@ from homeassistant.const import Platform
 
 from custom_components.bosch_shc.const import OPT_EXCLUDED_DEVICES
 from custom_components.bosch_shc.update import (
+    _FAST_POLL_INTERVAL,
     FIRMWARE_CAPABLE_MODELS,
+    SCAN_INTERVAL,
     ControllerUpdate,
     DeviceUpdate,
+    _controller_in_progress,
+    _controller_update_fetch,
+    _controller_update_state,
     async_setup_entry,
 )
 
-from .conftest import run_setup_entry
+from .conftest import make_poll_scheduler, make_polled_resource, run_setup_entry
 
 
 @pytest.fixture(autouse=True)
 def _mock_issue_registry(monkeypatch):
-    """DeviceUpdate.async_update now syncs repair issues on every poll
+    """DeviceUpdate syncs repair issues on every coordinator update
     (#377 follow-up) -- stub out the real issue-registry calls so tests
     that don't care about them don't need a real hass instance."""
     create = MagicMock()
@@ -52,6 +57,23 @@ def _run(coro):
     return asyncio.run(coro)
 
 
+def _controller(info, title="My SHC", entry_id="e1"):
+    """ControllerUpdate on a resource wired exactly like async_setup_entry's."""
+    return ControllerUpdate(
+        info,
+        title,
+        entry_id,
+        make_poll_scheduler().async_get(
+            "controller_update",
+            _controller_update_fetch(info),
+            SCAN_INTERVAL,
+            data=_controller_update_state(info),
+            fast_interval=_FAST_POLL_INTERVAL,
+            fast_poll_while=_controller_in_progress,
+        ),
+    )
+
+
 def _fake_dev(dev_id="dev1", root_id="root1", serial="SER1", **kw):
     base = dict(
         id=dev_id,
@@ -66,6 +88,7 @@ def _fake_dev(dev_id="dev1", root_id="root1", serial="SER1", **kw):
         device_model="TestModel",
         subscribe_callback=MagicMock(),
         unsubscribe_callback=MagicMock(),
+        async_firmware_update_state=AsyncMock(return_value="UpToDate"),
     )
     base.update(kw)
     return SimpleNamespace(**base)
@@ -108,7 +131,7 @@ class TestControllerUpdateInit:
 
     def test_init_sets_attributes(self):
         info = SimpleNamespace(unique_id="aa:bb:cc:dd:ee:ff", version="9.0.0")
-        cu = ControllerUpdate(info, "My SHC Title", "entry1")
+        cu = _controller(info, "My SHC Title", "entry1")
         assert cu._information is info
         assert cu._entry_id == "entry1"
         assert "aa:bb:cc:dd:ee:ff" in cu._attr_unique_id
@@ -116,47 +139,72 @@ class TestControllerUpdateInit:
 
 
 class TestControllerUpdateAsyncUpdate:
-    """Cover ControllerUpdate.async_update (lines 111-113)."""
-
-    def test_async_update_calls_refresh_when_present(self):
-        info = SimpleNamespace(unique_id="aa:bb:cc:dd:ee:ff", version="9.0.0")
-        cu = ControllerUpdate(info, "My SHC", "e1")
+    """Cover the controller's /information poll fetch (#186)."""
 
+    def test_fetch_calls_refresh_when_present(self):
         refresh_called = []
 
         async def fake_refresh():
             refresh_called.append(True)
 
-        cu._information = SimpleNamespace(
+        info = SimpleNamespace(
             unique_id="aa:bb:cc:dd:ee:ff",
             version="9.0.0",
+            update_state="DOWNLOADING",
             async_refresh=fake_refresh,
         )
-        _run(cu.async_update())
+        assert _run(_controller_update_fetch(info)()) == (
+            "DOWNLOADING",
+            "9.0.0",
+            None,
+        )
         assert refresh_called
 
-    def test_async_update_no_refresh(self):
+    def test_fetch_no_refresh(self):
         """If async_refresh not present, no error."""
         info = SimpleNamespace(unique_id="aa:bb:cc:dd:ee:ff", version="9.0.0")
-        cu = ControllerUpdate(info, "My SHC", "e1")
         # information without async_refresh — must not raise
-        _run(cu.async_update())
+        assert _run(_controller_update_fetch(info)()) == (None, "9.0.0", None)
 
-    def test_async_update_logs_and_keeps_last_state_on_error(self):
+    def test_poll_logs_and_keeps_last_state_on_error(self):
         """Bughunt follow-up (#373): a transient probe failure must not
         crash/unavailable this entity, matching DeviceUpdate's own guard."""
-        info = SimpleNamespace(unique_id="aa:bb:cc:dd:ee:ff", version="9.0.0")
-        cu = ControllerUpdate(info, "My SHC", "e1")
 
         async def fake_refresh():
             raise SHCException("boom")
 
-        cu._information = SimpleNamespace(
+        info = SimpleNamespace(
             unique_id="aa:bb:cc:dd:ee:ff",
             version="9.0.0",
             async_refresh=fake_refresh,
         )
-        _run(cu.async_update())  # must not raise
+        cu = _controller(info)
+        _run(cu.coordinator.async_refresh())  # must not raise
+        assert cu.coordinator.data == (None, "9.0.0", None)
+
+    def test_seeded_without_startup_probe(self):
+        info = SimpleNamespace(unique_id="aa:bb:cc:dd:ee:ff", version="9.0.0")
+        cu = _controller(info)
+        assert cu.should_poll is False
+        assert cu.extra_state_attributes == {"poll_interval": 6 * 3600}
+
+    def test_install_switches_to_fast_poll(self):
+        """hass#373-class: progress must not look stale for 6h after Install."""
+        info = SimpleNamespace(
+            unique_id="aa:bb:cc:dd:ee:ff",
+            version="9.0.0",
+            update_state="UPDATE_AVAILABLE",
+        )
+
+        async def fake_start():
+            info.update_state = "DOWNLOADING"
+
+        info.async_start_software_update = fake_start
+        cu = _controller(info)
+        cu.coordinator.async_update_listeners = MagicMock()
+        _run(cu.async_install(version=None, backup=False))
+        assert cu.in_progress is True
+        assert cu.extra_state_attributes == {"poll_interval": 5}
 
 
 class TestControllerUpdateAsyncInstall:
@@ -171,10 +219,8 @@ class TestControllerUpdateAsyncInstall:
         async def fake_refresh():
             pass
 
-        cu = ControllerUpdate(
-            SimpleNamespace(unique_id="aa:bb:cc:dd:ee:ff", version="9.0.0"),
-            "My SHC",
-            "e1",
+        cu = _controller(
+            SimpleNamespace(unique_id="aa:bb:cc:dd:ee:ff", version="9.0.0")
         )
         cu._information = SimpleNamespace(
             update_state="UPDATE_AVAILABLE",
@@ -191,10 +237,8 @@ class TestControllerUpdateAsyncInstall:
         async def fake_refresh():
             pass
 
-        cu = ControllerUpdate(
-            SimpleNamespace(unique_id="aa:bb:cc:dd:ee:ff", version="9.0.0"),
-            "My SHC",
-            "e1",
+        cu = _controller(
+            SimpleNamespace(unique_id="aa:bb:cc:dd:ee:ff", version="9.0.0")
         )
         cu._information = SimpleNamespace(
             update_state="UPDATE_AVAILABLE",
@@ -221,10 +265,8 @@ class TestControllerUpdateAsyncInstall:
             async def fake_start():
                 called.append(True)
 
-            cu = ControllerUpdate(
-                SimpleNamespace(unique_id="aa:bb:cc:dd:ee:ff", version="9.0.0"),
-                "My SHC",
-                "e1",
+            cu = _controller(
+                SimpleNamespace(unique_id="aa:bb:cc:dd:ee:ff", version="9.0.0")
             )
             cu._information = SimpleNamespace(
                 update_state=state, async_start_software_update=fake_start
@@ -319,10 +361,18 @@ def test_controller_update_has_firmware_device_class():
     assert cu.device_class == UpdateDeviceClass.FIRMWARE
 
 
+def _with_coordinator(u, probe, data=None):
+    """Attach a real SHCPolledResource around *probe*; listeners stubbed."""
+    u.coordinator = make_polled_resource(probe, data=data)
+    u.coordinator.async_update_listeners = lambda: u._handle_coordinator_update()
+    u.async_write_ha_state = MagicMock()
+    return u
+
+
 class TestDeviceUpdateAsyncUpdateExceptionScope:
     def test_non_shc_exception_is_also_swallowed(self):
-        """Bughunt follow-up: async_update must never raise, whatever the
-        error type -- a bare SHCException-only catch let e.g. a timeout
+        """Bughunt follow-up: the firmware poll must never raise, whatever
+        the error type -- a bare SHCException-only catch let e.g. a timeout
         propagate and mask the real error in async_install's finally block."""
         u = _new(DeviceUpdate)
         u._firmware_state = "UpToDate"
@@ -335,24 +385,24 @@ class TestDeviceUpdateAsyncUpdateExceptionScope:
             device_model="TestModel",
             async_firmware_update_state=fake_probe,
         )
-        _run(u.async_update())  # must not raise
+        _with_coordinator(u, fake_probe, data="UpToDate")
+        _run(u.coordinator.async_refresh())  # must not raise
         assert u._firmware_state == "UpToDate"
 
 
 class TestControllerUpdateAsyncUpdateExceptionScope:
     def test_non_shc_exception_is_also_swallowed(self):
-        info = SimpleNamespace(unique_id="aa:bb:cc:dd:ee:ff", version="9.0.0")
-        cu = ControllerUpdate(info, "My SHC", "e1")
-
         async def fake_refresh():
             raise TimeoutError("boom")
 
-        cu._information = SimpleNamespace(
-            unique_id="aa:bb:cc:dd:ee:ff",
-            version="9.0.0",
-            async_refresh=fake_refresh,
+        cu = _controller(
+            SimpleNamespace(
+                unique_id="aa:bb:cc:dd:ee:ff",
+                version="9.0.0",
+                async_refresh=fake_refresh,
+            )
         )
-        _run(cu.async_update())  # must not raise
+        _run(cu.coordinator.async_refresh())  # must not raise
 
 
 def test_device_update_release_summary_surfaces_raw_state():
@@ -521,6 +571,7 @@ def test_device_update_unrecognized_state_treated_as_pending():
 class TestDeviceUpdateAsyncUpdate:
     def test_async_update_stores_probed_state(self):
         u = _new(DeviceUpdate)
+        u._firmware_state = None
 
         async def fake_probe():
             return "AwaitingActivation"
@@ -530,8 +581,10 @@ class TestDeviceUpdateAsyncUpdate:
             device_model="TestModel",
             async_firmware_update_state=fake_probe,
         )
-        _run(u.async_update())
+        _with_coordinator(u, fake_probe)
+        _run(u.coordinator.async_refresh())
         assert u._firmware_state == "AwaitingActivation"
+        u.async_write_ha_state.assert_called()
 
     def test_async_update_logs_and_keeps_last_state_on_error(self):
         u = _new(DeviceUpdate)
@@ -545,9 +598,18 @@ class TestDeviceUpdateAsyncUpdate:
             device_model="TestModel",
             async_firmware_update_state=fake_probe
         )
-        _run(u.async_update())
+        _with_coordinator(u, fake_probe, data="UpToDate")
+        _run(u.coordinator.async_refresh())
         assert u._firmware_state == "UpToDate"
 
+    def test_init_seeds_state_from_coordinator(self):
+        dev = _fake_dev(device_model="TRV_GEN2")
+        u = DeviceUpdate(
+            dev, "e1", make_polled_resource(data="AwaitingActivation")
+        )
+        assert u._firmware_state == "AwaitingActivation"
+        assert u.should_poll is False
+
 
 class TestDeviceUpdateAsyncInstall:
     """Cover DeviceUpdate.async_install (the new APK-traced trigger)."""
@@ -569,6 +631,7 @@ class TestDeviceUpdateAsyncInstall:
             async_activate_firmware_update=fake_activate,
             async_firmware_update_state=fake_probe,
         )
+        _with_coordinator(u, fake_probe)
         _run(u.async_install(version=None, backup=False))
         assert called
 
@@ -591,6 +654,7 @@ class TestDeviceUpdateAsyncInstall:
             async_activate_firmware_update=fake_activate,
             async_firmware_update_state=fake_probe,
         )
+        _with_coordinator(u, fake_probe)
         _run(u.async_install(version=None, backup=False))
         assert u._firmware_state == "UpdatePending"
 
@@ -609,6 +673,7 @@ class TestDeviceUpdateAsyncInstall:
             async_activate_firmware_update=fake_activate,
             async_firmware_update_state=fake_probe,
         )
+        _with_coordinator(u, fake_probe)
         with pytest.raises(HomeAssistantError):
             _run(u.async_install(version=None, backup=False))
 
@@ -677,20 +742,69 @@ class TestUpdateAsyncSetupEntry:
         result = self._run(mock_config_entry, mock_session)
         assert any(e._information for e in result)
 
-    def test_setup_entry_polls_before_add(self, mock_config_entry, mock_session):
-        """hass#373 follow-up: without update_before_add=True, HA schedules
-        the first poll a full SCAN_INTERVAL (6h) from now, leaving these
-        entities on a stale/unset firmware_state after every restart."""
+    def test_setup_entry_adds_without_startup_poll(
+        self, mock_config_entry, mock_session
+    ):
+        """hass#373 follow-up: the controller entity must not sit unset until
+        the first 6h poll -- it is seeded from async_init's /information
+        instead of an update_before_add round-trip."""
         mock_config_entry.title = "Test SHC"
         mock_config_entry.runtime_data.session = mock_session
         mock_session.devices = []
         calls = []
 
         def add(entities, update_before_add=False):
-            calls.append(update_before_add)
+            calls.append((entities, update_before_add))
+
+        asyncio.run(async_setup_entry(SimpleNamespace(), mock_config_entry, add))
+        ((entities, update_before_add),) = calls
+        assert update_before_add is False
+        (controller,) = entities
+        assert controller.coordinator.data == _controller_update_state(
+            mock_session.information
+        )
+
+    def test_setup_entry_device_updates_use_scheduler(
+        self, mock_config_entry, mock_session
+    ):
+        """DeviceUpdates are not update_before_add'd: each gets its own
+        scheduler resource whose first probe is staggered instead."""
+        mock_config_entry.title = "Test SHC"
+        mock_config_entry.runtime_data.session = mock_session
+        mock_session.devices = [
+            _fake_dev("d1", device_model="TRV_GEN2"),
+            _fake_dev("d2", device_model="TWINGUARD"),
+        ]
+        calls = []
+
+        def add(entities, update_before_add=False):
+            calls.append((len(entities), update_before_add))
 
         asyncio.run(async_setup_entry(SimpleNamespace(), mock_config_entry, add))
-        assert calls == [True]
+        assert calls == [(3, False)]
+        assert set(mock_config_entry.runtime_data.poll_scheduler.resources) == {
+            "controller_update",
+            "firmware_d1",
+            "firmware_d2",
+        }
+
+    def test_device_update_fast_polls_only_in_progress_states(
+        self, mock_config_entry, mock_session
+    ):
+        dev = _fake_dev("d1", device_model="TRV_GEN2")
+        dev.async_firmware_update_state = AsyncMock(return_value="UpdateRunning")
+        mock_session.devices = [dev]
+        result = self._run(mock_config_entry, mock_session)
+        coordinator = next(e for e in result if isinstance(e, DeviceUpdate)).coordinator
+        _run(coordinator.async_refresh())
+        assert coordinator.update_interval == _FAST_POLL_INTERVAL
+        dev.async_firmware_update_state.return_value = "AwaitingActivation"
+        _run(coordinator.async_refresh())
+        assert coordinator.update_interval == 2 * _FAST_POLL_INTERVAL  # decaying
+        for _ in range(20):
+            _run(coordinator.async_refresh())
+        # Back on the idle cycle (plus this device's one-off phase slot).
+        assert SCAN_INTERVAL <= coordinator.update_interval < 2 * SCAN_INTERVAL
 
     def test_setup_entry_device_with_firmware_capable_model(
         self, mock_config_entry, mock_session
@@ -749,7 +863,7 @@ class TestUpdateExcludedDevice:
     ):
         """#356-class regression: a firmware-capable device (e.g. TRV_GEN2)
         that becomes excluded via OPT_EXCLUDED_DEVICES/OPT_EXCLUDED_ROOMS
-        (an OptionsFlowWithReload option -> full entry reload) must have its
+        (the options change re-runs the platform setup) must have its
         previously-created DeviceUpdate entity actively removed from the
         registry, not just skipped on re-creation -- otherwise it is
         orphaned there forever."""
@@ -767,8 +881,8 @@ class TestUpdateExcludedDevice:
         assert not any(isinstance(e, DeviceUpdate) for e in result)
         remove_mock.assert_awaited_once()
         args = remove_mock.await_args.args
-        assert args[1] == Platform.UPDATE
-        assert args[2] == "root1_excl1_software_update"
+        assert args[2] == Platform.UPDATE
+        assert args[3] == "root1_excl1_software_update"
 
     def test_no_longer_firmware_capable_device_removes_stale_entity(
         self, mock_config_entry, mock_session
@@ -790,5 +904,5 @@ class TestUpdateExcludedDevice:
         assert not any(isinstance(e, DeviceUpdate) for e in result)
         remove_mock.assert_awaited_once()
         args = remove_mock.await_args.args
-        assert args[1] == Platform.UPDATE
-        assert args[2] == "root1_dev1_software_update"
+        assert args[2] == Platform.UPDATE
+        assert args[3] == "root1_dev1_software_update"